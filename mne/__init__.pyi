@@ -10,6 +10,7 @@ __all__ = [
     "EpochsArray",
     "Evoked",
     "EvokedArray",
+    "EventFinder",
     "Forward",
     "HEDAnnotations",
     "Info",
@@ -312,6 +313,7 @@ from .epochs import (
 )
 from .event import (
     AcqParserFIF,
+    EventFinder,
     concatenate_events,
     count_events,
     find_events,
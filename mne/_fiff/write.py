@@ -39,14 +39,21 @@ def _write(fid, data, kind, data_size, FIFFT_TYPE, dtype):
     fid.write(np.array(data, dtype=dtype).tobytes())
 
 
-def _get_split_size(split_size):
-    """Convert human-readable bytes to machine-readable bytes."""
-    if isinstance(split_size, str):
-        exp = dict(MB=20, GB=30).get(split_size[-2:], None)
+def _get_size_bytes(size, name):
+    """Convert human-readable bytes (e.g., "10MB" or "2GB") to bytes."""
+    if isinstance(size, str):
+        exp = dict(MB=20, GB=30).get(size[-2:], None)
         if exp is None:
-            raise ValueError('split_size has to end with either "MB" or "GB"')
-        split_size = int(float(split_size[:-2]) * 2**exp)
+            raise ValueError(
+                f'{name} has to end with either "MB" or "GB", got {size!r}'
+            )
+        size = int(float(size[:-2]) * 2**exp)
+    return size
+
 
+def _get_split_size(split_size):
+    """Convert human-readable bytes to machine-readable bytes."""
+    split_size = _get_size_bytes(split_size, "split_size")
     if split_size > 2147483648:
         raise ValueError("split_size cannot be larger than 2GB")
     return split_size
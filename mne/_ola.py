@@ -2,6 +2,8 @@
 # License: BSD-3-Clause
 # Copyright the MNE-Python contributors.
 
+from collections import deque
+
 import numpy as np
 from scipy.signal import get_window
 
@@ -476,3 +478,73 @@ class _Storer:
         for o1, o2 in zip(self.outs, outs):
             o1[idx] = o2
         self.idx = stop
+
+
+class _QueueStorer(_Storer):
+    """Store data into queued chunks, releasing them once fully stored.
+
+    This is useful for streaming processing, where the input chunks are
+    provided with :meth:`push` and the chunks whose samples have all been
+    stored by a :class:`_COLA` instance can be retrieved with :meth:`pop`.
+    """
+
+    def __init__(self, picks=None):
+        self.outs = None
+        self.idx = 0
+        self.picks = picks
+        self._chunks = deque()
+        self._n_pushed = 0
+        self._n_popped = 0
+
+    def push(self, data):
+        """Add a chunk whose picked data will be overwritten."""
+        if not isinstance(data, np.ndarray) or data.ndim < 1:
+            raise TypeError(f"data must be >= 1D ndarray, got {type(data)}")
+        self._chunks.append(data)
+        self._n_pushed += data.shape[-1]
+
+    def __call__(self, *outs):
+        if len(outs) != 1:
+            raise ValueError(f"Can only queue a single output, got {len(outs)}")
+        out = outs[0]
+        stop = self.idx + out.shape[-1]
+        if stop > self._n_pushed:
+            raise RuntimeError(
+                f"Cannot store samples {self.idx}:{stop}, only {self._n_pushed} "
+                "samples have been pushed"
+            )
+        c_start = self._n_popped
+        for chunk in self._chunks:
+            c_stop = c_start + chunk.shape[-1]
+            lo, hi = max(c_start, self.idx), min(c_stop, stop)
+            if lo < hi:
+                idx = (Ellipsis,)
+                if self.picks is not None:
+                    idx += (self.picks,)
+                idx += (slice(lo - c_start, hi - c_start),)
+                chunk[idx] = out[..., lo - self.idx : hi - self.idx]
+            c_start = c_stop
+        self.idx = stop
+
+    def pop(self):
+        """Get (and remove) the fully stored samples."""
+        ready = list()
+        while self._chunks and self._n_popped < self.idx:
+            chunk = self._chunks[0]
+            n_use = min(chunk.shape[-1], self.idx - self._n_popped)
+            ready.append(chunk[..., :n_use])
+            if n_use == chunk.shape[-1]:
+                self._chunks.popleft()
+            else:
+                self._chunks[0] = chunk[..., n_use:]
+            self._n_popped += n_use
+        if len(ready) == 1:
+            return ready[0]
+        elif len(ready) == 0:
+            return None
+        return np.concatenate(ready, axis=-1)
+
+    @property
+    def n_pending(self):
+        """The number of samples pushed but not yet popped."""
+        return self._n_pushed - self._n_popped
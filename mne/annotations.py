@@ -242,6 +242,80 @@ def _ndarray_ch_names(ch_names):
     return out
 
 
+class _AnnotationsIndex:
+    """Find the annotations overlapping many segments at once.
+
+    The index keeps a copy of the annotations it was made from, so that
+    changes of the (public) arrays in place can be detected.
+    """
+
+    def __init__(self, annotations):
+        self.onset = annotations.onset.copy()
+        self.duration = annotations.duration.copy()
+        self.description = annotations.description.copy()
+        self._masks = dict()
+
+    def matches(self, annotations):
+        """Check whether the annotations are still the same."""
+        return (
+            np.array_equal(self.onset, annotations.onset)
+            and np.array_equal(self.duration, annotations.duration, equal_nan=True)
+            and np.array_equal(self.description, annotations.description)
+        )
+
+    def kind_mask(self, kinds):
+        """Get the annotations starting with any of the kinds (any case)."""
+        kinds = tuple(kind.upper() for kind in kinds)
+        if kinds not in self._masks:
+            description = np.char.upper(self.description.astype(str))
+            mask = np.zeros(len(description), bool)
+            for kind in kinds:
+                mask |= np.char.startswith(description, kind)
+            self._masks[kinds] = mask
+        return self._masks[kinds]
+
+    def first_overlap(self, kinds, tmin, tmax, offset=0.0):
+        """Get the first annotation of the kinds overlapping each segment.
+
+        Parameters
+        ----------
+        kinds : tuple of str
+            The beginnings of the descriptions of the annotations to use.
+        tmin, tmax : array, shape (n_segments,)
+            The start and end of the segments (in seconds). An annotation
+            overlaps a segment if it starts before tmax and ends after tmin.
+        offset : float
+            The time of the first sample in the time base of the annotations.
+
+        Returns
+        -------
+        idx : array of int, shape (n_segments,)
+            The index of the first overlapping annotation, -1 if there is none.
+        """
+        tmin, tmax = np.atleast_1d(tmin, tmax)
+        idx = np.flatnonzero(self.kind_mask(kinds))
+        out = np.full(len(tmin), -1)
+        if len(idx) == 0:
+            return out
+        onset = self.onset[idx] - offset
+        end = onset + self.duration[idx]
+        end[np.isnan(end)] = -np.inf
+        if np.any(np.diff(onset) < 0):  # unsorted by changes in place
+            for ii, (this_tmin, this_tmax) in enumerate(zip(tmin, tmax)):
+                hits = np.flatnonzero((onset < this_tmax) & (end > this_tmin))
+                if len(hits):
+                    out[ii] = idx[hits[0]]
+            return out
+        # the annotations that start before tmax come first, and the first of
+        # them that ends after tmin is the first at which the running maximum
+        # of the ends exceeds tmin
+        n_before = np.searchsorted(onset, tmax, side="left")
+        first = np.searchsorted(np.maximum.accumulate(end), tmin, side="right")
+        overlap = first < n_before
+        out[overlap] = idx[first[overlap]]
+        return out
+
+
 @fill_doc
 class Annotations:
     """Annotation object for annotating segments of raw data.
@@ -712,6 +786,13 @@ class Annotations:
         """
         return deepcopy(self)
 
+    def _get_index(self):
+        """Get the index for finding overlapping annotations (cached)."""
+        index = getattr(self, "_index", None)
+        if index is None or not index.matches(self):
+            index = self._index = _AnnotationsIndex(self)
+        return index
+
     def delete(self, idx):
         """Remove an annotation. Operates inplace.
 
@@ -721,6 +802,7 @@ class Annotations:
             Index of the annotation to remove. Can be array-like to
             remove multiple indices.
         """
+        self._index = None
         self._onset = np.delete(self._onset, idx)
         self._duration = np.delete(self._duration, idx)
         self._description = np.delete(self._description, idx)
@@ -861,6 +943,7 @@ class Annotations:
         # the onset-then-duration hierarchy
         vals = sorted(zip(self.onset, self.duration, range(len(self))))
         order = list(list(zip(*vals))[-1]) if len(vals) else []
+        self._index = None
         self._onset = self._onset[order]
         self._duration = self._duration[order]
         self._description = self._description[order]
@@ -969,6 +1052,7 @@ class Annotations:
                 ch_names.append(ch)
                 extras.append(extra)
         logger.debug(f"Cropping complete (kept {len(onsets)})")
+        self._index = None
         self._onset = np.array(onsets, float)
         self._duration = np.array(durations, float)
         assert (self._duration >= 0).all()
@@ -1814,11 +1898,7 @@ def _annotations_starts_stops(raw, kinds, name="skip_by_annotation", invert=Fals
     if len(raw.annotations) == 0:
         onsets, ends = np.array([], int), np.array([], int)
     else:
-        idxs = [
-            idx
-            for idx, desc in enumerate(raw.annotations.description)
-            if any(desc.upper().startswith(kind.upper()) for kind in kinds)
-        ]
+        idxs = raw.annotations._get_index().kind_mask(kinds)
         # onsets are already sorted
         onsets = raw.annotations.onset[idxs]
         onsets = _sync_onset(raw, onsets)
@@ -1829,10 +1909,7 @@ def _annotations_starts_stops(raw, kinds, name="skip_by_annotation", invert=Fals
     if invert:
         # We need to eliminate overlaps here, otherwise wacky things happen,
         # so we carefully invert the relationship
-        mask = np.zeros(len(raw.times), bool)
-        for onset, end in zip(onsets, ends):
-            mask[onset:end] = True
-        mask = ~mask
+        mask = ~_intervals_to_mask(onsets, ends, len(raw.times))
         extras = onsets == ends
         extra_onsets, extra_ends = onsets[extras], ends[extras]
         onsets, ends = _mask_to_onsets_offsets(mask)
@@ -1846,6 +1923,15 @@ def _annotations_starts_stops(raw, kinds, name="skip_by_annotation", invert=Fals
     return onsets, ends
 
 
+def _intervals_to_mask(onsets, ends, n_times):
+    """Get the samples within any of the intervals [onset, end)."""
+    onsets, ends = np.clip(onsets, 0, n_times), np.clip(ends, 0, n_times)
+    keep = onsets < ends
+    count = np.bincount(onsets[keep], minlength=n_times + 1)
+    count -= np.bincount(ends[keep], minlength=n_times + 1)
+    return np.cumsum(count[:n_times]) > 0
+
+
 def _write_annotations(fid, annotations):
     """Write annotations."""
     start_block(fid, FIFF.FIFFB_MNE_ANNOTATIONS)
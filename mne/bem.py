@@ -16,6 +16,7 @@ from functools import partial
 from pathlib import Path
 
 import numpy as np
+from scipy import linalg, sparse
 from scipy.optimize import fmin_cobyla
 
 from ._fiff._digitization import _dig_kind_dict, _dig_kind_ints, _dig_kind_rev
@@ -33,11 +34,10 @@ from ._fiff.write import (
     write_int_matrix,
     write_string,
 )
-from .fixes import _compare_version, _safe_svd
+from .fixes import _compare_version, _reshape_view, _safe_svd, has_numba, jit, prange
 from .surface import (
     _complete_sphere_surf,
     _compute_nearest,
-    _fast_cross_nd_sum,
     _get_ico_surface,
     _get_solids,
     complete_surface_info,
@@ -117,34 +117,56 @@ class ConductorModel(dict):
         return None if len(self["layers"]) == 0 else self["layers"][-1]["rad"]
 
 
+_LIN_POT_BLOCK_BYTES = 2**18  # size of each temporary array in _lin_pot_coeff
+
+
 def _calc_beta(rk, rk_norm, rk1, rk1_norm):
     """Compute coefficients for calculating the magic vector omega."""
-    rkk1 = rk1[0] - rk[0]
-    size = np.linalg.norm(rkk1)
-    rkk1 /= size
-    num = rk_norm + np.dot(rk, rkk1)
-    den = rk1_norm + np.dot(rk1, rkk1)
+    # rk and rk1 are lists of the x, y, and z components
+    rkk1 = [c1[:, :1] - c[:, :1] for c, c1 in zip(rk, rk1)]
+    size = np.sqrt(_dot3(rkk1, rkk1))
+    rkk1 = [c / size for c in rkk1]
+    num = rk_norm + _dot3(rk, rkk1)
+    den = rk1_norm + _dot3(rk1, rkk1)
     res = np.log(num / den) / size
     return res
 
 
+def _dot3(a, b):
+    return a[0] * b[0] + a[1] * b[1] + a[2] * b[2]
+
+
+def _cross3(a, b):
+    return [
+        a[1] * b[2] - a[2] * b[1],
+        a[2] * b[0] - a[0] * b[2],
+        a[0] * b[1] - a[1] * b[0],
+    ]
+
+
 def _lin_pot_coeff(fros, tri_rr, tri_nn, tri_area):
-    """Compute the linear potential matrix element computations."""
-    omega = np.zeros((len(fros), 3))
+    """Compute the linear potential matrix elements for a block of triangles.
+
+    Returns omega with shape (n_tri, 3, n_fro), the coefficients of each triangle
+    vertex for each field point.
+    """
+    omega = np.zeros((len(tri_rr), 3, len(fros)))
 
     # we replicate a little bit of the _get_solids code here for speed
-    # (we need some of the intermediate values later)
-    v1 = tri_rr[np.newaxis, 0, :] - fros
-    v2 = tri_rr[np.newaxis, 1, :] - fros
-    v3 = tri_rr[np.newaxis, 2, :] - fros
-    triples = _fast_cross_nd_sum(v1, v2, v3)
-    l1 = np.linalg.norm(v1, axis=1)
-    l2 = np.linalg.norm(v2, axis=1)
-    l3 = np.linalg.norm(v3, axis=1)
+    # (we need some of the intermediate values later); vectors are stored as
+    # lists of (n_tri, n_fro) arrays of their x, y, and z components
+    fros = fros.T
+    tri_rr = tri_rr[..., np.newaxis]
+    v1, v2, v3 = ([tri_rr[:, vi, ci] - fros[ci] for ci in range(3)] for vi in range(3))
+    cross = [_cross3(v2, v3), _cross3(v3, v1), _cross3(v1, v2)]
+    triples = _dot3(cross[2], v3)
+    l1 = np.sqrt(_dot3(v1, v1))
+    l2 = np.sqrt(_dot3(v2, v2))
+    l3 = np.sqrt(_dot3(v3, v3))
     ss = l1 * l2 * l3
-    ss += np.einsum("ij,ij,i->i", v1, v2, l3)
-    ss += np.einsum("ij,ij,i->i", v1, v3, l2)
-    ss += np.einsum("ij,ij,i->i", v2, v3, l1)
+    ss += _dot3(v1, v2) * l3
+    ss += _dot3(v1, v3) * l2
+    ss += _dot3(v2, v3) * l1
     solids = np.arctan2(triples, ss)
 
     # We *could* subselect the good points from v1, v2, v3, triples, solids,
@@ -159,31 +181,138 @@ def _lin_pot_coeff(fros, tri_rr, tri_nn, tri_area):
 
     # Calculate the magic vector vec_omega
     beta = [
-        _calc_beta(v1, l1, v2, l2)[:, np.newaxis],
-        _calc_beta(v2, l2, v3, l3)[:, np.newaxis],
-        _calc_beta(v3, l3, v1, l1)[:, np.newaxis],
+        _calc_beta(v1, l1, v2, l2),
+        _calc_beta(v2, l2, v3, l3),
+        _calc_beta(v3, l3, v1, l1),
+    ]
+    vec_omega = [
+        (beta[2] - beta[0]) * c1 + (beta[0] - beta[1]) * c2 + (beta[1] - beta[2]) * c3
+        for c1, c2, c3 in zip(v1, v2, v3)
     ]
-    vec_omega = (beta[2] - beta[0]) * v1
-    vec_omega += (beta[0] - beta[1]) * v2
-    vec_omega += (beta[1] - beta[2]) * v3
 
-    area2 = 2.0 * tri_area
+    area2 = 2.0 * tri_area[:, np.newaxis]
     n2 = 1.0 / (area2 * area2)
+    nn = [tri_nn[:, ci, np.newaxis] for ci in range(3)]
     # leave omega = 0 otherwise
     # Put it all together...
     yys = [v1, v2, v3]
     idx = [0, 1, 2, 0, 2]
     for k in range(3):
-        diff = yys[idx[k - 1]] - yys[idx[k + 1]]
-        zdots = _fast_cross_nd_sum(yys[idx[k + 1]], yys[idx[k - 1]], tri_nn)
+        diff = [a - b for a, b in zip(yys[idx[k - 1]], yys[idx[k + 1]])]
+        # cross[k] is yys[idx[k + 1]] x yys[idx[k - 1]]
+        zdots = _dot3(cross[k], nn)
         omega[:, k] = -n2 * (
-            area2 * zdots * 2.0 * solids - triples * (diff * vec_omega).sum(axis=-1)
+            area2 * zdots * 2.0 * solids - triples * _dot3(diff, vec_omega)
         )
     # omit the bad points from the solution
-    omega[bad_mask] = 0.0
+    omega.transpose(0, 2, 1)[bad_mask] = 0.0
     return omega
 
 
+def _lin_pot_coeff_submat(fros, tri_rr, tri_nn, tri_area, tris, same, submat):
+    """Subtract the linear potential coefficients of all triangles from submat."""
+    # Process blocks of triangles against all field points, and add the
+    # coefficients of a block to the columns of its vertices at once
+    n_block = max(_LIN_POT_BLOCK_BYTES // (8 * len(fros)), 1)
+    for start in range(0, len(tris), n_block):
+        sl = slice(start, start + n_block)
+        omega = _lin_pot_coeff(fros, tri_rr[sl], tri_nn[sl], tri_area[sl])
+        these_tris = tris[sl]
+        if same:
+            # No contribution from a triangle that this vertex belongs to
+            omega[np.arange(len(these_tris))[:, np.newaxis], :, these_tris] = 0.0
+        cols, inverse = np.unique(these_tris, return_inverse=True)
+        gather = sparse.csr_array(
+            (
+                np.ones(these_tris.size),
+                (inverse.ravel(), np.arange(these_tris.size)),
+            ),
+            shape=(len(cols), these_tris.size),
+        )
+        omega = _reshape_view(omega, (these_tris.size, len(fros)))
+        submat[:, cols] -= (gather @ omega).T
+
+
+@jit(parallel=True)
+def _lin_pot_coeff_rows(
+    fros, tri_rr, tri_nn, tri_area, tris, same, submat
+):  # pragma: no cover
+    """Compute the same as _lin_pot_coeff_submat one field point at a time.
+
+    Each field point (row of submat) is handled by one thread, with scalar
+    arithmetic for each triangle, which is much faster under numba (but much
+    slower as plain Python) than the array operations of _lin_pot_coeff.
+    """
+    bad_limit = np.pi / 1e6
+    for pi in prange(len(fros)):
+        fx, fy, fz = fros[pi, 0], fros[pi, 1], fros[pi, 2]
+        for ti in range(len(tris)):
+            t0, t1, t2 = tris[ti, 0], tris[ti, 1], tris[ti, 2]
+            if same and (t0 == pi or t1 == pi or t2 == pi):
+                # No contribution from a triangle that this vertex belongs to
+                continue
+            tr = tri_rr[ti]
+            v1x, v1y, v1z = tr[0, 0] - fx, tr[0, 1] - fy, tr[0, 2] - fz
+            v2x, v2y, v2z = tr[1, 0] - fx, tr[1, 1] - fy, tr[1, 2] - fz
+            v3x, v3y, v3z = tr[2, 0] - fx, tr[2, 1] - fy, tr[2, 2] - fz
+            # cross products used for the triple product and zdots
+            c12x = v1y * v2z - v1z * v2y
+            c12y = v1z * v2x - v1x * v2z
+            c12z = v1x * v2y - v1y * v2x
+            c23x = v2y * v3z - v2z * v3y
+            c23y = v2z * v3x - v2x * v3z
+            c23z = v2x * v3y - v2y * v3x
+            c31x = v3y * v1z - v3z * v1y
+            c31y = v3z * v1x - v3x * v1z
+            c31z = v3x * v1y - v3y * v1x
+            triple = c12x * v3x + c12y * v3y + c12z * v3z
+            l1 = np.sqrt(v1x * v1x + v1y * v1y + v1z * v1z)
+            l2 = np.sqrt(v2x * v2x + v2y * v2y + v2z * v2z)
+            l3 = np.sqrt(v3x * v3x + v3y * v3y + v3z * v3z)
+            ss = (
+                l1 * l2 * l3
+                + (v1x * v2x + v1y * v2y + v1z * v2z) * l3
+                + (v1x * v3x + v1y * v3y + v1z * v3z) * l2
+                + (v2x * v3x + v2y * v3y + v2z * v3z) * l1
+            )
+            solid = np.arctan2(triple, ss)
+            if abs(solid) < bad_limit:
+                continue
+            # Calculate the magic vector vec_omega
+            beta1 = _jit_calc_beta(v1x, v1y, v1z, l1, v2x, v2y, v2z, l2)
+            beta2 = _jit_calc_beta(v2x, v2y, v2z, l2, v3x, v3y, v3z, l3)
+            beta3 = _jit_calc_beta(v3x, v3y, v3z, l3, v1x, v1y, v1z, l1)
+            wx = (beta3 - beta1) * v1x + (beta1 - beta2) * v2x + (beta2 - beta3) * v3x
+            wy = (beta3 - beta1) * v1y + (beta1 - beta2) * v2y + (beta2 - beta3) * v3y
+            wz = (beta3 - beta1) * v1z + (beta1 - beta2) * v2z + (beta2 - beta3) * v3z
+            area2 = 2.0 * tri_area[ti]
+            n2 = 1.0 / (area2 * area2)
+            nx, ny, nz = tri_nn[ti, 0], tri_nn[ti, 1], tri_nn[ti, 2]
+            # vertex 0: diff = v3 - v2, zdots = (v2 x v3) . nn
+            zdots = c23x * nx + c23y * ny + c23z * nz
+            dw = (v3x - v2x) * wx + (v3y - v2y) * wy + (v3z - v2z) * wz
+            submat[pi, t0] += n2 * (area2 * zdots * 2.0 * solid - triple * dw)
+            # vertex 1: diff = v1 - v3, zdots = (v3 x v1) . nn
+            zdots = c31x * nx + c31y * ny + c31z * nz
+            dw = (v1x - v3x) * wx + (v1y - v3y) * wy + (v1z - v3z) * wz
+            submat[pi, t1] += n2 * (area2 * zdots * 2.0 * solid - triple * dw)
+            # vertex 2: diff = v2 - v1, zdots = (v1 x v2) . nn
+            zdots = c12x * nx + c12y * ny + c12z * nz
+            dw = (v2x - v1x) * wx + (v2y - v1y) * wy + (v2z - v1z) * wz
+            submat[pi, t2] += n2 * (area2 * zdots * 2.0 * solid - triple * dw)
+
+
+@jit()
+def _jit_calc_beta(rx, ry, rz, r_norm, r1x, r1y, r1z, r1_norm):  # pragma: no cover
+    """Compute _calc_beta for a single field point."""
+    dx, dy, dz = r1x - rx, r1y - ry, r1z - rz
+    size = np.sqrt(dx * dx + dy * dy + dz * dz)
+    dx, dy, dz = dx / size, dy / size, dz / size
+    num = r_norm + rx * dx + ry * dy + rz * dz
+    den = r1_norm + r1x * dx + r1y * dy + r1z * dz
+    return np.log(num / den) / size
+
+
 def _correct_auto_elements(surf, mat):
     """Improve auto-element approximation."""
     pi2 = 2.0 * np.pi
@@ -215,46 +344,33 @@ def _fwd_bem_lin_pot_coeff(surfs):
     np_tot = sum(nps)
     coeff = np.zeros((np_tot, np_tot))
     offsets = np.cumsum(np.concatenate(([0], nps)))
+    # with numba, threads work on different field points (rows), otherwise
+    # blocks of triangles are processed with array operations
+    fun = _lin_pot_coeff_rows if has_numba else _lin_pot_coeff_submat
     for si_1, surf1 in enumerate(surfs):
-        rr_ord = np.arange(nps[si_1])
         for si_2, surf2 in enumerate(surfs):
             logger.info(
                 f"        {_bem_surf_name[surf1['id']]} ({nps[si_1]:d}) -> "
                 f"{_bem_surf_name[surf2['id']]} ({nps[si_2]}) ..."
             )
-            tri_rr = surf2["rr"][surf2["tris"]]
-            tri_nn = surf2["tri_nn"]
-            tri_area = surf2["tri_area"]
             submat = coeff[
                 offsets[si_1] : offsets[si_1 + 1], offsets[si_2] : offsets[si_2 + 1]
             ]  # view
-            for k in range(surf2["ntri"]):
-                tri = surf2["tris"][k]
-                if si_1 == si_2:
-                    skip_idx = (
-                        (rr_ord == tri[0]) | (rr_ord == tri[1]) | (rr_ord == tri[2])
-                    )
-                else:
-                    skip_idx = list()
-                # No contribution from a triangle that
-                # this vertex belongs to
-                # if sidx1 == sidx2 and (tri == j).any():
-                #     continue
-                # Otherwise do the hard job
-                coeffs = _lin_pot_coeff(
-                    fros=surf1["rr"],
-                    tri_rr=tri_rr[k],
-                    tri_nn=tri_nn[k],
-                    tri_area=tri_area[k],
-                )
-                coeffs[skip_idx] = 0.0
-                submat[:, tri] -= coeffs
+            fun(
+                surf1["rr"],
+                surf2["rr"][surf2["tris"]],
+                surf2["tri_nn"],
+                surf2["tri_area"],
+                surf2["tris"],
+                si_1 == si_2,
+                submat,
+            )
             if si_1 == si_2:
                 _correct_auto_elements(surf1, submat)
     return coeff
 
 
-def _fwd_bem_multi_solution(solids, gamma, nps):
+def _fwd_bem_multi_solution(solids, gamma, nps, dtype=np.float64):
     """Do multi surface solution.
 
     * Invert I - solids/(2*M_PI)
@@ -275,13 +391,15 @@ def _fwd_bem_multi_solution(solids, gamma, nps):
             slice_j = slice(offsets[si_1], offsets[si_1 + 1])
             slice_k = slice(offsets[si_2], offsets[si_2 + 1])
             solids[slice_j, slice_k] = defl - solids[slice_j, slice_k] * mult
-    solids += np.eye(n_tot)
-    return np.linalg.inv(solids)
+    solids.flat[:: n_tot + 1] += 1.0
+    solids = solids.astype(dtype, copy=False)
+    # LU factorization and inversion in place (LAPACK getrf + getri)
+    return linalg.inv(solids, overwrite_a=True, check_finite=False)
 
 
-def _fwd_bem_homog_solution(solids, nps):
+def _fwd_bem_homog_solution(solids, nps, dtype=np.float64):
     """Make a homogeneous solution."""
-    return _fwd_bem_multi_solution(solids, gamma=None, nps=nps)
+    return _fwd_bem_multi_solution(solids, gamma=None, nps=nps, dtype=dtype)
 
 
 def _fwd_bem_ip_modify_solution(solution, ip_solution, ip_mult, n_tri):
@@ -322,28 +440,32 @@ def _check_complete_surface(surf, copy=False, incomplete="raise", extra=""):
     return surf
 
 
-def _fwd_bem_linear_collocation_solution(bem):
+def _fwd_bem_linear_collocation_solution(bem, dtype=np.float64):
     """Compute the linear collocation potential solution."""
     # first, add surface geometries
     logger.info("Computing the linear collocation solution...")
     logger.info("    Matrix coefficients...")
     coeff = _fwd_bem_lin_pot_coeff(bem["surfs"])
     bem["nsol"] = len(coeff)
-    logger.info("    Inverting the coefficient matrix...")
     nps = [surf["np"] for surf in bem["surfs"]]
-    bem["solution"] = _fwd_bem_multi_solution(coeff, bem["gamma"], nps)
+    ip_mult = None
     if len(bem["surfs"]) == 3:
         ip_mult = bem["sigma"][1] / bem["sigma"][2]
         if ip_mult <= FWD.BEM_IP_APPROACH_LIMIT:
-            logger.info("IP approach required...")
-            logger.info("    Matrix coefficients (homog)...")
-            coeff = _fwd_bem_lin_pot_coeff([bem["surfs"][-1]])
-            logger.info("    Inverting the coefficient matrix (homog)...")
-            ip_solution = _fwd_bem_homog_solution(coeff, [bem["surfs"][-1]["np"]])
-            logger.info(
-                "    Modify the original solution to incorporate IP approach..."
-            )
-            _fwd_bem_ip_modify_solution(bem["solution"], ip_solution, ip_mult, nps)
+            # The homogeneous coefficients of the inner skull are the last
+            # diagonal block, so keep them before the inversion destroys them
+            ip_coeff = coeff[-nps[-1] :, -nps[-1] :].copy()
+        else:
+            ip_mult = None
+    logger.info("    Inverting the coefficient matrix...")
+    bem["solution"] = _fwd_bem_multi_solution(coeff, bem["gamma"], nps, dtype)
+    del coeff
+    if ip_mult is not None:
+        logger.info("IP approach required...")
+        logger.info("    Inverting the coefficient matrix (homog)...")
+        ip_solution = _fwd_bem_homog_solution(ip_coeff, [nps[-1]], dtype)
+        logger.info("    Modify the original solution to incorporate IP approach...")
+        _fwd_bem_ip_modify_solution(bem["solution"], ip_solution, ip_mult, nps)
     bem["bem_method"] = FIFF.FIFFV_BEM_APPROX_LINEAR
     bem["solver"] = "mne"
 
@@ -395,7 +517,7 @@ def _fwd_bem_openmeeg_solution(bem):
 
 
 @verbose
-def make_bem_solution(surfs, *, solver="mne", verbose=None):
+def make_bem_solution(surfs, *, solver="mne", dtype="float64", verbose=None):
     """Create a BEM solution using the linear collocation approach.
 
     Parameters
@@ -407,6 +529,14 @@ def make_bem_solution(surfs, *, solver="mne", verbose=None):
         `OpenMEEG <https://openmeeg.github.io>`__ package.
 
         .. versionadded:: 1.2
+    dtype : str
+        The precision of the solution matrix, can be ``'float64'`` (default) or
+        ``'float32'``. Only used when ``solver='mne'``. With ``'float32'``, the
+        coefficient matrix is inverted in single precision, which is faster, and
+        the solution needs half the memory. The solution is stored in single
+        precision in FIF files regardless of this setting.
+
+        .. versionadded:: 1.13
     %(verbose)s
 
     Returns
@@ -428,6 +558,7 @@ def make_bem_solution(surfs, *, solver="mne", verbose=None):
     """
     _validate_type(solver, str, "solver")
     _check_option("method", solver.lower(), ("mne", "openmeeg"))
+    _check_option("dtype", dtype, ("float64", "float32"))
     bem = _ensure_bem_surfaces(surfs)
     _add_gamma_multipliers(bem)
     if len(bem["surfs"]) == 3:
@@ -443,7 +574,7 @@ def make_bem_solution(surfs, *, solver="mne", verbose=None):
         _fwd_bem_openmeeg_solution(bem)
     else:
         assert solver.lower() == "mne"
-        _fwd_bem_linear_collocation_solution(bem)
+        _fwd_bem_linear_collocation_solution(bem, np.dtype(dtype))
     logger.info("Solution ready.")
     logger.info("BEM geometry computations complete.")
     return bem
@@ -15,7 +15,7 @@ from .._fiff.pick import pick_channels, pick_info, pick_types
 from .._fiff.proj import _has_eeg_average_ref_proj, make_eeg_average_ref_proj
 from ..bem import _check_origin
 from ..surface import _normalize_vectors
-from ..utils import _validate_type, logger, verbose, warn
+from ..utils import _ContentCache, _validate_type, logger, verbose, warn
 
 
 def _calc_h(cosang, stiffness=4, n_legendre_terms=50):
@@ -31,11 +31,11 @@ def _calc_h(cosang, stiffness=4, n_legendre_terms=50):
     n_legendre_terms : int
         number of Legendre terms to evaluate.
     """
-    factors = [
-        (2 * n + 1) / (n ** (stiffness - 1) * (n + 1) ** (stiffness - 1) * 4 * np.pi)
-        for n in range(1, n_legendre_terms + 1)
-    ]
-    return legval(cosang, [0] + factors)
+    n = np.arange(1.0, n_legendre_terms + 1)
+    factors = (2 * n + 1) / (
+        n ** (stiffness - 1) * (n + 1) ** (stiffness - 1) * 4 * np.pi
+    )
+    return legval(cosang, np.concatenate([[0.0], factors]))
 
 
 def _calc_g(cosang, stiffness=4, n_legendre_terms=50):
@@ -56,11 +56,9 @@ def _calc_g(cosang, stiffness=4, n_legendre_terms=50):
     G : np.ndrarray of float, shape(n_channels, n_channels)
         The G matrix.
     """
-    factors = [
-        (2 * n + 1) / (n**stiffness * (n + 1) ** stiffness * 4 * np.pi)
-        for n in range(1, n_legendre_terms + 1)
-    ]
-    return legval(cosang, [0] + factors)
+    n = np.arange(1.0, n_legendre_terms + 1)
+    factors = (2 * n + 1) / (n**stiffness * (n + 1) ** stiffness * 4 * np.pi)
+    return legval(cosang, np.concatenate([[0.0], factors]))
 
 
 def _make_interpolation_matrix(pos_from, pos_to, alpha=1e-5):
@@ -122,6 +120,109 @@ def _make_interpolation_matrix(pos_from, pos_to, alpha=1e-5):
     return interpolation
 
 
+# Bad channel repair always interpolates between the channels of one montage,
+# so the spline system of all of its channels is set up (and inverted) once,
+# and the system of each partition into good and bad channels is obtained from
+# it with a rank-n_bad downdate. Partitions seen before (e.g., the same bads
+# in each run of a subject) are looked up directly.
+_spline_system_cache = _ContentCache("eeg_spline_system", maxsize=4)
+_spline_interpolation_cache = _ContentCache("eeg_spline_interpolation", maxsize=128)
+
+
+def _spline_system(pos, alpha):
+    """Get the G matrix and the inverted spline system of all positions."""
+
+    def compute():
+        pos_norm = pos.copy()
+        _normalize_vectors(pos_norm)
+        G = _calc_g(pos_norm @ pos_norm.T)
+        n_pos = len(G)
+        C = np.zeros((n_pos + 1, n_pos + 1))
+        C[:n_pos, :n_pos] = G
+        C.flat[: n_pos * (n_pos + 1) : n_pos + 2] += alpha
+        C[:n_pos, -1] = C[-1, :n_pos] = 1.0
+        return dict(G=G, C=C, C_inv=pinv(C))
+
+    return _spline_system_cache((pos, alpha), compute)
+
+
+def _make_partition_interpolation_matrix(pos, bads, alpha=1e-5):
+    """Compute the interpolation matrix from the good to the bad positions.
+
+    Equivalent to ``_make_interpolation_matrix(pos[~bads], pos[bads], alpha)``.
+
+    Parameters
+    ----------
+    pos : np.ndarray of float, shape(n_sensors, 3)
+        The positions of all sensors.
+    bads : np.ndarray of bool, shape(n_sensors,)
+        Which of the sensors to interpolate.
+    alpha : float
+        Regularization parameter. Defaults to 1e-5.
+
+    Returns
+    -------
+    interpolation : np.ndarray of float, shape(n_bad_sensors, n_good_sensors)
+        The (read-only) interpolation matrix that maps good signals to the
+        location of bad signals.
+    """
+    bads = np.asarray(bads, dtype=bool)
+    if not np.isfinite(pos).all() or not np.linalg.norm(pos, axis=1).all():
+        # invalid (e.g., NaN) positions must not enter the system of all sensors
+        return _make_interpolation_matrix(pos[~bads], pos[bads], alpha)
+
+    def compute():
+        system = _spline_system(pos, alpha)
+        keep, drop = np.append(~bads, True), np.append(bads, False)
+        # Inverse of the system of the good sensors, i.e., of the inverse of the
+        # full system with the bad rows and columns eliminated
+        C_inv = system["C_inv"]
+        C_inv_kd = C_inv[np.ix_(keep, drop)]
+        inv = C_inv[np.ix_(keep, keep)]
+        inv -= C_inv_kd @ np.linalg.solve(C_inv[np.ix_(drop, drop)], C_inv_kd.T)
+        G_to_from = np.ones((bads.sum(), keep.sum()))
+        G_to_from[:, :-1] = system["G"][np.ix_(bads, ~bads)]
+        interpolation = G_to_from @ inv
+        # One step of iterative refinement makes this as accurate as inverting
+        # the system of the good sensors directly
+        interpolation += (
+            G_to_from - interpolation @ system["C"][np.ix_(keep, keep)]
+        ) @ inv
+        return dict(interpolation=interpolation[:, :-1])
+
+    key = (pos, alpha, bads)
+    return _spline_interpolation_cache(key, compute)["interpolation"]
+
+
+def _interpolate_bads_eeg_epochs(data, pos, bads, alpha=1e-5):
+    """Interpolate EEG data in place with a different set of bads in each epoch.
+
+    Parameters
+    ----------
+    data : np.ndarray of float, shape(n_epochs, n_sensors, n_times)
+        The EEG data.
+    pos : np.ndarray of float, shape(n_sensors, 3)
+        The positions of the sensors relative to the center of the sphere.
+    bads : np.ndarray of bool, shape(n_epochs, n_sensors)
+        Which sensors to interpolate in each epoch.
+    alpha : float
+        Regularization parameter. Defaults to 1e-5.
+    """
+    bads = np.asarray(bads, dtype=bool)
+    assert bads.shape == data.shape[:2]
+    # epochs with the same bads share an interpolation matrix (and matmul)
+    patterns, inverse = np.unique(bads, axis=0, return_inverse=True)
+    inverse = inverse.ravel()
+    for pi, pattern in enumerate(patterns):
+        if not pattern.any():
+            continue
+        interpolation = _make_partition_interpolation_matrix(pos, pattern, alpha)
+        sel = np.where(inverse == pi)[0]
+        this_data = data[sel]
+        this_data[:, pattern] = np.matmul(interpolation, this_data[:, ~pattern])
+        data[sel] = this_data
+
+
 def _do_interp_dots(inst, interpolation, goods_idx, bads_idx):
     """Dot product of channel mapping matrix to channel data."""
     from ..epochs import BaseEpochs
@@ -155,7 +256,6 @@ def _interpolate_bads_eeg(inst, origin, exclude=None, ecog=False, verbose=None):
 
     # Make sure only EEG are used
     bads_idx_pos = bads_idx[picks]
-    goods_idx_pos = goods_idx[picks]
 
     # test spherical fit
     distance = np.linalg.norm(pos - origin, axis=-1)
@@ -166,12 +266,12 @@ def _interpolate_bads_eeg(inst, origin, exclude=None, ecog=False, verbose=None):
             "likely to be inaccurate."
         )
 
-    pos_good = pos[goods_idx_pos] - origin
-    pos_bad = pos[bads_idx_pos] - origin
-    logger.info(f"Computing interpolation matrix from {len(pos_good)} sensor positions")
-    interpolation = _make_interpolation_matrix(pos_good, pos_bad)
+    logger.info(
+        f"Computing interpolation matrix from {(~bads_idx_pos).sum()} sensor positions"
+    )
+    interpolation = _make_partition_interpolation_matrix(pos - origin, bads_idx_pos)
 
-    logger.info(f"Interpolating {len(pos_bad)} sensors")
+    logger.info(f"Interpolating {bads_idx_pos.sum()} sensors")
     _do_interp_dots(inst, interpolation, goods_idx, bads_idx)
 
 
@@ -14,7 +14,11 @@ from mne import Epochs, create_info, pick_channels, pick_types, read_events
 from mne._fiff.constants import FIFF
 from mne._fiff.proj import _has_eeg_average_ref_proj
 from mne.channels import make_dig_montage, make_standard_montage
-from mne.channels.interpolation import _make_interpolation_matrix
+from mne.channels.interpolation import (
+    _interpolate_bads_eeg_epochs,
+    _make_interpolation_matrix,
+    _make_partition_interpolation_matrix,
+)
 from mne.datasets import testing
 from mne.io import RawArray, read_raw_ctf, read_raw_fif, read_raw_nirx
 from mne.preprocessing.nirs import (
@@ -159,7 +163,7 @@ def test_interpolation_eeg(offset, avg_proj, ctol, atol, method):
         interpolation = _make_interpolation_matrix(pos_good, pos_bad)
         assert interpolation.shape == (1, len(epochs_eeg.ch_names) - 1)
         interp_manual = np.dot(interpolation, evoked_eeg_bad.data[goods_idx])
-        assert_array_equal(interp_manual, interp_zero)
+        assert_allclose(interp_manual, interp_zero, rtol=1e-7, atol=1e-12)
         del interp_manual, interpolation, pos, pos_good, pos_bad
     assert_allclose(ave_before, interp_zero, atol=atol)
     assert ctol[0] < np.corrcoef(ave_before, interp_zero)[0, 1] < ctol[1]
@@ -202,6 +206,52 @@ def test_interpolation_eeg(offset, avg_proj, ctol, atol, method):
     assert np.corrcoef(new_data, orig_data)[0, 1] > 0.2
 
 
+def test_interpolation_eeg_partitions():
+    """Test spherical spline interpolation from partitions of a montage."""
+    montage = make_standard_montage("biosemi64")
+    pos = np.array(list(montage.get_positions()["ch_pos"].values()))
+    pos -= (0.0, 0.0, 0.04)
+    rng = np.random.RandomState(0)
+    bads = np.zeros((20, len(pos)), bool)
+    for n_bad, this_bads in enumerate(bads[1:], 1):  # first epoch is all good
+        this_bads[rng.choice(len(pos), n_bad % 7 + 1, replace=False)] = True
+    for this_bads in bads[1:]:
+        want = _make_interpolation_matrix(pos[~this_bads], pos[this_bads])
+        got = _make_partition_interpolation_matrix(pos, this_bads)
+        assert_allclose(got, want, rtol=1e-8, atol=1e-10 * np.abs(want).max())
+        assert _make_partition_interpolation_matrix(pos, this_bads) is got
+    # a different set of bads in each epoch
+    bads[10:] = bads[:10]
+    data = rng.randn(len(bads), len(pos), 5)
+    want = data.copy()
+    for this_data, this_bads in zip(want, bads):
+        if this_bads.any():
+            interpolation = _make_interpolation_matrix(pos[~this_bads], pos[this_bads])
+            this_data[this_bads] = interpolation @ this_data[~this_bads]
+    _interpolate_bads_eeg_epochs(data, pos, bads)
+    assert_allclose(data, want, rtol=1e-7)
+    assert_array_equal(data[0], want[0])
+
+
+def test_interpolation_eeg_nan_position():
+    """Test that a bad EEG channel without position is interpolated as NaN."""
+    montage = make_standard_montage("biosemi64")
+    info = create_info(montage.ch_names, 256.0, "eeg")
+    data = np.random.RandomState(0).randn(len(info["ch_names"]), 100) * 1e-6
+    raw = RawArray(data, info)
+    raw.set_montage(montage)
+    raw.info["chs"][1]["loc"][:3] = np.nan
+    raw.info["bads"] = [raw.ch_names[1], raw.ch_names[5]]
+    want = _make_interpolation_matrix(
+        raw._get_channel_positions([0, 2, 3, 4] + list(range(6, 64))),
+        raw._get_channel_positions([5]),
+    )
+    raw.interpolate_bads(on_bad_position="ignore", origin=(0.0, 0.0, 0.0))
+    assert np.isnan(raw._data[1]).all()
+    assert np.isfinite(raw._data[5]).all()
+    assert_allclose(raw._data[5], want[0] @ np.delete(data, [1, 5], axis=0))
+
+
 @pytest.mark.slowtest
 def test_interpolation_meg():
     """Test interpolation of MEG channels."""
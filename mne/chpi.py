@@ -51,6 +51,7 @@ from .io import BaseRaw, RawArray
 from .io.ctf.trans import _make_ctf_coord_trans_set
 from .io.kit.constants import KIT
 from .io.kit.kit import RawKIT as _RawKIT
+from .parallel import parallel_func
 from .preprocessing.maxwell import (
     _get_mf_picks_fix_mags,
     _prep_mf_coils,
@@ -77,6 +78,7 @@ from .utils import (
     _pl,
     _validate_type,
     _verbose_safe_false,
+    array_split_idx,
     logger,
     use_log_level,
     verbose,
@@ -834,11 +836,7 @@ def _fit_chpi_amplitudes(raw, time_sl, hpi, snr=False):
             # loads hpi_stim channel
             chpi_data = raw[hpi["hpi_pick"], time_sl][0]
 
-        ons = (np.round(chpi_data).astype(np.int64) & hpi["on"][:, np.newaxis]).astype(
-            bool
-        )
-        n_on = ons.all(axis=-1).sum(axis=0)
-        if not (n_on >= 3).all():
+        if not _chpi_coils_on(chpi_data, hpi):
             return None
     if snr:
         return _fast_fit_snr(
@@ -858,6 +856,74 @@ def _fit_chpi_amplitudes(raw, time_sl, hpi, snr=False):
     )
 
 
+def _chpi_coils_on(chpi_data, hpi):
+    """Check if at least three cHPI coils are on for the entire window."""
+    ons = (np.round(chpi_data).astype(np.int64) & hpi["on"][:, np.newaxis]).astype(bool)
+    n_on = ons.all(axis=-1).sum(axis=0)
+    return (n_on >= 3).all()
+
+
+# Maximum size (in bytes) of the data windows stacked to fit cHPI amplitudes at once
+_CHPI_BATCH_BYTES = 2**26
+
+
+def _chpi_time_slice(midpt, hpi, n_times):
+    """Get the samples of the window centered at a given sample."""
+    start = midpt - hpi["n_window"] // 2
+    return slice(max(start, 0), min(start + hpi["n_window"], n_times))
+
+
+def _iter_chpi_amplitudes(raw, fit_idxs, hpi):
+    """Fit cHPI amplitudes for batches of windows (see _fit_chpi_amplitudes).
+
+    Yields arrays of shape (n_windows, n_freqs, n_channels), with all-nan entries
+    for windows that should be skipped.
+    """
+    n_batch = _CHPI_BATCH_BYTES // (8 * len(hpi["meg_picks"]) * hpi["n_window"])
+    n_batch = max(n_batch, 1)
+    for start in range(0, len(fit_idxs), n_batch):
+        time_sls = [
+            _chpi_time_slice(midpt, hpi, len(raw.times))
+            for midpt in fit_idxs[start : start + n_batch]
+        ]
+        yield _fit_chpi_amplitudes_batch(raw, time_sls, hpi)
+
+
+def _fit_chpi_amplitudes_batch(raw, time_sls, hpi):
+    """Fit amplitudes for many (overlapping) windows at once."""
+    n_freqs, n_window = len(hpi["freqs"]), hpi["n_window"]
+    sin_fits = np.full((len(time_sls), n_freqs, len(hpi["meg_picks"])), np.nan)
+    start, stop = time_sls[0].start, max(sl.stop for sl in time_sls)
+    with use_log_level(False):
+        # loads good channels and hpi_stim channel
+        data = raw[hpi["meg_picks"], start:stop][0]
+        if hpi["hpi_pick"] is not None:
+            chpi_data = raw[hpi["hpi_pick"], start:stop][0]
+    # The projection does not depend on the window, so apply it only once
+    data = hpi["proj_op"] @ data
+    use_idx, use_sls = list(), list()
+    for wi, time_sl in enumerate(time_sls):
+        this_sl = slice(time_sl.start - start, time_sl.stop - start)
+        if time_sl.stop - time_sl.start != n_window:  # first or last window
+            this_fit = _fit_chpi_amplitudes(raw, time_sl, hpi)
+            if this_fit is not None:
+                sin_fits[wi] = this_fit
+        elif hpi["hpi_pick"] is None or _chpi_coils_on(chpi_data[:, this_sl], hpi):
+            use_idx.append(wi)
+            use_sls.append(this_sl)
+    if not use_idx:
+        return sin_fits
+    # Fit the linear model to all windows with a single matrix multiply, then use
+    # (batched) SVDs across all sensors to estimate the sinusoid phases (see
+    # _fast_fit)
+    windows = np.array([data[:, sl] for sl in use_sls])
+    X = windows.reshape(-1, n_window) @ hpi["inv_model_reord"].T
+    X = X.reshape(len(use_idx), -1, n_freqs, 2).transpose(0, 2, 3, 1)
+    _, s, vt = np.linalg.svd(X, full_matrices=False)
+    sin_fits[use_idx] = vt[..., 0, :] * s[..., :1]
+    return sin_fits
+
+
 @jit()
 def _fast_fit(this_data, proj, n_freqs, model, inv_model_reord):
     # first or last window
@@ -1015,6 +1081,18 @@ def compute_head_pos(
     """
     _check_chpi_param(chpi_locs, "chpi_locs")
     _validate_type(info, Info, "info")
+    weighted = _check_weighted(weighted)
+    fitter = _setup_head_pos_fitting(info, adjust_dig=adjust_dig)
+    return _fit_head_pos(
+        chpi_locs,
+        fitter,
+        dist_limit=dist_limit,
+        gof_limit=gof_limit,
+        weighted=weighted,
+    )
+
+
+def _check_weighted(weighted):
     if weighted is None:
         warn(
             "The default for weighted will change from False to True in 1.14, set it "
@@ -1022,19 +1100,30 @@ def compute_head_pos(
             FutureWarning,
         )
         weighted = False
+    return weighted
+
+
+def _setup_head_pos_fitting(info, *, adjust_dig):
+    """Set up the head position fits."""
     hpi_dig_head_rrs = _get_hpi_initial_fit(info, adjust=adjust_dig, verbose="error")
-    n_coils = len(hpi_dig_head_rrs)
-    # reference inter-coil distances (rigid, so invariant to the dev_head_t we fit)
-    hpi_coil_dists = cdist(hpi_dig_head_rrs, hpi_dig_head_rrs)
     coil_dev_rrs = apply_trans(invert_transform(info["dev_head_t"]), hpi_dig_head_rrs)
     dev_head_t = info["dev_head_t"]["trans"]
-    pos_0 = dev_head_t[:3, 3]
     last = dict(
         quat_fit_time=-0.1,
         coil_dev_rrs=coil_dev_rrs,
         quat=np.concatenate([rot_to_quat(dev_head_t[:3, :3]), dev_head_t[:3, 3]]),
     )
-    del coil_dev_rrs
+    return dict(hpi_dig_head_rrs=hpi_dig_head_rrs, pos_0=dev_head_t[:3, 3], last=last)
+
+
+def _fit_head_pos(chpi_locs, fitter, *, dist_limit, gof_limit, weighted):
+    """Fit head positions, continuing from the last fit of the fitter."""
+    hpi_dig_head_rrs, pos_0, last = (
+        fitter[key] for key in ("hpi_dig_head_rrs", "pos_0", "last")
+    )
+    n_coils = len(hpi_dig_head_rrs)
+    # reference inter-coil distances (rigid, so invariant to the dev_head_t we fit)
+    hpi_coil_dists = cdist(hpi_dig_head_rrs, hpi_dig_head_rrs)
     quats = []
     for fit_time, this_coil_dev_rrs, g_coils in zip(
         *(chpi_locs[key] for key in ("times", "rrs", "gofs"))
@@ -1284,6 +1373,25 @@ def compute_chpi_amplitudes(
     )
 
 
+def _get_chpi_fit_idxs(raw, hpi, t_step_min, tmin, tmax):
+    """Get the center samples and times of the cHPI fitting windows."""
+    tmin, tmax = raw._tmin_tmax_to_start_stop(tmin, tmax)
+    tmin = tmin / raw.info["sfreq"]
+    tmax = tmax / raw.info["sfreq"]
+    need_win = hpi["t_window"] / 2.0
+    fit_idxs = raw.time_as_index(
+        np.arange(tmin + need_win, tmax, t_step_min), use_rounding=True
+    )
+    logger.info(
+        f"Fitting {len(hpi['freqs'])} HPI coil locations at up to "
+        f"{len(fit_idxs)} time points ({tmax - tmin:.1f} s duration)"
+    )
+    times = (
+        np.round(fit_idxs + raw.first_samp - hpi["n_window"] / 2.0) / raw.info["sfreq"]
+    )
+    return fit_idxs, times
+
+
 def _compute_chpi_amp_or_snr(
     raw,
     t_step_min=0.01,
@@ -1301,23 +1409,10 @@ def _compute_chpi_amp_or_snr(
     amplitude.
     """
     hpi = _setup_hpi_amplitude_fitting(raw.info, t_window, ext_order=ext_order)
-    tmin, tmax = raw._tmin_tmax_to_start_stop(tmin, tmax)
-    tmin = tmin / raw.info["sfreq"]
-    tmax = tmax / raw.info["sfreq"]
-    need_win = hpi["t_window"] / 2.0
-    fit_idxs = raw.time_as_index(
-        np.arange(tmin + need_win, tmax, t_step_min), use_rounding=True
-    )
-    logger.info(
-        f"Fitting {len(hpi['freqs'])} HPI coil locations at up to "
-        f"{len(fit_idxs)} time points ({tmax - tmin:.1f} s duration)"
-    )
-    del tmin, tmax
+    fit_idxs, times = _get_chpi_fit_idxs(raw, hpi, t_step_min, tmin, tmax)
     sin_fits = dict()
     sin_fits["proj"] = hpi["proj"]
-    sin_fits["times"] = (
-        np.round(fit_idxs + raw.first_samp - hpi["n_window"] / 2.0) / raw.info["sfreq"]
-    )
+    sin_fits["times"] = times
     n_times = len(sin_fits["times"])
     n_freqs = len(hpi["freqs"])
     n_chans = len(sin_fits["proj"]["data"]["col_names"])
@@ -1332,37 +1427,41 @@ def _compute_chpi_amp_or_snr(
                     cols = 1 if key == "resid" else n_freqs
                     sin_fits[f"{ch_type}_{key}"] = np.empty((n_times, cols))
     else:
+        # Fit amplitudes for each channel from each of the N sinusoids, for many
+        # windows at once
         sin_fits["slopes"] = np.empty((n_times, n_freqs, n_chans))
-    message = f"cHPI {'SNRs' if snr else 'amplitudes'}"
-    for mi, midpt in enumerate(ProgressBar(fit_idxs, mesg=message)):
+        pb = ProgressBar(n_times, mesg="cHPI amplitudes")
+        mi = 0
+        for slopes in _iter_chpi_amplitudes(raw, fit_idxs, hpi):
+            sin_fits["slopes"][mi : mi + len(slopes)] = slopes
+            mi += len(slopes)
+            pb.update(mi)
+        return sin_fits
+    for mi, midpt in enumerate(ProgressBar(fit_idxs, mesg="cHPI SNRs")):
         #
         # 0. determine samples to fit.
         #
-        time_sl = midpt - hpi["n_window"] // 2
-        time_sl = slice(max(time_sl, 0), min(time_sl + hpi["n_window"], len(raw.times)))
+        time_sl = _chpi_time_slice(midpt, hpi, len(raw.times))
 
         #
         # 1. Fit amplitudes for each channel from each of the N sinusoids
         #
         amps_or_snrs = _fit_chpi_amplitudes(raw, time_sl, hpi, snr)
-        if snr:
-            if amps_or_snrs is None:
-                amps_or_snrs = np.full((n_freqs, grad_offset + 3), np.nan)
-            # unpack the SNR estimates. mag & grad are returned in one array
-            # (because of Numba) so take care with which column is which.
-            # note that mean residual is a scalar (same for all HPI freqs) but
-            # is returned as a (tiled) vector (again, because Numba) so that's
-            # why below we take amps_or_snrs[0, 2] instead of [:, 2]
-            if "mag" in ch_types:
-                sin_fits["mag_snr"][mi] = amps_or_snrs[:, 0]  # SNR
-                sin_fits["mag_power"][mi] = amps_or_snrs[:, 1]  # mean power
-                sin_fits["mag_resid"][mi] = amps_or_snrs[0, 2]  # mean resid
-            if "grad" in ch_types:
-                sin_fits["grad_snr"][mi] = amps_or_snrs[:, grad_offset]
-                sin_fits["grad_power"][mi] = amps_or_snrs[:, grad_offset + 1]
-                sin_fits["grad_resid"][mi] = amps_or_snrs[0, grad_offset + 2]
-        else:
-            sin_fits["slopes"][mi] = amps_or_snrs
+        if amps_or_snrs is None:
+            amps_or_snrs = np.full((n_freqs, grad_offset + 3), np.nan)
+        # unpack the SNR estimates. mag & grad are returned in one array
+        # (because of Numba) so take care with which column is which.
+        # note that mean residual is a scalar (same for all HPI freqs) but
+        # is returned as a (tiled) vector (again, because Numba) so that's
+        # why below we take amps_or_snrs[0, 2] instead of [:, 2]
+        if "mag" in ch_types:
+            sin_fits["mag_snr"][mi] = amps_or_snrs[:, 0]  # SNR
+            sin_fits["mag_power"][mi] = amps_or_snrs[:, 1]  # mean power
+            sin_fits["mag_resid"][mi] = amps_or_snrs[0, 2]  # mean resid
+        if "grad" in ch_types:
+            sin_fits["grad_snr"][mi] = amps_or_snrs[:, grad_offset]
+            sin_fits["grad_power"][mi] = amps_or_snrs[:, grad_offset + 1]
+            sin_fits["grad_resid"][mi] = amps_or_snrs[0, grad_offset + 2]
     return sin_fits
 
 
@@ -1374,6 +1473,7 @@ def compute_chpi_locs(
     too_close="raise",
     adjust_dig=False,
     *,
+    n_jobs=None,
     verbose=None,
 ):
     """Compute locations of each cHPI coils over time.
@@ -1389,6 +1489,12 @@ def compute_chpi_locs(
         How to handle HPI positions too close to the sensors,
         can be ``'raise'`` (default), ``'warning'``, or ``'info'``.
     %(adjust_dig_chpi)s
+    %(n_jobs)s
+        The time points to fit are split into ``n_jobs`` consecutive chunks.
+        Within each chunk, each fit starts from the previous coil locations, so
+        the results can differ (slightly) depending on ``n_jobs``.
+
+        .. versionadded:: 1.13
     %(verbose)s
 
     Returns
@@ -1424,9 +1530,20 @@ def compute_chpi_locs(
     _check_chpi_param(chpi_amplitudes, "chpi_amplitudes")
     _validate_type(info, Info, "info")
     _validate_type(info["dev_head_t"], Transform, "info['dev_head_t']")
-    sin_fits = chpi_amplitudes  # use the old name below
-    del chpi_amplitudes
-    proj = sin_fits["proj"]
+    fitter = _setup_chpi_loc_fitting(
+        info, chpi_amplitudes["proj"], too_close=too_close, adjust_dig=adjust_dig
+    )
+    return _fit_chpi_locs(
+        chpi_amplitudes["times"],
+        chpi_amplitudes["slopes"],
+        fitter,
+        t_step_max=t_step_max,
+        n_jobs=n_jobs,
+    )
+
+
+def _setup_chpi_loc_fitting(info, proj, *, too_close, adjust_dig):
+    """Set up the magnetic dipole fits for cHPI coil locations."""
     meg_picks = pick_channels(info["ch_names"], proj["data"]["col_names"], ordered=True)
     info = pick_info(info, meg_picks)  # makes a copy
     with info._unlock():
@@ -1454,21 +1571,29 @@ def compute_chpi_locs(
     guesses = dict(rr=guesses, whitened_fwd_svd=fwd)
     del fwd, R
 
-    iter_ = list(zip(sin_fits["times"], sin_fits["slopes"]))
-    chpi_locs = dict(times=[], rrs=[], gofs=[], moments=[])
     # setup last iteration structure
     hpi_dig_dev_rrs = apply_trans(
         invert_transform(info["dev_head_t"])["trans"],
         _get_hpi_initial_fit(info, adjust=adjust_dig),
     )
-    last = dict(
-        sin_fit=None,
-        coil_fit_time=sin_fits["times"][0] - 1,
-        coil_dev_rrs=hpi_dig_dev_rrs,
+    last = dict(sin_fit=None, coil_fit_time=None, coil_dev_rrs=hpi_dig_dev_rrs)
+    return dict(
+        meg_coils=meg_coils,
+        whitener=whitener,
+        guesses=guesses,
+        too_close=too_close,
+        last=last,
     )
-    n_hpi = len(hpi_dig_dev_rrs)
-    del hpi_dig_dev_rrs
-    for fit_time, sin_fit in ProgressBar(iter_, mesg="cHPI locations "):
+
+
+def _fit_chpi_locs(times, slopes, fitter, *, t_step_max, n_jobs=None, progress=True):
+    """Fit cHPI coil locations, continuing from the last fit of the fitter."""
+    last = fitter["last"]
+    n_hpi = len(last["coil_dev_rrs"])
+    # Determine which windows to fit first, as this only depends on how much the
+    # amplitudes changed since the last window that was fit (not on the fits)
+    fit_idx = list()
+    for ti, (fit_time, sin_fit) in enumerate(zip(times, slopes)):
         # skip this window if bad
         if not np.isfinite(sin_fit).all():
             continue
@@ -1486,25 +1611,40 @@ def compute_chpi_locs(
             ):
                 # don't need to refit data
                 continue
-
-        # update 'last' sin_fit *before* inplace sign mult
         last["sin_fit"] = sin_fit.copy()
-
-        #
-        # 2. Fit magnetic dipole for each coil to obtain coil positions
-        #    in device coordinates
-        #
-        coil_fits = [
-            _fit_magnetic_dipole(f, x0, too_close, whitener, meg_coils, guesses)
-            for f, x0 in zip(sin_fit, last["coil_dev_rrs"])
-        ]
-        rrs, gofs, moments = zip(*coil_fits)
-        chpi_locs["times"].append(fit_time)
-        chpi_locs["rrs"].append(rrs)
-        chpi_locs["gofs"].append(gofs)
-        chpi_locs["moments"].append(moments)
         last["coil_fit_time"] = fit_time
-        last["coil_dev_rrs"] = rrs
+        fit_idx.append(ti)
+    fit_idx = np.array(fit_idx, int)
+
+    #
+    # 2. Fit magnetic dipole for each coil to obtain coil positions
+    #    in device coordinates
+    #
+    chpi_locs = dict(times=times[fit_idx], rrs=[], gofs=[], moments=[])
+    parallel, p_fun, n_jobs = parallel_func(
+        _fit_chpi_locs_chunk, n_jobs, max_jobs=max(len(fit_idx), 1)
+    )
+    which_tqdm = None if progress else "off"
+    with ProgressBar(len(fit_idx), mesg="cHPI locations ", which_tqdm=which_tqdm) as pb:
+        out = parallel(
+            p_fun(
+                slopes[idx],
+                last["coil_dev_rrs"],
+                fitter["too_close"],
+                fitter["whitener"],
+                fitter["meg_coils"],
+                fitter["guesses"],
+                pb.subset(pb_idx),
+            )
+            for pb_idx, idx in array_split_idx(fit_idx, n_jobs)
+            if len(idx)
+        )
+    for rrs, gofs, moments in out:
+        chpi_locs["rrs"].extend(rrs)
+        chpi_locs["gofs"].extend(gofs)
+        chpi_locs["moments"].extend(moments)
+    if len(fit_idx):
+        last["coil_dev_rrs"] = chpi_locs["rrs"][-1]
     n_times = len(chpi_locs["times"])
     shapes = dict(
         times=(n_times,),
@@ -1517,6 +1657,159 @@ def compute_chpi_locs(
     return chpi_locs
 
 
+def _fit_chpi_locs_chunk(slopes, coil_dev_rrs, too_close, whitener, coils, guesses, pb):
+    """Fit coil locations for consecutive windows, starting from the previous fit."""
+    out = list()
+    for ii, sin_fit in enumerate(slopes):
+        coil_fits = [
+            _fit_magnetic_dipole(f, x0, too_close, whitener, coils, guesses)
+            for f, x0 in zip(sin_fit, coil_dev_rrs)
+        ]
+        out.append(tuple(zip(*coil_fits)))
+        coil_dev_rrs = out[-1][0]
+        pb.update(ii + 1)
+    return tuple(zip(*out))
+
+
+@verbose
+def iter_head_pos(
+    raw,
+    chunk_duration=10.0,
+    *,
+    t_step_min=0.01,
+    t_window="auto",
+    ext_order=1,
+    tmin=0,
+    tmax=None,
+    t_step_max=1.0,
+    too_close="raise",
+    dist_limit=0.005,
+    gof_limit=0.98,
+    adjust_dig=False,
+    weighted=True,
+    verbose=None,
+):
+    """Estimate head positions from cHPI chunk by chunk.
+
+    This combines :func:`~mne.chpi.compute_chpi_amplitudes`,
+    :func:`~mne.chpi.compute_chpi_locs`, and :func:`~mne.chpi.compute_head_pos`,
+    but only reads and processes ``chunk_duration`` seconds of data at a time and
+    yields the head positions of each chunk as soon as they are available, e.g.,
+    to monitor head movements during long recordings.
+
+    Parameters
+    ----------
+    raw : instance of Raw
+        Raw data with cHPI information.
+    chunk_duration : float
+        Duration (in seconds) of the chunks of data to process at a time.
+    t_step_min : float
+        Minimum time step to use.
+    %(t_window_chpi_t)s
+    %(ext_order_chpi)s
+    %(tmin_raw)s
+    %(tmax_raw)s
+    t_step_max : float
+        Maximum time step to use.
+    too_close : str
+        How to handle HPI positions too close to the sensors,
+        can be ``'raise'`` (default), ``'warning'``, or ``'info'``.
+    dist_limit : float
+        Minimum distance (m) to accept for coil position fitting.
+    gof_limit : float
+        Minimum goodness of fit to accept for each coil.
+    %(adjust_dig_chpi)s
+    weighted : bool
+        See :func:`~mne.chpi.compute_head_pos`. Unlike there, the default is
+        ``True``.
+    %(verbose)s
+
+    Returns
+    -------
+    head_pos : generator
+        Generator yielding one array of shape (n_pos, 10) for each chunk, with
+        the MaxFilter-formatted head position parameters estimated in that chunk
+        (see :func:`~mne.chpi.compute_head_pos`). ``n_pos`` can be zero.
+
+    See Also
+    --------
+    compute_chpi_amplitudes
+    compute_chpi_locs
+    compute_head_pos
+
+    Notes
+    -----
+    Concatenating the yielded arrays gives the same head positions as calling
+    :func:`~mne.chpi.compute_chpi_amplitudes`, :func:`~mne.chpi.compute_chpi_locs`
+    (with ``n_jobs=1``), and :func:`~mne.chpi.compute_head_pos` in sequence with
+    the same parameters. A chunk contains the positions of the windows that end
+    within it, so only data up to the end of the chunk are read.
+
+    .. versionadded:: 1.13
+    """
+    _validate_type(raw, BaseRaw, "raw")
+    _validate_type(chunk_duration, "numeric", "chunk_duration")
+    if chunk_duration <= 0:
+        raise ValueError(f"chunk_duration must be positive, got {chunk_duration}")
+    _check_option("too_close", too_close, ["raise", "warning", "info"])
+    _validate_type(raw.info["dev_head_t"], Transform, "raw.info['dev_head_t']")
+    _validate_type(weighted, bool, "weighted")
+    hpi = _setup_hpi_amplitude_fitting(raw.info, t_window, ext_order=ext_order)
+    fit_idxs, times = _get_chpi_fit_idxs(raw, hpi, t_step_min, tmin, tmax)
+    loc_fitter = _setup_chpi_loc_fitting(
+        raw.info, hpi["proj"], too_close=too_close, adjust_dig=adjust_dig
+    )
+    pos_fitter = _setup_head_pos_fitting(raw.info, adjust_dig=adjust_dig)
+    # group the windows by the chunk in which they end
+    stops = [_chpi_time_slice(midpt, hpi, len(raw.times)).stop for midpt in fit_idxs]
+    n_chunk = max(int(round(chunk_duration * raw.info["sfreq"])), 1)
+    chunks = np.array(stops, int) // n_chunk
+    return _iter_head_pos(
+        raw,
+        hpi,
+        fit_idxs,
+        times,
+        chunks,
+        loc_fitter,
+        pos_fitter,
+        t_step_max=t_step_max,
+        dist_limit=dist_limit,
+        gof_limit=gof_limit,
+        weighted=weighted,
+    )
+
+
+def _iter_head_pos(
+    raw,
+    hpi,
+    fit_idxs,
+    times,
+    chunks,
+    loc_fitter,
+    pos_fitter,
+    *,
+    t_step_max,
+    dist_limit,
+    gof_limit,
+    weighted,
+):
+    for chunk in np.unique(chunks):
+        mask = chunks == chunk
+        slopes = np.concatenate(
+            list(_iter_chpi_amplitudes(raw, fit_idxs[mask], hpi)), axis=0
+        )
+        chpi_locs = _fit_chpi_locs(
+            times[mask], slopes, loc_fitter, t_step_max=t_step_max, progress=False
+        )
+        yield _fit_head_pos(
+            chpi_locs,
+            pos_fitter,
+            dist_limit=dist_limit,
+            gof_limit=gof_limit,
+            weighted=weighted,
+        )
+
+
 def _chpi_locs_to_times_dig(chpi_locs):
     """Reformat chpi_locs as list of dig (dict)."""
     dig = list()
@@ -2233,6 +2233,110 @@ def _regularized_covariance(
     return cov
 
 
+def _gram_covariance_ok(reg, method_params, info, rank):
+    """Check if _regularized_covariance_gram can replace _regularized_covariance."""
+    # Only the empirical and the (fixed) shrinkage estimators are functions of
+    # the Gram matrix, and the rank has to be known for all channel types
+    if method_params is not None or not isinstance(rank, dict):
+        return False
+    if isinstance(reg, str) and reg not in ("empirical", "shrinkage"):
+        return False
+    for ch_type, picks in _picks_by_type(
+        info, meg_combined=True, ref_meg=False, exclude="bads"
+    ):
+        if rank.get(ch_type, len(picks) + 1) > len(picks):
+            return False
+    return not info["bads"]
+
+
+def _regularized_covariance_gram(
+    grams,
+    n_samples,
+    reg=None,
+    info=None,
+    rank=None,
+    *,
+    log_ch_type=None,
+    log_rank=None,
+    cov_kind="",
+):
+    """Compute regularized covariances from the Gram matrices of data.
+
+    This gives the same result as :func:`_regularized_covariance` applied to
+    each ``data`` with ``data @ data.T == gram`` (when
+    :func:`_gram_covariance_ok` is True), but works on stacks of matrices.
+
+    Parameters
+    ----------
+    grams : ndarray, shape (..., n_channels, n_channels)
+        The Gram matrices (i.e., uncentered and unnormalized covariances).
+    n_samples : int
+        The number of time samples used to compute each Gram matrix.
+
+    Returns
+    -------
+    covs : ndarray, shape (..., n_channels, n_channels)
+        The covariance matrices.
+    """
+    _validate_type(reg, (str, "numeric", None))
+    if reg is None or reg == "empirical":
+        shrinkage = None
+    elif reg == "shrinkage":
+        method_params = _check_method_params(reg, None, name="reg")[1]
+        shrinkage = method_params["shrinkage"]["shrinkage"]
+    else:
+        shrinkage = float(reg)
+    name = "empirical" if shrinkage is None else "shrinkage"
+    shape = grams.shape
+    n_channels = shape[-1]
+    info = create_info(n_channels, 1000.0, "mag") if info is None else info
+    assert isinstance(rank, dict), type(rank)
+    scalings = _handle_default("scalings_cov_rank", None)
+    scales = np.ones(n_channels)
+    for ch_type, picks in _picks_by_type(info):
+        if ch_type in scalings:
+            scales[picks] = scalings[ch_type]
+    scales = np.outer(scales, scales)
+    grams = grams.reshape(-1, n_channels, n_channels) * scales
+    logger.info(
+        f"Estimating {cov_kind + (' ' if cov_kind else '')}"
+        f"covariance using {name.upper()}"
+    )
+    if sum(rank.values()) == n_channels:  # same short-circuit as _smart_eigh
+        covs = _shrink_gram(grams / n_samples, shrinkage)
+    else:
+        covs = np.empty_like(grams)
+        for gi, gram in enumerate(grams):
+            _, eigvec, mask = _smart_eigh(
+                gram,
+                info,
+                rank,
+                proj_subspace=True,
+                do_compute_rank=False,
+                log_ch_type=log_ch_type,
+                verbose=None if log_rank and gi == 0 else _verbose_safe_false(),
+            )
+            eigvec = eigvec[mask]
+            if log_rank and gi == 0:
+                logger.info(f"Reducing data rank from {len(mask)} -> {len(eigvec)}")
+            cov = _shrink_gram(eigvec @ gram @ eigvec.T / n_samples, shrinkage)
+            covs[gi] = eigvec.T @ cov @ eigvec
+    # undo bias and scaling
+    covs *= n_samples / max(n_samples - 1, 1) / scales
+    logger.info("Done.")
+    return covs.reshape(shape)
+
+
+def _shrink_gram(covs, shrinkage):
+    """Apply a fixed shrinkage like sklearn.covariance.shrunk_covariance (in place)."""
+    if shrinkage is not None:
+        mu = np.trace(covs, axis1=-2, axis2=-1) / covs.shape[-1]
+        covs *= 1.0 - shrinkage
+        idx = np.arange(covs.shape[-1])
+        covs[..., idx, idx] += shrinkage * mu[..., np.newaxis]
+    return covs
+
+
 @verbose
 def compute_whitener(
     noise_cov,
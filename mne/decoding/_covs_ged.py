@@ -7,17 +7,38 @@
 import numpy as np
 
 from .._fiff.meas_info import Info, create_info
-from .._fiff.pick import _picks_to_idx, pick_info
-from ..cov import Covariance, _compute_rank_raw_array, _regularized_covariance
+from .._fiff.pick import _picks_by_type, _picks_to_idx, pick_info
+from ..cov import (
+    Covariance,
+    _compute_rank_raw_array,
+    _gram_covariance_ok,
+    _regularized_covariance,
+    _regularized_covariance_gram,
+)
 from ..defaults import _handle_default
 from ..filter import filter_data
-from ..rank import compute_rank
+from ..rank import _estimate_rank_from_s, compute_rank
 from ..utils import _verbose_safe_false, logger
 
+_EPOCH_COVS_BYTES = 2**25  # size of the per-epoch covariances computed at once
+
 
 def _concat_cov(x_class, *, cov_kind, log_rank, reg, cov_method_params, info, rank):
     """Concatenate epochs before computing the covariance."""
-    _, n_channels, _ = x_class.shape
+    n_epochs, n_channels, n_times = x_class.shape
+
+    if _gram_covariance_ok(reg, cov_method_params, info, rank):
+        cov = _regularized_covariance_gram(
+            _concat_gram(x_class),
+            n_epochs * n_times,
+            reg=reg,
+            info=info,
+            rank=rank,
+            cov_kind=cov_kind,
+            log_rank=log_rank,
+            log_ch_type="data",
+        )
+        return cov, n_channels
 
     x_class = x_class.transpose(1, 0, 2).reshape(n_channels, -1)
     cov = _regularized_covariance(
@@ -34,6 +55,11 @@ def _concat_cov(x_class, *, cov_kind, log_rank, reg, cov_method_params, info, ra
     return cov, n_channels  # the weight here is just the number of channels
 
 
+def _concat_gram(X):
+    """Compute the Gram matrix of concatenated epochs."""
+    return np.tensordot(X, X, axes=([0, 2], [0, 2]))
+
+
 def _epoch_cov(x_class, *, cov_kind, log_rank, reg, cov_method_params, info, rank):
     """Mean of per-epoch covariances."""
     name = reg if isinstance(reg, str) else "empirical"
@@ -42,26 +68,85 @@ def _epoch_cov(x_class, *, cov_kind, log_rank, reg, cov_method_params, info, ran
         f"Estimating {cov_kind + (' ' if cov_kind else '')}"
         f"covariance (average over epochs; {name.upper()})"
     )
+    n_epochs, n_channels, _ = x_class.shape
+    n_block = max(_EPOCH_COVS_BYTES // (8 * n_channels**2), 1)
     cov = sum(
-        _regularized_covariance(
-            this_X,
+        _epoch_covs(
+            x_class[start : start + n_block],
             reg=reg,
-            method_params=cov_method_params,
-            rank=rank,
+            cov_method_params=cov_method_params,
             info=info,
+            rank=rank,
             cov_kind=cov_kind,
-            log_rank=log_rank and ii == 0,
-            log_ch_type="data",
+            log_rank=log_rank and start == 0,
             verbose=_verbose_safe_false(),
-        )
-        for ii, this_X in enumerate(x_class)
+        ).sum(0)
+        for start in range(0, n_epochs, n_block)
     )
-    cov /= len(x_class)
-    weight = len(x_class)
+    cov /= n_epochs
+    weight = n_epochs
 
     return cov, weight
 
 
+def _epoch_covs(
+    X, *, reg, cov_method_params, info, rank, cov_kind="", log_rank=False, verbose=None
+):
+    """Compute the regularized covariance of each epoch."""
+    n_epochs, n_channels, n_times = X.shape
+    info = create_info(n_channels, 1000.0, "mag") if info is None else info
+    if isinstance(rank, str):  # does not depend on the data
+        rank = _compute_rank_raw_array(
+            X[0], info, rank=rank, scalings=None, verbose=_verbose_safe_false()
+        )
+    picks_list = _picks_by_type(info, meg_combined=True, ref_meg=False, exclude="bads")
+    if rank is None and len(picks_list) == 1 and not info["projs"] and not info["bads"]:
+        # estimate the rank of all epochs at once, like _compute_rank would
+        # do it for each epoch separately
+        data = X
+        if n_times > 2 * n_channels:
+            data = np.linalg.qr(X.transpose(0, 2, 1), mode="r")
+        ranks = _estimate_rank_from_s(np.linalg.svd(data, compute_uv=False))
+        ch_type = picks_list[0][0]
+        groups = [({ch_type: int(r)}, ranks == r) for r in np.unique(ranks)]
+    else:
+        groups = [(rank, slice(None))]
+    if all(
+        _gram_covariance_ok(reg, cov_method_params, info, this_rank)
+        for this_rank, _ in groups
+    ):
+        covs = np.empty((n_epochs, n_channels, n_channels))
+        for gi, (this_rank, mask) in enumerate(groups):
+            X_ = X[mask]
+            covs[mask] = _regularized_covariance_gram(
+                X_ @ X_.transpose(0, 2, 1),
+                n_times,
+                reg=reg,
+                info=info,
+                rank=this_rank,
+                cov_kind=cov_kind,
+                log_rank=log_rank and gi == 0,
+                log_ch_type="data",
+            )
+        return covs
+    return np.array(
+        [
+            _regularized_covariance(
+                this_X,
+                reg=reg,
+                method_params=cov_method_params,
+                rank=rank,
+                info=info,
+                cov_kind=cov_kind,
+                log_rank=log_rank and ii == 0,
+                log_ch_type="data",
+                verbose=verbose,
+            )
+            for ii, this_X in enumerate(X)
+        ]
+    )
+
+
 def _handle_info_rank(X, info, rank):
     if info is None:
         # use mag instead of eeg to avoid the cov EEG projection warning
@@ -116,6 +201,86 @@ def _csp_estimate(X, y, reg, cov_method_params, cov_est, info, rank, norm_trace)
     return covs, C_ref, info, rank, dict(sample_weights=np.array(sample_weights))
 
 
+def _csp_partial_estimate(
+    X, y, state, *, reg, cov_method_params, cov_est, info, rank, norm_trace
+):
+    """Add epochs to the running CSP statistics and estimate the covariances."""
+    if "stats" not in state:
+        info, rank = _handle_info_rank(X, info, rank)
+        rank = _compute_rank_raw_array(
+            np.hstack(X),
+            info,
+            rank=rank,
+            scalings=None,
+            log_ch_type="data",
+            on_few_samples="ignore",
+        )
+        if cov_est == "concat" and not _gram_covariance_ok(
+            reg, cov_method_params, info, rank
+        ):
+            raise ValueError(
+                "partial_fit with cov_est='concat' requires reg to be None, "
+                "'empirical', 'shrinkage' or a float, cov_method_params to be None "
+                f"and no bad channels, got reg={repr(reg)}"
+            )
+        state.update(info=info, rank=rank, stats=dict())
+    info, rank, stats = state["info"], state["rank"], state["stats"]
+
+    # the concatenated data are summarized by their Gram matrix, the per-epoch
+    # covariances by their sum
+    for this_class in np.unique(y):
+        x_class = X[y == this_class]
+        if cov_est == "concat":
+            stat = _concat_gram(x_class)
+            weight = x_class.shape[0] * x_class.shape[2]
+        else:
+            cov, weight = _epoch_cov(
+                x_class,
+                cov_kind=f"class={this_class}",
+                log_rank=False,
+                reg=reg,
+                cov_method_params=cov_method_params,
+                info=info,
+                rank=rank,
+            )
+            stat = cov * weight
+        if this_class in stats:
+            stats[this_class][0] += stat
+            stats[this_class][1] += weight
+        else:
+            stats[this_class] = [stat, weight]
+
+    covs = []
+    sample_weights = []
+    for ci, this_class in enumerate(sorted(stats)):
+        stat, weight = stats[this_class]
+        if cov_est == "concat":
+            cov = _regularized_covariance_gram(
+                stat,
+                weight,
+                reg=reg,
+                info=info,
+                rank=rank,
+                cov_kind=f"class={this_class}",
+                log_rank=ci == 0,
+                log_ch_type="data",
+            )
+            weight = X.shape[1]
+        else:
+            cov = stat / weight
+
+        if norm_trace:
+            cov /= np.trace(cov)
+
+        covs.append(cov)
+        sample_weights.append(weight)
+
+    covs = np.stack(covs)
+    C_ref = covs.mean(0)
+
+    return covs, C_ref, info, rank, dict(sample_weights=np.array(sample_weights))
+
+
 def _xdawn_estimate(
     X,
     y,
@@ -256,19 +421,15 @@ def _spoc_estimate(X, y, reg, cov_method_params, info, rank):
     target -= target.mean()
     target /= target.std()
 
-    n_epochs, n_channels = X.shape[:2]
-
     # Estimate single trial covariance
-    covs = np.empty((n_epochs, n_channels, n_channels))
-    for ii, epoch in enumerate(X):
-        covs[ii] = _regularized_covariance(
-            epoch,
-            reg=reg,
-            method_params=cov_method_params,
-            rank=rank,
-            log_ch_type="data",
-            log_rank=ii == 0,
-        )
+    covs = _epoch_covs(
+        X,
+        reg=reg,
+        cov_method_params=cov_method_params,
+        info=None,
+        rank=rank,
+        log_rank=True,
+    )
 
     S = np.mean(covs * target[:, np.newaxis, np.newaxis], axis=0)
     R = covs.mean(0)
@@ -285,3 +446,45 @@ def _spoc_estimate(X, y, reg, cov_method_params, info, rank):
             on_few_samples="ignore",
         )
     return covs, C_ref, info, rank, dict()
+
+
+def _spoc_partial_estimate(X, y, state, *, reg, cov_method_params, info, rank):
+    """Add epochs to the running SPoC statistics and estimate the covariances."""
+    info, rank = _handle_info_rank(X, info, rank)
+    covs = _epoch_covs(
+        X,
+        reg=reg,
+        cov_method_params=cov_method_params,
+        info=None,
+        rank=rank,
+        log_rank="n" not in state,
+    )
+    if "n" not in state:
+        if not isinstance(rank, dict):
+            rank = _compute_rank_raw_array(
+                np.hstack(X),
+                info,
+                rank=rank,
+                scalings=None,
+                log_ch_type="data",
+                on_few_samples="ignore",
+            )
+        state.update(info=info, rank=rank, n=0, sum_cov=0.0, sum_target_cov=0.0)
+        state.update(sum_target=0.0, sum_target_2=0.0)
+    target = y.astype(np.float64)
+    state["n"] += len(target)
+    state["sum_cov"] = state["sum_cov"] + covs.sum(0)
+    state["sum_target_cov"] = state["sum_target_cov"] + np.tensordot(target, covs, 1)
+    state["sum_target"] += target.sum()
+    state["sum_target_2"] += (target**2).sum()
+
+    # Normalize target variable
+    n = state["n"]
+    mean = state["sum_target"] / n
+    std = np.sqrt(state["sum_target_2"] / n - mean**2)
+    S = (state["sum_target_cov"] - mean * state["sum_cov"]) / (n * std)
+    R = state["sum_cov"] / n
+
+    covs = [S, R]
+    C_ref = R
+    return covs, C_ref, state["info"], state["rank"], dict()
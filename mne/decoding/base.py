@@ -5,6 +5,7 @@
 # Copyright the MNE-Python contributors.
 
 import datetime as dt
+import itertools
 import numbers
 from functools import partial
 from inspect import Parameter, signature
@@ -210,6 +211,10 @@ class _GEDTransformer(MNETransformerMixin, BaseEstimator):
             )
         self._validate_ged_params()
         covs, C_ref, info, rank, kwargs = self.cov_callable(X, y)
+        return self._fit_ged(covs, C_ref, info, rank, kwargs, y=y)
+
+    def _fit_ged(self, covs, C_ref, info, rank, kwargs, *, y):
+        """Decompose the covariances returned by the cov_callable."""
         covs = np.stack(covs)
         self._validate_covariances(covs)
         if C_ref is not None:
@@ -620,6 +625,58 @@ def _check_estimator(estimator, get_params=True):
         )
 
 
+def _get_parallel_prefer(estimator):
+    """Get the joblib backend to prefer for fitting and scoring an estimator.
+
+    Threads share the data with the workers instead of copying it, but they
+    only run concurrently if the work is done in compiled code that releases
+    the GIL (LAPACK, liblinear, libsvm). Otherwise let joblib use processes.
+    """
+    from sklearn.discriminant_analysis import LinearDiscriminantAnalysis
+    from sklearn.linear_model import (
+        LinearRegression,
+        Ridge,
+        RidgeClassifier,
+        RidgeClassifierCV,
+        RidgeCV,
+    )
+    from sklearn.pipeline import Pipeline
+    from sklearn.preprocessing import StandardScaler
+    from sklearn.svm import SVC, SVR, LinearSVC, LinearSVR
+
+    from .search_light import SlidingEstimator
+
+    nogil_types = (
+        LinearDiscriminantAnalysis,
+        LinearRegression,
+        LinearSVC,
+        LinearSVR,
+        Ridge,
+        RidgeClassifier,
+        RidgeClassifierCV,
+        RidgeCV,
+        StandardScaler,
+        SVC,
+        SVR,
+        Vectorizer,
+    )
+    if isinstance(estimator, SlidingEstimator):
+        estimator = estimator.base_estimator
+    steps = [estimator]
+    if isinstance(estimator, Pipeline):
+        steps = [step for _, step in estimator.steps]
+    for step in steps:
+        if step is None or step == "passthrough":
+            continue
+        if type(step) is LinearModel:
+            step = step.model if step.model is not None else LogisticRegression()
+        if type(step) is LogisticRegression and step.solver == "liblinear":
+            continue
+        if type(step) not in nogil_types:
+            return None
+    return "threads"
+
+
 def _get_inverse_funcs(estimator, terminal=True):
     """Retrieve the inverse functions of an pipeline or an estimator."""
     inverse_func = list()
@@ -863,20 +920,79 @@ def cross_val_multiscore(
     -------
     scores : array of float, shape (n_splits,) | shape (n_splits, n_scores)
         Array of scores of the estimator for each run of the cross validation.
+
+    Notes
+    -----
+    If all steps of the estimator (or of the base estimator of a
+    :class:`~mne.decoding.SlidingEstimator`) do their work in compiled code
+    that releases the GIL, e.g.
+    :class:`~sklearn.discriminant_analysis.LinearDiscriminantAnalysis`,
+    :class:`~sklearn.linear_model.Ridge` or :class:`~sklearn.svm.LinearSVC`,
+    the jobs are run in threads that share ``X`` instead of processes that get
+    a copy of it. Use :func:`joblib.parallel_config` to select a backend
+    explicitly.
+
+    For a :class:`~mne.decoding.SlidingEstimator` or
+    :class:`~mne.decoding.GeneralizingEstimator` scored with its own
+    ``scoring``, the tasks of each split are divided into chunks that are
+    fitted and scored in separate jobs, so that all jobs are used even when
+    there are fewer splits than jobs.
+
+    .. versionchanged:: 1.13
+       Automatic selection of threads and scheduling of chunks of tasks.
     """
+    from .search_light import GeneralizingEstimator, SlidingEstimator
+
     # This code is copied from sklearn
     X, y, groups = indexable(X, y, groups)
 
     cv = check_cv(cv, y, classifier=is_classifier(estimator))
     cv_iter = list(cv.split(X, y, groups))
     scorer = check_scoring(estimator, scoring=scoring)
+    prefer = _get_parallel_prefer(estimator)
     # We clone the estimator to make sure that all the folds are
     # independent, and that it is pickle-able.
     # Note: this parallelization is implemented using MNE Parallel
     parallel, p_func, n_jobs = parallel_func(
-        _fit_and_score, n_jobs, pre_dispatch=pre_dispatch
+        _fit_and_score, n_jobs, pre_dispatch=pre_dispatch, prefer=prefer
     )
     position = hasattr(estimator, "position")
+    if (
+        n_jobs > 1
+        and scoring is None
+        and isinstance(estimator, SlidingEstimator)
+        and isinstance(X, np.ndarray)
+    ):
+        # Parallelizing across folds only leaves jobs idle when there are few
+        # folds (or not a multiple of n_jobs), so split the tasks of each fold
+        # into chunks, too. About four chunks per job balance the load.
+        n_chunks = min(X.shape[-1], -(-4 * n_jobs // len(cv_iter)))
+        bounds = np.linspace(0, X.shape[-1], n_chunks + 1).round().astype(int)
+        slices = [slice(start, stop) for start, stop in zip(bounds[:-1], bounds[1:])]
+        generalize = isinstance(estimator, GeneralizingEstimator)
+        parallel, p_func, _ = parallel_func(
+            _fit_and_score_tasks, n_jobs, pre_dispatch=pre_dispatch, prefer=prefer
+        )
+        estimator = clone(estimator).set_params(n_jobs=1)
+        scores = parallel(
+            p_func(
+                estimator=clone(estimator).set_params(position=ii % n_jobs),
+                X=X[..., sl],
+                X_score=X if generalize else None,
+                y=y,
+                scorer=scorer,
+                train=train,
+                test=test,
+                fit_params=fit_params,
+                verbose=verbose,
+            )
+            for ii, ((train, test), sl) in enumerate(itertools.product(cv_iter, slices))
+        )
+        scores = [
+            np.concatenate(scores[ii : ii + n_chunks], axis=0)
+            for ii in range(0, len(scores), n_chunks)
+        ]
+        return np.array(scores)
     scores = parallel(
         p_func(
             estimator=clone(estimator),
@@ -894,6 +1010,23 @@ def cross_val_multiscore(
     return np.array(scores)[:, 0, ...]  # flatten over joblib output.
 
 
+@verbose
+def _fit_and_score_tasks(
+    estimator, X, X_score, y, scorer, train, test, fit_params, *, verbose=None
+):
+    """Fit and score a SlidingEstimator on a chunk of tasks of a split."""
+    from sklearn.utils.metaestimators import _safe_split
+    from sklearn.utils.validation import _check_method_params
+
+    fit_params = fit_params if fit_params is not None else {}
+    fit_params = _check_method_params(X, fit_params, train)
+    X_train, y_train = _safe_split(estimator, X, y, train)
+    X_score = X if X_score is None else X_score
+    X_test, y_test = _safe_split(estimator, X_score, y, test, train)
+    estimator.fit(X_train, y_train, **fit_params)
+    return _score(estimator, X_test, y_test, scorer)
+
+
 # This verbose is necessary to properly set the verbosity level
 # during parallelization
 @verbose
@@ -917,16 +1050,13 @@ def _fit_and_score(
 ):
     """Fit estimator and compute scores for a given dataset split."""
     #  This code is adapted from sklearn
-    from sklearn.model_selection import _validation
     from sklearn.utils.metaestimators import _safe_split
-    from sklearn.utils.validation import _num_samples
+    from sklearn.utils.validation import _check_method_params, _num_samples
 
     # Adjust length of sample weights
 
     fit_params = fit_params if fit_params is not None else {}
-    fit_params = {
-        k: _validation._index_param_value(X, v, train) for k, v in fit_params.items()
-    }
+    fit_params = _check_method_params(X, fit_params, train)
 
     if parameters is not None:
         estimator.set_params(**parameters)
@@ -9,6 +9,7 @@ import numpy as np
 
 from .._fiff.meas_info import Info
 from ..defaults import _BORDER_DEFAULT, _EXTRAPOLATE_DEFAULT, _INTERPOLATION_DEFAULT
+from ..fixes import has_numba, jit
 from ..utils import (
     _check_option,
     _validate_type,
@@ -16,7 +17,12 @@ from ..utils import (
     legacy,
     verbose,
 )
-from ._covs_ged import _csp_estimate, _spoc_estimate
+from ._covs_ged import (
+    _csp_estimate,
+    _csp_partial_estimate,
+    _spoc_estimate,
+    _spoc_partial_estimate,
+)
 from ._mod_ged import _csp_mod, _spoc_mod
 from .base import _GEDTransformer, _read_ged
 from .spatial_filter import get_spatial_filter_from_estimator
@@ -189,6 +195,13 @@ class CSP(_GEDTransformer):
         "transform_into",
     )
 
+    def __getstate__(self):
+        """Prepare state for serialization."""
+        state = super().__getstate__()
+        # the statistics of partial_fit are not saved
+        state.pop("_partial_fit_state", None)
+        return state
+
     def _restore_callables(self):
         """Restore CSP-specific callables after loading state."""
         self.cov_callable = partial(
@@ -260,13 +273,14 @@ class CSP(_GEDTransformer):
         """
         X, y = self._check_data(X, y=y, fit=True, return_y=True)
         self._validate_params(y=y)
+        self._partial_fit_state = None
 
         # Covariance estimation, GED/AJD
         # and evecs/evals sorting happen here
         super().fit(X, y)
 
         pick_filters = self.filters_[: self.n_components]
-        X = np.asarray([np.dot(pick_filters, epoch) for epoch in X])
+        X = pick_filters @ X
 
         # compute features (mean power)
         X = (X**2).mean(axis=2)
@@ -277,6 +291,73 @@ class CSP(_GEDTransformer):
 
         return self
 
+    def partial_fit(self, X, y):
+        """Update the decomposition with new epochs.
+
+        Parameters
+        ----------
+        X : ndarray, shape (n_epochs, n_channels, n_times)
+            The new epochs.
+        y : array, shape (n_epochs,)
+            The class (or target value) for each epoch.
+
+        Returns
+        -------
+        self : instance of CSP
+            Returns the modified instance.
+
+        Notes
+        -----
+        The covariance statistics are updated with the new epochs, so that
+        calling ``partial_fit`` on successive batches of epochs gives the same
+        decomposition as calling :meth:`fit` once on all of them, without
+        keeping the data. To standardize the features, the (small) covariance
+        matrix of each epoch is kept instead. With ``cov_est='concat'``,
+        ``reg`` must be None, ``'empirical'``, ``'shrinkage'`` or a float and
+        ``cov_method_params`` must be None. If ``rank`` is not a dict, it is
+        estimated from the first batch. A decomposition obtained with
+        :meth:`fit` is not updated: the next call to ``partial_fit`` starts
+        anew.
+
+        .. versionadded:: 1.13
+        """
+        state = getattr(self, "_partial_fit_state", None)
+        X, y = self._check_data(X, y=y, fit=state is None, return_y=True)
+        state = dict(y=[], grams=[]) if state is None else state
+        self._validate_params(y=np.concatenate(state["y"] + [y]))
+        self._validate_ged_params()
+        covs, C_ref, info, rank, kwargs = self._partial_estimate(X, y, state)
+        state["y"].append(y)
+        state["grams"].append(X @ X.transpose(0, 2, 1) / X.shape[2])
+        self._partial_fit_state = state
+        self._fit_ged(covs, C_ref, info, rank, kwargs, y=np.concatenate(state["y"]))
+
+        # features (mean power) of all epochs from their covariances
+        pick_filters = self.filters_[: self.n_components]
+        X = np.concatenate(
+            [
+                ((pick_filters @ grams) * pick_filters).sum(-1)
+                for grams in state["grams"]
+            ]
+        )
+        self.mean_ = X.mean(axis=0)
+        self.std_ = X.std(axis=0)
+
+        return self
+
+    def _partial_estimate(self, X, y, state):
+        return _csp_partial_estimate(
+            X,
+            y,
+            state,
+            reg=self.reg,
+            cov_method_params=self.cov_method_params,
+            cov_est=self.cov_est,
+            info=self.info,
+            rank=self.rank,
+            norm_trace=self.norm_trace,
+        )
+
     def transform(self, X):
         """Estimate epochs sources given the CSP filters.
 
@@ -621,15 +702,23 @@ def _ajd_pham(X, eps=1e-6, max_iter=15):
 
     """
     # Adapted from http://github.com/alexandrebarachant/pyRiemann
-    n_epochs = X.shape[0]
+    X = np.array(X, dtype=np.float64)  # operate on a copy
+    n_channels = X.shape[1]
+    V = np.eye(n_channels)
+    epsilon = n_channels * (n_channels - 1) * eps
+    _ajd_pham_sweeps(X, V, epsilon, max_iter)
+    return V, X
+
+
+def _ajd_pham_sweeps_numpy(D, V, epsilon, max_iter):
+    """Run the sweeps of Pham's algorithm, updating D and V in place."""
+    n_epochs = D.shape[0]
 
     # Reshape input matrix
-    A = np.concatenate(X, axis=0).T
+    A = np.concatenate(D, axis=0).T
 
     # Init variables
     n_times, n_m = A.shape
-    V = np.eye(n_times)
-    epsilon = n_times * (n_times - 1) * eps
 
     for it in range(max_iter):
         decr = 0
@@ -672,8 +761,69 @@ def _ajd_pham(X, eps=1e-6, max_iter=15):
                 V[[ii, jj], :] = np.dot(tau, V[[ii, jj], :])
         if decr < epsilon:
             break
-    D = np.reshape(A, (n_times, -1, n_times)).transpose(1, 0, 2)
-    return V, D
+    D[:] = np.reshape(A, (n_times, -1, n_times)).transpose(1, 0, 2)
+
+
+@jit()
+def _ajd_pham_sweeps_numba(D, V, epsilon, max_iter):  # pragma: no cover
+    n_epochs, n_channels, _ = D.shape
+    for it in range(max_iter):
+        decr = 0.0
+        for ii in range(1, n_channels):
+            for jj in range(ii):
+                g12 = g21 = omega12 = omega21 = 0.0
+                for ei in range(n_epochs):
+                    c1 = D[ei, ii, ii]
+                    c2 = D[ei, jj, jj]
+                    g12 += D[ei, ii, jj] / c1
+                    g21 += D[ei, ii, jj] / c2
+                    omega21 += c1 / c2
+                    omega12 += c2 / c1
+                g12 /= n_epochs
+                g21 /= n_epochs
+                omega21 /= n_epochs
+                omega12 /= n_epochs
+                omega = np.sqrt(omega12 * omega21)
+
+                tmp = np.sqrt(omega21 / omega12)
+                tmp1 = (tmp * g12 + g21) / (omega + 1)
+                tmp2 = (tmp * g12 - g21) / max(omega - 1, 1e-9)
+
+                h12 = tmp1 + tmp2
+                h21 = (tmp1 - tmp2) / tmp
+
+                decr += n_epochs * (g12 * h12 + g21 * h21) / 2.0
+
+                # real part of 1 + sqrt(1 - h12 * h21)
+                tmp = 1.0 + np.sqrt(max(1.0 - h12 * h21, 0.0))
+                t12 = -h12 / tmp
+                t21 = -h21 / tmp
+
+                # left and right multiplication with the 2 x 2 rotation
+                for ei in range(n_epochs):
+                    for kk in range(n_channels):
+                        a = D[ei, ii, kk]
+                        b = D[ei, jj, kk]
+                        D[ei, ii, kk] = a + t12 * b
+                        D[ei, jj, kk] = t21 * a + b
+                    for kk in range(n_channels):
+                        a = D[ei, kk, ii]
+                        b = D[ei, kk, jj]
+                        D[ei, kk, ii] = a + t12 * b
+                        D[ei, kk, jj] = t21 * a + b
+                for kk in range(n_channels):
+                    a = V[ii, kk]
+                    b = V[jj, kk]
+                    V[ii, kk] = a + t12 * b
+                    V[jj, kk] = t21 * a + b
+        if decr < epsilon:
+            break
+
+
+if has_numba:
+    _ajd_pham_sweeps = _ajd_pham_sweeps_numba
+else:
+    _ajd_pham_sweeps = _ajd_pham_sweeps_numpy
 
 
 @fill_doc
@@ -833,6 +983,17 @@ class SPoC(CSP):
         self.mod_ged_callable = _spoc_mod
         self.R_func = None
 
+    def _partial_estimate(self, X, y, state):
+        return _spoc_partial_estimate(
+            X,
+            y,
+            state,
+            reg=self.reg,
+            cov_method_params=self.cov_method_params,
+            info=self.info,
+            rank=self.rank,
+        )
+
     def fit(self, X, y):
         """Estimate the SPoC decomposition on epochs.
 
@@ -850,11 +1011,12 @@ class SPoC(CSP):
         """
         X, y = self._check_data(X, y=y, fit=True, return_y=True)
         self._validate_params(y=y)
+        self._partial_fit_state = None
 
         super(CSP, self).fit(X, y)
 
         pick_filters = self.filters_[: self.n_components]
-        X = np.asarray([np.dot(pick_filters, epoch) for epoch in X])
+        X = pick_filters @ X
 
         # compute features (mean band power)
         X = (X**2).mean(axis=-1)
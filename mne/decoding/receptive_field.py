@@ -43,12 +43,17 @@ class ReceptiveField(MetaEstimatorMixin, BaseEstimator):
     feature_names : array, shape (n_features,) | None
         Names for input features to the model. If None, feature names will
         be auto-generated from the shape of input data after running `fit`.
-    estimator : instance of sklearn.base.BaseEstimator | float | None
+    estimator : instance of sklearn.base.BaseEstimator | float | array-like | None
         The model used in fitting inputs and outputs. This can be any
         scikit-learn-style model that contains a fit and predict method. If a
-        float is passed, it will be interpreted as the ``alpha`` parameter
-        to be passed to a Ridge regression model. If `None`, then a Ridge
-        regression model with an alpha of 0 will be used.
+        float (or an array of floats) is passed, it will be interpreted as the
+        ``alpha`` parameter to be passed to a
+        :class:`~mne.decoding.TimeDelayingRidge` model. If `None`, then a
+        Ridge regression model with an alpha of 0 will be used.
+
+        .. versionchanged:: 1.13
+           Support for an array of floats, from which the alpha with the
+           smallest generalized cross-validation error is chosen.
     fit_intercept : bool | None
         If True (default), the sample mean is removed before fitting.
         If ``estimator`` is a :class:`sklearn.base.BaseEstimator`,
@@ -235,7 +240,11 @@ class ReceptiveField(MetaEstimatorMixin, BaseEstimator):
         # Define the slice that we should use in the middle
         self.valid_samples_ = _delays_to_slice(self.delays_)
 
-        if self.estimator is None or isinstance(self.estimator, numbers.Real):
+        if (
+            self.estimator is None
+            or isinstance(self.estimator, numbers.Real)
+            or _is_alphas(self.estimator)
+        ):
             alpha = self.estimator if self.estimator is not None else 0.0
             if self.fit_intercept is None:
                 self.fit_intercept_ = True
@@ -568,3 +577,11 @@ def _r2_score(y_true, y, multioutput=None):
 
 
 _SCORERS = {"r2": _r2_score, "corrcoef": _corr_score}
+
+
+def _is_alphas(estimator):
+    """Check if the estimator is a 1D array-like of real numbers."""
+    if not isinstance(estimator, list | tuple | np.ndarray):
+        return False
+    alphas = np.asarray(estimator)
+    return alphas.ndim == 1 and alphas.dtype.kind in "iuf"
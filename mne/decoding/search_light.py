@@ -7,8 +7,24 @@ import logging
 import numpy as np
 from scipy.stats import rankdata
 from sklearn.base import BaseEstimator, MetaEstimatorMixin, clone
+from sklearn.discriminant_analysis import LinearDiscriminantAnalysis
+from sklearn.linear_model import (
+    ElasticNet,
+    Lasso,
+    LinearRegression,
+    LogisticRegression,
+    LogisticRegressionCV,
+    Ridge,
+    RidgeClassifier,
+    RidgeClassifierCV,
+    RidgeCV,
+    SGDClassifier,
+    SGDRegressor,
+)
 from sklearn.metrics import check_scoring
-from sklearn.preprocessing import LabelEncoder
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import LabelEncoder, RobustScaler, StandardScaler
+from sklearn.svm import LinearSVC, LinearSVR
 from sklearn.utils.validation import check_is_fitted
 
 from ..parallel import parallel_func
@@ -19,8 +35,8 @@ from ..utils import (
     array_split_idx,
     fill_doc,
 )
-from .base import _check_estimator
-from .transformer import MNETransformerMixin
+from .base import LinearModel, _check_estimator, _get_parallel_prefer
+from .transformer import MNETransformerMixin, Scaler, Vectorizer, _ConstantScaler
 
 
 @fill_doc
@@ -114,6 +130,7 @@ class SlidingEstimator(MetaEstimatorMixin, MNETransformerMixin, BaseEstimator):
             _sl_fit,
             self.n_jobs,
             max_jobs=X.shape[-1],
+            prefer=_get_parallel_prefer(self.base_estimator),
             verbose=_verbose_safe_false(),
         )
         self.estimators_ = list()
@@ -175,6 +192,7 @@ class SlidingEstimator(MetaEstimatorMixin, MNETransformerMixin, BaseEstimator):
             _sl_transform,
             self.n_jobs,
             max_jobs=X.shape[-1],
+            prefer=_get_parallel_prefer(self.base_estimator),
             verbose=_verbose_safe_false(),
         )
 
@@ -339,6 +357,7 @@ class SlidingEstimator(MetaEstimatorMixin, MNETransformerMixin, BaseEstimator):
             _sl_score,
             self.n_jobs,
             max_jobs=X.shape[-1],
+            prefer=_get_parallel_prefer(self.base_estimator),
             verbose=_verbose_safe_false(),
         )
         X_splits = np.array_split(X, n_jobs, axis=-1)
@@ -416,6 +435,10 @@ def _sl_transform(estimators, X, method, pb):
     y_pred : array, shape (n_samples, n_estimators, n_classes * (n_classes-1) // 2)
         The transformations for each slice of data.
     """  # noqa: E501
+    y_pred = _linear_predict(estimators, X, method, generalize=False)
+    if y_pred is not None:
+        pb.update(len(estimators))
+        return y_pred
     for ii, est in enumerate(estimators):
         transform = getattr(est, method)
         _y_pred = transform(X[..., ii])
@@ -460,6 +483,14 @@ def _sl_score(estimators, scoring, X, y):
         The score for each task / slice of data.
     """
     n_tasks = X.shape[-1]
+    scoring = _resolve_scoring_for_classifier(scoring, estimators)
+    response_method, can_batch = _detect_response_method(scoring)
+    if can_batch:
+        method = _get_response_method(response_method, estimators[0])
+        y_pred = _linear_predict(estimators, X, method, generalize=False)
+        if y_pred is not None:
+            y_pred = y_pred[:, np.newaxis]  # a single "training" estimator
+            return _score_predictions(scoring, response_method, method, y, y_pred)[0]
     score = np.zeros(n_tasks)
     for ii, est in enumerate(estimators):
         score[ii] = scoring(est, X[..., ii], y)
@@ -514,6 +545,7 @@ class GeneralizingEstimator(SlidingEstimator):
             _gl_transform,
             self.n_jobs,
             max_jobs=X.shape[-1],
+            prefer=_get_parallel_prefer(self.base_estimator),
             verbose=_verbose_safe_false(),
         )
 
@@ -645,6 +677,7 @@ class GeneralizingEstimator(SlidingEstimator):
             _gl_score,
             self.n_jobs,
             max_jobs=X.shape[-1],
+            prefer=_get_parallel_prefer(self.base_estimator),
             verbose=_verbose_safe_false(),
         )
         scoring = check_scoring(self.base_estimator, self.scoring)
@@ -686,6 +719,10 @@ def _gl_transform(estimators, X, method, pb):
         present when ``method`` returns multi-output (e.g. ``predict_proba``).
     """  # noqa: E501
     n_sample, n_iter = X.shape[0], X.shape[-1]
+    y_pred = _linear_predict(estimators, X, method, generalize=True)
+    if y_pred is not None:
+        pb.update(len(estimators) * n_iter)
+        return y_pred
     # stack generalized data for faster prediction
     X_stack = X.transpose(np.r_[0, X.ndim - 1, range(1, X.ndim - 1)])
     X_stack = X_stack.reshape((n_sample * n_iter,) + X_stack.shape[2:])
@@ -729,9 +766,14 @@ def _resolve_scoring_for_classifier(scoring, estimators):
     "<Subclass>.score", which we leave untouched.
     """
     if len(estimators) and getattr(scoring, "_score_func", None) is None:
-        qname = getattr(type(estimators[0]).score, "__qualname__", "")
+        estimator = estimators[0]
+        if type(estimator) is Pipeline:  # score is that of the final step
+            estimator = estimator.steps[-1][1]
+        if type(estimator) is LinearModel:  # score is that of the wrapped model
+            estimator = estimator.model_
+        qname = getattr(getattr(type(estimator), "score", None), "__qualname__", "")
         if qname == "ClassifierMixin.score":
-            scoring = check_scoring(estimators[0], "accuracy")
+            scoring = check_scoring(estimator, "accuracy")
     return scoring
 
 
@@ -857,20 +899,26 @@ def _gl_score(estimators, scoring, X, y, pb):
                 pb.update(jj * n_train + ii + 1)
         return score
 
-    # Resolve a single method name for _gl_transform: pick the first available
-    # if response_method is a tuple (e.g. roc_auc).
-    if isinstance(response_method, str):
-        method = response_method
-    else:
-        for m in response_method:
-            if hasattr(estimators[0], m):
-                method = m
-                break
+    method = _get_response_method(response_method, estimators[0])
 
     # Batch all predictions through _gl_transform. y_pred shape:
     # (n_sample, n_train, n_iter) or (n_sample, n_train, n_iter, n_classes).
     y_pred = _gl_transform(estimators, X, method, pb)
+    return _score_predictions(scoring, response_method, method, y, y_pred)
+
+
+def _get_response_method(response_method, estimator):
+    """Resolve a single method name for the predictions."""
+    # pick the first available if response_method is a tuple (e.g. roc_auc)
+    if isinstance(response_method, str):
+        return response_method
+    for method in response_method:
+        if hasattr(estimator, method):
+            return method
 
+
+def _score_predictions(scoring, response_method, method, y, y_pred):
+    """Score predictions of shape (n_sample, n_train, n_iter[, n_classes])."""
     # Binary predict_proba: take the positive-class column to match sklearn
     # scorer expectations for binary problems.
     if method == "predict_proba" and y_pred.ndim == 4 and y_pred.shape[-1] == 2:
@@ -890,15 +938,151 @@ def _gl_score(estimators, scoring, X, y, pb):
     if batched_score is not None:
         score = batched_score(y_pred)
     else:
+        n_train, n_iter = y_pred.shape[1:3]
         for ii in range(n_train):
             for jj in range(n_iter):
                 _score = sign * score_func(y, y_pred[:, ii, jj], **kwargs)
                 if (ii == 0) and (jj == 0):
-                    score = np.zeros(score_shape, type(_score))
+                    score = np.zeros((n_train, n_iter), type(_score))
                 score[ii, jj, ...] = _score
     return score
 
 
+# Estimators whose decision function (and predict) is X @ coef_.T + intercept_
+_LINEAR_CLASSIFIERS = (
+    LinearDiscriminantAnalysis,
+    LinearSVC,
+    LogisticRegression,
+    LogisticRegressionCV,
+    RidgeClassifier,
+    RidgeClassifierCV,
+    SGDClassifier,
+)
+_LINEAR_REGRESSORS = (
+    ElasticNet,
+    Lasso,
+    LinearRegression,
+    LinearSVR,
+    Ridge,
+    RidgeCV,
+    SGDRegressor,
+)
+
+
+def _get_linear_params(estimator):
+    """Get the affine decision function of a fitted (linear) estimator.
+
+    Returns
+    -------
+    params : tuple | None
+        The ``coef`` of shape (n_features, n_outputs), the ``intercept`` of
+        shape (n_outputs,), and the final estimator. None if the estimator is
+        not known to be linear.
+    """
+    scaling = None
+    if isinstance(estimator, Pipeline):
+        # fold the scaling of the features into the coefficients
+        *steps, estimator = (step for _, step in estimator.steps)
+        for step in steps:
+            if step is None or step == "passthrough" or type(step) is Vectorizer:
+                continue
+            if scaling is not None:
+                return None
+            scaling = _get_scaling(step)
+            if scaling is None:
+                return None
+    if type(estimator) is LinearModel:
+        estimator = estimator.model_
+    if type(estimator) not in _LINEAR_CLASSIFIERS + _LINEAR_REGRESSORS:
+        return None
+    coef = np.atleast_2d(estimator.coef_).T
+    intercept = np.broadcast_to(estimator.intercept_, coef.shape[1:])
+    if scaling is not None:
+        # (X - center) / scale @ coef + intercept
+        center, scale = scaling
+        # mne Scaler scales channels, which can be followed by a Vectorizer
+        n_rep, rem = divmod(len(coef), len(center))
+        if rem:
+            return None
+        coef = coef / np.repeat(scale, n_rep)[:, np.newaxis]
+        intercept = intercept - np.repeat(center, n_rep) @ coef
+    return coef, intercept, estimator
+
+
+def _get_scaling(scaler):
+    """Get the center and scale of each feature of a fitted scaler.
+
+    Returns None if the scaler is not supported.
+    """
+    if type(scaler) is Scaler:
+        scaler = scaler.scaler_
+    if type(scaler) is _ConstantScaler:
+        return scaler.mean_, scaler.std_
+    if type(scaler) is StandardScaler:
+        n_features = scaler.n_features_in_
+        center = scaler.mean_ if scaler.with_mean else np.zeros(n_features)
+        scale = scaler.scale_ if scaler.with_std else np.ones(n_features)
+    elif type(scaler) is RobustScaler:
+        n_features = scaler.n_features_in_
+        center = scaler.center_ if scaler.with_centering else np.zeros(n_features)
+        scale = scaler.scale_ if scaler.with_scaling else np.ones(n_features)
+    else:
+        return None
+    return center, scale
+
+
+def _linear_predict(estimators, X, method, generalize):
+    """Predict with stacked coefficients if all estimators are linear.
+
+    This replaces the per-estimator calls by a single matrix product, i.e.,
+    ``X[:, :, jj] @ coef[ii] + intercept[ii]`` for all tasks ``jj`` and
+    estimators ``ii`` (or only ``jj == ii`` if not ``generalize``).
+    Returns None if the estimators are not all (known to be) linear.
+    """
+    if method not in ("decision_function", "predict") or not len(estimators):
+        return None
+    params = list()
+    for est in estimators:
+        this_params = _get_linear_params(est)
+        if this_params is None:
+            return None
+        params.append(this_params)
+    coefs, intercepts, finals = zip(*params)
+    final = finals[0]
+    is_classifier = type(final) in _LINEAR_CLASSIFIERS
+    if is_classifier:
+        classes = final.classes_
+        if any(not np.array_equal(est.classes_, classes) for est in finals):
+            return None
+    elif method == "decision_function":
+        return None  # let sklearn raise the error
+    if len(set(coef.shape for coef in coefs)) != 1:
+        return None
+    coef, intercept = np.array(coefs), np.array(intercepts)
+    n_estimators, n_features, n_outputs = coef.shape
+    n_samples, n_tasks = X.shape[0], X.shape[-1]
+    X = np.reshape(X, (n_samples, -1, n_tasks))
+    # let the estimators raise errors for bad input
+    if X.shape[1] != n_features or not np.isfinite(X).all():
+        return None
+    X = X.transpose(2, 0, 1)  # (n_tasks, n_samples, n_features)
+    if generalize:
+        y_pred = X @ coef.transpose(1, 0, 2).reshape(n_features, -1)
+        y_pred = y_pred.reshape(n_tasks, n_samples, n_estimators, n_outputs)
+        y_pred = y_pred.transpose(1, 2, 0, 3) + intercept[:, np.newaxis]
+    else:
+        if n_tasks != n_estimators:
+            return None
+        y_pred = (X @ coef).transpose(1, 0, 2) + intercept
+    if is_classifier and method == "predict":
+        if n_outputs == 1:
+            return classes[(y_pred[..., 0] > 0).astype(int)]
+        return classes[y_pred.argmax(axis=-1)]
+    if n_outputs == 1 and (is_classifier or final.coef_.ndim == 1):
+        y_pred = y_pred[..., 0]
+    return y_pred
+
+
 def _fix_auc(scoring, y):
     # This fixes sklearn's inability to compute roc_auc when y not in [0, 1]
     # scikit-learn/scikit-learn#6874
@@ -47,7 +47,9 @@ from mne.decoding import GeneralizingEstimator, Scaler, TransformerMixin, Vector
 from mne.decoding.base import (
     BaseEstimator,
     LinearModel,
+    _fit_and_score_tasks,
     _get_inverse_funcs,
+    _get_parallel_prefer,
     cross_val_multiscore,
     get_coef,
 )
@@ -595,6 +597,62 @@ def test_cross_val_multiscore():
         assert_array_equal(manual, auto)
 
 
+def test_get_parallel_prefer():
+    """Test choosing threads for estimators that release the GIL."""
+    liblinear = LogisticRegression(solver="liblinear")
+    for est in (
+        LinearDiscriminantAnalysis(),
+        liblinear,
+        LinearModel(Ridge()),
+        make_pipeline(Vectorizer(), StandardScaler(), svm.LinearSVC()),
+        SlidingEstimator(make_pipeline(StandardScaler(), liblinear)),
+        GeneralizingEstimator(svm.SVC()),
+    ):
+        assert _get_parallel_prefer(est) == "threads"
+    for est in (
+        LogisticRegression(),
+        LinearModel(),
+        make_pipeline(PCA(), LinearDiscriminantAnalysis()),
+        SlidingEstimator(LogisticRegression(solver="lbfgs")),
+    ):
+        assert _get_parallel_prefer(est) is None
+
+
+@pytest.mark.parametrize("generalize", (False, True))
+@pytest.mark.parametrize("fit_params", (None, "sample_weight"))
+def test_cross_val_multiscore_chunks(generalize, fit_params, monkeypatch):
+    """Test scheduling chunks of tasks of SlidingEstimator folds in parallel."""
+    pytest.importorskip("joblib")
+    rng = np.random.RandomState(0)
+    X = rng.randn(30, 4, 7)
+    y = np.arange(30) % 2
+    X[y == 1, 0] += np.linspace(0, 2, 7)
+    if fit_params is not None:
+        fit_params = dict(sample_weight=rng.rand(30))
+    klass = GeneralizingEstimator if generalize else SlidingEstimator
+    clf = klass(LogisticRegression(solver="liblinear"), scoring="roc_auc")
+    cv = KFold(3)
+    want = list()
+    for train, test in cv.split(X, y):
+        kwargs = dict()
+        if fit_params is not None:
+            kwargs["sample_weight"] = fit_params["sample_weight"][train]
+        want.append(clf.fit(X[train], y[train], **kwargs).score(X[test], y[test]))
+    scores = cross_val_multiscore(clf, X, y, cv=cv, n_jobs=1, fit_params=fit_params)
+    assert_array_equal(scores, want)
+    calls = list()
+    monkeypatch.setattr(
+        "mne.decoding.base._fit_and_score_tasks",
+        lambda *args, **kwargs: (
+            calls.append(kwargs["X"].shape[-1]) or _fit_and_score_tasks(*args, **kwargs)
+        ),
+    )
+    scores = cross_val_multiscore(clf, X, y, cv=cv, n_jobs=2, fit_params=fit_params)
+    assert_allclose(scores, want)
+    # 3 folds for 2 jobs: each fold is split into chunks of tasks
+    assert sorted(calls) == [2] * 6 + [3] * 3
+
+
 @parametrize_with_checks([LinearModel(LogisticRegression())])
 def test_sklearn_compliance(estimator, check):
     """Test LinearModel compliance with sklearn."""
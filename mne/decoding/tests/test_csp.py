@@ -23,7 +23,7 @@ from sklearn.utils.estimator_checks import parametrize_with_checks
 
 from mne import Epochs, compute_proj_raw, io, pick_types, read_events
 from mne.decoding import CSP, LinearModel, Scaler, SPoC, get_coef, read_csp, read_spoc
-from mne.decoding.csp import _ajd_pham
+from mne.decoding.csp import _ajd_pham, _ajd_pham_sweeps_numpy
 from mne.utils import catch_logging, check_version
 
 data_dir = Path(__file__).parents[2] / "io" / "tests" / "data"
@@ -415,6 +415,13 @@ def test_ajd():
     ]
     assert_array_almost_equal(V, V_matlab)
 
+    # compiled and NumPy sweeps
+    covmats = np.array([np.dot(A, np.diag(d)) @ A.T for d in 1.0 + seed.rand(5, 3)])
+    D, V = covmats.copy(), np.eye(n_channels)
+    _ajd_pham_sweeps_numpy(D, V, n_channels * (n_channels - 1) * 1e-6, 15)
+    assert_allclose(_ajd_pham(covmats)[0], V, rtol=1e-7)
+    assert_allclose(_ajd_pham(covmats)[1], D, rtol=1e-7, atol=1e-10)
+
 
 def test_spoc():
     """Test SPoC."""
@@ -457,6 +464,44 @@ def test_spoc():
     assert np.abs(corr) > 0.85
 
 
+@pytest.mark.parametrize(
+    "Estimator, kwargs",
+    [
+        (CSP, dict()),
+        (CSP, dict(reg=0.1, norm_trace=True)),
+        (CSP, dict(cov_est="epoch", reg="oas", rank="full")),
+        (SPoC, dict()),
+    ],
+)
+def test_partial_fit(Estimator, kwargs):
+    """Test updating CSP and SPoC with batches of epochs."""
+    rng = np.random.RandomState(0)
+    X = rng.randn(60, 8, 50)
+    if Estimator is CSP:
+        y = np.arange(60) % 3
+        X[y == 1, 2] *= 2
+    else:
+        y = rng.rand(60)
+        X[:, 3] *= 1 + 3 * y[:, np.newaxis]
+    est = Estimator(log=False, **kwargs).fit(X, y)
+    est_batch = Estimator(log=False, **kwargs)
+    for sl in (slice(0, 10), slice(10, 45), slice(45, None)):
+        assert est_batch.partial_fit(X[sl], y[sl]) is est_batch
+    for attr in ("filters_", "patterns_", "mean_", "std_"):
+        assert_allclose(getattr(est_batch, attr), getattr(est, attr), rtol=1e-7)
+    assert_allclose(est_batch.transform(X), est.transform(X), rtol=1e-7)
+    assert "_partial_fit_state" not in est_batch.__getstate__()
+    # fitting discards the updates
+    est_batch.fit(X[:20], y[:20])
+    est_batch.partial_fit(X[20:], y[20:])
+    assert_allclose(est_batch.filters_, est.fit(X[20:], y[20:]).filters_, rtol=1e-7)
+    with pytest.raises(ValueError, match="expecting 8 features"):
+        est_batch.partial_fit(X[:, :5], y)
+    if Estimator is CSP and "reg" not in kwargs:
+        with pytest.raises(ValueError, match="requires reg"):
+            CSP(reg="oas").partial_fit(X, y)
+
+
 def test_csp_twoclass_symmetry():
     """Test that CSP is symmetric when swapping classes."""
     x, y = deterministic_toy_data(["class_a", "class_b"])
@@ -238,11 +238,11 @@ def test_receptive_field_basic(n_jobs):
     rf = ReceptiveField(tmin, tmax, 1, ["one"], estimator=0)
     rf.fit(X[:, [0]], y)
     str(rf)  # repr with one feature
-    # Should only accept estimators or floats
+    # Should only accept estimators or (arrays of) floats
     with pytest.raises((ValueError, AttributeError)):
         ReceptiveField(tmin, tmax, 1, estimator="foo").fit(X, y)
     with pytest.raises((ValueError, AttributeError)):
-        ReceptiveField(tmin, tmax, 1, estimator=np.array([1, 2, 3])).fit(X, y)
+        ReceptiveField(tmin, tmax, 1, estimator=np.array([[1, 2, 3]])).fit(X, y)
     with pytest.raises(ValueError, match="tmin .* must be at most tmax"):
         ReceptiveField(5, 4, 1).fit(X, y)
     # scorers
@@ -373,6 +373,64 @@ def test_time_delaying_fast_calc(n_jobs):
             assert_allclose(x_xt, x_xt_true, atol=1e-7, err_msg=(smin, smax))
 
 
+@pytest.mark.parametrize(
+    "n_times, smin, smax",
+    [
+        (1000, -3, 12),  # several blocks per epoch
+        (30, -5, 20),  # a single block
+    ],
+)
+def test_compute_corrs_epochs(n_times, smin, smax):
+    """Test auto- and cross-correlations of epoched data."""
+    rng = np.random.RandomState(0)
+    X = rng.randn(n_times, 3, 2)
+    y = rng.randn(n_times, 3, 2)
+    x_xt, x_yt, _, _, _ = _compute_corrs(X, y, smin, smax + 1)
+    x_xt_true = x_yt_true = 0.0
+    for ei in range(X.shape[1]):
+        X_del = _delay_time_series(X[:, ei], smin, smax, 1.0, fill_mean=False)
+        x_yt_true += einsum("tfd,to->ofd", X_del, y[:, ei])
+        X_del = _reshape_view(X_del, (n_times, -1))
+        x_xt_true += X_del.T @ X_del
+    x_yt_true = np.reshape(x_yt_true, (x_yt_true.shape[0], -1)).T
+    assert_allclose(x_yt, x_yt_true, atol=1e-7)
+    assert_allclose(x_xt, x_xt_true, atol=1e-7)
+
+
+@pytest.mark.parametrize("reg_type", ("ridge", "laplacian"))
+def test_time_delaying_ridge_alphas(reg_type):
+    """Test choosing among several alphas with GCV."""
+    tmin, tmax = -1, 4
+    X, y = _make_data(3, 2, 500, tmin, tmax)
+    y += 10 * np.random.RandomState(0).randn(*y.shape)
+    alphas = np.logspace(-2, 5, 8)
+    tdr = TimeDelayingRidge(tmin, tmax, 1.0, alphas, reg_type).fit(X, y)
+    assert tdr.alpha_ in alphas
+    # the same as fitting the chosen alpha directly
+    tdr_1 = TimeDelayingRidge(tmin, tmax, 1.0, tdr.alpha_, reg_type).fit(X, y)
+    assert_allclose(tdr.coef_, tdr_1.coef_, rtol=1e-7)
+    assert_allclose(tdr.intercept_, tdr_1.intercept_, atol=1e-10)
+    # the GCV error with the explicit hat matrix of the time-delayed data
+    X_del = _delay_time_series(X - X.mean(0), tmin, tmax, 1.0, fill_mean=False)
+    X_del = _reshape_view(X_del, (len(X), -1))
+    y_c = y - y.mean(0)
+    reg = _compute_reg_neighbors(3, tmax - tmin + 1, reg_type)
+    gcv = list()
+    for alpha in alphas:
+        hat = X_del @ np.linalg.solve(X_del.T @ X_del + alpha * reg, X_del.T)
+        rss = np.sum((y_c - hat @ y_c) ** 2)
+        gcv.append(rss / len(X) / (1 - np.trace(hat) / len(X)) ** 2)
+    assert tdr.alpha_ == alphas[np.argmin(gcv)]
+    assert alphas[0] < tdr.alpha_  # the noise needs some regularization
+    # also through ReceptiveField
+    if reg_type == "ridge":
+        rf = ReceptiveField(tmin, tmax, 1.0, estimator=list(alphas)).fit(X, y)
+        assert rf.estimator_.alpha_ == tdr.alpha_
+        assert_allclose(rf.coef_, tdr.coef_)
+    with pytest.raises(ValueError, match="1D array of floats"):
+        TimeDelayingRidge(tmin, tmax, 1.0, []).fit(X, y)
+
+
 @pytest.mark.parametrize("n_jobs", n_jobs_test)
 def test_receptive_field_1d(n_jobs):
     """Test that the fast solving works like Ridge."""
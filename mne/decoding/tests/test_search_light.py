@@ -18,12 +18,19 @@ from sklearn.linear_model import LinearRegression, LogisticRegression, Ridge
 from sklearn.metrics import check_scoring, make_scorer, roc_auc_score
 from sklearn.model_selection import cross_val_predict
 from sklearn.multiclass import OneVsRestClassifier
-from sklearn.pipeline import make_pipeline
+from sklearn.pipeline import Pipeline, make_pipeline
+from sklearn.preprocessing import StandardScaler
 from sklearn.svm import SVC
 from sklearn.utils.estimator_checks import parametrize_with_checks
 
-from mne.decoding.search_light import GeneralizingEstimator, SlidingEstimator
-from mne.decoding.transformer import Vectorizer
+from mne import create_info
+from mne.decoding.base import LinearModel
+from mne.decoding.search_light import (
+    GeneralizingEstimator,
+    SlidingEstimator,
+    _linear_predict,
+)
+from mne.decoding.transformer import Scaler, Vectorizer
 from mne.utils import check_version, use_log_level
 
 NEW_MULTICLASS_SAMPLE_WEIGHT = check_version("sklearn", "1.4")
@@ -352,7 +359,13 @@ def test_gl_score_branches(scoring, est_name, method):
     # this run (the reference run below would otherwise add to them).
     gl.scoring = scorer
     actual = gl.score(X, y)
-    assert len(pred_calls) == (n_iter if est_name != "ridge" else n_iter**2)
+    if est_name == "ridge":  # default R² scoring is not batched
+        n_pred_calls = n_iter**2
+    elif method == "predict_proba":  # one call per estimator on stacked data
+        n_pred_calls = n_iter
+    else:  # linear fast path with stacked coefficients
+        n_pred_calls = 0
+    assert len(pred_calls) == n_pred_calls
     assert len(score_calls) == (n_iter**2 if per_slice else 0)
 
     # Reference: force can_batch=False. _score_func set (non-None) bypasses the
@@ -366,6 +379,90 @@ def test_gl_score_branches(scoring, est_name, method):
     assert_allclose(actual, expected)
 
 
+@pytest.mark.parametrize(
+    "est, y_kind",
+    [
+        (LogisticRegression(solver="liblinear"), "binary"),
+        (make_pipeline(StandardScaler(), LogisticRegression()), "multiclass"),
+        (
+            make_pipeline(Vectorizer(), StandardScaler(with_mean=False), SVC()),
+            "binary",
+        ),  # not linear
+        (
+            make_pipeline(Vectorizer(), StandardScaler(), LinearDiscriminantAnalysis()),
+            "multiclass",
+        ),
+        (make_pipeline(Scaler(scalings="mean"), Vectorizer(), Ridge()), "continuous"),
+        (
+            make_pipeline(
+                Scaler(scalings="median"), Vectorizer(), LogisticRegression()
+            ),
+            "multiclass",
+        ),
+        (
+            make_pipeline(Scaler(create_info(3, 1000.0, "eeg")), Vectorizer(), Ridge()),
+            "continuous",
+        ),
+        (LinearModel(LogisticRegression()), "binary"),
+        (Ridge(), "continuous"),
+        (LinearModel(Ridge()), "continuous"),
+    ],
+)
+def test_linear_fast_path(est, y_kind, monkeypatch):
+    """Test that linear estimators give the same results with stacked coefs."""
+    rng = np.random.RandomState(0)
+    n_epochs, n_time = 30, 5
+    X = rng.randn(n_epochs, 3, 2, n_time)
+    if y_kind == "continuous":
+        y = rng.randn(n_epochs)
+    else:
+        y = np.arange(n_epochs) % (2 if y_kind == "binary" else 3)
+        X[y == 1] += 0.5
+    if not isinstance(est, Pipeline) or not any(
+        isinstance(step, Vectorizer) for step in est
+    ):
+        X = X[:, :, 0]
+    methods = ["predict", "score"]
+    if y_kind in ("binary", "multiclass"):
+        methods.append("decision_function")
+    scorings = [None, "roc_auc"] if y_kind == "binary" else [None]
+
+    def run():
+        out = dict()
+        for klass in (SlidingEstimator, GeneralizingEstimator):
+            for scoring in scorings:
+                inst = klass(est, scoring=scoring).fit(X, y)
+                for method in methods:
+                    func = getattr(inst, method)
+                    key = (klass, scoring, method)
+                    out[key] = func(X, y) if method == "score" else func(X)
+        return out
+
+    fast = list()
+
+    def spy(*args, **kwargs):
+        y_pred = _linear_predict(*args, **kwargs)
+        fast.append(y_pred is not None)
+        return y_pred
+
+    monkeypatch.setattr("mne.decoding.search_light._linear_predict", spy)
+    got = run()
+    assert all(fast) == (
+        est[-1].__class__ is not SVC if isinstance(est, Pipeline) else True
+    )
+    monkeypatch.setattr(
+        "mne.decoding.search_light._linear_predict", lambda *args, **kwargs: None
+    )
+    want = run()
+    for key in want:
+        assert got[key].shape == want[key].shape
+        assert got[key].dtype == want[key].dtype
+        if key[2] == "predict" and y_kind != "continuous":
+            assert_array_equal(got[key], want[key])
+        else:
+            assert_allclose(got[key], want[key], rtol=1e-7, atol=1e-12)
+
+
 @pytest.mark.parametrize(
     "n_jobs, verbose", [(1, False), (2, False), (1, True), (2, "info")]
 )
@@ -17,6 +17,8 @@ from ..fixes import jit
 from ..utils import ProgressBar, _check_option, logger, warn
 from ._fixes import _check_n_features_3d, validate_data
 
+_CORRS_BLOCK_BYTES = 2**25  # size of the spectra of the data blocks at once
+
 
 def _compute_corrs(
     X, y, smin, smax, n_jobs=None, fit_intercept=False, edge_correction=True
@@ -45,81 +47,107 @@ def _compute_corrs(
     assert len_x == len_y
     assert n_epochs == n_epochs_y
 
-    n_fft = next_fast_len(2 * X.shape[0] - 1)
+    # Only the correlations at lags below len_trf (auto) and from smin to
+    # smax - 1 (cross) are needed. So the data are cut into blocks that are
+    # correlated with slightly longer windows, and the cross-spectra of all
+    # pairs of channels are summed over blocks and epochs before a single
+    # inverse FFT, without ever forming the time-delayed data.
+    n_lag = 2 * len_trf - 1
+    n_fft = next_fast_len(min(len_x, 4 * n_lag) + n_lag - 1)
+    n_block = n_fft - n_lag + 1
 
     _, cuda_dict = _setup_cuda_fft_multiply_repeated(
         n_jobs, [1.0], n_fft, "correlation calculations"
     )
     del n_jobs  # only used to set as CUDA
 
-    # create our Toeplitz indexer
-    ij = np.empty((len_trf, len_trf), int)
-    for ii in range(len_trf):
-        ij[ii, ii:] = np.arange(len_trf - ii)
-        x = np.arange(n_fft - 1, n_fft - len_trf + ii, -1)
-        ij[ii + 1 :, ii] = x
-
-    x_xt = np.zeros([n_ch_x * len_trf] * 2)
-    x_y = np.zeros((len_trf, n_ch_x, n_ch_y), order="F")
-    n = n_epochs * (n_ch_x * (n_ch_x + 1) // 2 + n_ch_x)
+    n_freq = n_fft // 2 + 1
+    n_chunk = max(_CORRS_BLOCK_BYTES // (16 * n_freq * (2 * n_ch_x + n_ch_y)), 1)
+    epochs, starts = np.meshgrid(
+        np.arange(n_epochs), np.arange(0, len_x, n_block), indexing="ij"
+    )
+    epochs, starts = epochs.ravel(), starts.ravel()
     logger.info(f"Fitting {n_epochs} epochs, {n_ch_x} channels")
-    pb = ProgressBar(n, mesg="Sample")
-    count = 0
-    pb.update(count)
-    for ei in range(n_epochs):
-        this_X = X[:, ei, :]
-        # XXX maybe this is what we should parallelize over CPUs at some point
-        X_fft = cuda_dict["rfft"](this_X, n=n_fft, axis=0)
-        X_fft_conj = X_fft.conj()
-        y_fft = cuda_dict["rfft"](y[:, ei, :], n=n_fft, axis=0)
-
+    x_x_fft = x_y_fft = 0.0
+    for ci in ProgressBar(range(0, len(starts), n_chunk), mesg="Block"):
+        this_epochs = epochs[ci : ci + n_chunk]
+        this_starts = starts[ci : ci + n_chunk]
+        # shape (n_freq, n_ch_x, n_blocks)
+        X_fft_conj = (
+            cuda_dict["rfft"](
+                _get_windows(X, this_epochs, this_starts, n_block), n=n_fft, axis=-1
+            )
+            .conj()
+            .transpose(2, 1, 0)
+        )
+        # shape (n_freq, n_blocks, n_ch)
+        X_fft = cuda_dict["rfft"](
+            _get_windows(X, this_epochs, this_starts - len_trf + 1, n_fft),
+            n=n_fft,
+            axis=-1,
+        ).transpose(2, 0, 1)
+        y_fft = cuda_dict["rfft"](
+            _get_windows(y, this_epochs, this_starts + smin, n_block + len_trf - 1),
+            n=n_fft,
+            axis=-1,
+        ).transpose(2, 0, 1)
+        x_x_fft = x_x_fft + X_fft_conj @ X_fft
+        x_y_fft = x_y_fft + X_fft_conj @ y_fft
+        del X_fft_conj, X_fft, y_fft
+
+    # x_x[len_trf - 1 + lag, ch0, ch1] is the sum of X[t, ch0] * X[t + lag, ch1]
+    x_x = cuda_dict["irfft"](x_x_fft, n=n_fft, axis=0)[:n_lag]
+    # Our autocorrelation structure is a Toeplitz matrix for each pair of
+    # channels, with x_xt[(ch0, ii), (ch1, jj)] corresponding to lag ii - jj
+    ij = len_trf - 1 + np.arange(len_trf)[:, np.newaxis] - np.arange(len_trf)
+    x_xt = x_x[ij].transpose(2, 0, 3, 1).reshape([n_ch_x * len_trf] * 2)
+    # However, we need to adjust for coeffs that are cut off, i.e. the
+    # non-zero delays should not have the same AC value as the zero-delay
+    # ones (because they actually have fewer coefficients).
+    #
+    # These adjustments also follow a Toeplitz structure, so we construct a
+    # matrix of what has been left off, compute their inner products, and
+    # remove them.
+    if edge_correction:
+        for ei in range(n_epochs):
+            _edge_correct_blocks(x_xt, X[:, ei, :], smax, smin, len_trf)
         for ch0 in range(n_ch_x):
-            for oi, ch1 in enumerate(range(ch0, n_ch_x)):
-                this_result = cuda_dict["irfft"](
-                    X_fft[:, ch0] * X_fft_conj[:, ch1], n=n_fft, axis=0
-                )
-                # Our autocorrelation structure is a Toeplitz matrix, but
-                # it's faster to create the Toeplitz ourselves than use
-                # linalg.toeplitz.
-                this_result = this_result[ij]
-                # However, we need to adjust for coeffs that are cut off,
-                # i.e. the non-zero delays should not have the same AC value
-                # as the zero-delay ones (because they actually have fewer
-                # coefficients).
-                #
-                # These adjustments also follow a Toeplitz structure, so we
-                # construct a matrix of what has been left off, compute their
-                # inner products, and remove them.
-                if edge_correction:
-                    _edge_correct(this_result, this_X, smax, smin, ch0, ch1)
-
-                # Store the results in our output matrix
+            sl0 = slice(ch0 * len_trf, (ch0 + 1) * len_trf)
+            for ch1 in range(ch0 + 1, n_ch_x):
+                sl1 = slice(ch1 * len_trf, (ch1 + 1) * len_trf)
+                x_xt[sl1, sl0] = x_xt[sl0, sl1].T
+
+    # x_y[ii, ch0, ch1] is the sum of X[t, ch0] * y[t + smin + ii, ch1]
+    x_y = cuda_dict["irfft"](x_y_fft, n=n_fft, axis=0)[:len_trf]
+    x_y = np.reshape(x_y, (n_ch_x * len_trf, n_ch_y), order="F")
+    return x_xt, x_y, n_ch_x, X_offset, y_offset
+
+
+def _get_windows(data, epochs, starts, n_window):
+    """Get zero-padded windows of (n_times, n_epochs, n_channels) data."""
+    idx = starts[:, np.newaxis] + np.arange(n_window)
+    invalid = (idx < 0) | (idx >= len(data))
+    out = data[np.clip(idx, 0, len(data) - 1), epochs[:, np.newaxis]]
+    out[invalid] = 0.0
+    return out.transpose(0, 2, 1)  # (n_windows, n_channels, n_window)
+
+
+@jit()
+def _edge_correct_blocks(x_xt, this_X, smax, smin, len_trf):
+    n_ch = this_X.shape[1]
+    for ch0 in range(n_ch):
+        for ch1 in range(ch0, n_ch):
+            _edge_correct(
                 x_xt[
                     ch0 * len_trf : (ch0 + 1) * len_trf,
                     ch1 * len_trf : (ch1 + 1) * len_trf,
-                ] += this_result
-                if ch0 != ch1:
-                    x_xt[
-                        ch1 * len_trf : (ch1 + 1) * len_trf,
-                        ch0 * len_trf : (ch0 + 1) * len_trf,
-                    ] += this_result.T
-                count += 1
-                pb.update(count)
-
-            # compute the crosscorrelations
-            cc_temp = cuda_dict["irfft"](
-                y_fft * X_fft_conj[:, slice(ch0, ch0 + 1)], n=n_fft, axis=0
+                ],
+                this_X,
+                smax,
+                smin,
+                ch0,
+                ch1,
             )
-            if smin < 0 and smax >= 0:
-                x_y[:-smin, ch0] += cc_temp[smin:]
-                x_y[len_trf - smax :, ch0] += cc_temp[:smax]
-            else:
-                x_y[:, ch0] += cc_temp[smin:smax]
-            count += 1
-            pb.update(count)
-
-    x_y = np.reshape(x_y, (n_ch_x * len_trf, n_ch_y), order="F")
-    return x_xt, x_y, n_ch_x, X_offset, y_offset
 
 
 @jit()
@@ -228,6 +256,53 @@ def _fit_corrs(x_xt, x_y, n_ch_x, reg_type, alpha, n_ch_in):
     return w
 
 
+def _fit_corrs_path(x_xt, x_y, y_y, n_samples, n_ch_x, reg_type, alphas, n_ch_in):
+    """Fit the model for the alpha with the smallest GCV error.
+
+    A single (generalized) eigendecomposition of the correlation matrices is
+    shared across all alphas.
+    """
+    n_ch_out = x_y.shape[1]
+    assert x_y.shape[0] % n_ch_x == 0
+    n_delays = x_y.shape[0] // n_ch_x
+    reg = _compute_reg_neighbors(n_ch_x, n_delays, reg_type)
+    # x_xt + alpha * reg == inv(V.T) @ diag(lam + alpha * mu) @ inv(V)
+    try:
+        if np.array_equal(reg, np.eye(len(reg))):
+            lam, V = linalg.eigh(x_xt)
+            mu = np.ones_like(lam)
+        else:
+            # V.T @ x_xt @ V == I and V.T @ reg @ V == diag(mu)
+            mu, V = linalg.eigh(reg, x_xt)
+            lam = np.ones_like(mu)
+    except np.linalg.LinAlgError:
+        logger.info("Singular correlation matrix, fitting each alpha separately")
+        ws, rss, dof = list(), list(), list()
+        for alpha in alphas:
+            mat = x_xt + alpha * reg
+            ws.append(_fit_corrs(x_xt, x_y, n_ch_x, reg_type, alpha, n_ch_in))
+            w = ws[-1].reshape(n_ch_out, -1).T
+            rss.append(y_y - 2 * np.sum(w * x_y, 0) + np.sum(w * (x_xt @ w), 0))
+            dof.append(np.trace(linalg.lstsq(mat, x_xt, lapack_driver="gelsy")[0]))
+        gcv = _gcv(np.array(rss), np.array(dof), n_samples)
+        best = np.argmin(gcv)
+        return ws[best], float(alphas[best]), gcv
+    b = V.T @ x_y
+    d = 1.0 / (lam + alphas[:, np.newaxis] * mu)  # (n_alphas, n_ch_x * n_delays)
+    b_2 = b * b
+    rss = y_y - 2 * d @ b_2 + (lam * d * d) @ b_2  # (n_alphas, n_ch_out)
+    gcv = _gcv(rss, (lam * d).sum(-1), n_samples)
+    best = np.argmin(gcv)
+    w = V @ (d[best][:, np.newaxis] * b)
+    w = w.T.reshape([n_ch_out, n_ch_in, n_delays])
+    return w, float(alphas[best]), gcv
+
+
+def _gcv(rss, dof, n_samples):
+    """Compute the generalized cross-validation error summed over outputs."""
+    return (rss / n_samples).sum(-1) / (1.0 - dof / n_samples) ** 2
+
+
 class TimeDelayingRidge(RegressorMixin, BaseEstimator):
     """Ridge regression of data with time delays.
 
@@ -242,8 +317,14 @@ class TimeDelayingRidge(RegressorMixin, BaseEstimator):
         Must be >= tmin.
     sfreq : float
         The sampling frequency used to convert times into samples.
-    alpha : float
-        The ridge (or laplacian) regularization factor.
+    alpha : float | array-like of float
+        The ridge (or laplacian) regularization factor. If several values
+        are given, the one with the smallest generalized cross-validation
+        (GCV) error is chosen, using a single eigendecomposition of the
+        autocorrelation matrix for all of them.
+
+        .. versionchanged:: 1.13
+           Support for several values.
     reg_type : str | list
         Can be ``"ridge"`` (default) or ``"laplacian"``.
         Can also be a 2-element list specifying how to regularize in time
@@ -351,7 +432,12 @@ class TimeDelayingRidge(RegressorMixin, BaseEstimator):
         self.tmin_ = float(self.tmin)
         self.tmax_ = float(self.tmax)
         self.sfreq_ = float(self.sfreq)
-        self.alpha_ = float(self.alpha)
+        alpha = np.array(self.alpha, float)
+        if alpha.ndim > 1 or alpha.size == 0:
+            raise ValueError(
+                f"alpha must be a float or a 1D array of floats, got {self.alpha}"
+            )
+        self.alpha_ = float(alpha) if alpha.ndim == 0 else alpha
         if self.tmin_ > self.tmax_:
             raise ValueError(f"tmin must be <= tmax, got {self.tmin_} and {self.tmax_}")
         n_delays = self._smax - self._smin
@@ -391,9 +477,23 @@ class TimeDelayingRidge(RegressorMixin, BaseEstimator):
             self.fit_intercept,
             self.edge_correction,
         )
-        self.coef_ = _fit_corrs(
-            self.cov_, x_y_, n_ch_x, self.reg_type, self.alpha_, n_ch_x
-        )
+        if np.ndim(self.alpha_) == 0:
+            self.coef_ = _fit_corrs(
+                self.cov_, x_y_, n_ch_x, self.reg_type, self.alpha_, n_ch_x
+            )
+        else:
+            y_y = np.sum((y - y_offset) ** 2, axis=tuple(range(y.ndim - 1)))
+            self.coef_, self.alpha_, gcv = _fit_corrs_path(
+                self.cov_,
+                x_y_,
+                y_y,
+                y.size // y.shape[-1],
+                n_ch_x,
+                self.reg_type,
+                self.alpha_,
+                n_ch_x,
+            )
+            logger.info(f"Chose alpha={self.alpha_:g} (GCV error {gcv.min():g})")
         # This is the sklearn formula from LinearModel (will be 0. for no fit)
         if self.fit_intercept:
             self.intercept_ = y_offset - np.dot(X_offset, self.coef_.sum(-1).T)
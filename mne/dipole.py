@@ -20,7 +20,7 @@ from ._freesurfer import _get_aseg, head_to_mni, head_to_mri, read_freesurfer_lu
 from .bem import ConductorModel, _bem_find_surface, _bem_surf_name, _fit_sphere
 from .cov import _ensure_cov, compute_whitener
 from .evoked import _aspect_rev, _read_evoked, _write_evokeds
-from .fixes import _safe_svd
+from .fixes import _reshape_view, _safe_svd
 from .forward._compute_forward import _compute_forwards_meeg, _prep_field_computation
 from .forward._make_forward import (
     _get_trans,
@@ -1010,6 +1010,39 @@ def _dipole_gof(uu, sing, vv, B, B2):
     return gof, one
 
 
+_GOF_BLOCK_BYTES = 2**25  # size of the projections in _best_guesses
+
+
+def _dipole_gof_multi(sing, vv, B, B2):
+    """Calculate the goodness of fit for many candidates and data vectors at once.
+
+    This is the batched version of :func:`_dipole_gof` for the candidate forward
+    SVDs ``sing`` (n_cand, 3) and ``vv`` (n_cand, 3, n_chan) and the data ``B``
+    (n_chan, n_data) with squared norms ``B2`` (n_data,).
+    """
+    n_cand, _, n_chan = vv.shape
+    use_3 = sing[:, 2] / np.where(sing[:, 0] > 0, sing[:, 0], 1.0) > 0.2
+    one = _reshape_view(vv, (3 * n_cand, n_chan)) @ B
+    one *= one
+    one = _reshape_view(one, (n_cand, 3, B.shape[1]))
+    Bm2 = one[:, 0] + one[:, 1]
+    Bm2[use_3] += one[use_3, 2]
+    return Bm2 / B2
+
+
+def _best_guesses(B, B2, guess_data):
+    """Find the index of the best guess for each data vector."""
+    _, sing, vv = guess_data["fwd_svd"]
+    idx = np.zeros(B.shape[1], int)
+    n_block = max(_GOF_BLOCK_BYTES // (24 * len(vv)), 1)
+    for start in range(0, B.shape[1], n_block):
+        sl = slice(start, start + n_block)
+        with np.errstate(invalid="ignore", divide="ignore"):  # B2 == 0
+            gof = _dipole_gof_multi(sing, vv, B[:, sl], B2[sl])
+        idx[sl] = np.argmin(1.0 - gof, axis=0)
+    return idx
+
+
 def _fit_Q(*, sensors, fwd_data, whitener, B, B2, B_orig, rd, ori=None):
     """Fit the dipole moment once the location is known."""
     if "fwd" in fwd_data:
@@ -1021,7 +1054,7 @@ def _fit_Q(*, sensors, fwd_data, whitener, B, B2, B_orig, rd, ori=None):
         assert fwd_orig.shape[0] == 3
         scales = fwd_data["scales"]
         assert scales.shape == (3,)
-        fwd_svd = fwd_data["fwd_svd"][0]
+        fwd_svd = tuple(x[0] for x in fwd_data["fwd_svd"])
     else:
         fwd, fwd_orig, scales = _dipole_forwards(
             sensors=sensors, fwd_data=fwd_data, whitener=whitener, rr=rd[np.newaxis, :]
@@ -1065,6 +1098,10 @@ def _fit_dipoles(
     rhoend,
 ):
     """Fit a single dipole to the given whitened, projected data."""
+    # find the best guess for all time points at once (find_best_guess in C)
+    B_white = whitener @ data
+    guess_idx = _best_guesses(B_white, np.sum(B_white * B_white, axis=0), guess_data)
+    del B_white
     parallel, p_fun, n_jobs = parallel_func(fun, n_jobs)
     # parallel over time points
     res = parallel(
@@ -1072,7 +1109,7 @@ def _fit_dipoles(
             min_dist_to_inner_skull,
             B,
             t,
-            guess_rrs,
+            guess_rrs[gi],
             guess_data,
             sensors=sensors,
             fwd_data=fwd_data,
@@ -1082,7 +1119,7 @@ def _fit_dipoles(
             rank=rank,
             rhoend=rhoend,
         )
-        for B, t in zip(data.T, times)
+        for B, t, gi in zip(data.T, times, guess_idx)
     )
     pos = np.array([r[0] for r in res])
     amp = np.array([r[1] for r in res])
@@ -1289,7 +1326,7 @@ def _fit_dipole(
     min_dist_to_inner_skull,
     B_orig,
     t,
-    guess_rrs,
+    x0,
     guess_data,
     *,
     sensors,
@@ -1319,28 +1356,12 @@ def _fit_dipole(
             R_adj=fwd_data["inner_skull"].radius - min_dist_to_inner_skull,
         )
 
-    # Find a good starting point (find_best_guess in C)
+    # The starting point x0 is the best guess (see _best_guesses)
     B2 = np.dot(B, B)
     if B2 == 0:
         warn(f"Zero field found for time {t}")
         return np.zeros(3), 0, np.zeros(3), 0, B
 
-    idx = np.argmin(
-        [
-            _fit_eval(
-                guess_rrs[[fi], :],
-                B,
-                B2,
-                fwd_svd=fwd_svd,
-                fwd_data=None,
-                sensors=None,
-                whitener=None,
-                lwork=None,
-            )
-            for fi, fwd_svd in enumerate(guess_data["fwd_svd"])
-        ]
-    )
-    x0 = guess_rrs[idx]
     lwork = _svd_lwork((3, B.shape[0]))
     fun = partial(
         _fit_eval,
@@ -1402,7 +1423,7 @@ def _fit_dipole_fixed(
     min_dist_to_inner_skull,
     B_orig,
     t,
-    guess_rrs,
+    x0,
     guess_data,
     *,
     sensors,
@@ -1436,7 +1457,7 @@ def _fit_dipole_fixed(
         ori = Q / norm
     else:
         amp = np.dot(Q, ori)
-    rd_final = guess_rrs[0]
+    rd_final = x0
     # This will be slow, and we don't use it anyway, so omit it for now:
     # conf = _fit_confidence(rd_final, Q, ori, whitener, fwd_data)
     conf = khi2 = nfree = None
@@ -1739,10 +1760,12 @@ def fit_dipole(
         n_jobs=fit_n_jobs,
     )
     # decompose ahead of time
-    guess_fwd_svd = [
-        _safe_svd(fwd, full_matrices=False)
-        for fwd in np.array_split(guess_fwd, len(guess_src["rr"]))
-    ]
+    guess_fwd_svd = _reshape_view(guess_fwd, (len(guess_src["rr"]), 3, -1))
+    try:
+        guess_fwd_svd = np.linalg.svd(guess_fwd_svd, full_matrices=False)
+    except np.linalg.LinAlgError:
+        guess_fwd_svd = [_safe_svd(fwd, full_matrices=False) for fwd in guess_fwd_svd]
+        guess_fwd_svd = tuple(np.array(x) for x in zip(*guess_fwd_svd))
     guess_data = dict(
         fwd=guess_fwd,
         fwd_svd=guess_fwd_svd,
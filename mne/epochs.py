@@ -1638,6 +1638,11 @@ class BaseEpochs(
         """Get a given epoch from disk."""
         raise NotImplementedError
 
+    def _iter_epochs_from_raw(self, idxs):
+        """Get the given epochs from disk one by one."""
+        for idx in idxs:
+            yield self._get_epoch_from_raw(idx)
+
     def _project_epoch(self, epoch):
         """Process a raw epoch based on the delayed param."""
         # whenever requested, the first epoch is being projected.
@@ -1775,9 +1780,8 @@ class BaseEpochs(
 
             # we need to load from disk, drop, and return data
             detrend_picks = self._detrend_picks
-            for ii, idx in enumerate(use_idx):
+            for ii, epoch_noproj in enumerate(self._iter_epochs_from_raw(use_idx)):
                 # faster to pre-allocate memory here
-                epoch_noproj = self._get_epoch_from_raw(idx)
                 epoch_noproj = self._detrend_offset_decim(epoch_noproj, detrend_picks)
                 if self._do_delayed_proj:
                     epoch_out = epoch_noproj
@@ -1798,6 +1802,7 @@ class BaseEpochs(
             assert n_events == len(self.selection)
             if not self.preload:
                 detrend_picks = self._detrend_picks
+                epochs_from_raw = self._iter_epochs_from_raw(range(n_events))
             for idx, sel in enumerate(self.selection):
                 if self.preload:  # from memory
                     assert self._data is not None
@@ -1808,7 +1813,7 @@ class BaseEpochs(
                         epoch_noproj = None
                         epoch = self._data[idx]
                 else:  # from disk
-                    epoch_noproj = self._get_epoch_from_raw(idx)
+                    epoch_noproj = next(epochs_from_raw)
                     epoch_noproj = self._detrend_offset_decim(
                         epoch_noproj, detrend_picks
                     )
@@ -3696,6 +3701,13 @@ class Epochs(BaseEpochs):
             If array, it's the data in the desired range (good segment)
             If None, it means no data is available.
         """
+        return next(self._iter_epochs_from_raw([idx]))
+
+    def _iter_epochs_from_raw(self, idxs):
+        """Load epochs from disk one by one.
+
+        All of the epochs are checked for overlapping bad annotations at once.
+        """
         if self._raw is None:
             # This should never happen, as raw=None only if preload=True
             raise ValueError(
@@ -3704,10 +3716,10 @@ class Epochs(BaseEpochs):
                 "developers."
             )
         sfreq = self._raw.info["sfreq"]
-        event_samp = self.events[idx, 0]
+        event_samp = self.events[np.asarray(idxs, int), 0]
         # Read a data segment from "start" to "stop" in samples
         first_samp = self._raw.first_samp
-        start = int(round(event_samp + self._raw_times[0] * sfreq))
+        start = np.round(event_samp + self._raw_times[0] * sfreq).astype(int)
         start -= first_samp
         stop = start + len(self._raw_times)
 
@@ -3716,7 +3728,7 @@ class Epochs(BaseEpochs):
         reject_tmin = self.reject_tmin
         if reject_tmin is None:
             reject_tmin = self._raw_times[0]
-        reject_start = int(round(event_samp + reject_tmin * sfreq))
+        reject_start = np.round(event_samp + reject_tmin * sfreq).astype(int)
         reject_start -= first_samp
 
         reject_tmax = self.reject_tmax
@@ -3725,16 +3737,17 @@ class Epochs(BaseEpochs):
         diff = int(round((self._raw_times[-1] - reject_tmax) * sfreq))
         reject_stop = stop - diff
 
-        logger.debug(f"    Getting epoch for {start}-{stop}")
-        data = self._raw._check_bad_segment(
-            start,
-            stop,
-            self.picks,
-            reject_start,
-            reject_stop,
-            self.reject_by_annotation,
-        )
-        return data
+        bads = [None] * len(start)
+        if self.reject_by_annotation:
+            bads = self._raw._get_bad_annotations(reject_start, reject_stop)
+        for ii, bad in enumerate(bads):
+            logger.debug(f"    Getting epoch for {start[ii]}-{stop[ii]}")
+            if start[ii] >= 0 and bad is not None:
+                yield bad
+            else:
+                yield self._raw._check_bad_segment(
+                    start[ii], stop[ii], self.picks, reject_start[ii], reject_stop[ii]
+                )
 
 
 @fill_doc
@@ -32,6 +32,8 @@ from .utils import (
     warn,
 )
 
+_FIND_EVENTS_CHUNK_BYTES = 2**25  # stim channel data to read at once
+
 
 @fill_doc
 def pick_events(events, include=None, exclude=None, step=False):
@@ -493,23 +495,12 @@ def _find_events(
     """Help find events."""
     assert data.shape[0] == 1  # data should be only a row vector
 
-    if min_samples > 0:
-        merge = int(min_samples // 1)
-        if merge == min_samples:
-            merge -= 1
-    else:
-        merge = 0
-
+    merge = _min_samples_to_merge(min_samples)
     data = data.astype(np.int64)
     if uint_cast:
         data = data.astype(np.uint16).astype(np.int64)
     if data.min() < 0:
-        warn(
-            "Trigger channel contains negative values, using absolute "
-            "value. If data were acquired on a Neuromag system with "
-            "STI016 active, consider using uint_cast=True to work around "
-            "an acquisition bug"
-        )
+        _warn_negative_trigger()
         data = np.abs(data)  # make sure trig channel is positive
 
     events = _find_stim_steps(data, first_samp, pad_stop=0, merge=merge)
@@ -518,15 +509,42 @@ def _find_events(
         if initial_event:
             events = np.insert(events, 0, [first_samp, 0, initial_value], axis=0)
         else:
-            logger.info(
-                f"Trigger channel {ch_name} has a non-zero initial value of "
-                f"{initial_value} (consider using initial_event=True to detect this "
-                "event)"
-            )
+            _log_initial_value(ch_name, initial_value)
 
     events = _mask_trigs(events, mask, mask_type)
+    return _select_events(events, output, consecutive, ch_name)
 
-    # Determine event onsets and offsets
+
+def _min_samples_to_merge(min_samples):
+    """Convert the minimum duration of events to the merge of steps."""
+    if min_samples > 0:
+        merge = int(min_samples // 1)
+        if merge == min_samples:
+            merge -= 1
+    else:
+        merge = 0
+    return merge
+
+
+def _warn_negative_trigger():
+    warn(
+        "Trigger channel contains negative values, using absolute "
+        "value. If data were acquired on a Neuromag system with "
+        "STI016 active, consider using uint_cast=True to work around "
+        "an acquisition bug"
+    )
+
+
+def _log_initial_value(ch_name, initial_value):
+    logger.info(
+        f"Trigger channel {ch_name} has a non-zero initial value of "
+        f"{initial_value} (consider using initial_event=True to detect this "
+        "event)"
+    )
+
+
+def _onsets_offsets(events, consecutive):
+    """Determine which steps are event onsets and offsets."""
     if consecutive == "increasing":
         onsets = events[:, 2] > events[:, 1]
         offsets = np.logical_and(
@@ -538,7 +556,12 @@ def _find_events(
     else:
         onsets = events[:, 1] == 0
         offsets = events[:, 2] == 0
+    return onsets, offsets
+
 
+def _select_events(events, output, consecutive, ch_name):
+    """Get the events from the (masked) steps of a stim channel."""
+    onsets, offsets = _onsets_offsets(events, consecutive)
     onset_idx = np.where(onsets)[0]
     offset_idx = np.where(offsets)[0]
 
@@ -574,6 +597,25 @@ def _find_events(
     return events
 
 
+def _check_shortest_event(events, shortest_event):
+    # add safety check for spurious events (for ex. from neuromag syst.) by
+    # checking the number of low sample events
+    n_short_events = np.sum(np.diff(events[:, 0]) < shortest_event)
+    if n_short_events > 0:
+        raise ValueError(
+            f"You have {n_short_events} events shorter than the shortest_event. "
+            "These are very unusual and you may want to set min_duration to a "
+            "larger value e.g. x / raw.info['sfreq']. Where x = 1 sample shorter "
+            "than the shortest event length."
+        )
+
+
+def _merge_events_list(events_list):
+    events = np.concatenate(events_list, axis=0)
+    events = _find_unique_events(events)
+    return events[np.argsort(events[:, 0])]
+
+
 def _find_unique_events(events):
     """Uniquify events (ie remove duplicated rows."""
     e = np.ascontiguousarray(events).view(
@@ -669,6 +711,7 @@ def find_events(
     find_stim_steps : Find all the steps in the stim channel.
     read_events : Read events from disk.
     write_events : Write events to disk.
+    EventFinder : Find events in data that arrive in chunks.
 
     Notes
     -----
@@ -677,6 +720,13 @@ def find_events(
                  your events after decimation, but note this reduces the
                  precision of event timing.
 
+    If ``raw`` is not preloaded, the stim channels are read in chunks (see
+    :class:`mne.EventFinder`), so the memory use does not grow with the
+    duration of the recording.
+
+    .. versionchanged:: 1.13
+       Reading the stim channels of data that are not preloaded in chunks.
+
     Examples
     --------
     Consider data with a stim channel that looks like::
@@ -769,6 +819,24 @@ def find_events(
     if len(picks) == 0:
         raise ValueError("No stim channel found to extract event triggers.")
     logger.info(f"Finding events on: {', '.join(raw.ch_names[pick] for pick in picks)}")
+    if not raw.preload:
+        finder = EventFinder(
+            raw.info,
+            stim_channel,
+            output,
+            consecutive,
+            min_duration,
+            shortest_event,
+            mask,
+            uint_cast,
+            mask_type,
+            initial_event,
+            first_samp=raw.first_samp,
+        )
+        n_chunk = max(_FIND_EVENTS_CHUNK_BYTES // (8 * len(picks)), 1)
+        for start in range(0, len(raw.times), n_chunk):
+            finder.process(raw[picks, start : start + n_chunk][0])
+        return finder.finish()
     data, _ = raw[picks, :]
 
     events_list = []
@@ -786,23 +854,277 @@ def find_events(
             initial_event=initial_event,
             ch_name=ch_name,
         )
-        # add safety check for spurious events (for ex. from neuromag syst.) by
-        # checking the number of low sample events
-        n_short_events = np.sum(np.diff(events[:, 0]) < shortest_event)
-        if n_short_events > 0:
+        _check_shortest_event(events, shortest_event)
+        events_list.append(events)
+
+    return _merge_events_list(events_list)
+
+
+@fill_doc
+class EventFinder:
+    """Find events in stim channel data that arrive in chunks.
+
+    The state needed to handle events that span (or are merged across) the
+    borders of chunks is kept between calls to :meth:`process`, so the events
+    are the same as those of :func:`mne.find_events` on all of the data.
+
+    Parameters
+    ----------
+    %(info_not_none)s
+    stim_channel : None | str | list of str
+        The stim channel(s), see :func:`mne.find_events`.
+    output : 'onset' | 'offset' | 'step'
+        Whether to report when events start, when events end, or both.
+    consecutive : bool | 'increasing'
+        How to treat changes of the value without first returning to zero,
+        see :func:`mne.find_events`.
+    min_duration : float
+        The minimum duration of a change in the events channel required to
+        consider it as an event (in seconds).
+    shortest_event : int
+        Minimum number of samples an event must last, checked by
+        :meth:`finish`.
+    mask : int | None
+        The value of the digital mask to apply to the stim channel values.
+    uint_cast : bool
+        If True, cast the stim channel data to an unsigned integer.
+    mask_type : 'and' | 'not_and'
+        The type of operation between the mask and the trigger.
+    initial_event : bool
+        If True, report a non-zero value in the first sample as an event.
+    first_samp : int
+        The sample number of the first sample of the first chunk.
+    %(verbose)s
+
+    See Also
+    --------
+    find_events
+
+    Notes
+    -----
+    Steps closer than ``min_duration`` to the end of the data received so far
+    are reported once the next chunk shows whether they are merged with a
+    later step. The events returned by :meth:`process` can end with an onset
+    whose offset never arrives, which :meth:`finish` removes like
+    :func:`mne.find_events` does.
+
+    .. versionadded:: 1.13
+    """
+
+    @verbose
+    def __init__(
+        self,
+        info,
+        stim_channel=None,
+        output="onset",
+        consecutive="increasing",
+        min_duration=0,
+        shortest_event=2,
+        mask=None,
+        uint_cast=False,
+        mask_type="and",
+        initial_event=False,
+        *,
+        first_samp=0,
+        verbose=None,
+    ):
+        stim_channel = _get_stim_channel(stim_channel, info)
+        picks = pick_channels(info["ch_names"], include=stim_channel)
+        if len(picks) == 0:
+            raise ValueError("No stim channel found to extract event triggers.")
+        _check_option("output", output, ("onset", "step", "offset"))
+        _check_option("consecutive", consecutive, (True, False, "increasing"))
+        _mask_trigs(np.empty((0, 3), int), mask, mask_type)  # validate
+        self._ch_names = [info["ch_names"][pick] for pick in picks]
+        self.output = output
+        self.consecutive = consecutive
+        self.shortest_event = shortest_event
+        merge = _min_samples_to_merge(min_duration * info["sfreq"])
+        self._channels = [
+            _ChannelEventFinder(
+                ch_name, merge, mask, uint_cast, mask_type, initial_event, first_samp
+            )
+            for ch_name in self.ch_names
+        ]
+        self._finished = False
+
+    def __repr__(self):  # noqa: D105
+        n_samples = self._channels[0].n_times - self._channels[0].first_samp
+        return (
+            f"<EventFinder | {', '.join(self.ch_names)}, {n_samples} samples processed>"
+        )
+
+    @property
+    def ch_names(self):
+        """The names of the stim channels, in the order expected by process."""
+        return list(self._ch_names)
+
+    def process(self, data):
+        """Find the events in the next chunk of data.
+
+        Parameters
+        ----------
+        data : array, shape (n_stim_channels, n_times)
+            The next samples of the stim channels, in the order of
+            :attr:`ch_names`.
+
+        Returns
+        -------
+        %(events)s
+            The events that are complete.
+        """
+        if self._finished:
+            raise RuntimeError("Cannot process data after finish() was called")
+        data = np.asarray(data)
+        if data.ndim == 1:
+            data = data[np.newaxis]
+        if data.ndim != 2 or len(data) != len(self._channels):
             raise ValueError(
-                f"You have {n_short_events} events shorter than the shortest_event. "
-                "These are very unusual and you may want to set min_duration to a "
-                "larger value e.g. x / raw.info['sfreq']. Where x = 1 sample shorter "
-                "than the shortest event length."
+                f"data must have shape ({len(self._channels)}, n_times), got "
+                f"{data.shape}"
             )
+        return _merge_events_list(
+            [
+                channel.online_events(channel.process(d), self.output, self.consecutive)
+                for channel, d in zip(self._channels, data)
+            ]
+        )
 
-        events_list.append(events)
+    def finish(self):
+        """Find the remaining events at the end of the data.
 
-    events = np.concatenate(events_list, axis=0)
-    events = _find_unique_events(events)
-    events = events[np.argsort(events[:, 0])]
-    return events
+        Returns
+        -------
+        %(events)s
+            All events found in the data, the same as those of
+            :func:`mne.find_events`.
+        """
+        if self._finished:
+            raise RuntimeError("finish() was already called")
+        self._finished = True
+        events_list = list()
+        for channel in self._channels:
+            channel.process(np.empty(0, np.int64), final=True)
+            events = _select_events(
+                np.concatenate(channel.events),
+                self.output,
+                self.consecutive,
+                channel.ch_name,
+            )
+            _check_shortest_event(events, self.shortest_event)
+            events_list.append(events)
+        return _merge_events_list(events_list)
+
+
+class _ChannelEventFinder:
+    """Masked steps of one stim channel, found chunk by chunk."""
+
+    def __init__(
+        self, ch_name, merge, mask, uint_cast, mask_type, initial_event, first_samp
+    ):
+        self.ch_name = ch_name
+        self.merge = merge
+        self.mask = mask
+        self.uint_cast = uint_cast
+        self.mask_type = mask_type
+        self.initial_event = initial_event
+        self.first_samp = self.n_times = first_samp
+        self.last = None  # the last value of the previous chunk
+        self.steps = np.empty((0, 3), np.int64)  # steps that might still merge
+        self.prev = None  # the last step that cannot merge anymore
+        self.events = [np.empty((0, 3), np.int64)]  # masked (merged) steps
+        self.has_steps = False
+        self.warned = False
+        # for the events reported by online_events
+        self.first_offset = True
+        self.seen_onset = False
+        self.onset_ids = list()  # offsets are paired with onsets in order
+        self.offsets = list()
+
+    def process(self, data, final=False):
+        """Get the masked steps that cannot change anymore."""
+        data = data.astype(np.int64)
+        if self.uint_cast:
+            data = data.astype(np.uint16).astype(np.int64)
+        if len(data) and data.min() < 0:
+            if not self.warned:
+                _warn_negative_trigger()
+                self.warned = True
+            data = np.abs(data)
+        events = list()
+        if self.last is None and len(data):
+            if data[0] != 0:
+                if self.initial_event:
+                    events.append([[self.first_samp, 0, data[0]]])
+                else:
+                    _log_initial_value(self.ch_name, data[0])
+            self.last = data[:1]
+        if len(data):
+            steps = _find_stim_steps(
+                np.concatenate([self.last, data])[np.newaxis], self.n_times - 1
+            )
+            self.steps = np.concatenate([self.steps, steps])
+            self.has_steps |= len(steps) > 0
+            self.last = data[-1:]
+            self.n_times += len(data)
+        # like pad_stop=0 in _find_stim_steps (which only pads actual steps)
+        if final and self.has_steps and self.last[0]:
+            self.steps = np.concatenate([self.steps, [[self.n_times, self.last[0], 0]]])
+        events.append(self._merge(final))
+        events = _mask_trigs(
+            np.concatenate(events).astype(np.int64), self.mask, self.mask_type
+        )
+        self.events.append(events)
+        return events
+
+    def _merge(self, final):
+        """Merge the steps that cannot merge with later ones anymore."""
+        steps, merge = self.steps, abs(self.merge)
+        n_done = len(steps)
+        if not final and self.merge and n_done:
+            n_done -= self.n_times - steps[-1, 0] <= merge
+        done = steps[:n_done].copy()
+        if self.merge and n_done:
+            orig = steps if self.prev is None else np.concatenate([[self.prev], steps])
+            n_prev = len(orig) - len(steps)
+            close = np.diff(orig[:, 0]) <= merge  # each step and the next
+            close_prev = np.r_[False, close] if self.prev is None else close
+            close_prev = close_prev[:n_done]
+            close_next = np.r_[close[n_prev:], False][:n_done]
+            if self.merge > 0:  # drop the earlier step
+                where = np.where(close_prev)[0]
+                done[where, 1] = orig[where + n_prev - 1, 1]
+                keep = ~close_next
+            else:  # drop the later step
+                where = np.where(close_next)[0]
+                done[where, 2] = steps[where + 1, 2]
+                keep = ~close_prev
+            keep &= done[:, 1] != done[:, 2]
+            self.prev = steps[n_done - 1]
+            done = done[keep]
+        self.steps = steps[n_done:]
+        return done
+
+    def online_events(self, events, output, consecutive):
+        """Get events from new masked steps as soon as they are known."""
+        onsets, offsets = _onsets_offsets(events, consecutive)
+        if self.first_offset and offsets.any():
+            self.first_offset = False
+            first = np.where(offsets)[0][0]
+            if not onsets[: first + 1].any() and not self.seen_onset:
+                offsets[first] = False  # orphaned offset
+        self.seen_onset |= onsets.any()
+        if output == "onset":
+            return events[onsets]
+        elif output == "step":
+            return events[onsets | offsets]
+        self.onset_ids.extend(events[onsets, 2])
+        self.offsets.extend(events[offsets][:, ::2] - [1, 0])
+        n_out = min(len(self.onset_ids), len(self.offsets))
+        out = np.array(self.offsets[:n_out], events.dtype).reshape(-1, 2)
+        out = np.c_[out, np.array(self.onset_ids[:n_out], events.dtype)]
+        del self.onset_ids[:n_out], self.offsets[:n_out]
+        return out
 
 
 def _mask_trigs(events, mask, mask_type):
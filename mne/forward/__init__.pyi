@@ -1,5 +1,6 @@
 __all__ = [
     "Forward",
+    "_MovingForwardModeler",
     "_apply_forward",
     "_as_meg_type_inst",
     "_compute_forwards",
@@ -52,6 +53,7 @@ from ._field_interpolation import (
 )
 from ._make_forward import (
     _create_meg_coils,
+    _MovingForwardModeler,
     _prep_eeg_channels,
     _prep_meg_channels,
     _prepare_for_forward,
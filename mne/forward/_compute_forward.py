@@ -12,16 +12,29 @@
 #        Lewis, 1999. Generalized discussion of forward solutions.
 
 from copy import deepcopy
+from functools import partial
 
 import numpy as np
 
 from .._fiff.constants import FIFF
+from .._fiff.write import _get_size_bytes
 from ..bem import _import_openmeeg, _make_openmeeg_geometry
 from ..fixes import _reshape_view, bincount, jit
 from ..parallel import parallel_func
 from ..surface import _jit_cross, _project_onto_surface
 from ..transforms import apply_trans, invert_transform
-from ..utils import _check_option, _pl, fill_doc, logger, verbose, warn
+from ..utils import (
+    _check_option,
+    _ContentCache,
+    _ensure_int,
+    _pl,
+    _validate_type,
+    fill_doc,
+    logger,
+    object_hash,
+    verbose,
+    warn,
+)
 
 # #############################################################################
 # COIL SPECIFICATION AND FIELD COMPUTATION MATRIX
@@ -85,22 +98,27 @@ def _lin_field_coeff(surf, mult, rmags, cosmags, ws, bins, n_jobs):
         (?)
     """
     parallel, p_fun, n_jobs = parallel_func(
-        _do_lin_field_coeff, n_jobs, max_jobs=len(surf["tris"])
+        _do_lin_field_coeff, n_jobs, max_jobs=len(surf["rr"]), prefer="threads"
     )
-    nas = np.array_split
+    # The contribution of each triangle is linear in its area-weighted normal,
+    # so the triangles around each vertex can be combined before the
+    # integration points are visited
+    tri_nn = surf["tri_nn"] * surf["tri_area"][:, np.newaxis]
+    tris = surf["tris"].ravel()
+    nn = np.array(
+        [
+            bincount(tris, np.repeat(tri_nn[:, ii], 3), len(surf["rr"]))
+            for ii in range(3)
+        ]
+    ).T
+    verts = np.array_split(np.arange(len(surf["rr"])), n_jobs)
     coeffs = parallel(
-        p_fun(surf["rr"], t, tn, ta, rmags, cosmags, ws, bins)
-        for t, tn, ta in zip(
-            nas(surf["tris"], n_jobs),
-            nas(surf["tri_nn"], n_jobs),
-            nas(surf["tri_area"], n_jobs),
-        )
+        p_fun(surf["rr"][v], nn[v], rmags, cosmags, ws, bins) for v in verts
     )
-    return mult * np.sum(coeffs, axis=0)
+    return mult * np.concatenate(coeffs, axis=1)
 
 
-@jit()
-def _do_lin_field_coeff(bem_rr, tris, tn, ta, rmags, cosmags, ws, bins):
+def _do_lin_field_coeff(bem_rr, bem_nn, rmags, cosmags, ws, bins):
     """Compute field coefficients (parallel-friendly).
 
     See section IV of Mosher et al., 1999 (specifically equation 35).
@@ -110,12 +128,8 @@ def _do_lin_field_coeff(bem_rr, tris, tn, ta, rmags, cosmags, ws, bins):
     bem_rr : ndarray, shape (n_BEM_vertices, 3)
         Positions on one BEM surface in 3-space. 2562 BEM vertices for BEM with
         5120 triangles (ico-4)
-    tris : ndarray, shape (n_BEM_vertices, 3)
-        Vertex indices for each triangle (referring to bem_rr)
-    tn : ndarray, shape (n_BEM_vertices, 3)
-        Triangle unit normal vectors
-    ta : ndarray, shape (n_BEM_vertices,)
-        Triangle areas
+    bem_nn : ndarray, shape (n_BEM_vertices, 3)
+        Sum of the area-weighted normals of the triangles of each vertex
     rmag : ndarray, shape (n_sensor_pts, 3)
         3D positions of MEG coil integration points (from coil['rmag'])
     cosmag : ndarray, shape (n_sensor_pts, 3)
@@ -130,39 +144,27 @@ def _do_lin_field_coeff(bem_rr, tris, tn, ta, rmags, cosmags, ws, bins):
     coeff : ndarray, shape (n_MEG_sensors, n_BEM_vertices)
         Linear coefficients with effect of each BEM vertex on each sensor (?)
     """
-    n_bem_rr = len(bem_rr)
-    coeff = np.zeros((bins[-1] + 1, n_bem_rr))
-    w_cosmags = ws.reshape(-1, 1) * cosmags
-    # Store as (n_BEM_vertices, n_sensor_pts, 3): below we repeatedly index
-    # a single BEM vertex out of this array, and this layout makes that a
-    # contiguous slice along the leading axis instead of a strided gather
-    # along a middle axis, which is ~2x faster in practice.
-    diff = rmags.reshape(1, -1, 3) - bem_rr.reshape(n_bem_rr, 1, 3)
-    den = np.sum(diff * diff, axis=-1)
+    # Simple version (bem_lin_field_coeffs_simple)
+    # For each triangle and each of its vertices, the coefficient is
+    # area * ((rmag - rr) x tri_nn) . (w * cosmag) / (3 * |rmag - rr| ** 3).
+    # Using the vertex normals (summed over triangles) and expanding the triple
+    # product as nn . (w_cosmag x rmag) - w_cosmag . (rr x nn), the numerator
+    # for all points and vertices is a single matrix product
+    w_cosmags = ws[:, np.newaxis] * cosmags
+    lhs = np.concatenate([np.cross(w_cosmags, rmags), -w_cosmags], axis=1)
+    rhs = np.concatenate([bem_nn, np.cross(bem_rr, bem_nn)], axis=1)
+    x = lhs @ rhs.T
+    den = np.zeros_like(x)
+    for ii in range(3):
+        diff = rmags[:, ii, np.newaxis] - bem_rr[:, ii]
+        diff *= diff
+        den += diff
     den *= np.sqrt(den)
     den *= 3
-    for ti in range(len(tris)):
-        tri, tri_nn, tri_area = tris[ti], tn[ti], ta[ti]
-        # Accumulate the coefficients for each triangle node and add to the
-        # corresponding coefficient matrix
-
-        # Simple version (bem_lin_field_coeffs_simple)
-        # The following is equivalent to:
-        # tri_rr = bem_rr[tri]
-        # for j, coil in enumerate(coils['coils']):
-        #     x = func(coil['rmag'], coil['cosmag'],
-        #              tri_rr, tri_nn, tri_area)
-        #     res = np.sum(coil['w'][np.newaxis, :] * x, axis=1)
-        #     coeff[j][tri + off] += mult * res
-        for vi in range(3):
-            idx = tri[vi]
-            c = np.empty((diff.shape[1], 3))
-            _jit_cross(c, diff[idx], tri_nn)
-            c *= w_cosmags
-            x = np.sum(c, axis=-1)
-            x /= den[idx] / tri_area
-            coeff[:, idx] += bincount(bins, weights=x, minlength=bins[-1] + 1)
-    return coeff
+    x /= den
+    # the integration points of each coil are contiguous
+    starts = np.searchsorted(bins, np.arange(bins[-1] + 1))
+    return np.add.reduceat(x, starts, axis=0)
 
 
 def _concatenate_coils(coils):
@@ -201,6 +203,21 @@ def _bem_specify_coils(bem, coils, coord_frame, mults, n_jobs):
     sol: ndarray, shape (n_MEG_sensors, n_BEM_vertices)
         MEG solution
     """
+    coeff = _bem_field_coeff(bem, coils, coord_frame, n_jobs)
+    sol = np.dot(coeff, bem["solution"])
+    sol *= mults
+    return sol
+
+
+def _bem_field_coeff(bem, coils, coord_frame, n_jobs):
+    """Compute the linear field coefficients of all BEM vertices at the coils.
+
+    Returns
+    -------
+    coeff : ndarray, shape (n_MEG_sensors, n_BEM_vertices)
+        The coefficients, such that ``coeff @ bem["solution"] * mults`` is the
+        solution from :func:`_bem_specify_coils`.
+    """
     # Make sure MEG coils are in MRI coordinate frame to match BEM coords
     coils, coord_frame = _check_coil_frame(coils, coord_frame, bem)
 
@@ -215,9 +232,9 @@ def _bem_specify_coils(bem, coils, coord_frame, mults, n_jobs):
     rmags, cosmags, ws, bins = _triage_coils(coils)
     del coils
     lens = np.cumsum(np.r_[0, [len(s["rr"]) for s in bem["surfs"]]])
-    sol = np.zeros((bins[-1] + 1, bem["solution"].shape[1]))
+    coeff = np.zeros((bins[-1] + 1, lens[-1]))
 
-    lims = np.concatenate([np.arange(0, sol.shape[0], 100), [sol.shape[0]]])
+    lims = np.concatenate([np.arange(0, coeff.shape[0], 100), [coeff.shape[0]]])
     # Put through the bem (in channel-based chunks to save memory)
     for start, stop in zip(lims[:-1], lims[1:]):
         mask = np.logical_and(bins >= start, bins < stop)
@@ -226,10 +243,8 @@ def _bem_specify_coils(bem, coils, coord_frame, mults, n_jobs):
         for o1, o2, surf, mult in zip(
             lens[:-1], lens[1:], bem["surfs"], bem["field_mult"]
         ):
-            coeff = _lin_field_coeff(surf, mult, r, c, w, b, n_jobs)
-            sol[start:stop] += np.dot(coeff, bem["solution"][o1:o2])
-    sol *= mults
-    return sol
+            coeff[start:stop, o1:o2] = _lin_field_coeff(surf, mult, r, c, w, b, n_jobs)
+    return coeff
 
 
 def _bem_specify_els(bem, els, mults):
@@ -275,6 +290,7 @@ def _bem_specify_els(bem, els, mults):
 # BEM COMPUTATION
 
 _MAG_FACTOR = 1e-7  # μ_0 / (4π)
+_FWD_MAX_MEMORY = 2**28  # default maximum size of temporaries for BEM fields
 
 # def _bem_inf_pot(rd, Q, rp):
 #     """The infinite medium potential in one direction. See Eq. (8) in
@@ -286,7 +302,6 @@ _MAG_FACTOR = 1e-7  # μ_0 / (4π)
 #     return np.sum(Q * diff, axis=1) / (diff2 * np.sqrt(diff2))
 
 
-@jit()
 def _bem_inf_pots(mri_rr, bem_rr, mri_Q=None):
     """Compute the infinite medium potential in all 3 directions.
 
@@ -304,20 +319,27 @@ def _bem_inf_pots(mri_rr, bem_rr, mri_Q=None):
     ndarray : shape(n_dipole_vertices, 3, n_BEM_vertices)
     """
     # NOTE: the (μ_0 / (4π) factor has been moved to _prep_field_communication
-    # Get position difference vector between BEM vertex and dipole
-    diff = np.empty((len(mri_rr), 3, len(bem_rr)))
-    for ri in range(mri_rr.shape[0]):
-        rr = mri_rr[ri]
-        this_diff = bem_rr - rr
-        diff_norm = np.sum(this_diff * this_diff, axis=1)
-        diff_norm *= np.sqrt(diff_norm)
-        diff_norm[diff_norm == 0] = 1.0
-        if mri_Q is not None:
-            this_diff = np.dot(this_diff, mri_Q.T)
-        this_diff /= diff_norm.reshape(-1, 1)
-        diff[ri] = this_diff.T
-
-    return diff
+    # Get position difference vector between BEM vertex and dipole, operating
+    # on all dipoles at once one component at a time (so that numpy can
+    # release the GIL for threads)
+    bem_rr = bem_rr.T
+    diff = [bem_rr[ii] - mri_rr[:, ii, np.newaxis] for ii in range(3)]
+    diff_norm = diff[0] * diff[0]
+    diff_norm += diff[1] * diff[1]
+    diff_norm += diff[2] * diff[2]
+    diff_norm *= np.sqrt(diff_norm)
+    diff_norm[diff_norm == 0] = 1.0
+    np.divide(1.0, diff_norm, out=diff_norm)
+    if mri_Q is None:
+        mri_Q = np.eye(3)
+    v0s = np.empty((len(mri_rr), 3, bem_rr.shape[1]))
+    for ii in range(3):
+        this_v0 = v0s[:, ii]
+        np.multiply(diff[0], mri_Q[ii, 0], out=this_v0)
+        this_v0 += mri_Q[ii, 1] * diff[1]
+        this_v0 += mri_Q[ii, 2] * diff[2]
+        this_v0 *= diff_norm
+    return v0s
 
 
 # This function has been refactored to process all points simultaneously
@@ -380,7 +402,17 @@ def _bem_inf_fields(rr, rmag, cosmag):
 
 
 @fill_doc
-def _bem_pot_or_field(rr, mri_rr, mri_Q, coils, solution, bem_rr, n_jobs, coil_type):
+def _bem_pot_or_field(
+    rr,
+    mri_rr,
+    mri_Q,
+    coils,
+    solution,
+    bem_rr,
+    n_jobs,
+    coil_type,
+    max_memory=_FWD_MAX_MEMORY,
+):
     """Calculate the magnetic field or electric potential forward solution.
 
     The code is very similar between EEG and MEG potentials, so combine them.
@@ -404,118 +436,199 @@ def _bem_pot_or_field(rr, mri_rr, mri_Q, coils, solution, bem_rr, n_jobs, coil_t
     %(n_jobs)s
     coil_type : str
         'meg' or 'eeg'
+    max_memory : int
+        Approximate maximum number of bytes to use for temporary arrays
+        (across all jobs).
 
     Returns
     -------
     B : ndarray, shape (n_dipoles * 3, n_sensors)
         Forward solution for a set of sensors
     """
-    # Both MEG and EEG have the inifinite-medium potentials
-    # This could be just vectorized, but eats too much memory, so instead we
-    # reduce memory by chunking within _do_inf_pots and parallelize, too:
-    parallel, p_fun, n_jobs = parallel_func(_do_inf_pots, n_jobs, max_jobs=len(rr))
-    nas = np.array_split
-    B = np.sum(
-        parallel(
-            p_fun(
-                mri_rr, sr.copy(), np.ascontiguousarray(mri_Q), np.array(sol)
-            )  # copy and contig
-            for sr, sol in zip(nas(bem_rr, n_jobs), nas(solution.T, n_jobs))
-        ),
-        axis=0,
+    # Sources are processed in tiles whose results are written directly into
+    # the preallocated output. The tiles are computed in threads, which share
+    # the solution matrix (so it never needs to be pickled), and the heavy
+    # lifting is done by numpy and BLAS, which release the GIL.
+    parallel, p_fun, n_jobs = parallel_func(
+        _bem_field_tile, n_jobs, max_jobs=len(rr), prefer="threads"
     )
-    # The copy()s above should make it so the whole objects don't need to be
-    # pickled...
-
     # Only MEG coils are sensitive to the primary current distribution.
+    coils = _triage_coils(coils) if coil_type == "meg" else None
+    n_points = 0 if coils is None else len(coils[0])
+    # The infinite-medium potentials (and their temporaries) and the primary
+    # current temporaries for each source
+    source_bytes = 8 * (7 * len(bem_rr) + 8 * n_points)
+    B = np.empty((3 * len(rr), solution.shape[0]))
+    parallel(
+        p_fun(B, rr, mri_rr, mri_Q, coils, solution.T, bem_rr, start, stop)
+        for start, stop in _source_tiles(len(rr), source_bytes, n_jobs, max_memory)
+    )
     if coil_type == "meg":
-        # Primary current contribution (can be calc. in coil/dipole coords)
-        parallel, p_fun, n_jobs = parallel_func(_do_prim_curr, n_jobs)
-        pcc = np.concatenate(parallel(p_fun(r, coils) for r in nas(rr, n_jobs)), axis=0)
-        B += pcc
         B *= _MAG_FACTOR
     return B
 
 
-def _do_prim_curr(rr, coils):
-    """Calculate primary currents in a set of MEG coils.
+def _bem_field_tile(B, rr, mri_rr, mri_Q, coils, sol, bem_rr, start, stop):
+    """Compute the forward solution for a tile of sources in place."""
+    # Doing work of 'fwd_bem_pot_calc' in MNE-C
+    # v0 in Hämäläinen et al., 1989 == v_inf in Mosher, et al., 1999
+    v0s = _bem_inf_pots(mri_rr[start:stop], bem_rr, mri_Q)
+    v0s = _reshape_view(v0s, (-1, v0s.shape[2]))
+    out = B[3 * start : 3 * stop]
+    np.dot(v0s, sol, out=out)
+    del v0s
+    if coils is not None:
+        # Primary current contribution (can be calc. in coil/dipole coords)
+        out += _do_prim_curr(rr[start:stop], coils)
 
-    See Mosher et al., 1999 Section II for discussion of primary vs. volume
-    currents.
+
+def _source_tiles(n_sources, source_bytes, n_jobs, max_memory):
+    """Split sources into tiles that fit in memory and can be spread over jobs."""
+    n_tile = max(max_memory // (n_jobs * source_bytes), 1)
+    n_tile = min(n_tile, -(-n_sources // n_jobs))
+    starts = np.arange(0, n_sources, n_tile)
+    return zip(starts, np.minimum(starts + n_tile, n_sources))
+
+
+@fill_doc
+def _bem_pots(rr, *, bem, n_jobs, max_memory=_FWD_MAX_MEMORY):
+    """Pass the infinite-medium potentials of sources through the BEM solution.
+
+    This is the part of the BEM field computation that does not depend on the
+    sensors.
 
     Parameters
     ----------
     rr : ndarray, shape (n_dipoles, 3)
         3D dipole source positions in head coordinates
-    coils : list of dict
-        List of MEG coils where each element contains coil specific information
+    bem : instance of ConductorModel
+        Boundary Element Model information
+    %(n_jobs)s
+    max_memory : int
+        Approximate maximum number of bytes to use for temporary arrays.
 
     Returns
     -------
-    pc : ndarray, shape (n_sources, n_MEG_sensors)
-        Primary current for set of MEG coils due to all sources
+    pots : ndarray, shape (n_dipoles * 3, n_BEM_vertices)
+        The potentials, such that ``pots @ coeff.T`` is the contribution of
+        the volume currents to the MEG fields for field coefficients ``coeff``
+        from :func:`_bem_field_coeff`.
     """
-    rmags, cosmags, ws, bins = _triage_coils(coils)
-    n_coils = bins[-1] + 1
-    del coils
-    pc = np.empty((len(rr) * 3, n_coils))
-    for start, stop in _rr_bounds(rr):
-        pp = _bem_inf_fields(rr[start:stop], rmags, cosmags)
-        pp *= ws
-        pp = _reshape_view(pp, (3 * (stop - start), -1))
-        pc[3 * start : 3 * stop] = [
-            bincount(bins, this_pp, bins[-1] + 1) for this_pp in pp
-        ]
-    return pc
+    bem_rr = np.concatenate([s["rr"] for s in bem["surfs"]])
+    head_mri_t = bem["head_mri_t"]["trans"]
+    mri_rr = np.ascontiguousarray(apply_trans(head_mri_t, rr))
+    # With sol = coeff @ S * mults (as in _bem_specify_coils), the product
+    # v0s @ sol.T is equal to (v0s @ (S * mults).T) @ coeff.T, and the first
+    # part is computed just like an EEG field (i.e., without primary currents)
+    return _bem_pot_or_field(
+        rr,
+        mri_rr,
+        head_mri_t[:3, :3].T,
+        None,
+        bem["solution"] * _bem_mults(bem),
+        bem_rr,
+        n_jobs,
+        "eeg",
+        max_memory=max_memory,
+    )
 
 
-def _rr_bounds(rr, chunk=200):
-    # chunk data nicely
-    bounds = np.concatenate([np.arange(0, len(rr), chunk), [len(rr)]])
-    return zip(bounds[:-1], bounds[1:])
+@fill_doc
+def _meg_field_from_pots(rr, *, pots, sensors, bem, n_jobs, max_memory=_FWD_MAX_MEMORY):
+    """Compute the MEG forward solution from precomputed BEM potentials.
 
+    Parameters
+    ----------
+    rr : ndarray, shape (n_dipoles, 3)
+        3D dipole source positions in head coordinates
+    pots : ndarray, shape (n_dipoles * 3, n_BEM_vertices)
+        The potentials from :func:`_bem_pots`.
+    sensors : dict
+        The MEG sensors (see :func:`_prepare_for_forward`) in head coordinates.
+    bem : instance of ConductorModel
+        Boundary Element Model information
+    %(n_jobs)s
+    max_memory : int
+        Approximate maximum number of bytes to use for temporary arrays.
 
-def _do_inf_pots(mri_rr, bem_rr, mri_Q, sol):
-    """Calculate infinite potentials for MEG or EEG sensors using chunks.
+    Returns
+    -------
+    B : ndarray, shape (n_dipoles * 3, n_sensors)
+        Forward solution for the MEG sensors
+    """
+    coils = sensors["defs"]
+    coeff = _bem_field_coeff(bem, coils, FIFF.FIFFV_COORD_HEAD, n_jobs)
+    B = np.dot(pots, coeff.T)
+    del coeff
+    coils = _triage_coils(coils)
+    parallel, p_fun, n_jobs = parallel_func(
+        _prim_curr_tile, n_jobs, max_jobs=len(rr), prefer="threads"
+    )
+    # _bem_inf_fields and its temporaries for each source
+    source_bytes = 64 * len(coils[0])
+    parallel(
+        p_fun(B, rr, coils, start, stop)
+        for start, stop in _source_tiles(len(rr), source_bytes, n_jobs, max_memory)
+    )
+    B *= _MAG_FACTOR
+    if sensors.get("compensator", None) is not None:
+        B = B @ sensors["compensator"].T
+    if sensors.get("post_picks", None) is not None:
+        B = B[:, sensors["post_picks"]]
+    return B
+
+
+def _prim_curr_tile(B, rr, coils, start, stop):
+    """Add the primary currents for a tile of sources in place."""
+    B[3 * start : 3 * stop] += _do_prim_curr(rr[start:stop], coils)
+
+
+def _do_prim_curr(rr, coils):
+    """Calculate primary currents in a set of MEG coils.
+
+    See Mosher et al., 1999 Section II for discussion of primary vs. volume
+    currents.
 
     Parameters
     ----------
-    mri_rr : ndarray, shape (n_dipoles, 3)
-        3D dipole source positions in MRI coordinates
-    bem_rr : ndarray, shape (n_BEM_vertices, 3)
-        3D vertex positions for all surfaces in the BEM
-    mri_Q :
-        3x3 head -> MRI transform. I.e., head_mri_t.dot(np.eye(3))
-    sol : ndarray, shape (n_sensors_subset, n_BEM_vertices_subset)
-        Comes from _bem_specify_coils
+    rr : ndarray, shape (n_dipoles, 3)
+        3D dipole source positions in head coordinates
+    coils : list of dict
+        List of MEG coils where each element contains coil specific information
 
     Returns
     -------
-    B : ndarray, (n_dipoles * 3, n_sensors)
-        Forward solution for sensors due to volume currents
+    pc : ndarray, shape (n_sources, n_MEG_sensors)
+        Primary current for set of MEG coils due to all sources
     """
-    # Doing work of 'fwd_bem_pot_calc' in MNE-C
-    # The following code is equivalent to this, but saves memory
-    # v0s = _bem_inf_pots(rr, bem_rr, Q)  # n_rr x 3 x n_bem_rr
-    # v0s.shape = (len(rr) * 3, v0s.shape[2])
-    # B = np.dot(v0s, sol)
-
-    # We chunk the source mri_rr's in order to save memory
-    B = np.empty((len(mri_rr) * 3, sol.shape[1]))
-    for start, stop in _rr_bounds(mri_rr):
-        # v0 in Hämäläinen et al., 1989 == v_inf in Mosher, et al., 1999
-        v0s = _bem_inf_pots(mri_rr[start:stop], bem_rr, mri_Q)
-        v0s = v0s.reshape(-1, v0s.shape[2])
-        B[3 * start : 3 * stop] = np.dot(v0s, sol)
-    return B
+    rmags, cosmags, ws, bins = _triage_coils(coils)
+    del coils
+    pp = _bem_inf_fields(rr, rmags, cosmags)
+    pp *= ws
+    pp = _reshape_view(pp, (3 * len(rr), -1))
+    # the integration points of each coil are contiguous
+    starts = np.searchsorted(bins, np.arange(bins[-1] + 1))
+    return np.add.reduceat(pp, starts, axis=1)
 
 
 # #############################################################################
 # SPHERE COMPUTATION
 
 
-def _sphere_pot_or_field(rr, mri_rr, mri_Q, coils, solution, bem_rr, n_jobs, coil_type):
+def _sphere_pot_or_field(
+    rr,
+    mri_rr,
+    mri_Q,
+    coils,
+    solution,
+    bem_rr,
+    n_jobs,
+    coil_type,
+    max_memory=_FWD_MAX_MEMORY,
+):
     """Do potential or field for spherical model."""
+    # The temporaries here are small (they do not depend on the number of
+    # sources), so max_memory is not needed
     fun = _eeg_spherepot_coil if coil_type == "eeg" else _sphere_field
     parallel, p_fun, n_jobs = parallel_func(fun, n_jobs, max_jobs=len(rr))
     B = np.concatenate(
@@ -665,6 +778,7 @@ def _triage_coils(coils):
 # MAGNETIC DIPOLE (e.g. CHPI)
 
 _MIN_DIST_LIMIT = 1e-5
+_MDFV_BLOCK_BYTES = 2**22  # size of each temporary array in _compute_mdfv
 
 
 def _magnetic_dipole_field_vec(rrs, coils, too_close="raise"):
@@ -679,10 +793,9 @@ def _magnetic_dipole_field_vec(rrs, coils, too_close="raise"):
     return fwd
 
 
-@jit()
 def _compute_mdfv(rrs, rmags, cosmags, ws, bins, too_close):
     """Compute an MEG forward solution for a set of magnetic dipoles."""
-    # The code below is a more efficient version (~30x) of this:
+    # The code below is a more efficient version of this:
     # for ri, rr in enumerate(rrs):
     #     for k in range(len(coils)):
     #         this_coil = coils[k]
@@ -697,23 +810,32 @@ def _compute_mdfv(rrs, rmags, cosmags, ws, bins, too_close):
     #                                   axis=1)[:, np.newaxis] -
     #                 dist2 * this_coil['cosmag']) / dist5
     #         fwd[3*ri:3*ri+3, k] = 1e-7 * np.dot(this_coil['w'], sum_)
-    fwd = np.zeros((3 * len(rrs), bins[-1] + 1))
+    # Here the dipoles are processed in blocks (with temporaries of bounded size)
+    # using one array per Cartesian component, and the sums over the integration
+    # points of each coil (which are contiguous) are done for a block at once.
+    n_coils = bins[-1] + 1
+    starts = np.searchsorted(bins, np.arange(n_coils))
+    rmags, cosmags = np.ascontiguousarray(rmags.T), np.ascontiguousarray(cosmags.T)
+    fwd = np.zeros((len(rrs), 3, n_coils))
     min_dist = np.inf
-    ws2 = ws.reshape(-1, 1)
-    for ri in range(len(rrs)):
-        rr = rrs[ri]
-        diff = rmags - rr
-        dist2_ = np.sum(diff * diff, axis=1)
-        dist2 = dist2_.reshape(-1, 1)
+    n_block = max(_MDFV_BLOCK_BYTES // (8 * rmags.shape[1]), 1)
+    for start in range(0, len(rrs), n_block):
+        sl = slice(start, start + n_block)
+        diff = [rmag - rr[:, np.newaxis] for rmag, rr in zip(rmags, rrs[sl].T)]
+        dist2 = diff[0] * diff[0] + diff[1] * diff[1] + diff[2] * diff[2]
         dist = np.sqrt(dist2)
         min_dist = min(dist.min(), min_dist)
         if min_dist < _MIN_DIST_LIMIT and too_close == "raise":
             break
-        t_ = np.sum(diff * cosmags, axis=1)
-        t = t_.reshape(-1, 1)
-        sum_ = ws2 * (3 * diff * t - dist2 * cosmags) / (dist2 * dist2 * dist)
+        scale = ws / (dist2 * dist2 * dist)
+        t = diff[0] * cosmags[0] + diff[1] * cosmags[1] + diff[2] * cosmags[2]
+        t *= 3 * scale
+        dist2 *= scale
         for ii in range(3):
-            fwd[3 * ri + ii] = bincount(bins, sum_[:, ii], bins[-1] + 1)
+            diff[ii] *= t
+            diff[ii] -= dist2 * cosmags[ii]
+            fwd[sl, ii] = np.add.reduceat(diff[ii], starts, axis=1)
+    fwd = _reshape_view(fwd, (3 * len(rrs), n_coils))
     fwd *= _MAG_FACTOR
     return fwd, min_dist
 
@@ -722,8 +844,15 @@ def _compute_mdfv(rrs, rmags, cosmags, ws, bins, too_close):
 # MAIN TRIAGING FUNCTION
 
 
+def _bem_mults(bem):
+    """Get the multiplier for every BEM vertex."""
+    return np.repeat(
+        bem["source_mult"] / (4.0 * np.pi), [len(s["rr"]) for s in bem["surfs"]]
+    )[np.newaxis, :]
+
+
 @verbose
-def _prep_field_computation(*, sensors, bem, n_jobs, verbose=None):
+def _prep_field_computation(*, sensors, bem, n_jobs, bem_key=None, verbose=None):
     """Precompute and store some things that are used for both MEG and EEG.
 
     Calculation includes multiplication factors, coordinate transforms,
@@ -740,6 +869,9 @@ def _prep_field_computation(*, sensors, bem, n_jobs, verbose=None):
         Gets updated here with BEM and sensor information for later forward
         calculations.
     %(n_jobs)s
+    bem_key : int | None
+        The hash of the BEM from :func:`_bem_cache_key`. If not None, the
+        sensor-dependent BEM solutions are cached.
     %(verbose)s
     """
     bem_rr = mults = mri_Q = head_mri_t = None
@@ -747,9 +879,7 @@ def _prep_field_computation(*, sensors, bem, n_jobs, verbose=None):
         if bem["bem_method"] != FIFF.FIFFV_BEM_APPROX_LINEAR:
             raise RuntimeError("only linear collocation supported")
         # Store (and apply soon) μ_0/(4π) factor before source computations
-        mults = np.repeat(
-            bem["source_mult"] / (4.0 * np.pi), [len(s["rr"]) for s in bem["surfs"]]
-        )[np.newaxis, :]
+        mults = _bem_mults(bem)
         # Get positions of BEM points for every surface
         bem_rr = np.concatenate([s["rr"] for s in bem["surfs"]])
 
@@ -767,11 +897,18 @@ def _prep_field_computation(*, sensors, bem, n_jobs, verbose=None):
                 logger.info("\n" + start + "...")
                 cf = FIFF.FIFFV_COORD_HEAD
                 # multiply solution by "mults" here for simplicity
-                solution = _bem_specify_coils(bem, coils, cf, mults, n_jobs)
+                compute = partial(_bem_specify_coils, bem, coils, cf, mults, n_jobs)
             else:
                 # Compute solution for EEG sensor
                 logger.info("Setting up for EEG...")
-                solution = _bem_specify_els(bem, coils, mults)
+                compute = partial(_bem_specify_els, bem, coils, mults)
+            if bem_key is None:
+                solution = compute()
+            else:
+                solution = _sensor_solution_cache(
+                    (bem_key, coil_type, _triage_coils(coils)),
+                    lambda: dict(solution=compute()),
+                )["solution"]
         else:
             solution = bem
             if coil_type == "eeg":
@@ -799,7 +936,9 @@ def _prep_field_computation(*, sensors, bem, n_jobs, verbose=None):
 
 
 @fill_doc
-def _compute_forwards_meeg(rr, *, sensors, fwd_data, n_jobs, silent=False):
+def _compute_forwards_meeg(
+    rr, *, sensors, fwd_data, n_jobs, silent=False, max_memory=_FWD_MAX_MEMORY
+):
     """Compute MEG and EEG forward solutions for all sensor types."""
     Bs = dict()
     # The dipole location and orientation must be transformed to mri coords
@@ -832,6 +971,7 @@ def _compute_forwards_meeg(rr, *, sensors, fwd_data, n_jobs, silent=False):
             bem_rr=bem_rr,
             n_jobs=n_jobs,
             coil_type=coil_type,
+            max_memory=max_memory,
         )
 
         # Compensate if needed (only done for MEG systems w/compensation)
@@ -844,20 +984,40 @@ def _compute_forwards_meeg(rr, *, sensors, fwd_data, n_jobs, silent=False):
 
 
 @verbose
-def _compute_forwards(rr, *, bem, sensors, n_jobs, verbose=None):
+def _compute_forwards(
+    rr, *, bem, sensors, n_jobs, cache=False, max_memory=None, verbose=None
+):
     """Compute the MEG and EEG forward solutions."""
+    max_memory = _check_max_memory(max_memory)
     # Split calculation into two steps to save (potentially) a lot of time
     # when e.g. dipole fitting
     solver = bem.get("solver", "mne")
     _check_option("solver", solver, ("mne", "openmeeg"))
     if bem["is_sphere"] or solver == "mne":
-        # This modifies "sensors" in place, so let's copy it in case the calling
-        # function needs to reuse it (e.g., in simulate_raw.py)
-        sensors = deepcopy(sensors)
-        fwd_data = _prep_field_computation(sensors=sensors, bem=bem, n_jobs=n_jobs)
-        Bs = _compute_forwards_meeg(
-            rr, sensors=sensors, fwd_data=fwd_data, n_jobs=n_jobs
-        )
+        if cache:
+            # Cache each sensor type separately so that e.g. EEG can be reused
+            # when only the MEG sensors move
+            bem_key = _bem_cache_key(bem)
+            Bs = dict()
+            for coil_type, sens in sensors.items():
+                key = (rr, bem_key, _sensors_cache_key(coil_type, sens))
+                B = _fwd_field_cache(
+                    key,
+                    partial(
+                        _compute_forwards_mne,
+                        rr,
+                        bem=bem,
+                        sensors={coil_type: sens},
+                        n_jobs=n_jobs,
+                        bem_key=bem_key,
+                        max_memory=max_memory,
+                    ),
+                )[coil_type]
+                Bs[coil_type] = B.copy()  # so our cached values cannot change
+        else:
+            Bs = _compute_forwards_mne(
+                rr, bem=bem, sensors=sensors, n_jobs=n_jobs, max_memory=max_memory
+            )
     else:
         Bs = _compute_forwards_openmeeg(rr, bem=bem, sensors=sensors)
     n_sensors_want = sum(len(s["ch_names"]) for s in sensors.values())
@@ -867,6 +1027,70 @@ def _compute_forwards(rr, *, bem, sensors, n_jobs, verbose=None):
     return Bs
 
 
+def _compute_forwards_mne(
+    rr, *, bem, sensors, n_jobs, bem_key=None, max_memory=_FWD_MAX_MEMORY
+):
+    """Compute the MEG and EEG forward solutions using MNE's own solvers."""
+    # This modifies "sensors" in place, so let's copy it in case the calling
+    # function needs to reuse it (e.g., in simulate_raw.py)
+    sensors = deepcopy(sensors)
+    fwd_data = _prep_field_computation(
+        sensors=sensors, bem=bem, n_jobs=n_jobs, bem_key=bem_key
+    )
+    return _compute_forwards_meeg(
+        rr, sensors=sensors, fwd_data=fwd_data, n_jobs=n_jobs, max_memory=max_memory
+    )
+
+
+def _check_max_memory(max_memory):
+    """Convert a human-readable memory size to bytes."""
+    _validate_type(max_memory, ("int-like", str, None), "max_memory")
+    if max_memory is None:
+        return _FWD_MAX_MEMORY
+    max_memory = _ensure_int(_get_size_bytes(max_memory, "max_memory"), "max_memory")
+    if max_memory <= 0:
+        raise ValueError(f"max_memory must be positive, got {max_memory}")
+    return max_memory
+
+
+# Fields are (n_sources * 3, n_sensors) so only keep a few in memory; the
+# sensor solutions (n_sensors, n_BEM_vertices) are usually much smaller and
+# can be reused for different source spaces
+_fwd_field_cache = _ContentCache("forward_field", maxsize=4)
+_sensor_solution_cache = _ContentCache("forward_sensor_solution", maxsize=8)
+
+
+def _bem_cache_key(bem):
+    """Hash the parts of a conductor model that determine the fields."""
+    if bem["is_sphere"]:
+        key = dict(bem)
+    else:
+        # Everything else (e.g., triangle areas and normals) derives from these.
+        # The solution is determined by the surfaces and conductivities, so
+        # avoid hashing the (much larger) solution matrix itself.
+        key = dict(
+            sigma=bem["sigma"],
+            solver=bem.get("solver", "mne"),
+            solution=(bem["solution"].shape, bem["solution"].dtype.str),
+            bem_method=bem["bem_method"],
+            head_mri_t=bem["head_mri_t"]["trans"],
+            source_mult=bem["source_mult"],
+            field_mult=bem["field_mult"],
+            surfs=[dict(rr=s["rr"], tris=s["tris"]) for s in bem["surfs"]],
+        )
+    return object_hash(key)
+
+
+def _sensors_cache_key(coil_type, sens):
+    """Get the parts of sensor definitions that determine the fields."""
+    return (
+        coil_type,
+        _triage_coils(sens["defs"]),
+        sens.get("compensator", None),
+        sens.get("post_picks", None),
+    )
+
+
 def _compute_forwards_openmeeg(rr, *, bem, sensors):
     """Compute the MEG and EEG forward solutions for OpenMEEG."""
     if len(bem["surfs"]) != 3:
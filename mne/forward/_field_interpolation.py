@@ -21,8 +21,21 @@ from ..evoked import Evoked, EvokedArray
 from ..fixes import _safe_svd
 from ..surface import get_head_surf, get_meg_helmet_surf
 from ..transforms import _find_trans, transform_surface_to
-from ..utils import _check_fname, _check_option, _pl, _reg_pinv, logger, verbose
-from ._lead_dots import _do_cross_dots, _do_self_dots, _do_surface_dots, _get_legen_fun
+from ..utils import (
+    _check_fname,
+    _check_option,
+    _ContentCache,
+    _pl,
+    _reg_pinv,
+    logger,
+    verbose,
+)
+from ._lead_dots import (
+    _do_cross_dots,
+    _do_self_dots,
+    _do_surface_dots,
+    _get_legen_n_fact,
+)
 from ._make_forward import _create_eeg_els, _create_meg_coils, _read_coil_defs
 
 
@@ -32,8 +45,33 @@ def _setup_dots(mode, info, coils, ch_type):
     noise = make_ad_hoc_cov(info, dict(mag=20e-15, grad=5e-13, eeg=1e-6))
     # "fast" uses a coarser (n_coeff=50) Legendre series than "accurate" (n_coeff=100)
     n_coeff = 50 if mode == "fast" else 100
-    leg_fun, n_fact = _get_legen_fun(ch_type, False, n_coeff)
-    return int_rad, noise, leg_fun, n_fact
+    n_fact = _get_legen_n_fact(ch_type, False, n_coeff)
+    return int_rad, noise, n_fact
+
+
+# Mapping matrices only depend on the sensor geometry (and projectors), so e.g.
+# interpolating the same bad channels of every run of a subject is done once
+_mapping_cache = _ContentCache("field_mapping", maxsize=8)
+
+
+def _coils_key(coils):
+    """Get the integration points of coils (or electrodes)."""
+    return [(coil["rmag"], coil["cosmag"], coil["w"]) for coil in coils]
+
+
+def _mapping_cache_key(kind, mode, origin, coils, noise, info, *extra):
+    """Get the parts of the inputs that determine a mapping matrix."""
+    return (
+        kind,
+        mode,
+        origin,
+        _coils_key(coils),
+        noise["data"],
+        info["ch_names"],
+        info.get("projs", list()),
+        _has_eeg_average_ref_proj(info),
+        *extra,
+    )
 
 
 def _compute_mapping_matrix(fmd, info):
@@ -176,43 +214,49 @@ def _map_meg_or_eeg_channels(info_from, info_to, mode, *, origin, miss=None):
                 "info_from has one"
             )
     origin = _check_origin(origin, info_from)
-    #
-    # Step 2. Calculate the dot products
-    #
-    int_rad, noise, leg_fun, n_fact = _setup_dots(mode, info_from, coils_from, kind)
-    logger.info(
-        f"    Computing dot products for {len(coils_from)} "
-        f"{kind.upper()} channel{_pl(coils_from)}..."
-    )
-    self_dots = _do_self_dots(
-        int_rad, False, coils_from, origin, kind, leg_fun, n_fact, n_jobs=None
-    )
-    logger.info(
-        f"    Computing cross products for {len(coils_from)} → "
-        f"{len(coils_to)} {kind.upper()} channel{_pl(coils_to)}..."
-    )
-    cross_dots = _do_cross_dots(
-        int_rad, False, coils_from, coils_to, origin, kind, leg_fun, n_fact
-    ).T
+    int_rad, noise, n_fact = _setup_dots(mode, info_from, coils_from, kind)
 
-    ch_names = [c["ch_name"] for c in info_from["chs"]]
-    fmd = dict(
-        kind=kind,
-        ch_names=ch_names,
-        origin=origin,
-        noise=noise,
-        self_dots=self_dots,
-        surface_dots=cross_dots,
-        int_rad=int_rad,
-        miss=miss,
-        pinv_method=pinv_method,
-    )
+    def compute():
+        #
+        # Step 2. Calculate the dot products
+        #
+        logger.info(
+            f"    Computing dot products for {len(coils_from)} "
+            f"{kind.upper()} channel{_pl(coils_from)}..."
+        )
+        self_dots = _do_self_dots(
+            int_rad, False, coils_from, origin, kind, n_fact, n_jobs=None
+        )
+        logger.info(
+            f"    Computing cross products for {len(coils_from)} → "
+            f"{len(coils_to)} {kind.upper()} channel{_pl(coils_to)}..."
+        )
+        cross_dots = _do_cross_dots(
+            int_rad, False, coils_from, coils_to, origin, kind, n_fact
+        ).T
+
+        ch_names = [c["ch_name"] for c in info_from["chs"]]
+        fmd = dict(
+            kind=kind,
+            ch_names=ch_names,
+            origin=origin,
+            noise=noise,
+            self_dots=self_dots,
+            surface_dots=cross_dots,
+            int_rad=int_rad,
+            miss=miss,
+            pinv_method=pinv_method,
+        )
 
-    #
-    # Step 3. Compute the mapping matrix
-    #
-    mapping = _compute_mapping_matrix(fmd, info_from)
-    return mapping
+        #
+        # Step 3. Compute the mapping matrix
+        #
+        return dict(mapping=_compute_mapping_matrix(fmd, info_from))
+
+    key = _mapping_cache_key(
+        kind, mode, origin, coils_from, noise, info_from, _coils_key(coils_to)
+    )
+    return _mapping_cache(key, compute)["mapping"].copy()
 
 
 def _as_meg_type_inst(inst, ch_type="grad", mode="fast"):
@@ -391,20 +435,7 @@ def _make_surface_mapping(
     #
     # Step 2. Calculate the dot products
     #
-    int_rad, noise, leg_fun, n_fact = _setup_dots(mode, info, coils, ch_type)
-    logger.info("Computing dot products for %i %s...", len(coils), type_str)
-    self_dots = _do_self_dots(
-        int_rad, False, coils, origin, ch_type, leg_fun, n_fact, n_jobs
-    )
-    sel = np.arange(len(surf["rr"]))  # eventually we should do sub-selection
-    logger.info("Computing dot products for %i surface locations...", len(sel))
-    surface_dots = _do_surface_dots(
-        int_rad, False, coils, surf, sel, origin, ch_type, leg_fun, n_fact, n_jobs
-    )
-
-    #
-    # Step 4. Return the result
-    #
+    int_rad, noise, n_fact = _setup_dots(mode, info, coils, ch_type)
     fmd = dict(
         kind=ch_type,
         surf=surf,
@@ -412,20 +443,38 @@ def _make_surface_mapping(
         coils=coils,
         origin=origin,
         noise=noise,
-        self_dots=self_dots,
-        surface_dots=surface_dots,
         int_rad=int_rad,
         miss=miss,
     )
-    logger.info("Field mapping data ready")
 
-    fmd["data"] = _compute_mapping_matrix(fmd, info)
+    def compute():
+        logger.info("Computing dot products for %i %s...", len(coils), type_str)
+        self_dots = _do_self_dots(
+            int_rad, False, coils, origin, ch_type, n_fact, n_jobs
+        )
+        sel = np.arange(len(surf["rr"]))  # eventually we should do sub-selection
+        logger.info("Computing dot products for %i surface locations...", len(sel))
+        surface_dots = _do_surface_dots(
+            int_rad, False, coils, surf, sel, origin, ch_type, n_fact, n_jobs
+        )
+        logger.info("Field mapping data ready")
+        this_fmd = dict(fmd, self_dots=self_dots, surface_dots=surface_dots)
+        data = _compute_mapping_matrix(this_fmd, info)
+        return dict(data=data, nest=this_fmd["nest"])
+
+    #
+    # Step 4. Return the result
+    #
+    key = _mapping_cache_key(
+        ch_type, mode, origin, coils, noise, info, surf["rr"], surf["nn"]
+    )
+    cached = _mapping_cache(key, compute)
+    fmd["data"] = cached["data"].copy()
+    fmd["nest"] = int(cached["nest"])
     # bring the original back, whatever coord frame it was in
     fmd["surf"] = orig_surf
 
     # Remove some unnecessary fields
-    del fmd["self_dots"]
-    del fmd["surface_dots"]
     del fmd["int_rad"]
     del fmd["miss"]
     return fmd
@@ -10,7 +10,7 @@ from functools import partial
 import numpy as np
 from numpy.polynomial import legendre
 
-from ..fixes import _reshape_view
+from ..fixes import _reshape_view, has_numba, jit, prange
 from ..parallel import parallel_func
 from ..utils import fill_doc
 
@@ -77,38 +77,44 @@ def _get_legen_fun(ch_type, volume_integral=False, n_coeff=100):
     return leg_fun, n_fact
 
 
-def _comp_sum_eeg(beta, ctheta, leg_fun, n_fact):
-    """Lead field dot products using Legendre polynomial (P_n) series."""
+def _comp_sum_eeg(beta, ctheta, n_fact):
+    """Lead field dot products using Legendre polynomial (P_n) series.
+
+    Parameters
+    ----------
+    beta : array, shape (n_points * n_points,)
+        Coefficients of the integration.
+    ctheta : array, shape (n_points * n_points,)
+        Cosine of the angle between the sensor integration points.
+    n_fact : array, shape (n_coeff - 1,)
+        Coefficients in the integration sum.
+
+    Returns
+    -------
+    sums : array, shape (n_points * n_points,)
+        The results.
+    """
     # Compute the sum occurring in the evaluation.
     # The result is
     #   sums[:]    (2n+1)^2/n beta^n P_n
-    n_chunk = 50000000 // (8 * max(n_fact.shape) * 2)
-    lims = np.concatenate([np.arange(0, beta.size, n_chunk), [beta.size]])
-    s0 = np.empty(beta.shape)
-    for start, stop in zip(lims[:-1], lims[1:]):
-        coeffs = leg_fun(ctheta[start:stop])
-        betans = np.tile(beta[start:stop][:, np.newaxis], (1, n_fact.shape[0]))
-        np.cumprod(betans, axis=1, out=betans)  # run inplace
-        coeffs *= betans
-        s0[start:stop] = np.dot(coeffs, n_fact)  # == weighted sum across cols
-    return s0
-
-
-def _comp_sums_meg(beta, ctheta, leg_fun, n_fact, volume_integral):
+    beta = np.ascontiguousarray(beta, float)
+    ctheta = np.ascontiguousarray(ctheta, float)
+    sums = np.zeros(beta.size)
+    _comp_sum_eeg_fun(beta, ctheta, np.ascontiguousarray(n_fact, float), sums)
+    return sums
+
+
+def _comp_sums_meg(beta, ctheta, n_fact):
     """Lead field dot products using Legendre polynomial (P_n) series.
 
     Parameters
     ----------
-    beta : array, shape (n_points * n_points, 1)
+    beta : array, shape (n_points * n_points,)
         Coefficients of the integration.
-    ctheta : array, shape (n_points * n_points, 1)
+    ctheta : array, shape (n_points * n_points,)
         Cosine of the angle between the sensor integration points.
-    leg_fun : callable
-        Evaluates the Legendre (derivative) series.
-    n_fact : array
+    n_fact : array, shape (n_coeff - 1, 4)
         Coefficients in the integration sum.
-    volume_integral : bool
-        If True, compute volume integral.
 
     Returns
     -------
@@ -122,31 +128,117 @@ def _comp_sums_meg(beta, ctheta, leg_fun, n_fact, volume_integral):
     #  * sums[:, 1]    n/(2n+1) beta^(n+1) P_n'
     #  * sums[:, 2]    n/((2n+1)(n+1)) beta^(n+1) P_n'
     #  * sums[:, 3]    n/((2n+1)(n+1)) beta^(n+1) P_n''
-
-    # This is equivalent, but slower:
-    # sums = np.sum(bbeta[:, :, np.newaxis].T * n_fact * coeffs, axis=1)
-    # sums = np.rollaxis(sums, 2)
-    # or
-    # sums = np.einsum('ji,jk,ijk->ki', bbeta, n_fact, leg_fun(ctheta)))
-    sums = np.empty((n_fact.shape[1], len(beta)))
-    # beta can be e.g. 3 million elements, which ends up using lots of memory
-    # so we split up the computations into ~50 MB blocks
-    n_chunk = 50000000 // (8 * max(n_fact.shape) * 2)
-    lims = np.concatenate([np.arange(0, beta.size, n_chunk), [beta.size]])
-    for start, stop in zip(lims[:-1], lims[1:]):
-        bbeta = np.tile(beta[start:stop][np.newaxis], (n_fact.shape[0], 1))
-        bbeta[0] *= beta[start:stop]
-        np.cumprod(bbeta, axis=0, out=bbeta)  # run inplace
-        np.einsum(
-            "ji,jk,ijk->ki",
-            bbeta,
-            n_fact,
-            leg_fun(ctheta[start:stop]),
-            out=sums[:, start:stop],
-        )
+    beta = np.ascontiguousarray(beta, float)
+    ctheta = np.ascontiguousarray(ctheta, float)
+    sums = np.zeros((4, beta.size))
+    _comp_sums_meg_fun(beta, ctheta, np.ascontiguousarray(n_fact, float), sums)
     return sums
 
 
+# The Legendre polynomials (and their derivatives) are evaluated with their
+# three-term recurrences while the series are being summed, so the
+# (n_points, n_coeff) tables of _get_legen(_der) are never formed. With numba,
+# each thread sums the series for one point pair in registers; otherwise the
+# recurrences run over cache-sized blocks of point pairs.
+_LEGEN_BLOCK = 16384
+
+
+def _comp_sum_eeg_numpy(beta, ctheta, n_fact, sums):
+    for start in range(0, beta.size, _LEGEN_BLOCK):
+        sl = slice(start, start + _LEGEN_BLOCK)
+        x, b, out = ctheta[sl], beta[sl], sums[sl]
+        p_prev, p, tmp = np.ones_like(x), x.copy(), np.empty_like(x)
+        betan = b.copy()
+        for n in range(1, len(n_fact) + 1):
+            if n > 1:
+                # P_n = ((2n - 1) x P_{n-1} - (n - 1) P_{n-2}) / n
+                np.multiply(x, p, out=tmp)
+                tmp *= (2 * n - 1) / n
+                p_prev *= (n - 1) / n
+                tmp -= p_prev
+                p_prev, p, tmp = p, tmp, p_prev
+                betan *= b
+            np.multiply(betan, p, out=tmp)
+            tmp *= n_fact[n - 1]
+            out += tmp
+
+
+def _comp_sums_meg_numpy(beta, ctheta, n_fact, sums):
+    for start in range(0, beta.size, _LEGEN_BLOCK):
+        sl = slice(start, start + _LEGEN_BLOCK)
+        x, b, out = ctheta[sl], beta[sl], sums[:, sl]
+        p_prev, p, tmp = np.ones_like(x), x.copy(), np.empty_like(x)
+        pd, pdd = np.ones_like(x), np.zeros_like(x)
+        betan = b * b
+        for n in range(1, len(n_fact) + 1):
+            if n > 1:
+                # P_n'' = (n + 1) P_{n-1}' + x P_{n-1}''
+                np.multiply(pd, n + 1, out=tmp)
+                pdd *= x
+                pdd += tmp
+                # P_n' = n P_{n-1} + x P_{n-1}'
+                np.multiply(p, n, out=tmp)
+                pd *= x
+                pd += tmp
+                # P_n = ((2n - 1) x P_{n-1} - (n - 1) P_{n-2}) / n
+                np.multiply(x, p, out=tmp)
+                tmp *= (2 * n - 1) / n
+                p_prev *= (n - 1) / n
+                tmp -= p_prev
+                p_prev, p, tmp = p, tmp, p_prev
+                betan *= b
+            fact = n_fact[n - 1]
+            for ii, leg in enumerate((p, pd, pd, pdd)):
+                np.multiply(betan, leg, out=tmp)
+                tmp *= fact[ii]
+                out[ii] += tmp
+
+
+@jit(parallel=True)
+def _comp_sum_eeg_jit(beta, ctheta, n_fact, sums):  # pragma: no cover
+    for pi in prange(beta.size):
+        x, b = ctheta[pi], beta[pi]
+        p_prev, p = 1.0, x
+        betan = b
+        total = n_fact[0] * betan * p
+        for n in range(2, len(n_fact) + 1):
+            p_prev, p = p, ((2 * n - 1) * x * p - (n - 1) * p_prev) / n
+            betan *= b
+            total += n_fact[n - 1] * betan * p
+        sums[pi] = total
+
+
+@jit(parallel=True)
+def _comp_sums_meg_jit(beta, ctheta, n_fact, sums):  # pragma: no cover
+    for pi in prange(beta.size):
+        x, b = ctheta[pi], beta[pi]
+        p_prev, p, pd, pdd = 1.0, x, 1.0, 0.0
+        betan = b * b
+        s0 = n_fact[0, 0] * betan * p
+        s1 = n_fact[0, 1] * betan * pd
+        s2 = n_fact[0, 2] * betan * pd
+        s3 = 0.0
+        for n in range(2, len(n_fact) + 1):
+            pdd = (n + 1) * pd + x * pdd
+            pd = n * p + x * pd
+            p_prev, p = p, ((2 * n - 1) * x * p - (n - 1) * p_prev) / n
+            betan *= b
+            s0 += n_fact[n - 1, 0] * betan * p
+            s1 += n_fact[n - 1, 1] * betan * pd
+            s2 += n_fact[n - 1, 2] * betan * pd
+            s3 += n_fact[n - 1, 3] * betan * pdd
+        sums[0, pi] = s0
+        sums[1, pi] = s1
+        sums[2, pi] = s2
+        sums[3, pi] = s3
+
+
+if has_numba:
+    _comp_sum_eeg_fun, _comp_sums_meg_fun = _comp_sum_eeg_jit, _comp_sums_meg_jit
+else:
+    _comp_sum_eeg_fun, _comp_sums_meg_fun = _comp_sum_eeg_numpy, _comp_sums_meg_numpy
+
+
 ###############################################################################
 # SPHERE DOTS
 
@@ -165,7 +257,6 @@ def _fast_sphere_dot_r0(
     w1,
     w2s,
     volume_integral,
-    leg_fun,
     n_fact,
     ch_type,
 ):
@@ -194,8 +285,6 @@ def _fast_sphere_dot_r0(
         Weights of integration points in the second sensor.
     volume_integral : bool
         If True, compute volume integral.
-    leg_fun : callable
-        Evaluates the Legendre (derivative) series.
     n_fact : array
         Coefficients in the integration sum.
     ch_type : str
@@ -228,9 +317,7 @@ def _fast_sphere_dot_r0(
 
     beta = (r * r) / lr1lr2
     if ch_type == "meg":
-        sums = _comp_sums_meg(
-            beta.flatten(), ct.flatten(), leg_fun, n_fact, volume_integral
-        )
+        sums = _comp_sums_meg(beta.ravel(), ct.ravel(), n_fact)
         sums = _reshape_view(sums, ((4,) + beta.shape))
 
         # Accumulate the result, a little bit streamlined version
@@ -261,7 +348,7 @@ def _fast_sphere_dot_r0(
         if volume_integral:
             result *= r
     else:  # 'eeg'
-        result = _comp_sum_eeg(beta.flatten(), ct.flatten(), leg_fun, n_fact)
+        result = _comp_sum_eeg(beta.ravel(), ct.ravel(), n_fact)
         result = _reshape_view(result, beta.shape)
         # Give it a finishing touch!
         result *= _eeg_const
@@ -278,7 +365,7 @@ def _fast_sphere_dot_r0(
 
 
 @fill_doc
-def _do_self_dots(intrad, volume, coils, r0, ch_type, leg_fun, n_fact, n_jobs):
+def _do_self_dots(intrad, volume, coils, r0, ch_type, n_fact, n_jobs):
     """Perform the lead field dot product integrations.
 
     Parameters
@@ -294,8 +381,6 @@ def _do_self_dots(intrad, volume, coils, r0, ch_type, leg_fun, n_fact, n_jobs):
         The origin of the sphere.
     ch_type : str
         The channel type. It can be 'meg' or 'eeg'.
-    leg_fun : callable
-        Evaluates the Legendre (derivative) series.
     n_fact : array
         Coefficients in the integration sum.
     %(n_jobs)s
@@ -315,7 +400,7 @@ def _do_self_dots(intrad, volume, coils, r0, ch_type, leg_fun, n_fact, n_jobs):
     ws = [coil["w"] for coil in coils]
     parallel, p_fun, n_jobs = parallel_func(_do_self_dots_subset, n_jobs)
     prods = parallel(
-        p_fun(intrad, rmags, rlens, cosmags, ws, volume, leg_fun, n_fact, ch_type, idx)
+        p_fun(intrad, rmags, rlens, cosmags, ws, volume, n_fact, ch_type, idx)
         for idx in np.array_split(np.arange(len(rmags)), n_jobs)
     )
     products = np.sum(prods, axis=0)
@@ -323,34 +408,84 @@ def _do_self_dots(intrad, volume, coils, r0, ch_type, leg_fun, n_fact, n_jobs):
 
 
 def _do_self_dots_subset(
-    intrad, rmags, rlens, cosmags, ws, volume, leg_fun, n_fact, ch_type, idx
+    intrad, rmags, rlens, cosmags, ws, volume, n_fact, ch_type, idx
 ):
     """Parallelize."""
-    # all possible combinations of two magnetometers
+    # all possible combinations of two magnetometers, of which only the lower
+    # triangle is computed (and mirrored)
     products = np.zeros((len(rmags), len(rmags)))
-    for ci1 in idx:
-        ci2 = ci1 + 1
-        res = _fast_sphere_dot_r0(
+    for block in _coil_blocks(idx, ws, sum(len(w) for w in ws)):
+        start, stop = block[0], block[-1] + 1
+        res = _block_dots(
             intrad,
-            rmags[ci1],
-            rmags[:ci2],
-            rlens[ci1],
-            rlens[:ci2],
-            cosmags[ci1],
-            cosmags[:ci2],
-            ws[ci1],
-            ws[:ci2],
+            rmags[start:stop],
+            rmags[:stop],
+            rlens[start:stop],
+            rlens[:stop],
+            cosmags[start:stop],
+            cosmags[:stop],
+            ws[start:stop],
+            ws[:stop],
             volume,
-            leg_fun,
             n_fact,
             ch_type,
         )
-        products[ci1, :ci2] = res
-        products[:ci2, ci1] = res
+        products[start:stop, :stop] = res
+        products[:stop, start:stop] = res.T
     return products
 
 
-def _do_cross_dots(intrad, volume, coils1, coils2, r0, ch_type, leg_fun, n_fact):
+# Number of integration point pairs to handle at once
+_DOTS_BLOCK_PAIRS = 2**18
+
+
+def _coil_blocks(idx, ws, n_other):
+    """Split coils into contiguous blocks of about _DOTS_BLOCK_PAIRS point pairs."""
+    if len(idx) == 0:
+        return []
+    n_pairs = sum(len(ws[ci]) for ci in idx) * n_other
+    n_blocks = min(-(-n_pairs // _DOTS_BLOCK_PAIRS), len(idx))
+    return np.array_split(idx, n_blocks)
+
+
+def _block_dots(
+    intrad,
+    rmags1,
+    rmags2,
+    rlens1,
+    rlens2,
+    cosmags1,
+    cosmags2,
+    ws1,
+    ws2,
+    volume,
+    n_fact,
+    ch_type,
+):
+    """Compute the lead field dot products between two lists of coils."""
+    # Treat the integration points of the first coils like surface points,
+    # weighting and summing them afterward, so that the Legendre series are
+    # evaluated for many point pairs at once
+    res = _fast_sphere_dot_r0(
+        intrad,
+        np.concatenate(rmags1),
+        rmags2,
+        np.concatenate(rlens1),
+        rlens2,
+        np.concatenate(cosmags1),
+        cosmags2,
+        None,
+        ws2,
+        volume,
+        n_fact,
+        ch_type,
+    )
+    res *= np.concatenate(ws1)
+    starts = np.cumsum([0] + [len(w) for w in ws1[:-1]])
+    return np.add.reduceat(res, starts, axis=1).T
+
+
+def _do_cross_dots(intrad, volume, coils1, coils2, r0, ch_type, n_fact):
     """Compute lead field dot product integrations between two coil sets.
 
     The code is a direct translation of MNE-C code found in
@@ -371,8 +506,6 @@ def _do_cross_dots(intrad, volume, coils1, coils2, r0, ch_type, leg_fun, n_fact)
         The origin of the sphere.
     ch_type : str
         The channel type. It can be 'meg' or 'eeg'
-    leg_fun : callable
-        Evaluates the Legendre (derivative) series.
     n_fact : array
         Coefficients in the integration sum.
 
@@ -399,30 +532,28 @@ def _do_cross_dots(intrad, volume, coils1, coils2, r0, ch_type, leg_fun, n_fact)
     cosmags2 = [coil["cosmag"] for coil in coils2]
 
     products = np.zeros((len(rmags1), len(rmags2)))
-    for ci1 in range(len(coils1)):
-        res = _fast_sphere_dot_r0(
+    n_points2 = sum(len(w) for w in ws2)
+    for block in _coil_blocks(np.arange(len(coils1)), ws1, n_points2):
+        start, stop = block[0], block[-1] + 1
+        products[start:stop] = _block_dots(
             intrad,
-            rmags1[ci1],
+            rmags1[start:stop],
             rmags2,
-            rlens1[ci1],
+            rlens1[start:stop],
             rlens2,
-            cosmags1[ci1],
+            cosmags1[start:stop],
             cosmags2,
-            ws1[ci1],
+            ws1[start:stop],
             ws2,
             volume,
-            leg_fun,
             n_fact,
             ch_type,
         )
-        products[ci1, :] = res
     return products
 
 
 @fill_doc
-def _do_surface_dots(
-    intrad, volume, coils, surf, sel, r0, ch_type, leg_fun, n_fact, n_jobs
-):
+def _do_surface_dots(intrad, volume, coils, surf, sel, r0, ch_type, n_fact, n_jobs):
     """Compute the map construction products.
 
     Parameters
@@ -442,8 +573,6 @@ def _do_surface_dots(
         The origin of the sphere.
     ch_type : str
         The channel type. It can be 'meg' or 'eeg'.
-    leg_fun : callable
-        Evaluates the Legendre (derivative) series.
     n_fact : array
         Coefficients in the integration sum.
     %(n_jobs)s
@@ -491,7 +620,6 @@ def _do_surface_dots(
             cosmags,
             ws,
             volume,
-            leg_fun,
             n_fact,
             ch_type,
             idx,
@@ -514,7 +642,6 @@ def _do_surface_dots_subset(
     cosmags,
     ws,
     volume,
-    leg_fun,
     n_fact,
     ch_type,
     idx,
@@ -538,8 +665,6 @@ def _do_surface_dots_subset(
         Integration weights of the coils.
     volume : bool
         If True, compute volume integral.
-    leg_fun : callable
-        Evaluates the Legendre (derivative) series.
     n_fact : array
         Coefficients in the integration sum.
     ch_type : str
@@ -563,7 +688,6 @@ def _do_surface_dots_subset(
         None,
         ws,
         volume,
-        leg_fun,
         n_fact,
         ch_type,
     ).T
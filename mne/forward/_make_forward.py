@@ -34,6 +34,7 @@ from ..transforms import (
     _ensure_trans,
     _get_trans,
     _print_coord_trans,
+    angle_distance_between_rigid,
     apply_trans,
     invert_transform,
 )
@@ -47,8 +48,11 @@ from ..utils import (
     warn,
 )
 from ._compute_forward import (
+    _bem_pots,
+    _check_max_memory,
     _compute_forwards,
     _compute_forwards_meeg,
+    _meg_field_from_pots,
     _prep_field_computation,
 )
 from .forward import _FWD_ORDER, Forward, _merge_fwds, convert_forward_solution
@@ -626,6 +630,8 @@ def make_forward_solution(
     ignore_ref=False,
     n_jobs=None,
     on_inside="raise",
+    cache=False,
+    max_memory=None,
     verbose=None,
 ):
     """Calculate a forward solution for a subject.
@@ -663,6 +669,24 @@ def make_forward_solution(
         respectively.
 
         .. versionadded:: 1.10
+    cache : bool
+        If True, cache the computed fields in memory (and on disk if the
+        ``MNE_PERSISTENT_CACHE_DIR`` config value is set), keyed by the source
+        locations, conductor model, and sensor geometry. The sensor-dependent
+        BEM field computation matrices are cached separately, and MEG and EEG
+        fields are cached independently. Repeated calls that only change e.g.
+        the source space or ``info['dev_head_t']`` then only recompute the
+        parts that changed. Defaults to False.
+
+        .. versionadded:: 1.13
+    max_memory : int | str | None
+        Approximate maximum amount of memory to use for temporary arrays when
+        computing BEM fields, either in bytes or as a string ending in ``"MB"``
+        or ``"GB"`` (e.g., ``"1GB"``). Sources are processed in tiles sized
+        to fit in this limit, which does not include the forward solution
+        itself. None (default) uses 256 MB.
+
+        .. versionadded:: 1.13
     %(verbose)s
 
     Returns
@@ -703,6 +727,7 @@ def make_forward_solution(
     else:
         bem_extra = bem
     _validate_type(info, ("path-like", Info), "info")
+    _validate_type(cache, bool, "cache")
     if not isinstance(info, Info):
         info_extra = op.split(info)[1]
         info = _check_fname(info, must_exist=True, overwrite="read", name="info")
@@ -744,7 +769,14 @@ def make_forward_solution(
     del (src, mri_head_t, trans, info_extra, bem_extra, mindist, meg, eeg, ignore_ref)
 
     # Time to do the heavy lifting: MEG first, then EEG
-    fwds = _compute_forwards(rr, bem=bem, sensors=sensors, n_jobs=n_jobs)
+    fwds = _compute_forwards(
+        rr,
+        bem=bem,
+        sensors=sensors,
+        n_jobs=n_jobs,
+        cache=cache,
+        max_memory=max_memory,
+    )
 
     # merge forwards
     fwds = {
@@ -1064,3 +1096,157 @@ class _ForwardModeler:
         fwd["source_rr"] = np.vstack([s["rr"][s["inuse"] == 1] for s in src])
         fwd["source_nn"] = np.tile(np.eye(3), (fwd["nsource"], 1))
         return fwd
+
+
+_N_CACHED_POSES = 10  # MEG gain matrices kept for reuse by _MovingForwardModeler
+
+
+class _MovingForwardModeler:
+    """Optimized incremental computation for the same sources and moving MEG.
+
+    The EEG forward solution and, for BEM models, the infinite-medium
+    potentials of the sources passed through the BEM solution do not depend
+    on the head position, so they are computed once. Each head position then
+    only requires the BEM field coefficients of the MEG coils, one matrix
+    product, and the primary currents. If ``trans_tol`` or ``rot_tol`` are
+    nonzero, the gain matrix of the closest head position among the
+    ``_N_CACHED_POSES`` most recently used ones within the tolerances is
+    reused.
+    """
+
+    @verbose
+    def __init__(
+        self,
+        info,
+        trans,
+        src,
+        bem,
+        *,
+        mindist=0.0,
+        n_jobs=None,
+        trans_tol=0.0,
+        rot_tol=0.0,
+        max_memory=None,
+        verbose=None,
+    ):
+        self.mri_head_t, _ = _get_trans(trans)
+        self.n_jobs = n_jobs
+        self.trans_tol = float(trans_tol)  # m
+        self.rot_tol = float(rot_tol)  # deg
+        self.max_memory = _check_max_memory(max_memory)
+        self.sensors, self.rr, _, self.update_kwargs, self.bem = _prepare_for_forward(
+            src,
+            self.mri_head_t,
+            info,
+            bem,
+            mindist,
+            n_jobs,
+            bem_extra="",
+            trans="",
+            info_extra="",
+            meg=True,
+            eeg=True,
+            ignore_ref=False,
+        )
+        self.Bs = dict()
+        if "eeg" in self.sensors:
+            self.Bs["eeg"] = _compute_forwards(
+                self.rr,
+                bem=self.bem,
+                sensors=dict(eeg=self.sensors["eeg"]),
+                n_jobs=n_jobs,
+                max_memory=self.max_memory,
+            )["eeg"]
+        self.pots = self.check_inside = None
+        self.poses = list()  # (dev_head_t, B) for MEG, least recently used first
+        if "meg" in self.sensors:
+            if not self.bem["is_sphere"]:
+                inner_skull = _bem_find_surface(self.bem, "inner_skull")
+                self.check_inside = _CheckInside(inner_skull)
+                if self.bem.get("solver", "mne") == "mne":
+                    logger.info(
+                        f"Computing BEM potentials for {len(self.rr)} source "
+                        f"location{_pl(self.rr)}..."
+                    )
+                    self.pots = _bem_pots(
+                        self.rr,
+                        bem=self.bem,
+                        n_jobs=n_jobs,
+                        max_memory=self.max_memory,
+                    )
+            elif len(self.bem["layers"]):
+                # sensors must be outside the head, like in simulate_raw
+                self.check_inside = _CheckInsideSphere(self.bem, check="outer")
+
+    @verbose
+    def compute(self, dev_head_t, *, verbose=None):
+        dev_head_t = _ensure_trans(dev_head_t, "meg", "head")
+        Bs = dict(self.Bs)
+        if "meg" in self.sensors:
+            Bs["meg"] = self._compute_meg(dev_head_t)
+        fwds = {
+            key: _to_forward_dict(Bs[key].copy(), self.sensors[key]["ch_names"])
+            for key in _FWD_ORDER
+            if key in Bs
+        }
+        fwd = _merge_fwds(fwds, verbose=False)
+        del fwds
+        fwd.update(**self.update_kwargs)
+        fwd["info"] = fwd["info"].copy()
+        with fwd["info"]._unlock():
+            fwd["info"]["dev_head_t"] = dev_head_t
+        return fwd
+
+    def _compute_meg(self, dev_head_t):
+        if self.poses and (self.trans_tol > 0 or self.rot_tol > 0):
+            angles, dists = angle_distance_between_rigid(
+                np.array([pose["trans"] for pose, _ in self.poses]),
+                dev_head_t["trans"],
+                angle_units="deg",
+            )
+            close = np.flatnonzero((dists <= self.trans_tol) & (angles <= self.rot_tol))
+            if len(close):
+                # closest in terms of the movement of a point 10 cm away
+                idx = close[np.argmin(dists[close] + 0.1 * np.deg2rad(angles[close]))]
+                logger.info(
+                    f"Using the gain matrix for a head position {angles[idx]:0.2f}° "
+                    f"and {1000 * dists[idx]:0.1f} mm away"
+                )
+                self.poses.append(self.poses.pop(idx))
+                return self.poses[-1][1]
+        sensors = dict(self.sensors["meg"])
+        sensors["defs"] = deepcopy(sensors["defs"])
+        _transform_orig_meg_coils(sensors["defs"], dev_head_t)
+        # Make sure our sensors are all outside our BEM
+        if self.check_inside is not None:
+            coil_rr = np.array([coil["r0"] for coil in sensors["defs"]])
+            if not self.bem["is_sphere"]:
+                coil_rr = apply_trans(invert_transform(self.mri_head_t), coil_rr)
+            inside = self.check_inside(coil_rr, n_jobs=self.n_jobs, verbose=False)
+            if inside.any():
+                raise RuntimeError(
+                    f"{inside.sum()} MEG sensors collided with inner skull surface "
+                    f"for head position:\n{dev_head_t}"
+                )
+        if self.pots is None:
+            B = _compute_forwards(
+                self.rr,
+                bem=self.bem,
+                sensors=dict(meg=sensors),
+                n_jobs=self.n_jobs,
+                max_memory=self.max_memory,
+                verbose=False,
+            )["meg"]
+        else:
+            B = _meg_field_from_pots(
+                self.rr,
+                pots=self.pots,
+                sensors=sensors,
+                bem=self.bem,
+                n_jobs=self.n_jobs,
+                max_memory=self.max_memory,
+            )
+        if self.trans_tol > 0 or self.rot_tol > 0:
+            self.poses.append((dev_head_t, B))
+            del self.poses[:-_N_CACHED_POSES]
+        return B
@@ -16,20 +16,32 @@ from numpy.testing import (
 )
 
 import mne
-from mne import Epochs, make_fixed_length_events, pick_types, read_evokeds
+from mne import (
+    Epochs,
+    make_fixed_length_events,
+    pick_info,
+    pick_types,
+    read_evokeds,
+)
 from mne.datasets import testing
 from mne.fixes import _reshape_view
-from mne.forward import _make_surface_mapping, make_field_map
-from mne.forward._field_interpolation import _setup_dots
+from mne.forward import _field_interpolation, _make_surface_mapping, make_field_map
+from mne.forward._field_interpolation import _map_meg_or_eeg_channels, _setup_dots
 from mne.forward._lead_dots import (
     _comp_sum_eeg,
+    _comp_sum_eeg_jit,
+    _comp_sum_eeg_numpy,
     _comp_sums_meg,
+    _comp_sums_meg_jit,
+    _comp_sums_meg_numpy,
     _do_cross_dots,
+    _do_self_dots,
     _get_legen_fun,
 )
 from mne.forward._make_forward import _create_meg_coils
-from mne.io import read_raw_fif
+from mne.io import read_info, read_raw_fif
 from mne.surface import get_head_surf, get_meg_helmet_surf
+from mne.utils import _ContentCache
 
 base_dir = op.join(op.dirname(__file__), "..", "..", "io", "tests", "data")
 raw_fname = op.join(base_dir, "test_raw.fif")
@@ -79,7 +91,7 @@ def test_legendre_val():
     # Now let's look at our sums
     ctheta = rng.rand(20, 30) * 2.0 - 1.0
     beta = rng.rand(20, 30) * 0.8
-    c1 = _comp_sum_eeg(beta.flatten(), ctheta.flatten(), leg_fun, n_fact)
+    c1 = _comp_sum_eeg(beta.flatten(), ctheta.flatten(), n_fact)
     c1 = _reshape_view(c1, beta.shape)
 
     # compare to numpy
@@ -99,7 +111,7 @@ def test_legendre_val():
     beta = rng.rand(20 * 30) * 0.8
     for n_coeff in (10, 20):
         leg_fun, n_fact = _get_legen_fun("meg", n_coeff=n_coeff)
-        _comp_sums_meg(beta, ctheta, leg_fun, n_fact, False)
+        _comp_sums_meg(beta, ctheta, n_fact)
 
 
 def test_legendre_fun():
@@ -118,6 +130,70 @@ def test_legendre_fun():
         assert_allclose(n_fact1, n_fact2)
 
 
+@pytest.mark.parametrize("ch_type", ["eeg", "meg"])
+def test_legendre_sums(ch_type):
+    """Test the compiled and NumPy Legendre series sums against the tables."""
+    rng = np.random.RandomState(0)
+    ctheta = rng.rand(300) * 2.0 - 1.0
+    beta = rng.rand(300) * 0.8
+    leg_fun, n_fact = _get_legen_fun(ch_type, n_coeff=50)
+    betans = np.cumprod(np.tile(beta[:, np.newaxis], (1, len(n_fact))), axis=1)
+    if ch_type == "eeg":
+        want = (leg_fun(ctheta) * betans) @ n_fact
+        funs = (_comp_sum_eeg_numpy, _comp_sum_eeg_jit)
+    else:  # beta ** (n + 1)
+        betans *= beta[:, np.newaxis]
+        want = np.einsum("ij,jk,ijk->ki", betans, n_fact, leg_fun(ctheta))
+        funs = (_comp_sums_meg_numpy, _comp_sums_meg_jit)
+    for fun in funs:
+        sums = np.zeros(want.shape)
+        fun(beta, ctheta, n_fact, sums)
+        assert_allclose(sums, want, rtol=1e-10, atol=1e-12)
+
+
+def test_field_mapping_cache(monkeypatch):
+    """Test that mapping matrices are reused for the same sensors."""
+    info = read_info(op.join(base_dir, "test-ave.fif.gz"))
+    with info._unlock():
+        info["projs"] = []
+    info = pick_info(info, pick_types(info, meg="mag"))
+    info_from = pick_info(info, np.arange(0, len(info["chs"]), 2))
+    info_to = pick_info(info, np.arange(1, len(info["chs"]), 2))
+    monkeypatch.setattr(
+        _field_interpolation, "_mapping_cache", _ContentCache("field_mapping", 8)
+    )
+    n_computed = list()
+
+    def _count_self_dots(*args, **kwargs):
+        n_computed.append(None)
+        return _do_self_dots(*args, **kwargs)
+
+    monkeypatch.setattr(_field_interpolation, "_do_self_dots", _count_self_dots)
+    kwargs = dict(mode="fast", origin=(0.0, 0.0, 0.04))
+    mapping = _map_meg_or_eeg_channels(info_from, info_to, **kwargs)
+    assert len(n_computed) == 1
+    mapping_2 = _map_meg_or_eeg_channels(info_from.copy(), info_to, **kwargs)
+    assert len(n_computed) == 1
+    assert_array_equal(mapping, mapping_2)
+    mapping_2 *= 2  # callers get their own copy
+    assert_array_equal(mapping, _map_meg_or_eeg_channels(info_from, info_to, **kwargs))
+    # anything that changes the result is recomputed
+    _map_meg_or_eeg_channels(info_from, info_to, mode="fast", origin=(0.0, 0.0, 0.05))
+    assert len(n_computed) == 2
+    _map_meg_or_eeg_channels(info_from, info_to, mode="accurate", origin=(0, 0, 0.04))
+    assert len(n_computed) == 3
+    _map_meg_or_eeg_channels(info_to, info_from, **kwargs)
+    assert len(n_computed) == 4
+    # surface mappings are cached too
+    surf = get_meg_helmet_surf(info)
+    fmd = _make_surface_mapping(info, surf, "meg", **kwargs)
+    assert len(n_computed) == 5
+    fmd_2 = _make_surface_mapping(info, surf, "meg", **kwargs)
+    assert len(n_computed) == 5
+    assert_array_equal(fmd["data"], fmd_2["data"])
+    assert fmd["nest"] == fmd_2["nest"]
+
+
 @testing.requires_testing_data
 def test_make_field_map_eeg():
     """Test interpolation of EEG field onto head."""
@@ -266,7 +342,7 @@ def test_make_field_map_meeg():
 def _setup_args(info):
     """Configure args for test_as_meg_type_evoked."""
     coils = _create_meg_coils(info["chs"], "normal", info["dev_head_t"])
-    int_rad, _, leg_fun, n_fact = _setup_dots("fast", info, coils, "meg")
+    int_rad, _, n_fact = _setup_dots("fast", info, coils, "meg")
     my_origin = np.array([0.0, 0.0, 0.04])
     args_dict = dict(
         intrad=int_rad,
@@ -274,7 +350,6 @@ def _setup_args(info):
         coils1=coils,
         r0=my_origin,
         ch_type="meg",
-        leg_fun=leg_fun,
         n_fact=n_fact,
     )
     return args_dict
@@ -27,15 +27,17 @@ from mne import (
     write_forward_solution,
 )
 from mne._fiff.constants import FIFF
-from mne.bem import make_bem_solution, read_bem_surfaces
+from mne.bem import _surfaces_to_bem, make_bem_solution, read_bem_surfaces
 from mne.channels import make_standard_montage
 from mne.datasets import testing
 from mne.dipole import Dipole, fit_dipole
-from mne.forward import Forward, _do_forward_solution, use_coil_def
+from mne.forward import Forward, _compute_forward, _do_forward_solution, use_coil_def
 from mne.forward._compute_forward import _magnetic_dipole_field_vec
 from mne.forward._make_forward import (
     _create_meg_coils,
     _ForwardModeler,
+    _MovingForwardModeler,
+    _setup_bem,
     make_forward_dipole,
 )
 from mne.forward.tests.test_forward import assert_forward_allclose
@@ -48,8 +50,15 @@ from mne.source_space._source_space import (
     write_source_spaces,
 )
 from mne.surface import _get_ico_surface
-from mne.transforms import Transform, apply_trans, invert_transform
+from mne.transforms import (
+    Transform,
+    apply_trans,
+    invert_transform,
+    rotation,
+    translation,
+)
 from mne.utils import (
+    _ContentCache,
     _record_warnings,
     catch_logging,
     requires_mne,
@@ -215,6 +224,73 @@ def test_magnetic_dipole():
     assert not np.isfinite(fwd).any()
 
 
+def test_magnetic_dipole_blocks(monkeypatch):
+    """Test that magnetic dipoles processed in blocks match one at a time."""
+    info = read_info(fname_raw)
+    info = pick_info(info, pick_types(info, meg=True, exclude=[]))
+    coils = _create_meg_coils(info["chs"], "accurate", None)
+    rng = np.random.default_rng(0)
+    rrs = rng.uniform(-0.05, 0.05, (10, 3))
+    want = np.concatenate(
+        [_magnetic_dipole_field_vec(rr[np.newaxis], coils) for rr in rrs]
+    )
+    assert want.shape == (30, len(coils))
+    # make each block hold 3 dipoles
+    n_points = sum(len(coil["rmag"]) for coil in coils)
+    monkeypatch.setattr(_compute_forward, "_MDFV_BLOCK_BYTES", 3 * 8 * n_points)
+    fwd = _magnetic_dipole_field_vec(rrs, coils)
+    assert_allclose(fwd, want, rtol=1e-12, atol=1e-20)
+    # a dipole too close to a coil in a later block still raises
+    rrs[-1] = coils[-1]["rmag"][0]
+    with pytest.raises(RuntimeError, match="Coil too close"):
+        _magnetic_dipole_field_vec(rrs, coils)
+
+
+@pytest.mark.parametrize("coil_type", ("meg", "eeg"))
+def test_bem_field_tiles(coil_type):
+    """Test that BEM fields computed in tiles do not depend on the tiling."""
+    info = read_info(fname_raw)
+    info = pick_info(info, pick_types(info, meg=True, exclude=[]))
+    coils = _create_meg_coils(info["chs"], "normal", None)
+    rng = np.random.default_rng(0)
+    rr = rng.uniform(-0.05, 0.05, (50, 3))
+    bem_rr = rng.normal(size=(300, 3)) * 0.08
+    mri_Q = np.linalg.qr(rng.normal(size=(3, 3)))[0]
+    mri_rr = rr @ mri_Q.T
+    solution = rng.normal(size=(len(coils), len(bem_rr)))
+    args = (rr, mri_rr, mri_Q, coils, solution, bem_rr)
+    # one source at a time
+    want = np.concatenate(
+        [
+            _compute_forward._bem_pot_or_field(
+                rr[[ii]], mri_rr[[ii]], mri_Q, coils, solution, bem_rr, 1, coil_type
+            )
+            for ii in range(len(rr))
+        ]
+    )
+    for n_jobs, max_memory in ((1, 1), (1, 2**16), (2, 2**16), (None, 2**28)):
+        B = _compute_forward._bem_pot_or_field(
+            *args, n_jobs, coil_type, max_memory=max_memory
+        )
+        assert_allclose(B, want, rtol=1e-12, atol=1e-12 * np.abs(want).max())
+    # the BEM solution is used as-is for EEG, and MEG adds the primary currents
+    v0s = _compute_forward._bem_inf_pots(mri_rr, bem_rr, mri_Q).reshape(-1, 300)
+    assert_allclose(
+        want,
+        v0s @ solution.T
+        if coil_type == "eeg"
+        else 1e-7 * (v0s @ solution.T + _compute_forward._do_prim_curr(rr, coils)),
+        rtol=1e-10,
+    )
+    # sizes
+    assert _compute_forward._check_max_memory("1GB") == 2**30
+    assert _compute_forward._check_max_memory(None) == 2**28
+    with pytest.raises(ValueError, match='end with either "MB" or "GB"'):
+        _compute_forward._check_max_memory("1TB")
+    with pytest.raises(ValueError, match="must be positive"):
+        _compute_forward._check_max_memory(0)
+
+
 @pytest.mark.slowtest  # slow-ish on Travis OSX
 @requires_mne
 def test_make_forward_solution_kit(tmp_path, fname_src_small):
@@ -958,3 +1034,171 @@ def test_make_forward_iterative():
         fwd_data.append(fm.compute(ss)["sol"]["data"])
     fwd_data = np.concatenate(fwd_data, axis=1)
     assert_allclose(fwd_data, fwd["sol"]["data"])
+
+
+def test_make_forward_solution_cache(monkeypatch):
+    """Test caching of fields and sensor solutions in make_forward_solution."""
+    monkeypatch.setattr(
+        _compute_forward, "_fwd_field_cache", _ContentCache("forward_field", 4)
+    )
+    monkeypatch.setattr(
+        _compute_forward,
+        "_sensor_solution_cache",
+        _ContentCache("forward_sensor_solution", 8),
+    )
+    surfs = list()
+    for rad in (90.0, 85.0, 80.0):
+        surf = _get_ico_surface(2)
+        surfs.append(dict(rr=surf["rr"] * rad + [0, 0, 40], tris=surf["tris"]))
+    ids = [
+        FIFF.FIFFV_BEM_SURF_ID_HEAD,
+        FIFF.FIFFV_BEM_SURF_ID_SKULL,
+        FIFF.FIFFV_BEM_SURF_ID_BRAIN,
+    ]
+    bem = make_bem_solution(_surfaces_to_bem(surfs, ids, (0.3, 0.006, 0.3)))
+    src = setup_volume_source_space(pos=20.0, sphere=(0.0, 0.0, 0.04, 0.07))
+    trans = Transform("mri", "head")
+    info = read_info(fname_raw)
+    info = pick_info(info, pick_types(info, meg=True, eeg=True, exclude=()))
+    fwd = make_forward_solution(info, trans, src, bem)
+
+    def _make(info, src):
+        with catch_logging() as log:
+            fwd = make_forward_solution(
+                info, trans, src, bem, cache=True, verbose="debug"
+            )
+        log = log.getvalue()
+        n_field = log.count("Using cached forward_field")
+        n_sol = log.count("Using cached forward_sensor_solution")
+        return fwd, n_field, n_sol
+
+    fwd_cache, n_field, n_sol = _make(info, src)
+    assert (n_field, n_sol) == (0, 0)
+    assert_allclose(fwd_cache["sol"]["data"], fwd["sol"]["data"], rtol=1e-7)
+    fwd_cache, n_field, n_sol = _make(info, src)
+    assert (n_field, n_sol) == (2, 0)  # MEG and EEG
+    assert_allclose(fwd_cache["sol"]["data"], fwd["sol"]["data"], rtol=1e-7)
+    assert fwd_cache["sol"]["data"].flags.writeable
+    # new head position: only MEG needs to be recomputed
+    info_move = info.copy()
+    with info_move._unlock():
+        info_move["dev_head_t"]["trans"][:3, 3] += [0.0, 0.005, 0.0]
+    fwd_move = make_forward_solution(info_move, trans, src, bem)
+    assert not np.allclose(fwd_move["sol"]["data"], fwd["sol"]["data"])
+    fwd_cache, n_field, n_sol = _make(info_move, src)
+    assert (n_field, n_sol) == (1, 0)  # EEG
+    assert_allclose(fwd_cache["sol"]["data"], fwd_move["sol"]["data"], rtol=1e-7)
+    # new source space: the sensor solutions are reused
+    src_sub = setup_volume_source_space(pos=25.0, sphere=(0.0, 0.0, 0.04, 0.07))
+    fwd_sub = make_forward_solution(info, trans, src_sub, bem)
+    fwd_cache, n_field, n_sol = _make(info, src_sub)
+    assert (n_field, n_sol) == (0, 2)  # MEG and EEG
+    assert_allclose(fwd_cache["sol"]["data"], fwd_sub["sol"]["data"], rtol=1e-7)
+    with pytest.raises(TypeError, match="cache must be an instance of bool"):
+        make_forward_solution(info, trans, src, bem, cache=1)
+
+
+def test_bem_cache_key():
+    """Test that the BEM cache key depends on the inputs of the solution."""
+    ids = [
+        FIFF.FIFFV_BEM_SURF_ID_HEAD,
+        FIFF.FIFFV_BEM_SURF_ID_SKULL,
+        FIFF.FIFFV_BEM_SURF_ID_BRAIN,
+    ]
+
+    def make(sigma, dtype="float64", trans=np.eye(4)):
+        surfs = list()
+        for rad in (90.0, 85.0, 80.0):
+            surf = _get_ico_surface(1)
+            surfs.append(dict(rr=surf["rr"] * rad, tris=surf["tris"]))
+        model = _surfaces_to_bem(surfs, ids, sigma)
+        bem = make_bem_solution(model, dtype=dtype, verbose=False)
+        return _setup_bem(bem, "", 0, Transform("mri", "head", trans), verbose=False)
+
+    bem = make((0.3, 0.006, 0.3))
+    key = _compute_forward._bem_cache_key(bem)
+    assert _compute_forward._bem_cache_key(make((0.3, 0.006, 0.3))) == key
+    assert _compute_forward._bem_cache_key(make((0.3, 0.01, 0.3))) != key
+    assert _compute_forward._bem_cache_key(make((0.3, 0.006, 0.3), "float32")) != key
+    # the solution matrix itself is not hashed
+    bem["solution"] = np.zeros_like(bem["solution"])
+    assert _compute_forward._bem_cache_key(bem) == key
+    moved = make((0.3, 0.006, 0.3), trans=translation(0.0, 0.0, 0.01))
+    assert _compute_forward._bem_cache_key(moved) != key
+
+
+@pytest.mark.parametrize("kind", ("bem", "sphere"))
+def test_moving_forward_modeler(kind, monkeypatch):
+    """Test computing forward solutions for moving heads."""
+    r0 = (0.0, 0.0, 0.04)
+    if kind == "bem":
+        surfs = list()
+        for rad in (90.0, 85.0, 80.0):
+            surf = _get_ico_surface(2)
+            surfs.append(dict(rr=surf["rr"] * rad + [0, 0, 40], tris=surf["tris"]))
+        ids = [
+            FIFF.FIFFV_BEM_SURF_ID_HEAD,
+            FIFF.FIFFV_BEM_SURF_ID_SKULL,
+            FIFF.FIFFV_BEM_SURF_ID_BRAIN,
+        ]
+        bem = make_bem_solution(_surfaces_to_bem(surfs, ids, (0.3, 0.006, 0.3)))
+    else:
+        bem = make_sphere_model(r0, head_radius=0.09)
+    src = setup_volume_source_space(pos=20.0, sphere=r0 + (0.07,))
+    trans = Transform("mri", "head")
+    info = read_info(fname_raw)
+    info = pick_info(info, pick_types(info, meg=True, eeg=True, exclude=()))
+    fm = _MovingForwardModeler(info, trans, src, bem)
+    dev_head_t = info["dev_head_t"]
+    moved = dev_head_t.copy()
+    moved["trans"] = translation(0.0, 0.005, 0.0) @ rotation(0.05) @ moved["trans"]
+    for this_dev_head_t in (moved, dev_head_t):
+        this_info = info.copy()
+        with this_info._unlock():
+            this_info["dev_head_t"] = this_dev_head_t
+        want = make_forward_solution(this_info, trans, src, bem)
+        fwd = fm.compute(this_dev_head_t)
+        assert_forward_allclose(fwd, want, rtol=1e-7)
+        assert_allclose(fwd["info"]["dev_head_t"]["trans"], this_dev_head_t["trans"])
+    # reuse of close head positions
+    fm = _MovingForwardModeler(info, trans, src, bem, trans_tol=0.002, rot_tol=1.0)
+    fwd = fm.compute(dev_head_t)
+    close = dev_head_t.copy()
+    close["trans"] = translation(0.001, 0.0, 0.0) @ close["trans"]
+    with catch_logging() as log:
+        fwd_close = fm.compute(close, verbose=True)
+    log = log.getvalue()
+    assert "Using the gain matrix for a head position" in log
+    assert_allclose(fwd_close["sol"]["data"], fwd["sol"]["data"])
+    assert len(fm.poses) == 1
+    fm.compute(moved)
+    assert len(fm.poses) == 2
+    # only the most recently used gain matrices are kept
+    monkeypatch.setattr("mne.forward._make_forward._N_CACHED_POSES", 2)
+    fm.compute(dev_head_t)  # reused, now the most recent
+    far = dev_head_t.copy()
+    far["trans"] = translation(0.0, -0.005, 0.0) @ far["trans"]
+    fm.compute(far)
+    assert len(fm.poses) == 2
+    assert_allclose(fm.poses[0][0]["trans"], dev_head_t["trans"])
+    assert_allclose(fm.poses[1][0]["trans"], far["trans"])
+    # sensors inside the head
+    inside = dev_head_t.copy()
+    inside["trans"] = translation(0.0, 0.0, -0.1) @ inside["trans"]
+    with pytest.raises(RuntimeError, match="collided with inner skull"):
+        fm.compute(inside)
+    if kind == "sphere":
+        # sensors must be outside of the outer sphere, not only the inner one
+        picks = pick_types(info, meg=True)
+        coil_rr = apply_trans(
+            dev_head_t, np.array([info["chs"][pick]["loc"][:3] for pick in picks])
+        )
+        d = coil_rr - r0
+        dist = np.linalg.norm(d, axis=1)
+        closest = np.argmin(dist)
+        shift = (dist[closest] - 0.085) * d[closest] / dist[closest]
+        assert bem["layers"][0]["rad"] < 0.085 < bem.radius
+        inside = dev_head_t.copy()
+        inside["trans"] = translation(*-shift) @ inside["trans"]
+        with pytest.raises(RuntimeError, match="MEG sensors collided"):
+            fm.compute(inside)
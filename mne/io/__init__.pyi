@@ -2,6 +2,7 @@ __all__ = [
     "BaseRaw",
     "Raw",
     "RawArray",
+    "RawStream",
     "anonymize_info",
     "concatenate_raws",
     "constants",
@@ -93,3 +94,4 @@ from .nirx import read_raw_nirx
 from .nsx import read_raw_nsx
 from .persyst import read_raw_persyst
 from .snirf import read_raw_snirf
+from .stream import RawStream
@@ -54,6 +54,7 @@ from ..annotations import (
     _annotations_starts_stops,
     _combine_annotations,
     _handle_meas_date,
+    _intervals_to_mask,
     _sync_onset,
     _write_annotations,
 )
@@ -561,19 +562,39 @@ class BaseRaw(
         """
         if start < 0:
             return None
-        if reject_by_annotation and len(self.annotations) > 0:
-            annot = self.annotations
-            sfreq = self.info["sfreq"]
-            onset = _sync_onset(self, annot.onset)
-            overlaps = np.where(onset < reject_stop / sfreq)
-            overlaps = np.where(
-                onset[overlaps] + annot.duration[overlaps] > reject_start / sfreq
-            )
-            for descr in annot.description[overlaps]:
-                if descr.lower().startswith("bad"):
-                    return str(descr)
+        if reject_by_annotation:
+            bad = self._get_bad_annotations(reject_start, reject_stop)[0]
+            if bad is not None:
+                return bad
         return self._getitem((picks, slice(start, stop)), return_times=False)
 
+    def _get_bad_annotations(self, reject_start, reject_stop):
+        """Get the first bad annotation overlapping each segment.
+
+        Parameters
+        ----------
+        reject_start : int | array of int
+            First sample of each segment.
+        reject_stop : int | array of int
+            Last sample of each segment.
+
+        Returns
+        -------
+        bads : list of str | None
+            The description of the first bad annotation overlapping each
+            segment, None if there is none.
+        """
+        reject_start, reject_stop = np.atleast_1d(reject_start, reject_stop)
+        if len(self.annotations) == 0:
+            return [None] * len(reject_start)
+        assert self.info["meas_date"] == self.annotations.orig_time
+        sfreq = self.info["sfreq"]
+        index = self.annotations._get_index()
+        idx = index.first_overlap(
+            ("bad",), reject_start / sfreq, reject_stop / sfreq, self._first_time
+        )
+        return [None if ii < 0 else str(index.description[ii]) for ii in idx]
+
     @verbose
     def load_data(self, *, memmap=None, verbose=None):
         """Load raw data.
@@ -1020,11 +1041,7 @@ class BaseRaw(
                 return data, times
             return data
         n_samples = stop - start  # total number of samples
-        used = np.ones(n_samples, bool)
-        for onset, end in zip(onsets, ends):
-            if onset >= end:
-                continue
-            used[onset - start : end - start] = False
+        used = ~_intervals_to_mask(onsets - start, ends - start, n_samples)
         used = np.concatenate([[False], used, [False]])
         starts = np.where(~used[:-1] & used[1:])[0] + start
         stops = np.where(used[:-1] & ~used[1:])[0] + start
@@ -1044,15 +1061,20 @@ class BaseRaw(
                         n_kept / n_samples,
                     )
                 )
-                data = np.zeros((len(picks), n_kept))
-                times = np.zeros(data.shape[1])
-                idx = 0
-                for start, stop in zip(starts, stops):  # get the data
-                    if start == stop:
-                        continue
-                    end = idx + stop - start
-                    data[:, idx:end], times[idx:end] = self[picks, start:stop]
-                    idx = end
+                if self.preload:  # take all of the samples at once
+                    use = np.flatnonzero(used[1:-1]) + start
+                    data = self._data[np.ix_(picks, use)].astype(float, copy=False)
+                    times = use / self.info["sfreq"]
+                else:
+                    data = np.zeros((len(picks), n_kept))
+                    times = np.zeros(data.shape[1])
+                    idx = 0
+                    for start, stop in zip(starts, stops):  # get the data
+                        if start == stop:
+                            continue
+                        end = idx + stop - start
+                        data[:, idx:end], times[idx:end] = self[picks, start:stop]
+                        idx = end
             else:
                 msg = (
                     "Setting {} of {} ({:.2%}) samples to NaN, retaining {}"
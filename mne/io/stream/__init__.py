@@ -0,0 +1,7 @@
+"""Module for processing continuous data as it arrives."""
+
+# Authors: The MNE-Python contributors.
+# License: BSD-3-Clause
+# Copyright the MNE-Python contributors.
+
+from ._stream import RawStream
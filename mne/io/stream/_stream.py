@@ -0,0 +1,607 @@
+"""Ring buffer of continuous data processed as it arrives."""
+
+# Authors: The MNE-Python contributors.
+# License: BSD-3-Clause
+# Copyright the MNE-Python contributors.
+
+import time
+
+import numpy as np
+from scipy.signal import fftconvolve, lfilter, lfilter_zi, sosfilt, sosfilt_zi
+
+from ..._fiff.constants import FIFF
+from ..._fiff.meas_info import ContainsMixin, Info
+from ..._fiff.pick import _picks_to_idx, pick_channels, pick_types
+from ..._fiff.proj import setup_proj
+from ..._fiff.reference import _check_ssp, _get_ch_type
+from ...epochs import EpochsArray
+from ...event import EventFinder
+from ...filter import _filt_check_picks, _filt_update_info, create_filter
+from ...utils import (
+    _validate_type,
+    fill_doc,
+    logger,
+    verbose,
+    warn,
+)
+from ..base import BaseRaw
+
+
+@fill_doc
+class RawStream(ContainsMixin):
+    """Continuous data processed chunk by chunk as they arrive.
+
+    Each chunk passed to :meth:`push` goes through the operators set up with
+    :meth:`filter`, :meth:`set_eeg_reference` and :meth:`apply_proj` (in the
+    order in which they were added), and is then stored in a ring buffer from
+    which :meth:`get_data` returns the most recent samples. Operators keep
+    their state between chunks, so the result does not depend on how the data
+    are split into chunks. Events can be detected on the incoming stim
+    channels with :meth:`detect_events`, and epochs around them are collected
+    with :meth:`set_epochs` as soon as enough data have arrived.
+
+    Parameters
+    ----------
+    %(info_not_none)s The channels (and their order) are fixed for the
+        lifetime of the stream.
+    buffer_size : float
+        The duration of the ring buffer in seconds. Older data are
+        discarded, so epochs must fit into this duration.
+    %(verbose)s
+
+    See Also
+    --------
+    mne.io.RawArray
+
+    Notes
+    -----
+    All operators are causal: FIR filters are minimum-phase and IIR filters
+    are applied forward only. The first sample of the stream sets the initial
+    (steady) state of the filters.
+
+    .. versionadded:: 1.13
+    """
+
+    @verbose
+    def __init__(self, info, buffer_size=10.0, *, verbose=None):
+        _validate_type(info, Info, "info")
+        _validate_type(buffer_size, "numeric", "buffer_size")
+        self.info = info.copy()
+        n_buffer = int(round(buffer_size * self.info["sfreq"]))
+        if n_buffer < 1:
+            raise ValueError(
+                f"buffer_size must be at least one sample long, got {buffer_size}"
+            )
+        self._buffer = np.zeros((self.info["nchan"], n_buffer))
+        self._n_times = 0
+        self._operators = list()
+        self._projector = None  # SSP operator of info["projs"]
+        self._event_finder = None
+        self._stim_picks = None
+        self._events = np.empty((0, 3), int)
+        self._epochs_params = None
+        self._pending = np.empty((0, 3), int)
+        self._epochs = list()
+
+    def __repr__(self):  # noqa: D105
+        return (
+            f"<RawStream | {self.info['nchan']} channels, "
+            f"{self.info['sfreq']:g} Hz, "
+            f"{self._buffer.shape[1] / self.info['sfreq']:g} s buffer, "
+            f"{self.n_times} samples received>"
+        )
+
+    @property
+    def ch_names(self):
+        """Channel names."""
+        return self.info["ch_names"]
+
+    @property
+    def n_times(self):
+        """The number of samples received so far."""
+        return self._n_times
+
+    @property
+    def events(self):
+        """The events detected so far, shape (n_events, 3)."""
+        return self._events.copy()
+
+    @verbose
+    def push(self, data, *, verbose=None):
+        """Process a chunk of data and add it to the buffer.
+
+        Parameters
+        ----------
+        data : array, shape (n_channels, n_times)
+            The next samples of all channels.
+        %(verbose)s
+
+        Returns
+        -------
+        data : ndarray, shape (n_channels, n_times)
+            The processed data.
+        """
+        data = np.array(data, float, ndmin=2)
+        if data.ndim != 2 or data.shape[0] != self.info["nchan"]:
+            raise ValueError(
+                f"data must have shape ({self.info['nchan']}, n_times), got "
+                f"{data.shape}"
+            )
+        n_times = data.shape[1]
+        if n_times == 0:
+            return data
+        for operator in self._operators:
+            operator(data)
+        # store the data in the ring buffer (only the last part fits)
+        n_buffer = self._buffer.shape[1]
+        use = data[:, -n_buffer:]
+        start = (self._n_times + n_times - use.shape[1]) % n_buffer
+        n_first = min(use.shape[1], n_buffer - start)
+        self._buffer[:, start : start + n_first] = use[:, :n_first]
+        self._buffer[:, : use.shape[1] - n_first] = use[:, n_first:]
+        self._n_times += n_times
+        if self._event_finder is not None:
+            events = self._event_finder.process(data[self._stim_picks])
+            if len(events):
+                logger.info(f"Events found at samples {events[:, 0]}")
+                self._events = np.concatenate([self._events, events])
+                if self._epochs_params is not None:
+                    self._pending = np.concatenate([self._pending, events])
+        if len(self._pending):
+            self._collect_epochs()
+        return data
+
+    @verbose
+    def get_data(self, picks=None, n_times=None, *, verbose=None):
+        """Get the most recent data from the buffer.
+
+        Parameters
+        ----------
+        %(picks_all)s
+        n_times : int | None
+            The number of samples to get. None (default) gets all of the
+            available data.
+        %(verbose)s
+
+        Returns
+        -------
+        data : ndarray, shape (n_channels, n_times)
+            The data, oldest sample first.
+        """
+        picks = _picks_to_idx(self.info, picks, "all", exclude=())
+        n_available = min(self._n_times, self._buffer.shape[1])
+        if n_times is None:
+            n_times = n_available
+        _validate_type(n_times, "int-like", "n_times")
+        if not 0 <= n_times <= n_available:
+            raise ValueError(
+                f"n_times must be between 0 and {n_available}, got {n_times}"
+            )
+        return self._get_samples(self._n_times - n_times, self._n_times, picks)
+
+    def _get_samples(self, start, stop, picks=slice(None)):
+        idx = np.arange(start, stop) % self._buffer.shape[1]
+        return self._buffer[picks][:, idx]
+
+    @verbose
+    def filter(
+        self,
+        l_freq,
+        h_freq,
+        picks=None,
+        filter_length="auto",
+        l_trans_bandwidth="auto",
+        h_trans_bandwidth="auto",
+        method="fir",
+        iir_params=None,
+        fir_window="hamming",
+        fir_design="firwin",
+        *,
+        verbose=None,
+    ):
+        """Filter the incoming data.
+
+        Parameters
+        ----------
+        %(l_freq)s
+        %(h_freq)s
+        %(picks_all_data)s
+        %(filter_length)s
+        %(l_trans_bandwidth)s
+        %(h_trans_bandwidth)s
+        %(method_fir)s
+        %(iir_params)s
+        %(fir_window)s
+        %(fir_design)s
+        %(verbose)s
+
+        Returns
+        -------
+        stream : instance of RawStream
+            The stream, modified in place.
+
+        See Also
+        --------
+        mne.io.Raw.filter
+        mne.filter.create_filter
+
+        Notes
+        -----
+        The filter is causal: FIR filters are constructed with
+        ``phase="minimum"`` and IIR filters are applied with
+        ``phase="forward"``. Long FIR filters (e.g., for high-pass filtering
+        at low frequencies) are expensive to apply to short chunks, so IIR
+        filters are usually better suited for low latency.
+        """
+        update_info, picks = _filt_check_picks(self.info, picks, l_freq, h_freq)
+        filt = create_filter(
+            None,
+            self.info["sfreq"],
+            l_freq,
+            h_freq,
+            filter_length,
+            l_trans_bandwidth,
+            h_trans_bandwidth,
+            method,
+            iir_params,
+            phase="forward" if method == "iir" else "minimum",
+            fir_window=fir_window,
+            fir_design=fir_design,
+        )
+        if isinstance(filt, dict):
+            self._operators.append(_IIRFilter(picks, filt))
+        else:
+            self._operators.append(_FIRFilter(picks, filt))
+        _filt_update_info(self.info, update_info, l_freq, h_freq)
+        return self
+
+    @verbose
+    def set_eeg_reference(
+        self, ref_channels="average", *, ch_type="auto", verbose=None
+    ):
+        """Re-reference the incoming EEG data.
+
+        Parameters
+        ----------
+        ref_channels : list of str | str
+            The name(s) of the channel(s) to use as the reference, or
+            ``"average"`` (default) for an average reference of the good
+            channels.
+        ch_type : list of str | str
+            The channel type(s) to apply the reference to, among ``'auto'``
+            (default), ``'eeg'``, ``'ecog'``, ``'seeg'`` and ``'dbs'``. With
+            ``ref_channels="average"``, each type gets its own average
+            reference.
+        %(verbose)s
+
+        Returns
+        -------
+        stream : instance of RawStream
+            The stream, modified in place.
+
+        See Also
+        --------
+        mne.set_eeg_reference
+        """
+        ch_type = _get_ch_type(self, ch_type)
+        if isinstance(ref_channels, str) and ref_channels == "average":
+            ref_tos = [pick_types(self.info, **{type_: True}) for type_ in ch_type]
+            ref_froms = ref_tos
+        else:
+            if isinstance(ref_channels, str):
+                ref_channels = [ref_channels]
+            _validate_type(ref_channels, (list, tuple), "ref_channels")
+            ch_dict = {type_: True for type_ in ch_type}
+            ref_tos = [pick_types(self.info, meg=False, **ch_dict)]
+            ref_froms = [pick_channels(self.ch_names, ref_channels, ordered=True)]
+        if sum(len(ref_to) for ref_to in ref_tos) == 0:
+            raise ValueError("No EEG channels found to apply the reference to")
+        _check_ssp(
+            self, [self.ch_names[pick] for pick in np.concatenate(ref_froms + ref_tos)]
+        )
+        with self.info._unlock():
+            self.info["custom_ref_applied"] = FIFF.FIFFV_MNE_CUSTOM_REF_ON
+        for ref_from, ref_to in zip(ref_froms, ref_tos):
+            if len(ref_to):
+                self._operators.append(_Reference(ref_from, ref_to))
+        return self
+
+    @verbose
+    def apply_proj(self, *, verbose=None):
+        """Apply the signal space projection (SSP) operators to incoming data.
+
+        Parameters
+        ----------
+        %(verbose)s
+
+        Returns
+        -------
+        stream : instance of RawStream
+            The stream, modified in place.
+
+        See Also
+        --------
+        mne.io.Raw.apply_proj
+        """
+        if all(proj["active"] for proj in self.info["projs"]):
+            logger.info("Projections have already been applied. Doing nothing.")
+            return self
+        projector, _ = setup_proj(self.info, add_eeg_ref=False, activate=False)
+        if projector is None:
+            logger.info("The projections don't apply to these data. Doing nothing.")
+            return self
+        self._projector = projector
+        self._operators.append(_Projector(projector))
+        # the epochs and any later consumer of info must not project again
+        with self.info._unlock():
+            for proj in self.info["projs"]:
+                proj["active"] = True
+        return self
+
+    @verbose
+    def detect_events(
+        self,
+        stim_channel=None,
+        *,
+        consecutive="increasing",
+        min_duration=0,
+        mask=None,
+        uint_cast=False,
+        mask_type="and",
+        verbose=None,
+    ):
+        """Detect event onsets on the incoming stim channel data.
+
+        The events detected so far are available as :attr:`events`.
+
+        Parameters
+        ----------
+        stim_channel : None | str | list of str
+            The stim channel(s), see :func:`mne.find_events`.
+        consecutive : bool | 'increasing'
+            How to treat changes of the value without first returning to
+            zero, see :func:`mne.find_events`.
+        min_duration : float
+            The minimum duration of a change in the events channel required
+            to consider it as an event (in seconds). Events are then
+            detected up to ``min_duration`` later.
+        mask : int | None
+            The value of the digital mask to apply to the stim channel values.
+        uint_cast : bool
+            If True, cast the stim channel data to an unsigned integer.
+        mask_type : 'and' | 'not_and'
+            The type of operation between the mask and the trigger.
+        %(verbose)s
+
+        Returns
+        -------
+        stream : instance of RawStream
+            The stream, modified in place.
+
+        See Also
+        --------
+        mne.EventFinder
+        mne.find_events
+        """
+        self._event_finder = EventFinder(
+            self.info,
+            stim_channel,
+            consecutive=consecutive,
+            min_duration=min_duration,
+            mask=mask,
+            uint_cast=uint_cast,
+            mask_type=mask_type,
+            first_samp=self._n_times,
+        )
+        self._stim_picks = pick_channels(
+            self.ch_names, self._event_finder.ch_names, ordered=True
+        )
+        return self
+
+    @verbose
+    def set_epochs(
+        self, event_id=None, tmin=-0.2, tmax=0.5, baseline=(None, 0), *, verbose=None
+    ):
+        """Collect epochs around the events that are detected from now on.
+
+        The epochs are returned by :meth:`pop_epochs` as soon as all of their
+        samples have arrived.
+
+        Parameters
+        ----------
+        event_id : int | list of int | dict | None
+            The events to use, like in :class:`mne.Epochs`. None (default)
+            uses all events.
+        tmin, tmax : float
+            The start and end time of the epochs in seconds, relative to the
+            events.
+        %(baseline_epochs)s
+        %(verbose)s
+
+        Returns
+        -------
+        stream : instance of RawStream
+            The stream, modified in place.
+        """
+        if self._event_finder is None:
+            raise RuntimeError("Call detect_events() before set_epochs()")
+        if event_id is not None:
+            if not isinstance(event_id, dict):
+                event_id = np.atleast_1d(event_id)
+                event_id = {str(int(id_)): int(id_) for id_ in event_id}
+            for key, val in event_id.items():
+                _validate_type(val, "int", f"event_id[{repr(key)}]")
+        sfreq = self.info["sfreq"]
+        smin, smax = int(round(tmin * sfreq)), int(round(tmax * sfreq))
+        if smin > smax:
+            raise ValueError(f"tmin must be <= tmax, got {tmin} and {tmax}")
+        if smax - smin + 1 > self._buffer.shape[1]:
+            raise ValueError(
+                f"Epochs of {smax - smin + 1} samples do not fit into the buffer "
+                f"of {self._buffer.shape[1]} samples"
+            )
+        self._epochs_params = dict(
+            event_id=event_id, smin=smin, smax=smax, baseline=baseline
+        )
+        self._pending = np.empty((0, 3), int)
+        self._epochs = list()
+        return self
+
+    def _collect_epochs(self):
+        params = self._epochs_params
+        event_id = params["event_id"]
+        if event_id is not None:
+            keep = np.isin(self._pending[:, 2], list(event_id.values()))
+            self._pending = self._pending[keep]
+        ready = self._pending[:, 0] + params["smax"] < self._n_times
+        oldest = max(self._n_times - self._buffer.shape[1], 0)
+        for event in self._pending[ready]:
+            start = event[0] + params["smin"]
+            if start < 0:
+                warn(
+                    f"Dropping the epoch of the event at sample {event[0]}, "
+                    "which starts before the first sample of the stream"
+                )
+                continue
+            if start < oldest:
+                warn(
+                    f"Dropping the epoch of the event at sample {event[0]}, "
+                    "which is no longer in the buffer"
+                )
+                continue
+            self._epochs.append(
+                (event, self._get_samples(start, event[0] + params["smax"] + 1))
+            )
+        self._pending = self._pending[~ready]
+
+    @verbose
+    def pop_epochs(self, *, verbose=None):
+        """Get the epochs that are complete and remove them from the stream.
+
+        Parameters
+        ----------
+        %(verbose)s
+
+        Returns
+        -------
+        epochs : instance of EpochsArray | None
+            The epochs collected since the last call, or None if there are
+            none.
+        """
+        if self._epochs_params is None:
+            raise RuntimeError("Call set_epochs() before pop_epochs()")
+        if len(self._epochs) == 0:
+            return None
+        events = np.array([event for event, _ in self._epochs])
+        data = np.array([data for _, data in self._epochs])
+        self._epochs = list()
+        params = self._epochs_params
+        event_id = params["event_id"]
+        if event_id is None:
+            event_id = {str(id_): int(id_) for id_ in np.unique(events[:, 2])}
+        return EpochsArray(
+            data,
+            self.info,
+            events,
+            tmin=params["smin"] / self.info["sfreq"],
+            event_id=event_id,
+            baseline=params["baseline"],
+            on_missing="ignore",
+        )
+
+    @verbose
+    def replay(self, raw, chunk_duration=0.05, *, realtime=False, verbose=None):
+        """Push the data of a raw instance chunk by chunk.
+
+        This stands in for a live acquisition. If ``raw`` is not preloaded,
+        each chunk is read from disk when it is pushed.
+
+        Parameters
+        ----------
+        raw : instance of Raw
+            The raw data, with the same channels and sampling frequency as the
+            stream.
+        chunk_duration : float
+            The duration of each chunk in seconds.
+        realtime : bool
+            If True, wait between the chunks so that they arrive at the
+            speed of the acquisition.
+        %(verbose)s
+
+        Yields
+        ------
+        data : ndarray, shape (n_channels, n_times)
+            Each processed chunk, see :meth:`push`.
+        """
+        _validate_type(raw, BaseRaw, "raw")
+        if raw.ch_names != self.ch_names or raw.info["sfreq"] != self.info["sfreq"]:
+            raise ValueError(
+                "raw must have the same channels and sampling frequency as the stream"
+            )
+        n_chunk = max(int(round(chunk_duration * self.info["sfreq"])), 1)
+        t0 = time.perf_counter()
+        for start in range(0, len(raw.times), n_chunk):
+            stop = min(start + n_chunk, len(raw.times))
+            if realtime:
+                time.sleep(max(t0 + stop / self.info["sfreq"] - time.perf_counter(), 0))
+            yield self.push(raw.get_data(start=start, stop=stop))
+
+
+class _FIRFilter:
+    """Causal FIR filter that keeps the previous samples as its state."""
+
+    def __init__(self, picks, h):
+        self.picks = picks
+        self.h = h[np.newaxis]
+        self.state = None  # the last len(h) - 1 samples
+
+    def __call__(self, data):
+        x = data[self.picks]
+        if self.state is None:
+            self.state = np.repeat(x[:, :1], self.h.shape[1] - 1, axis=1)
+        x_ext = np.concatenate([self.state, x], axis=1)
+        data[self.picks] = fftconvolve(x_ext, self.h, mode="valid", axes=-1)
+        self.state = x_ext[:, x_ext.shape[1] - self.state.shape[1] :]
+
+
+class _IIRFilter:
+    """Causal IIR filter that keeps its internal state."""
+
+    def __init__(self, picks, iir_params):
+        self.picks = picks
+        self.iir_params = iir_params
+        self.zi = None
+
+    def __call__(self, data):
+        x = data[self.picks]
+        if "sos" in self.iir_params:
+            sos = self.iir_params["sos"]
+            if self.zi is None:  # steady state for the first sample
+                self.zi = sosfilt_zi(sos)[:, np.newaxis] * x[:, :1]
+            data[self.picks], self.zi = sosfilt(sos, x, axis=-1, zi=self.zi)
+        else:
+            b, a = self.iir_params["b"], self.iir_params["a"]
+            if self.zi is None:
+                self.zi = lfilter_zi(b, a)[np.newaxis] * x[:, :1]
+            data[self.picks], self.zi = lfilter(b, a, x, axis=-1, zi=self.zi)
+
+
+class _Reference:
+    """Subtract the average of some channels from others."""
+
+    def __init__(self, ref_from, ref_to):
+        self.ref_from = ref_from
+        self.ref_to = ref_to
+
+    def __call__(self, data):
+        data[self.ref_to] -= data[self.ref_from].mean(axis=0)
+
+
+class _Projector:
+    """Apply an SSP operator."""
+
+    def __init__(self, projector):
+        self.projector = projector
+
+    def __call__(self, data):
+        data[:] = self.projector @ data
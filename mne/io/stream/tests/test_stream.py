@@ -0,0 +1,149 @@
+# Authors: The MNE-Python contributors.
+# License: BSD-3-Clause
+# Copyright the MNE-Python contributors.
+
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose, assert_array_equal
+from scipy.signal import sosfilt, sosfilt_zi
+
+from mne import Epochs, compute_proj_raw, create_info, find_events
+from mne.filter import create_filter
+from mne.io import RawArray, RawStream, read_raw_fif
+
+
+def _make_raw():
+    rng = np.random.default_rng(0)
+    sfreq = 250.0
+    info = create_info(
+        ["EEG1", "EEG2", "EEG3", "EEG4", "STI 014"], sfreq, ["eeg"] * 4 + ["stim"]
+    )
+    data = rng.standard_normal((5, 5000)) * 1e-5
+    data[-1] = 0
+    for onset, code in ((400, 1), (1200, 2), (2000, 1), (3333, 3), (4990, 2)):
+        data[-1, onset : onset + 25] = code
+    data[-1, 2010:2020] = 3  # consecutive
+    return RawArray(data, info)
+
+
+def _push_chunks(stream, data, sizes):
+    out, start = list(), 0
+    while start < data.shape[1]:
+        size = sizes[len(out) % len(sizes)]
+        out.append(stream.push(data[:, start : start + size]))
+        start += size
+    return np.concatenate(out, axis=1)
+
+
+def test_stream_operators():
+    """Test that stream operators keep their state across chunks."""
+    raw = _make_raw()
+    raw.info["bads"] = ["EEG4"]
+    raw.add_proj(compute_proj_raw(raw, n_eeg=1, verbose="error"))
+    data = raw.get_data()
+
+    def make_stream():
+        stream = RawStream(raw.info, buffer_size=5.0)
+        stream.filter(1.0, 40.0, method="iir")
+        stream.filter(None, 30.0)
+        stream.apply_proj()
+        stream.set_eeg_reference()
+        return stream
+
+    stream = make_stream()
+    assert stream.info["lowpass"] == 30.0
+    assert stream.info["highpass"] == 1.0
+    assert all(proj["active"] for proj in stream.info["projs"])
+    assert not raw.info["projs"][0]["active"]
+    out = _push_chunks(stream, data, [1, 37, 128])
+    assert_allclose(out, make_stream().push(data), atol=1e-20)
+    assert stream.n_times == len(raw.times)
+    assert_allclose(stream.get_data(), out[:, -stream._buffer.shape[1] :])
+    assert_allclose(stream.get_data("EEG1", n_times=10), out[:1, -10:])
+    assert "eeg" in stream and "meg" not in stream
+    assert "5000 samples" in repr(stream)
+
+    # each operator individually
+    sfreq = raw.info["sfreq"]
+    iir_params = create_filter(None, sfreq, 1.0, 40.0, method="iir", phase="forward")
+    sos = iir_params["sos"]
+    zi = sosfilt_zi(sos)[:, np.newaxis] * data[:4, :1]
+    want = sosfilt(sos, data[:4], zi=zi)[0]
+    stream = RawStream(raw.info).filter(1.0, 40.0, method="iir")
+    assert_allclose(_push_chunks(stream, data, [50])[:4], want, atol=1e-20)
+    h = create_filter(None, sfreq, None, 30.0, phase="minimum")
+    want = np.convolve(np.r_[np.full(len(h) - 1, data[0, 0]), data[0]], h, "valid")
+    stream = RawStream(raw.info).filter(None, 30.0)
+    assert_allclose(_push_chunks(stream, data, [50])[0], want, atol=1e-20)
+    stream = RawStream(raw.info).apply_proj()
+    assert_allclose(stream.push(data), raw.copy().apply_proj().get_data())
+    with pytest.raises(RuntimeError, match="Inactive signal space projection"):
+        RawStream(raw.info).set_eeg_reference()
+    raw.del_proj()
+    stream = RawStream(raw.info).set_eeg_reference()
+    want = raw.copy().set_eeg_reference(verbose="error").get_data()
+    assert_allclose(stream.push(data), want, atol=1e-20)
+    stream = RawStream(raw.info).set_eeg_reference(["EEG1"])
+    assert_allclose(stream.push(data)[0], 0.0)
+
+    with pytest.raises(ValueError, match="must have shape"):
+        stream.push(data[:2])
+    with pytest.raises(ValueError, match="must be between"):
+        stream.get_data(n_times=len(raw.times) + 1)
+    with pytest.raises(ValueError, match="at least one sample"):
+        RawStream(raw.info, buffer_size=0.0)
+
+
+@pytest.mark.parametrize("consecutive", ("increasing", True, False))
+def test_stream_events_epochs(tmp_path, consecutive):
+    """Test detecting events and collecting epochs while replaying a file."""
+    fname = tmp_path / "test_raw.fif"
+    _make_raw().save(fname)
+    raw = read_raw_fif(fname)
+    stream = RawStream(raw.info, buffer_size=1.0)
+    with pytest.raises(RuntimeError, match="detect_events"):
+        stream.set_epochs()
+    stream.detect_events(consecutive=consecutive)
+    with pytest.raises(ValueError, match="do not fit"):
+        stream.set_epochs(tmin=-1, tmax=1)
+    stream.set_epochs(event_id=[1, 3], tmin=-0.2, tmax=0.5)
+    epochs_list = list()
+    for chunk in stream.replay(raw, chunk_duration=0.1):
+        assert chunk.shape == (5, 25)
+        epochs = stream.pop_epochs()
+        if epochs is not None:
+            epochs_list.append(epochs)
+    events = find_events(raw, consecutive=consecutive)
+    assert_array_equal(stream.events, events)
+    assert stream.pop_epochs() is None
+
+    # the same epochs as offline
+    epochs = Epochs(raw, events, [1, 3], -0.2, 0.5, preload=True)
+    data = np.concatenate([ep.get_data() for ep in epochs_list])
+    assert_allclose(data, epochs.get_data())
+    assert_array_equal(np.concatenate([ep.events for ep in epochs_list]), epochs.events)
+    for ep in epochs_list:
+        assert ep.event_id == dict(zip(["1", "3"], [1, 3]))
+        assert ep.baseline == (-0.2, 0.0)
+
+
+def test_stream_epochs_edges():
+    """Test that epochs are complete and projected once."""
+    raw = _make_raw()
+    raw.info["bads"] = ["EEG4"]
+    raw.add_proj(compute_proj_raw(raw, n_eeg=1, verbose="error"))
+    data = raw.get_data()
+    data[-1] = 0
+    data[-1, 5] = 1  # before tmin while the buffer is still filling
+    data[-1, 100] = 2
+    stream = RawStream(raw.info, buffer_size=1.0).apply_proj()
+    stream.detect_events().set_epochs(tmin=-0.2, tmax=0.2, baseline=None)
+    with pytest.warns(RuntimeWarning, match="before the first sample"):
+        out = stream.push(data[:, :200])
+    epochs = stream.pop_epochs()
+    assert_array_equal(epochs.events[:, 2], [2])
+    assert all(proj["active"] for proj in epochs.info["projs"])
+    assert_allclose(epochs.get_data()[0], out[:, 50:151])
+    # already applied
+    stream.apply_proj()
+    assert len(stream._operators) == 1
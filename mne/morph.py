@@ -25,6 +25,7 @@ from .utils import (
     ProgressBar,
     _check_fname,
     _check_option,
+    _ContentCache,
     _custom_lru_cache,
     _ensure_int,
     _import_h5io_funcs,
@@ -569,6 +570,53 @@ class SourceMorph:
             )
         return out
 
+    @verbose
+    def apply_array(self, data, *, n_jobs=None, verbose=None):
+        """Morph the data of many source estimates at once.
+
+        Parameters
+        ----------
+        data : ndarray, shape (n_stcs, n_vertices, ...)
+            The data of the source estimates to morph, e.g.,
+            ``np.array([stc.data for stc in stcs])``. The vertices must be the
+            ones the morph was computed from (those of the surface source
+            space, if any, followed by those of the volume source space).
+        %(n_jobs)s
+        %(verbose)s
+
+        Returns
+        -------
+        data_to : ndarray, shape (n_stcs, n_vertices_to, ...)
+            The morphed data, for the vertices in ``morph.vertices_to``.
+
+        Notes
+        -----
+        The data of all source estimates are morphed with a single sparse matrix
+        product (split across ``n_jobs`` threads), which is much faster than
+        calling :meth:`apply` for each of them.
+
+        .. versionadded:: 1.13
+        """
+        data = np.asarray(data)
+        do_surf = self.kind in ("surface", "mixed")
+        do_vol = self.kind in ("volume", "mixed")
+        n_from = 0
+        if do_surf:
+            n_from += sum(len(v) for v in self.src_data["vertices_from"])
+        if do_vol:
+            n_from += sum(len(v) for v in self._vol_vertices_from)
+        if data.ndim < 2 or data.shape[1] != n_from:
+            raise ValueError(
+                f"data must have shape (n_stcs, {n_from}, ...) to match the "
+                f"vertices of the morph, got {data.shape}"
+            )
+        data_from = np.moveaxis(data, 1, 0).reshape(n_from, -1)
+        data_to = _morph_array(
+            self, data_from, do_surf=do_surf, do_vol=do_vol, mesg="Time", n_jobs=n_jobs
+        )
+        data_to = data_to.reshape((len(data_to), len(data)) + data.shape[2:])
+        return np.ascontiguousarray(np.moveaxis(data_to, 0, 1))
+
     @verbose
     def compute_vol_morph_mat(self, *, verbose=None):
         """Compute the sparse matrix representation of the volumetric morph.
@@ -606,19 +654,9 @@ class SourceMorph:
         return self
 
     def _morph_vols(self, vols, mesg, subselect=True):
-        from dipy.align.reslice import reslice
-
         interp = self.src_data["interpolator"].tocsc()[
             :, np.concatenate(self._vol_vertices_from)
         ]
-        n_vols = interp.shape[1] if vols is None else vols.shape[1]
-        attrs = ("real", "imag") if np.iscomplexobj(vols) else ("real",)
-        dtype = np.complex128 if len(attrs) == 2 else np.float64
-        if vols is None:  # sparse -> sparse mode
-            img_to = (list(), list(), [0])  # data, indices, indptr
-            assert subselect
-        else:  # dense -> dense mode
-            img_to = None
         if subselect:
             vol_verts = np.concatenate(self._vol_vertices_to)
         else:
@@ -651,84 +689,61 @@ class SourceMorph:
             @ self.pre_affine.affine
             @ self.pre_affine.domain_grid2world,
         )
-        resamp_0_1 = resamp_1 @ resamp_0
+        # All steps are linear, so rather than transforming one volume at a
+        # time, we use sparse matrices to morph all (or memory-bounded chunks
+        # of) the volumes at once. The source space interpolation is combined
+        # with the first resampling to avoid materializing MRI-resolution data.
+        resamp_0_1 = (resamp_1 @ (resamp_0 @ interp)).tocsr()
+        shape = tuple(self.pre_affine.domain_shape)
+        # equivalent of:
+        # self.sdr_morph.transform(img_real)
+        resamp_sdr = resamp_reslice = None
+        if self.sdr_morph is not None:
+            resamp_sdr = _sdr_interp(self.sdr_morph, shape)
+            assert resamp_sdr.shape[0] == np.prod(shape)
+        # subselect the correct cube if src_to is provided
         resamp_2 = None
-        for ii in ProgressBar(list(range(n_vols)), mesg=mesg):
-            for attr in attrs:
-                # transform from source space to mri_from resolution/space
-                if vols is None:
-                    img_real = interp[:, [ii]]
-                else:
-                    img_real = interp @ getattr(vols[:, ii], attr)
-                _debug_img(img_real, from_affine, "From", src_shape)
-
-                img_real = resamp_0_1 @ img_real
-                if sparse.issparse(img_real):
-                    img_real = img_real.toarray()
-                img_real = img_real.reshape(self.pre_affine.domain_shape, order="F")
-                if self.sdr_morph is not None:
-                    img_real = self.sdr_morph.transform(img_real)
-                _debug_img(img_real, self.affine, "From-reslice-transform")
-
-                # subselect the correct cube if src_to is provided
-                if self.src_data["to_vox_map"] is not None:
-                    affine = self.affine
-                    to_zooms = np.diag(self.src_data["to_vox_map"][1])[:3]
-                    # There might be some sparse equivalent to this but
-                    # not sure...
-                    if not np.allclose(self.zooms, to_zooms, atol=1e-3):
-                        img_real, affine = reslice(
-                            img_real, self.affine, self.zooms, to_zooms
-                        )
-                    _debug_img(img_real, affine, "From-reslice-transform-src")
-                    if resamp_2 is None:
-                        resamp_2 = _grid_interp(
-                            img_real.shape,
-                            self.src_data["to_vox_map"][0],
-                            np.linalg.inv(affine) @ self.src_data["to_vox_map"][1],
-                        )
-                    # Equivalent to:
-                    # _resample_from_to(
-                    #     img_real, affine, self.src_data['to_vox_map'])
-                    img_real = resamp_2 @ img_real.ravel(order="F")
-                    _debug_img(
-                        img_real,
-                        self.src_data["to_vox_map"][1],
-                        "From-reslice-transform-src-subselect",
-                        self.src_data["to_vox_map"][0],
-                    )
-
-                # This can be used to help debug, but it really should just
-                # show the brain filling the volume:
-                # img_want = np.zeros(np.prod(img_real.shape))
-                # img_want[np.concatenate(self._vol_vertices_to)] = 1.
-                # img_want = np.reshape(
-                #     img_want, self.src_data['src_shape'][::-1], order='F')
-                # _debug_img(img_want, self.src_data['to_vox_map'][1],
-                #            'To mask')
-                # raise RuntimeError('Check')
-
-                # combine real and complex parts
-                img_real = img_real.ravel(order="F")[vol_verts]
-
-                # initialize output
-                if img_to is None and vols is not None:
-                    img_to = np.zeros((img_real.size, n_vols), dtype=dtype)
-
-                if vols is None:
-                    idx = np.where(img_real)[0]
-                    img_to[0].extend(img_real[idx])
-                    img_to[1].extend(idx)
-                    img_to[2].append(img_to[2][-1] + len(idx))
-                else:
-                    if attr == "real":
-                        img_to[:, ii] = img_to[:, ii] + img_real
-                    else:
-                        img_to[:, ii] = img_to[:, ii] + 1j * img_real
-
-        if vols is None:
-            img_to = sparse.csc_array(img_to, shape=(len(vol_verts), n_vols)).tocsr()
-
+        if self.src_data["to_vox_map"] is not None:
+            affine = self.affine
+            to_zooms = np.diag(self.src_data["to_vox_map"][1])[:3]
+            if not np.allclose(self.zooms, to_zooms, atol=1e-3):
+                # equivalent of:
+                # reslice(img_real, self.affine, self.zooms, to_zooms)
+                resamp_reslice, shape, affine = _reslice_interp(
+                    shape, affine, self.zooms, to_zooms
+                )
+            # Equivalent to:
+            # _resample_from_to(
+            #     img_real, affine, self.src_data['to_vox_map'])
+            resamp_2 = _grid_interp(
+                shape,
+                self.src_data["to_vox_map"][0],
+                np.linalg.inv(affine) @ self.src_data["to_vox_map"][1],
+            )
+        # All steps are linear, so rather than transforming one volume at a
+        # time, we use the sparse matrices to morph all (or memory-bounded
+        # chunks of) the volumes at once
+        ops = [resamp_2, resamp_reslice, resamp_sdr]
+        ops = [op for op in ops if op is not None]
+        if vols is None:  # sparse -> sparse mode
+            assert subselect
+            # go left-to-right to only compute the rows we need
+            img_to = (ops + [resamp_0_1])[0][vol_verts]
+            for op in (ops + [resamp_0_1])[1:]:
+                img_to = img_to @ op
+            img_to = sparse.csr_array(img_to)
+            img_to.eliminate_zeros()
+        else:  # dense -> dense mode
+            n_rows = max([resamp_0_1.shape[0]] + [op.shape[0] for op in ops])
+            img_to = list()
+            for sl in ProgressBar(
+                _vol_morph_slices((n_rows, vols.shape[1]), vols.dtype), mesg=mesg
+            ):
+                img = resamp_0_1 @ vols[:, sl]
+                for op in ops[::-1]:
+                    img = op @ img
+                img_to.append(img[vol_verts])
+            img_to = np.concatenate(img_to, axis=1)
         return img_to
 
     def __repr__(self):  # noqa: D105
@@ -1172,6 +1187,77 @@ def _compute_morph_sdr(mri_from, mri_to, niter_affine, niter_sdr, zooms):
     return to_shape, zooms, to_affine, pre_affine, sdr_morph
 
 
+# Limit the size of the intermediate volumes when morphing many time points
+_VOL_MORPH_CHUNK_BYTES = 256 * 1024**2
+
+
+def _vol_morph_slices(shape, dtype=np.float64):
+    """Split the columns into chunks that each use a bounded amount of memory."""
+    n_rows, n_cols = shape
+    n_chunk = max(_VOL_MORPH_CHUNK_BYTES // (np.dtype(dtype).itemsize * n_rows), 1)
+    return [slice(start, start + n_chunk) for start in range(0, n_cols, n_chunk)]
+
+
+def _reslice_interp(shape, affine, zooms, new_zooms):
+    """Get the sparse matrix equivalent of dipy's ``reslice``."""
+    zooms = np.array(zooms, np.float64)
+    new_zooms = np.array(new_zooms, np.float64)
+    ratio = new_zooms / zooms
+    new_shape = tuple(np.round(zooms / new_zooms * np.array(shape)).astype(int))
+    trans = np.diag(np.concatenate([ratio, [1.0]]))
+    interp = _grid_interp(shape, new_shape, trans)
+    # scipy.ndimage.affine_transform(..., mode="constant") does not
+    # interpolate beyond the edges of the input
+    inside = [np.arange(n) * r <= s - 1 for n, r, s in zip(new_shape, ratio, shape)]
+    inside = np.logical_and.outer(np.logical_and.outer(*inside[:2]), inside[2])
+    inside = inside.ravel(order="F")
+    interp = sparse.diags_array(inside.astype(np.float64)) @ interp
+    return interp, new_shape, affine @ trans
+
+
+def _sdr_interp(sdr_morph, from_shape):
+    """Get the sparse matrix equivalent of ``sdr_morph.transform``."""
+    from scipy.ndimage import map_coordinates
+
+    def _aff(*mats):
+        out = np.eye(4)
+        for mat in mats:
+            if mat is not None:
+                out = out @ mat
+        return out
+
+    # Same as dipy's DiffeomorphicMap._warp_forward and _warp_backward
+    if sdr_morph.is_inverse:
+        field = sdr_morph.backward
+        image_world2grid = sdr_morph.domain_world2grid
+        out_shape = sdr_morph.codomain_shape
+        out_grid2world = sdr_morph.codomain_grid2world
+        prealign = sdr_morph.prealign_inv
+        idx_in = _aff(sdr_morph.disp_world2grid, out_grid2world)
+        idx_disp = _aff(image_world2grid, prealign)
+    else:
+        field = sdr_morph.forward
+        image_world2grid = sdr_morph.codomain_world2grid
+        out_shape = sdr_morph.domain_shape
+        out_grid2world = sdr_morph.domain_grid2world
+        prealign = sdr_morph.prealign
+        idx_in = _aff(sdr_morph.disp_world2grid, prealign, out_grid2world)
+        idx_disp = _aff(image_world2grid)
+    idx_out = _aff(image_world2grid, prealign, out_grid2world)
+    field = np.moveaxis(np.asarray(field, np.float64), -1, 0)
+
+    def disp(rr):
+        rr = (idx_in @ rr)[:3]
+        # the displacement field is also linearly interpolated (with zeros
+        # outside), which we do for all voxels of a slice at once
+        this_disp = np.array(
+            [map_coordinates(f, rr, order=1, mode="grid-constant") for f in field]
+        )
+        return (idx_disp[:3, :3] @ this_disp).T
+
+    return _grid_interp(from_shape, out_shape, idx_out, disp=disp)
+
+
 def _compute_morph_matrix(
     subject_from,
     subject_to,
@@ -1224,14 +1310,53 @@ def _compute_morph_matrix(
     return morpher
 
 
+# The smoothing and morph map products take ~0.1-1 s per hemisphere, and group
+# analyses compute the same ones for every morph of a subject (and run)
+_hemi_morph_cache = _ContentCache("surface_morph", maxsize=8)
+
+
 def _hemi_morph(tris, vertices_to, vertices_from, smooth, maps, warn):
     _validate_type(smooth, (str, None, "int-like"), "smoothing steps")
     if len(vertices_from) == 0:
         return sparse.csr_array((len(vertices_to), 0))
+
+    def compute():
+        mm, n_missing, n_iter, n_vertices = _hemi_morph_mat(
+            tris, vertices_to, vertices_from, smooth, maps
+        )
+        return dict(
+            data=mm.data,
+            indices=mm.indices,
+            indptr=mm.indptr,
+            shape=mm.shape,
+            n_missing=n_missing,
+            n_iter=n_iter,
+            n_vertices=n_vertices,
+        )
+
+    key = (tris, vertices_to, vertices_from, smooth, maps)
+    value = _hemi_morph_cache(key, compute)
+    n_missing, n_iter = int(value["n_missing"]), int(value["n_iter"])
+    if n_missing and warn:
+        warn_(
+            f"{n_missing}/{int(value['n_vertices'])} vertices not included in "
+            "smoothing, consider increasing the number of steps"
+        )
+    if n_iter:
+        logger.info(f"    {n_iter} smooth iterations done.")
+    mm = sparse.csr_array(
+        (value["data"], value["indices"], value["indptr"]), shape=tuple(value["shape"])
+    )
+    assert mm.shape == (len(vertices_to), len(vertices_from))
+    return mm
+
+
+def _hemi_morph_mat(tris, vertices_to, vertices_from, smooth, maps):
     e = mesh_edges(tris)
     e.data[e.data == 2] = 1
     n_vertices = e.shape[0]
     e += sparse.eye_array(n_vertices, format="csr")
+    n_missing = n_iter = 0
     if isinstance(smooth, str):
         _check_option("smooth", smooth, ("nearest",), extra=" when used as a string.")
         mm = _surf_nearest(vertices_from, e).tocsr()
@@ -1246,19 +1371,14 @@ def _hemi_morph(tris, vertices_to, vertices_from, smooth, maps, warn):
         ).tocsr()
     else:
         mm, n_missing, n_iter = _surf_upsampling_mat(vertices_from, e, smooth)
-        if n_missing and warn:
-            warn_(
-                f"{n_missing}/{e.shape[0]} vertices not included in "
-                "smoothing, consider increasing the number of steps"
-            )
-        logger.info(f"    {n_iter} smooth iterations done.")
     assert mm.shape == (n_vertices, len(vertices_from))
     if maps is not None:
         mm = maps[vertices_to] @ mm
     else:  # to == from
         mm = mm[vertices_to]
+    mm = sparse.csr_array(mm)
     assert mm.shape == (len(vertices_to), len(vertices_from))
-    return mm
+    return mm, n_missing, n_iter, n_vertices
 
 
 @verbose
@@ -1503,25 +1623,47 @@ def _apply_morph_data(morph, stc_from):
     do_surf = not isinstance(stc_from, _BaseVolSourceEstimate)
 
     vol_src_offset = 2 if do_surf else 0
-    from_surf_stop = sum(len(v) for v in stc_from.vertices[:vol_src_offset])
-    to_surf_stop = sum(len(v) for v in morph.vertices_to[:vol_src_offset])
-    from_vol_stop = stc_from.data.shape[0]
+    if do_vol:
+        stc_from_vertices = stc_from.vertices[vol_src_offset:]
+        vertices_from = morph._vol_vertices_from
+        for ii, (v1, v2) in enumerate(zip(vertices_from, stc_from_vertices)):
+            _check_vertices_match(v1, v2, f"volume[{ii}]")
+    if do_surf:
+        for hemi, v1, v2 in zip(
+            ("left", "right"), morph.src_data["vertices_from"], stc_from.vertices[:2]
+        ):
+            _check_vertices_match(v1, v2, f"{hemi} hemisphere")
     vertices_to = morph.vertices_to
     if morph.kind == "mixed":
         vertices_to = vertices_to[0 if do_surf else 2 : None if do_vol else 2]
-    to_vol_stop = sum(len(v) for v in vertices_to)
 
     mesg = "Ori × Time" if stc_from.data.ndim == 3 else "Time"
     data_from = np.reshape(stc_from.data, (stc_from.data.shape[0], -1))
-    n_times = data_from.shape[1]  # oris treated as times
-    data = np.empty((to_vol_stop, n_times), stc_from.data.dtype)
+    data = _morph_array(morph, data_from, do_surf=do_surf, do_vol=do_vol, mesg=mesg)
+    data = _reshape_view(data, (data.shape[0],) + stc_from.data.shape[1:])
+    klass = stc_from.__class__
+    stc_to = klass(data, vertices_to, stc_from.tmin, stc_from.tstep, morph.subject_to)
+    return stc_to
+
+
+def _morph_array(morph, data_from, *, do_surf, do_vol, mesg, n_jobs=None):
+    """Morph data of shape (n_vertices_from, n_columns)."""
+    vol_src_offset = 2 if do_surf else 0
+    from_surf_stop = 0
+    if do_surf:
+        from_surf_stop = sum(len(v) for v in morph.src_data["vertices_from"])
+    to_surf_stop = sum(len(v) for v in morph.vertices_to[:vol_src_offset])
+    from_vol_stop = data_from.shape[0]
+    vertices_to = morph.vertices_to
+    if morph.kind == "mixed":
+        vertices_to = vertices_to[0 if do_surf else 2 : None if do_vol else 2]
+    to_vol_stop = sum(len(v) for v in vertices_to)
+
+    n_times = data_from.shape[1]  # oris (and stcs) treated as times
+    data = np.empty((to_vol_stop, n_times), data_from.dtype)
     to_used = np.zeros(data.shape[0], bool)
     from_used = np.zeros(data_from.shape[0], bool)
     if do_vol:
-        stc_from_vertices = stc_from.vertices[vol_src_offset:]
-        vertices_from = morph._vol_vertices_from
-        for ii, (v1, v2) in enumerate(zip(vertices_from, stc_from_vertices)):
-            _check_vertices_match(v1, v2, f"volume[{ii}]")
         from_sl = slice(from_surf_stop, from_vol_stop)
         assert not from_used[from_sl].any()
         from_used[from_sl] = True
@@ -1544,22 +1686,41 @@ def _apply_morph_data(morph, stc_from):
             data[to_sl, :] = morph._morph_vols(data_from[from_sl], mesg)
         else:
             logger.debug("Using sparse volume morph matrix")
-            data[to_sl, :] = morph.vol_morph_mat @ data_from[from_sl]
+            data[to_sl, :] = _sparse_matmul(
+                morph.vol_morph_mat, data_from[from_sl], n_jobs
+            )
     if do_surf:
-        for hemi, v1, v2 in zip(
-            ("left", "right"), morph.src_data["vertices_from"], stc_from.vertices[:2]
-        ):
-            _check_vertices_match(v1, v2, f"{hemi} hemisphere")
         from_sl = slice(0, from_surf_stop)
         assert not from_used[from_sl].any()
         from_used[from_sl] = True
         to_sl = slice(0, to_surf_stop)
         assert not to_used[to_sl].any()
         to_used[to_sl] = True
-        data[to_sl] = morph.morph_mat @ data_from[from_sl]
+        data[to_sl] = _sparse_matmul(morph.morph_mat, data_from[from_sl], n_jobs)
     assert to_used.all()
     assert from_used.all()
-    data = _reshape_view(data, (data.shape[0],) + stc_from.data.shape[1:])
-    klass = stc_from.__class__
-    stc_to = klass(data, vertices_to, stc_from.tmin, stc_from.tstep, morph.subject_to)
-    return stc_to
+    return data
+
+
+def _sparse_matmul(mat, data, n_jobs):
+    """Compute ``mat @ data`` with blocks of rows of the sparse mat in threads."""
+    parallel, p_fun, n_jobs = parallel_func(
+        _sparse_matmul_rows, n_jobs, max_jobs=mat.shape[0], prefer="threads"
+    )
+    if n_jobs == 1:
+        return mat @ data
+    mat = sparse.csr_array(mat)
+    out = np.empty((mat.shape[0], data.shape[1]), np.result_type(mat.dtype, data))
+    # balance the number of nonzero entries (i.e., the work) across threads
+    bounds = np.searchsorted(mat.indptr, np.linspace(0, mat.nnz, n_jobs + 1))
+    bounds[[0, -1]] = 0, mat.shape[0]
+    parallel(
+        p_fun(out, mat, data, start, stop)
+        for start, stop in zip(bounds[:-1], bounds[1:])
+    )
+    return out
+
+
+def _sparse_matmul_rows(out, mat, data, start, stop):
+    """Compute the product for a block of rows (scipy releases the GIL)."""
+    out[start:stop] = mat[start:stop] @ data
@@ -122,19 +122,25 @@ def parallel_func(
         if max_jobs is not None:
             n_jobs = min(n_jobs, max(_ensure_int(max_jobs, "max_jobs"), 1))
 
+        # TODO: Hack until https://github.com/joblib/joblib/issues/1687 lands
+        try:
+            backend_repr = str(parallel._backend)
+        except Exception:
+            backend_repr = ""
+
         def run_verbose(*args, verbose=logger.level, **kwargs):
             with use_log_level(verbose=verbose):
                 return func(*args, **kwargs)
 
-        my_func = delayed(run_verbose)
+        # threads share the logger, and setting its level from several of them
+        # at once would not restore it properly
+        if "ThreadingBackend" in backend_repr:
+            my_func = delayed(func)
+        else:
+            my_func = delayed(run_verbose)
 
         # if we got that n_jobs=1, we shouldn't bother with any parallelization
         if n_jobs == 1:
-            # TODO: Hack until https://github.com/joblib/joblib/issues/1687 lands
-            try:
-                backend_repr = str(parallel._backend)
-            except Exception:
-                backend_repr = ""
             is_local = any(
                 f"{x}Backend" in backend_repr
                 for x in ("Loky", "Threading", "Multiprocessing")
@@ -5,9 +5,12 @@
 import math
 
 import numpy as np
-from scipy.signal import hilbert
+from scipy.fft import ifft, rfft
 from scipy.special import logsumexp
 
+# memory for the intermediate arrays of the Kuiper statistics
+_CTPS_BLOCK_BYTES = 2**25
+
 
 def _compute_normalized_phase(data):
     """Compute normalized phase angles.
@@ -22,7 +25,21 @@ def _compute_normalized_phase(data):
     phase_angles : ndarray, shape (n_epochs, n_sources, n_times)
         The normalized phase angles.
     """
-    return (np.angle(hilbert(data)) + np.pi) / (2 * np.pi)
+    # analytic signal (as in scipy.signal.hilbert), using a real forward FFT
+    n_times = data.shape[-1]
+    n_freqs = n_times // 2 + 1
+    weights = np.full(n_freqs, 2.0)
+    weights[0] = 1.0
+    if n_times % 2 == 0:
+        weights[-1] = 1.0
+    analytic = np.zeros(data.shape, np.complex128)
+    analytic[..., :n_freqs] = rfft(data, axis=-1)
+    analytic[..., :n_freqs] *= weights
+    analytic = ifft(analytic, axis=-1, overwrite_x=True)
+    phase = np.arctan2(analytic.imag, analytic.real)
+    phase += np.pi
+    phase /= 2 * np.pi
+    return phase
 
 
 def ctps(data, is_raw=True):
@@ -70,11 +87,13 @@ def ctps(data, is_raw=True):
     ks_dynamics = np.zeros_like(phase_angles[0])
     pk_dynamics = np.zeros_like(phase_angles[0])
 
-    # calculate Kuiper's statistic for each source
-    for ii, source in enumerate(np.transpose(phase_angles, [1, 0, 2])):
-        ks, pk = kuiper(source)
-        pk_dynamics[ii, :] = pk
-        ks_dynamics[ii, :] = ks
+    # calculate Kuiper's statistic for all epochs and time slices of as many
+    # sources at once as fit in the memory budget
+    n_epochs, n_sources, n_times = phase_angles.shape
+    n_block = max(_CTPS_BLOCK_BYTES // (8 * n_epochs * n_times), 1)
+    for start in range(0, n_sources, n_block):
+        sl = slice(start, start + n_block)
+        ks_dynamics[sl], pk_dynamics[sl] = kuiper(phase_angles[:, sl])
 
     return ks_dynamics, pk_dynamics, phase_angles if is_raw else None
 
@@ -84,8 +103,8 @@ def kuiper(data, dtype=np.float64):  # noqa: D401
 
     Parameters
     ----------
-    data : ndarray, shape (n_sources,) | (n_sources, n_times)
-           Empirical distribution.
+    data : ndarray, shape (n_trials,) | (n_trials, ...)
+           Empirical distribution(s), along the first axis.
     dtype : str | obj
         The data type to be used.
 
@@ -98,7 +117,8 @@ def kuiper(data, dtype=np.float64):  # noqa: D401
     """
     # if data not numpy array, implicitly convert and make to use copied data
     # ! sort data array along first axis !
-    data = np.sort(data, axis=0).astype(dtype)
+    data = np.array(data, dtype)
+    data.sort(axis=0)
     shape = data.shape
     n_dim = len(shape)
     n_trials = shape[0]
@@ -106,9 +126,9 @@ def kuiper(data, dtype=np.float64):  # noqa: D401
     # create uniform cdf
     j1 = (np.arange(n_trials, dtype=dtype) + 1.0) / float(n_trials)
     j2 = np.arange(n_trials, dtype=dtype) / float(n_trials)
-    if n_dim > 1:  # single phase vector (n_trials)
-        j1 = j1[:, np.newaxis]
-        j2 = j2[:, np.newaxis]
+    if n_dim > 1:  # not a single phase vector (n_trials)
+        j1 = j1.reshape((n_trials,) + (1,) * (n_dim - 1))
+        j2 = j2.reshape((n_trials,) + (1,) * (n_dim - 1))
     d1 = (j1 - data).max(axis=0)
     d2 = (data - j2).max(axis=0)
     n_eff = n_trials
@@ -123,8 +143,8 @@ def _prob_kuiper(d, n_eff, dtype="f8"):
 
     Parameters
     ----------
-    d : float
-        The kuiper distance value.
+    d : float | ndarray
+        The kuiper distance value(s).
     n_eff : int
         The effective number of elements.
     dtype : str | obj
@@ -132,8 +152,8 @@ def _prob_kuiper(d, n_eff, dtype="f8"):
 
     Returns
     -------
-    pk_norm : float
-        The normalized Kuiper value such that 0 < ``pk_norm`` < 1.
+    pk_norm : float | ndarray
+        The normalized Kuiper value(s) such that 0 < ``pk_norm`` < 1.
 
     References
     ----------
@@ -143,20 +163,23 @@ def _prob_kuiper(d, n_eff, dtype="f8"):
     [2] Kuiper NH 1962. Proceedings of the Koninklijke Nederlands Akademie
     van Wetenschappen, ser Vol 63 pp 38-47
     """
-    n_time_slices = np.size(d)  # single value or vector
+    shape = np.shape(d)
+    d = np.ravel(d)
     n_points = 100
 
     en = math.sqrt(n_eff)
     k_lambda = (en + 0.155 + 0.24 / en) * d  # see [1]
     l2 = k_lambda**2.0
-    j2 = (np.arange(n_points) + 1) ** 2
-    j2 = j2.repeat(n_time_slices).reshape(n_points, n_time_slices)
-    fact = 4.0 * j2 * l2 - 1.0
+    j2 = ((np.arange(n_points) + 1) ** 2)[:, np.newaxis]
 
-    # compute normalized pK value in range [0,1]
-    a = -2.0 * j2 * l2
-    b = 2.0 * fact
-    pk_norm = -logsumexp(a, b=b, axis=0) / (2.0 * n_eff)
+    # compute normalized pK value in range [0,1], a few time slices at a time
+    pk_norm = np.empty(d.size, dtype)
+    n_block = max(_CTPS_BLOCK_BYTES // (8 * n_points), 1)
+    for start in range(0, d.size, n_block):
+        sl = slice(start, start + n_block)
+        a = -2.0 * j2 * l2[sl]
+        b = 2.0 * (4.0 * j2 * l2[sl] - 1.0)
+        pk_norm[sl] = -logsumexp(a, b=b, axis=0) / (2.0 * n_eff)
 
     # check for no difference to uniform cdf
     pk_norm = np.where(k_lambda < 0.4, 0.0, pk_norm)
@@ -164,4 +187,4 @@ def _prob_kuiper(d, n_eff, dtype="f8"):
     # check for round off errors
     pk_norm = np.where(pk_norm > 1.0, 1.0, pk_norm)
 
-    return pk_norm
+    return pk_norm.reshape(shape)
@@ -102,20 +102,22 @@ def qrs_detector(
         numcross = list()
         time = list()
         rms = list()
+        # the windows start at the first sample above threshold after the
+        # previous window
+        above = np.flatnonzero(ecg_abs[: max(n_points - win_size, 0)] > thresh1)
         ii = 0
-        while ii < (n_points - win_size):
+        while True:
+            idx = np.searchsorted(above, ii)
+            if idx == len(above):
+                break
+            ii = above[idx]
             window = ecg_abs[ii : ii + win_size]
-            if window[0] > thresh1:
-                max_time = np.argmax(window)
-                time.append(ii + max_time)
-                nx = np.sum(
-                    np.diff(((window > thresh1).astype(np.int64) == 1).astype(int))
-                )
-                numcross.append(nx)
-                rms.append(np.sqrt(sum_squared(window) / window.size))
-                ii += win_size
-            else:
-                ii += 1
+            max_time = np.argmax(window)
+            time.append(ii + max_time)
+            nx = np.sum(np.diff(((window > thresh1).astype(np.int64) == 1).astype(int)))
+            numcross.append(nx)
+            rms.append(np.sqrt(sum_squared(window) / window.size))
+            ii += win_size
 
         if len(rms) == 0:
             rms.append(0.0)
@@ -6,8 +6,10 @@
 import json
 import math
 import warnings
+import weakref
 from collections import namedtuple
 from collections.abc import Sequence
+from contextlib import contextmanager
 from copy import deepcopy
 from dataclasses import dataclass, is_dataclass
 from inspect import Parameter, isfunction, signature
@@ -46,6 +48,7 @@ from .._fiff.write import (
     write_name_list,
     write_string,
 )
+from ..annotations import _annotations_starts_stops
 from ..channels.layout import _find_topomap_coords
 from ..cov import Covariance, compute_whitener
 from ..defaults import _BORDER_DEFAULT, _EXTRAPOLATE_DEFAULT, _INTERPOLATION_DEFAULT
@@ -80,6 +83,7 @@ from ..utils import (
     fill_doc,
     int_like,
     logger,
+    object_hash,
     pinv,
     repr_html,
     verbose,
@@ -194,6 +198,10 @@ def _check_for_unsupported_ica_channels(picks, info, allow_ref_meg=False):
 
 
 _KNOWN_ICA_METHODS = ("fastica", "infomax", "picard")
+# memory for the data blocks ICA is applied to at once
+_ICA_BLOCK_BYTES = 2**25
+# number of (filtered) source time courses kept by a _SourcesView
+_N_CACHED_SOURCES = 4
 
 
 @fill_doc
@@ -473,6 +481,7 @@ class ICA(ContainsMixin):
         self.n_pca_components = None
         self.ch_names = None
         self.random_state = random_state
+        self._sources_cache = None
 
         if fit_params is None:
             fit_params = {}
@@ -602,6 +611,8 @@ class ICA(ContainsMixin):
         tstep=2.0,
         reject_by_annotation=True,
         verbose=None,
+        *,
+        warm_start=None,
     ):
         """Run the ICA decomposition on raw data.
 
@@ -657,6 +668,17 @@ class ICA(ContainsMixin):
 
             .. versionadded:: 0.14.0
         %(verbose)s
+        warm_start : instance of ICA | None
+            A fitted ICA, e.g., from another run of the same subject (or this
+            instance itself), whose unmixing matrix is used to initialize the
+            ICA algorithm. It must have been fitted to the same channels and
+            yield the same number of components. This usually reduces the
+            number of iterations. For Infomax, the learning rate then starts
+            at a tenth of its default, unless ``l_rate`` is given in
+            ``fit_params``. If None (default), the algorithm is initialized as
+            usual.
+
+            .. versionadded:: 1.13
 
         Returns
         -------
@@ -706,6 +728,19 @@ class ICA(ContainsMixin):
             picks, inst.info, allow_ref_meg=self.allow_ref_meg
         )
 
+        init = None
+        if warm_start is not None:
+            _validate_type(warm_start, ICA, "warm_start")
+            if warm_start.current_fit == "unfitted":
+                raise ValueError("warm_start must be a fitted ICA instance.")
+            ch_names = [inst.ch_names[pick] for pick in picks]
+            if warm_start.ch_names != ch_names:
+                raise ValueError(
+                    "The channels of warm_start do not match the picked channels: "
+                    f"{warm_start.ch_names} != {ch_names}"
+                )
+            init = _ica_channel_unmixing(warm_start)
+
         # Actually start fitting
         t_start = time()
         if self.current_fit != "unfitted":
@@ -743,11 +778,12 @@ class ICA(ContainsMixin):
                 flat,
                 tstep,
                 reject_by_annotation,
+                init,
                 verbose,
             )
         else:
             assert isinstance(inst, BaseEpochs)
-            self._fit_epochs(inst, picks, decim, verbose)
+            self._fit_epochs(inst, picks, decim, init, verbose)
 
         # sort ICA components by explained variance
         var = _ica_explained_variance(self, inst)
@@ -787,6 +823,7 @@ class ICA(ContainsMixin):
         flat,
         tstep,
         reject_by_annotation,
+        init,
         verbose,
     ):
         """Aux method."""
@@ -810,11 +847,11 @@ class ICA(ContainsMixin):
             self.reject_ = None
 
         self.n_samples_ = data.shape[1]
-        self._fit(data, "raw")
+        self._fit(data, "raw", init)
 
         return self
 
-    def _fit_epochs(self, epochs, picks, decim, verbose):
+    def _fit_epochs(self, epochs, picks, decim, init, verbose):
         """Aux method."""
         if epochs.events.size == 0:
             raise RuntimeError(
@@ -833,7 +870,7 @@ class ICA(ContainsMixin):
         # This will make at least one copy (one from hstack, maybe one
         # more from _pre_whiten)
         data = np.hstack(data)
-        self._fit(data, "epochs")
+        self._fit(data, "epochs", init)
         self.reject_ = deepcopy(epochs.reject)
 
         return self
@@ -887,7 +924,7 @@ class ICA(ContainsMixin):
             data = self.pre_whitener_ @ data
         return data
 
-    def _fit(self, data, fit_type):
+    def _fit(self, data, fit_type, init=None):
         """Aux function."""
         if not np.isfinite(data).all():
             raise ValueError("Input data contains non-finite values (NaN/Inf). ")
@@ -957,10 +994,31 @@ class ICA(ContainsMixin):
 
         # take care of ICA
         sel = slice(0, self.n_components_)
+        fit_params = self.fit_params
+        if init is not None:
+            if len(init) != self.n_components_:
+                raise ValueError(
+                    f"warm_start has {len(init)} components, but the data yield "
+                    f"n_components_={self.n_components_}"
+                )
+            # express the unmixing in the whitened PCA space of these data
+            if self.noise_cov is None:
+                init = init * self.pre_whitener_[:, 0]
+            else:
+                init = init @ pinv(self.pre_whitener_)
+            init = init @ self.pca_components_[sel].T
+            init *= np.sqrt(self.pca_explained_variance_[sel])
+            if self.method in ("fastica", "picard"):
+                fit_params = {**fit_params, "w_init": init}
+            else:
+                fit_params = {**fit_params, "weights": init}
+                # start closer to the annealed learning rate of a converged fit
+                if fit_params.get("l_rate") is None:
+                    fit_params["l_rate"] = 0.001 / np.log(self.n_components_**2.0)
         if self.method == "fastica":
             from sklearn.decomposition import FastICA
 
-            ica = FastICA(whiten=False, random_state=random_state, **self.fit_params)
+            ica = FastICA(whiten=False, random_state=random_state, **fit_params)
             ica.fit(data[:, sel])
             self.unmixing_matrix_ = ica.components_
             self.n_iter_ = ica.n_iter_
@@ -969,7 +1027,7 @@ class ICA(ContainsMixin):
                 data[:, sel],
                 random_state=random_state,
                 return_n_iter=True,
-                **self.fit_params,
+                **fit_params,
             )
             self.unmixing_matrix_ = unmixing_matrix
             self.n_iter_ = n_iter
@@ -982,7 +1040,7 @@ class ICA(ContainsMixin):
                 whiten=False,
                 return_n_iter=True,
                 random_state=random_state,
-                **self.fit_params,
+                **fit_params,
             )
             self.unmixing_matrix_ = W
             self.n_iter_ = n_iter + 1  # picard() starts counting at 0
@@ -1015,19 +1073,20 @@ class ICA(ContainsMixin):
         """Update ICA names when n_components_ is set."""
         self._ica_names = [f"ICA{ii:03d}" for ii in range(self.n_components_)]
 
-    def _transform(self, data):
-        """Compute sources from data (operates inplace)."""
-        data = self._pre_whiten(data)
+    def _get_sources_operator(self):
+        """Get the affine operator (matrix and offset) that computes sources."""
+        # pre-whitening, PCA, and unmixing
+        unmixing = self.unmixing_matrix_ @ self.pca_components_[: self.n_components_]
+        offset = np.zeros(len(unmixing))
         if self.pca_mean_ is not None:
-            data -= self.pca_mean_[:, None]
+            offset -= unmixing @ self.pca_mean_
+        op = unmixing @ self._pre_whiten(np.eye(len(self.ch_names)))
+        return op, offset
 
-        # Apply unmixing
-        pca_data = np.dot(
-            self.unmixing_matrix_, self.pca_components_[: self.n_components_]
-        )
-        # Apply PCA
-        sources = np.dot(pca_data, data)
-        return sources
+    def _transform(self, data):
+        """Compute sources from data."""
+        op, offset = self._get_sources_operator()
+        return _apply_affine(op, offset, data)
 
     def _transform_raw(self, raw, start, stop, reject_by_annotation=False):
         """Transform raw data."""
@@ -1035,20 +1094,69 @@ class ICA(ContainsMixin):
             raise RuntimeError("No fit available. Please fit ICA.")
         start, stop = _check_start_stop(raw, start, stop)
         picks = self._get_picks(raw)
-        reject = "omit" if reject_by_annotation else None
-        data = raw.get_data(picks, start, stop, reject)
-        return self._transform(data)
+        if reject_by_annotation:
+            return self._transform(raw.get_data(picks, start, stop, "omit"))
+        # read (and transform) the data block by block
+        op, offset = self._get_sources_operator()
+        sources = np.empty((len(op), stop - start))
+        n_block = _n_block_samples(len(picks))
+        for block_start in range(start, stop, n_block):
+            block_stop = min(block_start + n_block, stop)
+            sources[:, block_start - start : block_stop - start] = _apply_affine(
+                op, offset, raw.get_data(picks, block_start, block_stop)
+            )
+        return sources
+
+    def _get_sources_view(self, raw, start, stop):
+        """Get the (cached) sources of a Raw instance."""
+        start, stop = _check_start_stop(raw, start, stop)
+        cache = getattr(self, "_sources_cache", None)
+        if cache is None:  # not within cache_sources()
+            return _SourcesView(self, raw, start, stop)
+        return cache.get(self, raw, start, stop)
+
+    @contextmanager
+    def cache_sources(self):
+        """Share the sources of Raw instances between the artifact scorers.
+
+        Within this context, the sources (and band-pass filtered versions of
+        them) that :meth:`score_sources`, :meth:`find_bads_ecg`,
+        :meth:`find_bads_eog`, :meth:`find_bads_ref` and
+        :meth:`find_bads_muscle` compute from a Raw instance are kept and
+        reused by later calls with the same Raw instance and time span. They
+        are released when the context exits or the Raw instance is deleted.
+
+        Yields
+        ------
+        ica : instance of ICA
+            The ICA instance.
+
+        Notes
+        -----
+        The sources are computed again if the ICA solution or the annotations
+        of the Raw instance change, but the data of the Raw instances must
+        not be modified within the context.
+
+        .. versionadded:: 1.13
+        """
+        if getattr(self, "_sources_cache", None) is not None:  # nested
+            yield self
+            return
+        self._sources_cache = _SourcesCache()
+        try:
+            yield self
+        finally:
+            self._sources_cache.clear()
+            self._sources_cache = None
 
     def _transform_epochs(self, epochs, concatenate):
         """Aux method."""
         if not hasattr(self, "mixing_matrix_"):
             raise RuntimeError("No fit available. Please fit ICA.")
         picks = self._get_picks(epochs)
-        data = np.hstack(epochs.get_data(picks=picks))
-        sources = self._transform(data)
-        if not concatenate:
-            # Put the data back in 3D
-            sources = np.array(np.split(sources, len(epochs.events), 1))
+        sources = self._transform(epochs.get_data(picks=picks))
+        if concatenate:
+            sources = np.hstack(sources)
         return sources
 
     def _transform_evoked(self, evoked):
@@ -1267,11 +1375,13 @@ class ICA(ContainsMixin):
             raise ValueError("Data input must be of Raw, Epochs or Evoked type")
         return sources
 
-    def _sources_as_raw(self, raw, add_channels, start, stop):
+    def _sources_as_raw(self, raw, add_channels, start, stop, sources=None):
         """Aux method."""
         # merge copied instance and picked data with sources
         start, stop = _check_start_stop(raw, start, stop)
-        data_ = self._transform_raw(raw, start=start, stop=stop)
+        data_ = sources
+        if data_ is None:
+            data_ = self._transform_raw(raw, start=start, stop=stop)
         assert data_.shape[1] == stop - start
 
         preloaded = raw.preload
@@ -1439,7 +1549,8 @@ class ICA(ContainsMixin):
             _check_compensation_grade(
                 self.info, inst.info, "ICA", "Raw", ch_names=self.ch_names
             )
-            sources = self._transform_raw(inst, start, stop, reject_by_annotation)
+            view = self._get_sources_view(inst, start, stop)
+            sources = view.get_data(self, reject_by_annotation)
         elif isinstance(inst, BaseEpochs):
             _check_compensation_grade(
                 self.info, inst.info, "ICA", "Epochs", ch_names=self.ch_names
@@ -1464,9 +1575,8 @@ class ICA(ContainsMixin):
             if isinstance(inst, BaseRaw):
                 # We pass inst, not self, because the sfreq of the data we
                 # use for scoring components can be different:
-                sources, target = _band_pass_filter(
-                    inst, sources, target, l_freq, h_freq
-                )
+                _, target = _band_pass_filter(inst, None, target, l_freq, h_freq)
+                sources = view.get_data(self, reject_by_annotation, l_freq, h_freq)
 
         scores = _find_sources(sources, target, score_func)
 
@@ -1535,28 +1645,30 @@ class ICA(ContainsMixin):
             else:
                 target_names.append(ch)
 
-        for ii, (ch, target) in enumerate(zip(target_names, targets)):
-            scores += [
-                self.score_sources(
-                    inst,
-                    target=target,
-                    score_func="pearsonr",
-                    start=start,
-                    stop=stop,
-                    l_freq=l_freq,
-                    h_freq=h_freq,
-                    reject_by_annotation=reject_by_annotation,
-                )
-            ]
-            # pick last scores
-            if measure == "zscore":
-                this_idx = _find_outliers(scores[-1], threshold=threshold)
-            elif measure == "correlation":
-                this_idx = np.where(abs(scores[-1]) > threshold)[0]
-            else:
-                raise ValueError(f"Unknown measure {measure}")
-            idx += [this_idx]
-            self.labels_[f"{prefix}/{ii}/{ch}"] = list(this_idx)
+        # all targets are scored against the same sources
+        with self.cache_sources():
+            for ii, (ch, target) in enumerate(zip(target_names, targets)):
+                scores += [
+                    self.score_sources(
+                        inst,
+                        target=target,
+                        score_func="pearsonr",
+                        start=start,
+                        stop=stop,
+                        l_freq=l_freq,
+                        h_freq=h_freq,
+                        reject_by_annotation=reject_by_annotation,
+                    )
+                ]
+                # pick last scores
+                if measure == "zscore":
+                    this_idx = _find_outliers(scores[-1], threshold=threshold)
+                elif measure == "correlation":
+                    this_idx = np.where(abs(scores[-1]) > threshold)[0]
+                else:
+                    raise ValueError(f"Unknown measure {measure}")
+                idx += [this_idx]
+                self.labels_[f"{prefix}/{ii}/{ch}"] = list(this_idx)
 
         # remove duplicates but keep order by score, even across multiple
         # ref channels
@@ -2000,7 +2112,16 @@ class ICA(ContainsMixin):
 
         slope_score, focus_score, smoothness_score = None, None, None
 
-        sources = self.get_sources(inst, start=start, stop=stop)
+        if isinstance(inst, BaseRaw):
+            _check_compensation_grade(
+                self.info, inst.info, "ICA", "Raw", ch_names=self.ch_names
+            )
+            view = self._get_sources_view(inst, start, stop)
+            sources = self._sources_as_raw(
+                inst, None, start, stop, sources=view.get_data(self)
+            )
+        else:
+            sources = self.get_sources(inst, start=start, stop=stop)
         components = self.get_components()
 
         # compute metric #1: slope of the log-log psd
@@ -2234,6 +2355,13 @@ class ICA(ContainsMixin):
 
         .. versionchanged:: 0.23
             Warn if instance was baseline-corrected.
+
+        .. versionchanged:: 1.13
+            The cleaning is applied as a single precomputed
+            ``n_channels × n_channels`` operator, in place and a block of
+            samples at a time. Recordings that do not fit in memory can thus
+            be cleaned when loaded with ``preload`` set to a file name
+            (memory-mapped), using only the memory of one block.
         """
         _validate_type(
             inst, (BaseRaw, BaseEpochs, Evoked), "inst", "Raw, Epochs, or Evoked"
@@ -2292,10 +2420,12 @@ class ICA(ContainsMixin):
             raw.info, meg=False, include=self.ch_names, exclude=[], ref_meg=False
         )
 
-        data = raw[picks, start:stop][0]
-        data = self._pick_sources(data, include, exclude, n_pca_components)
-
-        raw[picks, start:stop] = data
+        # clean the data in place, block by block
+        op, offset = self._get_apply_operator(include, exclude, n_pca_components)
+        n_block = _n_block_samples(len(picks))
+        for block_start in range(start, stop, n_block):
+            sl = slice(block_start, min(block_start + n_block, stop))
+            raw._data[picks, sl] = _apply_affine(op, offset, raw._data[picks, sl])
         return raw
 
     def _apply_epochs(self, epochs, include, exclude, n_pca_components):
@@ -2314,11 +2444,14 @@ class ICA(ContainsMixin):
                 "provide Epochs compatible with 'ica.ch_names'."
             )
 
-        data = np.hstack(epochs.get_data(picks))
-        data = self._pick_sources(data, include, exclude, n_pca_components)
-
-        # restore epochs, channels, tsl order
-        epochs._data[:, picks] = np.array(np.split(data, len(epochs.events), 1))
+        # clean the data in place, a few epochs at a time
+        op, offset = self._get_apply_operator(include, exclude, n_pca_components)
+        n_block = max(_n_block_samples(len(picks)) // len(epochs.times), 1)
+        for block_start in range(0, len(epochs._data), n_block):
+            sl = slice(block_start, block_start + n_block)
+            epochs._data[sl, picks] = _apply_affine(
+                op, offset, epochs._data[sl][:, picks]
+            )
         epochs.preload = True
 
         return epochs
@@ -2337,22 +2470,23 @@ class ICA(ContainsMixin):
                 "provide an Evoked object that's compatible with ica.ch_names."
             )
 
-        data = evoked.data[picks]
-        data = self._pick_sources(data, include, exclude, n_pca_components)
-
-        # restore evoked
-        evoked.data[picks] = data
+        op, offset = self._get_apply_operator(include, exclude, n_pca_components)
+        evoked.data[picks] = _apply_affine(op, offset, evoked.data[picks])
 
         return evoked
 
-    def _pick_sources(self, data, include, exclude, n_pca_components):
-        """Aux function."""
+    def _get_apply_operator(self, include, exclude, n_pca_components):
+        """Get the affine operator (matrix and offset) that cleans the data.
+
+        This composes the pre-whitening, PCA, unmixing, zeroing of the
+        excluded components, mixing, and de-whitening.
+        """
         if n_pca_components is None:
             n_pca_components = self.n_pca_components
-        data = self._pre_whiten(data)
+        pre_whitener = self._pre_whiten(np.eye(len(self.ch_names)))
         exclude = self._check_exclude(exclude)
         _n_pca_comp = self._check_n_pca_components(n_pca_components)
-        n_ch, _ = data.shape
+        n_ch = len(pre_whitener)
 
         max_pca_components = self.pca_components_.shape[0]
         if not self.n_components_ <= _n_pca_comp <= max_pca_components:
@@ -2368,10 +2502,6 @@ class ICA(ContainsMixin):
             f"component{_pl(self.n_components_)})"
         )
 
-        # Apply first PCA
-        if self.pca_mean_ is not None:
-            data -= self.pca_mean_[:, None]
-
         sel_keep = np.arange(self.n_components_)
         if include not in (None, []):
             sel_keep = np.unique(include)
@@ -2408,19 +2538,19 @@ class ICA(ContainsMixin):
             (sel_keep, np.arange(self.n_components_, _n_pca_comp))
         )
         proj_mat = np.dot(mixing[:, sel_keep], unmixing[sel_keep, :])
-        data = np.dot(proj_mat, data)
         assert proj_mat.shape == (n_ch,) * 2
 
-        if self.pca_mean_ is not None:
-            data += self.pca_mean_[:, None]
-
         # restore scaling
         if self.noise_cov is None:  # revert standardization
-            data *= self.pre_whitener_
+            de_whitener = self.pre_whitener_ * np.eye(n_ch)
         else:
-            data = np.linalg.pinv(self.pre_whitener_, rcond=1e-14) @ data
-
-        return data
+            de_whitener = np.linalg.pinv(self.pre_whitener_, rcond=1e-14)
+        # the PCA mean is removed before and added back after the projection
+        offset = np.zeros(n_ch)
+        if self.pca_mean_ is not None:
+            offset = de_whitener @ (self.pca_mean_ - proj_mat @ self.pca_mean_)
+        op = de_whitener @ proj_mat @ pre_whitener
+        return op, offset
 
     @verbose
     def save(self, fname, *, overwrite=False, verbose=None):
@@ -2829,6 +2959,8 @@ def _get_target_ch(container, target):
 
 def _find_sources(sources, target, score_func):
     """Aux function."""
+    if isinstance(score_func, str) and score_func == "pearsonr" and target is not None:
+        return _pearsonr_rows(sources, target)
     if isinstance(score_func, str):
         score_func = get_score_funcs().get(score_func, score_func)
 
@@ -2842,6 +2974,112 @@ def _find_sources(sources, target, score_func):
     return scores
 
 
+def _pearsonr_rows(x, y):
+    """Compute the Pearson correlation of each row of x with y."""
+    y = y.ravel() - y.mean()
+    x_norm = np.linalg.norm(x - x.mean(axis=1, keepdims=True), axis=1)
+    r = (x @ y) / (x_norm * np.linalg.norm(y))
+    return np.clip(r, -1.0, 1.0)
+
+
+def _n_block_samples(n_channels):
+    """Get the number of time samples to process at once."""
+    return max(_ICA_BLOCK_BYTES // (8 * max(n_channels, 1)), 1)
+
+
+def _apply_affine(op, offset, data):
+    """Compute ``op @ data + offset`` for data of shape (..., n_channels, n_times)."""
+    out = op @ data
+    out += offset[:, np.newaxis]
+    return out
+
+
+class _SourcesCache:
+    """The _SourcesView of each Raw instance used within ICA.cache_sources()."""
+
+    def __init__(self):
+        self._views = dict()
+
+    def __deepcopy__(self, memo):
+        # copies of the ICA start without cached sources
+        return None
+
+    def get(self, ica, raw, start, stop):
+        key = (id(raw), start, stop)
+        view = self._views.get(key)
+        if view is None or not view._matches(ica, raw):
+            view = self._views[key] = _SourcesView(ica, raw, start, stop)
+            # release the sources together with the data
+            weakref.finalize(raw, self._views.pop, key, None)
+        return view
+
+    def clear(self):
+        self._views.clear()
+
+
+class _SourcesView:
+    """Lazily computed ICA sources of a Raw instance, shared by the scorers.
+
+    The sources (and band-pass filtered versions of them) are computed on first
+    use and kept until the ICA solution or the annotations change, which is
+    checked with a fingerprint of the unmixing operator and of the annotations.
+    """
+
+    def __init__(self, ica, raw, start, stop):
+        self._raw = weakref.ref(raw)
+        self._start, self._stop = start, stop
+        self._key = self._get_key(ica, raw)
+        self._data = dict()
+        # the samples that are not in bad segments
+        onsets, ends = _annotations_starts_stops(raw, ["BAD"])
+        self._used = np.ones(stop - start, bool)
+        for onset, end in zip(onsets, ends):
+            self._used[max(onset - start, 0) : max(end - start, 0)] = False
+
+    def _get_key(self, ica, raw):
+        op, offset = ica._get_sources_operator()
+        annot = raw.annotations
+        return object_hash(
+            [op, offset, ica._get_picks(raw), raw.info["sfreq"], raw.first_samp]
+            + [annot.onset, annot.duration, list(annot.description)]
+        )
+
+    def _matches(self, ica, raw):
+        return self._raw() is raw and self._get_key(ica, raw) == self._key
+
+    def get_data(self, ica, reject_by_annotation=False, l_freq=None, h_freq=None):
+        """Get the (read-only) sources, optionally band-pass filtered."""
+        reject = bool(reject_by_annotation) and not self._used.all()
+        if l_freq is None and h_freq is None:
+            key = (reject,)
+        else:
+            key = (reject, l_freq, h_freq)
+        if key not in self._data:
+            raw = self._raw()
+            if key == (True,):  # omit the bad segments from the full sources
+                data = self.get_data(ica)[:, self._used]
+            elif key == (False,):
+                data = ica._transform_raw(raw, self._start, self._stop)
+            else:
+                data = self.get_data(ica, reject_by_annotation)
+                data = _band_pass_filter(raw, data, None, l_freq, h_freq)[0]
+            data.setflags(write=False)
+            self._data[key] = data
+            while len(self._data) > _N_CACHED_SOURCES:
+                self._data.pop(next(iter(self._data)))  # first in, first out
+        else:
+            logger.debug("    Using cached ICA sources")
+        return self._data[key]
+
+
+def _ica_channel_unmixing(ica):
+    """Get the unmixing matrix of a fitted ICA for (projected) channel data."""
+    unmixing = ica.unmixing_matrix_ @ ica.pca_components_[: ica.n_components_]
+    if ica.noise_cov is None:
+        return unmixing / ica.pre_whitener_[:, 0]
+    return unmixing @ ica.pre_whitener_
+
+
 def _ica_explained_variance(ica, inst, normalize=False):
     """Check variance accounted for by each component in supplied data.
 
@@ -3165,7 +3403,6 @@ _ica_node = namedtuple("Node", "name target score_func criterion")
 def _band_pass_filter(inst, sources, target, l_freq, h_freq, verbose=None):
     """Optionally band-pass filter the data."""
     if l_freq is not None and h_freq is not None:
-        logger.info("... filtering ICA sources")
         # use FIR here, steeper is better
         kw = dict(
             phase="zero-double",
@@ -3175,9 +3412,12 @@ def _band_pass_filter(inst, sources, target, l_freq, h_freq, verbose=None):
             h_trans_bandwidth=0.5,
             fir_design="firwin2",
         )
-        sources = filter_data(sources, inst.info["sfreq"], l_freq, h_freq, **kw)
-        logger.info("... filtering target")
-        target = filter_data(target, inst.info["sfreq"], l_freq, h_freq, **kw)
+        if sources is not None:
+            logger.info("... filtering ICA sources")
+            sources = filter_data(sources, inst.info["sfreq"], l_freq, h_freq, **kw)
+        if target is not None:
+            logger.info("... filtering target")
+            target = filter_data(target, inst.info["sfreq"], l_freq, h_freq, **kw)
     elif l_freq is not None or h_freq is not None:
         raise ValueError("Must specify both pass bands")
     return sources, target
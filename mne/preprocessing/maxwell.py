@@ -10,7 +10,7 @@ from os import path as op
 from pathlib import Path
 
 import numpy as np
-from scipy import linalg
+from scipy import linalg, sparse
 from scipy.special import lpmv
 
 from .. import __version__
@@ -21,14 +21,15 @@ from .._fiff.pick import pick_info, pick_types
 from .._fiff.proc_history import _read_ctc
 from .._fiff.proj import Projection
 from .._fiff.tag import _coil_trans_to_loc, _loc_to_coil_trans
+from .._fiff.utils import _mult_cal_one
 from .._fiff.write import DATE_NONE, _generate_meas_id
-from .._ola import _COLA, _Interp2, _Storer
+from .._ola import _COLA, _Interp2, _QueueStorer, _Storer
 from ..annotations import _annotations_starts_stops
 from ..bem import _check_origin
 from ..channels.channels import _get_T1T2_mag_inds, fix_mag_coil_types
-from ..fixes import _reshape_view, _safe_svd, bincount, sph_harm_y
+from ..fixes import _reshape_view, _safe_svd, sph_harm_y
 from ..forward import _concatenate_coils, _create_meg_coils, _prep_meg_channels
-from ..io import BaseRaw, RawArray
+from ..io import BaseRaw, RawArray, read_raw_fif
 from ..surface import _normalize_vectors
 from ..transforms import (
     Transform,
@@ -50,6 +51,7 @@ from ..transforms import (
 from ..utils import (
     _check_option,
     _clean_names,
+    _ContentCache,
     _ensure_int,
     _pl,
     _time_mask,
@@ -239,6 +241,8 @@ def maxwell_filter(
     extended_proj=(),
     st_overlap=True,
     mc_interp="hann",
+    fname=None,
+    overwrite=False,
     verbose=None,
 ):
     """Maxwell filter data using multipole moments.
@@ -292,12 +296,26 @@ def maxwell_filter(
 
         .. versionadded:: 1.10
     %(maxwell_mc_interp)s
+    fname : path-like | None
+        If not None, process the data in a memory-bounded streaming mode and
+        write the result directly to this FIF file. Raw data are read from
+        ``raw`` one buffer at a time (so ``raw`` does not need to be
+        preloaded), and only a few ``st_duration`` windows are held in memory
+        at once. The data are written in single precision, as with
+        :meth:`mne.io.Raw.save` (including splitting large files).
+
+        .. versionadded:: 1.13
+    %(overwrite)s
+        Only used when ``fname`` is not None.
+
+        .. versionadded:: 1.13
     %(verbose)s
 
     Returns
     -------
     raw_sss : instance of Raw
-        The raw data with Maxwell filtering applied.
+        The raw data with Maxwell filtering applied. If ``fname`` is not None,
+        this is the written file read with ``preload=False``.
 
     See Also
     --------
@@ -427,9 +445,12 @@ def maxwell_filter(
         st_overlap=st_overlap,
         mc_interp=mc_interp,
     )
-    raw_sss = _run_maxwell_filter(raw, **params)
-    # Update info
-    _update_sss_info(raw_sss, **params["update_kwargs"])
+    if fname is not None:
+        raw_sss = _run_maxwell_filter_stream(raw, fname, overwrite=overwrite, **params)
+    else:
+        raw_sss = _run_maxwell_filter(raw, **params)
+        # Update info
+        _update_sss_info(raw_sss, **params["update_kwargs"])
     logger.info("[done]")
     return raw_sss
 
@@ -763,14 +784,7 @@ def _run_maxwell_filter(
         these_picks = meg_picks
 
     # Figure out which segments of data we can use
-    onsets, ends = _annotations_starts_stops(raw_sss, skip_by_annotation, invert=True)
-    max_samps = (ends - onsets).max()
-    if not 0.0 < st_duration <= max_samps + 1.0:
-        raise ValueError(
-            f"st_duration ({st_duration / sfreq:0.1f}s) must be between 0 and the "
-            "longest contiguous duration of the data "
-            "({max_samps / sfreq:0.1f}s)."
-        )
+    onsets, ends = _get_mf_segments(raw_sss, skip_by_annotation, st_duration)
 
     # This must be initialized inside _run_maxwell_filter because
     # find_bad_channels_maxwell modifies good_mask
@@ -859,6 +873,242 @@ def _run_maxwell_filter(
     return raw_sss
 
 
+def _get_mf_segments(raw, skip_by_annotation, st_duration):
+    """Get the contiguous segments to process and check st_duration."""
+    sfreq = raw.info["sfreq"]
+    onsets, ends = _annotations_starts_stops(raw, skip_by_annotation, invert=True)
+    max_samps = (ends - onsets).max()
+    if not 0.0 < st_duration <= max_samps + 1.0:
+        raise ValueError(
+            f"st_duration ({st_duration / sfreq:0.1f}s) must be between 0 and the "
+            "longest contiguous duration of the data "
+            f"({max_samps / sfreq:0.1f}s)."
+        )
+    return onsets, ends
+
+
+def _run_maxwell_filter_stream(
+    raw,
+    fname,
+    *,
+    overwrite,
+    skip_by_annotation,
+    st_duration,
+    st_correlation,
+    st_only,
+    ctc,
+    meg_picks,
+    good_mask,
+    info,
+    _get_this_decomp_trans,
+    S_recon,
+    update_kwargs,
+    ignore_ref,
+    add_channels,
+    st_fixed,
+    st_overlap,
+    mc,
+    **kwargs,
+):
+    """Maxwell filter data in windows and write them to disk as they finish."""
+    if ctc is not None:
+        ctc = ctc[good_mask][:, good_mask]
+    out_info = raw.info.copy()
+    with out_info._unlock():
+        out_info["chs"] = info["chs"]  # updated coil types
+    if add_channels:
+        logger.info("    Appending head position result channels")
+        pos_picks = _add_chpi_pos_chs(out_info)
+    else:
+        pos_picks = np.array([], int)
+    onsets, ends = _get_mf_segments(raw, skip_by_annotation, st_duration)
+    mc.initialize(_get_this_decomp_trans, info["dev_head_t"], S_recon)
+    update_kwargs.update(reg_moments=mc.reg_moments_0)
+    chunks = _iter_maxwell_stream(
+        raw,
+        out_info["nchan"],
+        onsets=onsets,
+        ends=ends,
+        st_duration=st_duration,
+        st_correlation=st_correlation,
+        st_only=st_only,
+        ctc=ctc,
+        meg_picks=meg_picks,
+        good_mask=good_mask,
+        pos_picks=pos_picks,
+        st_fixed=st_fixed,
+        st_overlap=st_overlap,
+        mc=mc,
+    )
+    raw_stream = _RawMaxwellStream(raw, out_info, chunks)
+    if not st_only:
+        # remove MEG projectors, they won't apply now
+        _remove_meg_projs_comps(raw_stream, ignore_ref)
+    _update_sss_info(raw_stream, **update_kwargs)
+    logger.info("    Streaming processed data to disk")
+    raw_stream.save(fname, overwrite=overwrite)
+    return read_raw_fif(fname, verbose=False)
+
+
+def _iter_raw_chunks(raw, start, stop, n_out, n_read):
+    """Read unprocessed raw data, padding rows for added channels."""
+    for this_start in range(start, stop, n_read):
+        this_stop = min(this_start + n_read, stop)
+        data = np.zeros((n_out, this_stop - this_start))
+        data[: len(raw.ch_names)] = raw._getitem(
+            (slice(None), slice(this_start, this_stop)), return_times=False
+        )
+        yield data
+
+
+def _iter_maxwell_stream(
+    raw,
+    n_out,
+    *,
+    onsets,
+    ends,
+    st_duration,
+    st_correlation,
+    st_only,
+    ctc,
+    meg_picks,
+    good_mask,
+    pos_picks,
+    st_fixed,
+    st_overlap,
+    mc,
+):
+    """Generate Maxwell filtered data in order, one chunk at a time.
+
+    This mirrors the two passes of ``_run_maxwell_filter``, but instead of
+    operating on the full data array, the output of the tSSS overlap-add
+    is queued until each sample is final and then passed to the next stage.
+    """
+    sfreq = raw.info["sfreq"]
+    n_read = int(round(raw.buffer_size_sec * sfreq))
+    if st_fixed and not st_only:
+        these_picks = meg_picks[good_mask]
+    else:
+        these_picks = meg_picks
+    last = 0
+    for onset, end in zip(onsets, ends):
+        # Data outside of the processed segments are passed through as-is
+        yield from _iter_raw_chunks(raw, last, onset, n_out, n_read)
+        last = end
+        n = end - onset
+        tsss_valid = n >= st_duration
+        if st_overlap and tsss_valid and st_correlation is not None:
+            n_overlap = st_duration // 2
+            window = "hann"
+        else:
+            n_overlap = 0
+            window = "boxcar"
+        if st_fixed and st_correlation is not None:
+            fun = partial(_do_tSSS_on_avg_trans, mc=mc)
+        else:
+            fun = _do_tSSS
+        queue = _QueueStorer(picks=these_picks)
+        tsss = _COLA(
+            partial(
+                fun,
+                st_correlation=st_correlation,
+                tsss_valid=tsss_valid,
+                sfreq=sfreq,
+            ),
+            queue,
+            n,
+            min(st_duration, n),
+            n_overlap,
+            sfreq,
+            window,
+            name="tSSS-COLA",
+        )
+        for data in _iter_raw_chunks(raw, onset, end, n_out, n_read):
+            # First stage: cross_talk, st_fixed=True
+            ctc_data = data[meg_picks[good_mask]]
+            if ctc is not None:
+                ctc_data = ctc.dot(ctc_data)
+            if st_fixed and st_correlation is not None:
+                if st_only:
+                    proc = data[meg_picks]
+                else:
+                    proc = ctc_data
+                queue.push(data)
+                tsss.feed(proc, ctc_data, sfreq=sfreq)
+                data = queue.pop()
+                if data is None:
+                    continue
+            else:
+                data[meg_picks[good_mask]] = ctc_data
+
+            # Second stage: movement compensation, st_fixed=False
+            mc_data, orig_in_data, resid, pos_data, n_positions = mc.feed(
+                data[meg_picks], good_mask, st_only
+            )
+            data[meg_picks] = mc_data
+            if len(pos_picks) > 0:
+                data[pos_picks] = pos_data
+            if not st_fixed and st_correlation is not None:
+                queue.push(data)
+                tsss.feed(
+                    data[meg_picks],
+                    orig_in_data,
+                    resid,
+                    n_positions=n_positions,
+                    sfreq=sfreq,
+                )
+                data = queue.pop()
+                if data is None:
+                    continue
+            yield data
+        assert queue.n_pending == 0
+    yield from _iter_raw_chunks(raw, last, len(raw.times), n_out, n_read)
+
+
+class _RawMaxwellStream(BaseRaw):
+    """Raw object whose data are computed on the fly (in order) for saving."""
+
+    def __init__(self, raw, info, chunks):
+        super().__init__(
+            info,
+            preload=False,
+            first_samps=(raw.first_samp,),
+            last_samps=(raw.last_samp,),
+            raw_extras=[dict(chunks=chunks, buffer=None, buffer_start=0)],
+            buffer_size_sec=raw.buffer_size_sec,
+            verbose=False,
+        )
+        self._raw_extras[0].update(first_samp=raw.first_samp, cals=self._cals)
+        self.set_annotations(raw.annotations, emit_warning=False)
+
+    def _read_segment_file(self, data, idx, fi, start, stop, cals, mult):
+        """Read a chunk of processed data."""
+        extras = self._raw_extras[fi]
+        start = start - extras["first_samp"]
+        stop = stop - extras["first_samp"]
+        buffer, buffer_start = extras["buffer"], extras["buffer_start"]
+        if start < buffer_start:
+            raise RuntimeError(
+                "Streamed Maxwell filtered data must be read in order, got request "
+                f"for sample {start} after sample {buffer_start}"
+            )
+        if buffer is None:
+            buffer = np.zeros((len(extras["cals"]), 0))
+        # Discard samples that are no longer needed and get what we need
+        buffer = buffer[:, start - buffer_start :]
+        buffer_start = start
+        need = [buffer]
+        n_have = buffer.shape[1]
+        while buffer_start + n_have < stop:
+            need.append(next(extras["chunks"]))
+            n_have += need[-1].shape[1]
+        if len(need) > 1:
+            buffer = np.concatenate(need, axis=1)
+        extras.update(buffer=buffer, buffer_start=buffer_start)
+        block = buffer[:, : stop - start] / extras["cals"][:, np.newaxis]
+        _mult_cal_one(data, block, idx, cals, mult)
+
+
 class _MoveComp:
     """Perform movement compensation."""
 
@@ -977,7 +1227,8 @@ def _trans_lims(pos, start, stop):
             rel_stop = rel_stop - start
             if rel_start == rel_stop:
                 continue  # our first pos occurs on first time sample
-            this_quat = pos[2][max(pos_idx[0] - 1 if len(pos_idx) else 0, 0)]
+            # the position in effect at the start of the block
+            this_quat = pos[2][max(np.searchsorted(pos[1], start, "right") - 1, 0)]
             n_positions += 1
         else:
             rel_start = pos[1][pos_idx[ti]] - start
@@ -1181,18 +1432,7 @@ def _copy_preload_add_channels(raw, add_channels, copy, info):
     with raw.info._unlock():
         raw.info["chs"] = info["chs"]  # updated coil types
     if add_channels:
-        kinds = [
-            FIFF.FIFFV_QUAT_1,
-            FIFF.FIFFV_QUAT_2,
-            FIFF.FIFFV_QUAT_3,
-            FIFF.FIFFV_QUAT_4,
-            FIFF.FIFFV_QUAT_5,
-            FIFF.FIFFV_QUAT_6,
-            FIFF.FIFFV_HPI_G,
-            FIFF.FIFFV_HPI_ERR,
-            FIFF.FIFFV_HPI_MOV,
-        ]
-        out_shape = (len(raw.ch_names) + len(kinds), len(raw.times))
+        out_shape = (len(raw.ch_names) + len(_CHPI_POS_KINDS), len(raw.times))
         out_data = np.zeros(out_shape, np.float64)
         msg = "    Appending head position result channels and "
         if raw.preload:
@@ -1205,29 +1445,8 @@ def _copy_preload_add_channels(raw, add_channels, copy, info):
                 raw._preload_data(out_data[: len(raw.ch_names)])
             raw._data = out_data
         assert raw.preload is True
-        off = len(raw.ch_names)
-        chpi_chs = [
-            dict(
-                ch_name=f"CHPI{ii:03d}",
-                logno=ii + 1,
-                scanno=off + ii + 1,
-                unit_mul=-1,
-                range=1.0,
-                unit=-1,
-                kind=kinds[ii],
-                coord_frame=FIFF.FIFFV_COORD_UNKNOWN,
-                cal=1e-4,
-                coil_type=FWD.COIL_UNKNOWN,
-                loc=np.zeros(12),
-            )
-            for ii in range(len(kinds))
-        ]
-        raw.info["chs"].extend(chpi_chs)
-        raw.info._update_redundant()
-        raw.info._check_consistency()
+        pos_picks = _add_chpi_pos_chs(raw.info)
         assert raw._data.shape == (raw.info["nchan"], len(raw.times))
-        # Return the pos picks
-        pos_picks = np.arange(len(raw.ch_names) - len(chpi_chs), len(raw.ch_names))
         return raw, pos_picks
     else:
         if copy:
@@ -1239,6 +1458,45 @@ def _copy_preload_add_channels(raw, add_channels, copy, info):
         return raw, np.array([], int)
 
 
+_CHPI_POS_KINDS = (
+    FIFF.FIFFV_QUAT_1,
+    FIFF.FIFFV_QUAT_2,
+    FIFF.FIFFV_QUAT_3,
+    FIFF.FIFFV_QUAT_4,
+    FIFF.FIFFV_QUAT_5,
+    FIFF.FIFFV_QUAT_6,
+    FIFF.FIFFV_HPI_G,
+    FIFF.FIFFV_HPI_ERR,
+    FIFF.FIFFV_HPI_MOV,
+)
+
+
+def _add_chpi_pos_chs(info):
+    """Add the cHPI pos channels to info inplace and return their picks."""
+    off = len(info["ch_names"])
+    chpi_chs = [
+        dict(
+            ch_name=f"CHPI{ii:03d}",
+            logno=ii + 1,
+            scanno=off + ii + 1,
+            unit_mul=-1,
+            range=1.0,
+            unit=-1,
+            kind=kind,
+            coord_frame=FIFF.FIFFV_COORD_UNKNOWN,
+            cal=1e-4,
+            coil_type=FWD.COIL_UNKNOWN,
+            loc=np.zeros(12),
+        )
+        for ii, kind in enumerate(_CHPI_POS_KINDS)
+    ]
+    with info._unlock():
+        info["chs"].extend(chpi_chs)
+    info._update_redundant()
+    info._check_consistency()
+    return np.arange(off, off + len(chpi_chs))
+
+
 def _check_pos(pos, coord_frame, raw, st_fixed):
     """Check for a valid pos array and transform it to a more usable form."""
     _validate_type(pos, (np.ndarray, None), "head_pos")
@@ -1313,6 +1571,97 @@ def _get_decomp(
     mult,
 ):
     """Get a decomposition matrix and pseudoinverse matrices."""
+    # Everything but "t" (only used for logging) and "bad_condition" (checked
+    # below) determines the decomposition
+    key = (
+        trans["trans"] if isinstance(trans, Transform) else trans,
+        all_coils[:5],  # the slice_map is redundant with "bins"
+        cal if cal is None else _cal_cache_key(cal),
+        regularize,
+        exp,
+        ignore_ref,
+        coil_scale,
+        grad_picks,
+        mag_picks,
+        good_mask,
+        mag_or_fine,
+        mag_scale,
+        mult,
+    )
+    decomp = _decomp_cache(
+        key,
+        partial(
+            _compute_decomp,
+            trans,
+            all_coils=all_coils,
+            cal=cal,
+            regularize=regularize,
+            exp=exp,
+            ignore_ref=ignore_ref,
+            coil_scale=coil_scale,
+            grad_picks=grad_picks,
+            mag_picks=mag_picks,
+            good_mask=good_mask,
+            mag_or_fine=mag_or_fine,
+            mag_scale=mag_scale,
+            mult=mult,
+        ),
+    )
+    n_use_in, n_in = int(decomp["n_use_in"]), int(decomp["n_in"])
+    n_use_out, n_out = int(decomp["n_use_out"]), int(decomp["n_out"])
+    if regularize is not None or n_use_out != n_out:
+        logger.info(
+            f"        Using {n_use_in + n_use_out}/{n_in + n_out} harmonic components "
+            f"for {t:8.3f}  ({n_use_in}/{n_in} in, {n_use_out}/{n_out} out)"
+        )
+    cond = float(decomp["cond"])
+    if bad_condition != "ignore" and cond >= 1000.0:
+        msg = f"Matrix is badly conditioned: {cond:0.0f} >= 1000"
+        if bad_condition == "error":
+            raise RuntimeError(msg)
+        elif bad_condition == "warning":
+            warn(msg)
+        else:  # condition == 'info'
+            logger.info(msg)
+    # copy so that our cached values cannot be modified
+    S_decomp = decomp["S_decomp"].copy()
+    S_decomp_full = decomp["S_decomp_full"].copy()
+    pS_decomp = decomp["pS_decomp"].copy()
+    reg_moments = decomp["reg_moments"].copy()
+    return S_decomp, S_decomp_full, pS_decomp, reg_moments, n_use_in
+
+
+# Decompositions are cheap to store relative to computing them, and the same
+# ones are used repeatedly across runs of the same system (and by
+# find_bad_channels_maxwell), so keep a reasonable number of them around
+_decomp_cache = _ContentCache("maxwell_decomp", maxsize=32)
+
+
+def _cal_cache_key(cal):
+    return (
+        cal["grad_imbalances"],
+        cal["mag_cals"],
+        [coils[:5] for coils in cal["grad_coilsets"]],
+    )
+
+
+def _compute_decomp(
+    trans,
+    *,
+    all_coils,
+    cal,
+    regularize,
+    exp,
+    ignore_ref,
+    coil_scale,
+    grad_picks,
+    mag_picks,
+    good_mask,
+    mag_or_fine,
+    mag_scale,
+    mult,
+):
+    """Compute the decomposition (see _get_decomp)."""
     #
     # Fine calibration processing (point-like magnetometers and calib. coeffs)
     #
@@ -1366,8 +1715,10 @@ def _get_decomp(
     #
     # Regularization
     #
+    n_in = _get_n_moments(exp["int_order"])
+    n_out = S_decomp.shape[1] - n_in
     S_decomp, reg_moments, n_use_in = _regularize(
-        regularize, exp, S_decomp, mag_or_fine, extended_remove, t=t
+        regularize, exp, S_decomp, mag_or_fine, extended_remove
     )
     S_decomp_full = S_decomp_full.take(reg_moments, axis=1)
 
@@ -1376,21 +1727,23 @@ def _get_decomp(
     #
     pS_decomp, sing = _col_norm_pinv(S_decomp.copy())
     cond = sing[0] / sing[-1]
-    if bad_condition != "ignore" and cond >= 1000.0:
-        msg = f"Matrix is badly conditioned: {cond:0.0f} >= 1000"
-        if bad_condition == "error":
-            raise RuntimeError(msg)
-        elif bad_condition == "warning":
-            warn(msg)
-        else:  # condition == 'info'
-            logger.info(msg)
 
     # Build in our data scaling here
     pS_decomp *= coil_scale[good_mask].T
     S_decomp /= coil_scale[good_mask]
     S_decomp_full /= coil_scale
     assert pS_decomp.shape[1] == S_decomp.shape[0] == good_mask.sum()
-    return S_decomp, S_decomp_full, pS_decomp, reg_moments, n_use_in
+    return dict(
+        S_decomp=S_decomp,
+        S_decomp_full=S_decomp_full,
+        pS_decomp=pS_decomp,
+        reg_moments=reg_moments,
+        n_use_in=n_use_in,
+        n_use_out=len(reg_moments) - n_use_in,
+        n_in=n_in,
+        n_out=n_out,
+        cond=cond,
+    )
 
 
 def _get_s_decomp(
@@ -1411,18 +1764,13 @@ def _get_s_decomp(
     return S_decomp
 
 
-@verbose
-def _regularize(
-    regularize, exp, S_decomp, mag_or_fine, extended_remove, t, verbose=None
-):
+def _regularize(regularize, exp, S_decomp, mag_or_fine, extended_remove):
     """Regularize a decomposition matrix."""
     # ALWAYS regularize the out components according to norm, since
     # gradiometer-only setups (e.g., KIT) can have zero first-order
     # (homogeneous field) components
     int_order, ext_order = exp["int_order"], exp["ext_order"]
     n_in = _get_n_moments(int_order)
-    n_out = S_decomp.shape[1] - n_in
-    t_str = f"{t:8.3f}"
     if regularize is not None:  # regularize='in' or 'in_argmax'
         in_removes, out_removes = _regularize_in(
             int_order,
@@ -1440,14 +1788,8 @@ def _regularize(
     reg_in_moments = np.setdiff1d(np.arange(n_in), in_removes)
     reg_out_moments = np.setdiff1d(np.arange(n_in, S_decomp.shape[1]), out_removes)
     n_use_in = len(reg_in_moments)
-    n_use_out = len(reg_out_moments)
     reg_moments = np.concatenate((reg_in_moments, reg_out_moments))
     S_decomp = S_decomp.take(reg_moments, axis=1)
-    if regularize is not None or n_use_out != n_out:
-        logger.info(
-            f"        Using {n_use_in + n_use_out}/{n_in + n_out} harmonic components "
-            f"for {t_str}  ({n_use_in}/{n_in} in, {n_use_out}/{n_out} out)"
-        )
     return S_decomp, reg_moments, n_use_in
 
 
@@ -1722,7 +2064,7 @@ def _sss_basis(exp, all_coils):
     n_in, n_out = _get_n_moments([int_order, ext_order])
     rmags = rmags - exp["origin"]
 
-    # do the heavy lifting
+    # Spherical coordinates of the integration points
     max_order = max(int_order, ext_order)
     L = _tabular_legendre(rmags, max_order)
     phi = np.arctan2(rmags[:, 1], rmags[:, 0])
@@ -1738,212 +2080,104 @@ def _sss_basis(exp, all_coils):
     cos_az[z_only] = 1.0
     sin_az = rmags[:, 1] / r_xy  # sin(phi)
     sin_az[z_only] = 0.0
-    # Appropriate vector spherical harmonics terms
-    r_nn2 = r_n.copy()
-    r_nn1 = 1.0 / (r_n * r_n)
-    S_tot = np.empty((n_coils, n_in + n_out), np.float64)
-    S_in = S_tot[:, :n_in]
-    S_out = S_tot[:, n_in:]
-    for degree in range(max_order + 1):
-        if degree <= ext_order:
-            r_nn1 *= r_n  # r^(l-1)
-        if degree <= int_order:
-            r_nn2 *= r_n  # r^(l+2)
-
+    # Project the integration-point-weighted normals onto the local spherical
+    # unit vectors, so that the dot products with the gradients below become
+    # elementwise products (rather than converting each gradient to cartesian)
+    c_x, c_y, c_z = cosmags.T
+    e_r = sin_pol * (cos_az * c_x + sin_az * c_y) + cos_pol * c_z
+    e_pol = cos_pol * (cos_az * c_x + sin_az * c_y) - sin_pol * c_z
+    e_az = (cos_az * c_y - sin_az * c_x) / sin_pol_nz
+    e_az[z_only] = 0.0
+
+    # Tabulate the terms that only depend on the order: cos(order * phi) and
+    # sin(order * phi) (and their derivatives) times the spherical components
+    # of the normals, for the "real" (order >= 0) and "imaginary" (order < 0)
+    # parts of the harmonics
+    ord_col = np.arange(max_order + 1)[:, np.newaxis]
+    cos_order = np.cos(ord_col * phi)
+    sin_order = np.sin(ord_col * phi)
+    rad_re, rad_im = cos_order * e_r, -sin_order * e_r
+    az_re, az_im = ord_col * sin_order * e_az, ord_col * cos_order * e_az
+    pol_re, pol_im = -cos_order * e_pol, sin_order * e_pol
+    del cos_order, sin_order, e_r, e_az, e_pol
+
+    # Compute all orders of a given degree at once. Within a degree, moments
+    # are ordered -degree, ..., 0, ..., degree (see _deg_ord_idx), so the
+    # negative orders use the tables above in reverse.
+    vals_in = np.empty((n_in, len(r_n)))
+    vals_out = np.empty((n_out, len(r_n)))
+    for degree in range(1, max_order + 1):
+        orders = np.arange(degree + 1)
         # mu_0*sqrt((2l+1)/4pi (l-m)!/(l+m)!)
-        mult = 2e-7 * np.sqrt((2 * degree + 1) * np.pi)
-
-        if degree > 0:
-            idx = _deg_ord_idx(degree, 0)
-            # alpha
-            if degree <= int_order:
-                b_r = mult * (degree + 1) * L[degree][0] / r_nn2
-                b_pol = -mult * L[degree][1] / r_nn2
-                S_in[:, idx] = _integrate_points(
-                    cos_az,
-                    sin_az,
-                    cos_pol,
-                    sin_pol,
-                    b_r,
-                    0.0,
-                    b_pol,
-                    cosmags,
-                    bins,
-                    n_coils,
-                )
-            # beta
-            if degree <= ext_order:
-                b_r = -mult * degree * L[degree][0] * r_nn1
-                b_pol = -mult * L[degree][1] * r_nn1
-                S_out[:, idx] = _integrate_points(
-                    cos_az,
-                    sin_az,
-                    cos_pol,
-                    sin_pol,
-                    b_r,
-                    0.0,
-                    b_pol,
-                    cosmags,
-                    bins,
-                    n_coils,
-                )
-        for order in range(1, degree + 1):
-            ord_phi = order * phi
-            sin_order = np.sin(ord_phi)
-            cos_order = np.cos(ord_phi)
-            mult /= np.sqrt((degree - order + 1) * (degree + order))
-            # √2 keeps the real basis orthonormal. MaxFilter's real
-            # ("even-odd") coefficients instead absorb a factor of 2 relative to
-            # the complex ones, so our order != 0 columns are its columns
-            # divided by √2. Being a per-column scaling, this cancels in
-            # S_in @ pinv(S_tot); it only matters where column norms do, i.e.
-            # when regularizing (see _regularize_in).
-            factor = mult * np.sqrt(2)
-
-            # Real
-            idx = _deg_ord_idx(degree, order)
-            r_fact = factor * L[degree][order] * cos_order
-            az_fact = factor * order * sin_order * L[degree][order]
-            pol_fact = (
-                -factor
-                * (
-                    L[degree][order + 1]
-                    - (degree + order) * (degree - order + 1) * L[degree][order - 1]
-                )
-                * cos_order
-            )
+        # √2 keeps the real basis orthonormal. MaxFilter's real ("even-odd")
+        # coefficients instead absorb a factor of 2 relative to the complex
+        # ones, so our order != 0 columns are its columns divided by √2. Being
+        # a per-column scaling, this cancels in S_in @ pinv(S_tot); it only
+        # matters where column norms do, i.e. when regularizing (see
+        # _regularize_in).
+        factor = np.array([_mu_0 * _sph_harm_norm(order, degree) for order in orders])
+        factor[1:] *= np.sqrt(2)
+        leg = factor[:, np.newaxis] * L[degree, : degree + 1]
+        # polar derivative (with an extra factor of 2 for order != 0)
+        d_leg = L[degree, 1 : degree + 2].copy()
+        d_leg[1:] -= ((degree + orders[1:]) * (degree - orders[1:] + 1))[
+            :, np.newaxis
+        ] * L[degree, :degree]
+        factor[1:] /= 2.0
+        d_leg *= factor[:, np.newaxis]
+        pos = slice(_deg_ord_idx(degree, 0), _deg_ord_idx(degree, degree) + 1)
+        neg = slice(_deg_ord_idx(degree, -degree), _deg_ord_idx(degree, 0))
+        rev = slice(degree, 0, -1)  # orders degree, ..., 1
+        for vals, rad_mult, r_pow, this_order in (
             # alpha
-            if degree <= int_order:
-                b_r = (degree + 1) * r_fact / r_nn2
-                b_az = az_fact / (sin_pol_nz * r_nn2)
-                b_az[z_only] = 0.0
-                b_pol = pol_fact / (2 * r_nn2)
-                S_in[:, idx] = _integrate_points(
-                    cos_az,
-                    sin_az,
-                    cos_pol,
-                    sin_pol,
-                    b_r,
-                    b_az,
-                    b_pol,
-                    cosmags,
-                    bins,
-                    n_coils,
-                )
+            (vals_in, degree + 1.0, r_n ** -(degree + 2), int_order),
             # beta
-            if degree <= ext_order:
-                b_r = -degree * r_fact * r_nn1
-                b_az = az_fact * r_nn1 / sin_pol_nz
-                b_az[z_only] = 0.0
-                b_pol = pol_fact * r_nn1 / 2.0
-                S_out[:, idx] = _integrate_points(
-                    cos_az,
-                    sin_az,
-                    cos_pol,
-                    sin_pol,
-                    b_r,
-                    b_az,
-                    b_pol,
-                    cosmags,
-                    bins,
-                    n_coils,
-                )
-
-            # Imaginary
-            idx = _deg_ord_idx(degree, -order)
-            r_fact = factor * L[degree][order] * sin_order
-            az_fact = factor * order * cos_order * L[degree][order]
-            pol_fact = (
-                factor
-                * (
-                    L[degree][order + 1]
-                    - (degree + order) * (degree - order + 1) * L[degree][order - 1]
-                )
-                * sin_order
-            )
-            # alpha
-            if degree <= int_order:
-                b_r = -(degree + 1) * r_fact / r_nn2
-                b_az = az_fact / (sin_pol_nz * r_nn2)
-                b_az[z_only] = 0.0
-                b_pol = pol_fact / (2 * r_nn2)
-                S_in[:, idx] = _integrate_points(
-                    cos_az,
-                    sin_az,
-                    cos_pol,
-                    sin_pol,
-                    b_r,
-                    b_az,
-                    b_pol,
-                    cosmags,
-                    bins,
-                    n_coils,
-                )
-            # beta
-            if degree <= ext_order:
-                b_r = degree * r_fact * r_nn1
-                b_az = az_fact * r_nn1 / sin_pol_nz
-                b_az[z_only] = 0.0
-                b_pol = pol_fact * r_nn1 / 2.0
-                S_out[:, idx] = _integrate_points(
-                    cos_az,
-                    sin_az,
-                    cos_pol,
-                    sin_pol,
-                    b_r,
-                    b_az,
-                    b_pol,
-                    cosmags,
-                    bins,
-                    n_coils,
-                )
+            (vals_out, -float(degree), r_n ** (degree - 1), ext_order),
+        ):
+            if degree > this_order:
+                continue
+            vals[pos] = leg * (rad_mult * rad_re[: degree + 1] + az_re[: degree + 1])
+            vals[pos] += d_leg * pol_re[: degree + 1]
+            vals[neg] = leg[rev] * (rad_mult * rad_im[rev] + az_im[rev])
+            vals[neg] += d_leg[rev] * pol_im[rev]
+            vals[neg.start : pos.stop] *= r_pow
+
+    # Sum the integration points of each coil
+    integ = sparse.csr_array(
+        (np.ones(len(bins)), (bins, np.arange(len(bins)))), shape=(n_coils, len(bins))
+    )
+    S_tot = np.empty((n_coils, n_in + n_out), np.float64)
+    S_tot[:, :n_in] = integ @ vals_in.T
+    S_tot[:, n_in:] = integ @ vals_out.T
     return S_tot
 
 
-def _integrate_points(
-    cos_az, sin_az, cos_pol, sin_pol, b_r, b_az, b_pol, cosmags, bins, n_coils
-):
-    """Integrate points in spherical coords."""
-    grads = _sp_to_cart(cos_az, sin_az, cos_pol, sin_pol, b_r, b_az, b_pol).T
-    grads = (grads * cosmags).sum(axis=1)
-    return bincount(bins, grads, n_coils)
-
-
 def _tabular_legendre(r, nind):
     """Compute associated Legendre polynomials."""
     r_n = np.sqrt(np.sum(r * r, axis=1))
     x = r[:, 2] / r_n  # cos(theta)
-    L = list()
-    for degree in range(nind + 1):
-        L.append(np.zeros((degree + 2, len(r))))
-    L[0][0] = 1.0
+    # L[degree, order], with an extra all-zero order so that order + 1 can
+    # always be indexed
+    L = np.zeros((nind + 1, nind + 2, len(r)))
+    L[0, 0] = 1.0
     pnn = np.ones(x.shape)
     fact = 1.0
     sx2 = np.sqrt((1.0 - x) * (1.0 + x))
     for degree in range(nind + 1):
-        L[degree][degree] = pnn
+        L[degree, degree] = pnn
         pnn *= -fact * sx2
         fact += 2.0
         if degree < nind:
-            L[degree + 1][degree] = x * (2 * degree + 1) * L[degree][degree]
+            L[degree + 1, degree] = x * (2 * degree + 1) * L[degree, degree]
         if degree >= 2:
-            for order in range(degree - 1):
-                L[degree][order] = (
-                    x * (2 * degree - 1) * L[degree - 1][order]
-                    - (degree + order - 1) * L[degree - 2][order]
-                ) / (degree - order)
+            order = np.arange(degree - 1)[:, np.newaxis]
+            L[degree, : degree - 1] = (
+                x * (2 * degree - 1) * L[degree - 1, : degree - 1]
+                - (degree + order - 1) * L[degree - 2, : degree - 1]
+            ) / (degree - order)
     return L
 
 
-def _sp_to_cart(cos_az, sin_az, cos_pol, sin_pol, b_r, b_az, b_pol):
-    """Convert spherical coords to cartesian."""
-    out = np.empty((3,) + sin_pol.shape)
-    out[0] = sin_pol * cos_az * b_r + cos_pol * cos_az * b_pol - sin_az * b_az
-    out[1] = sin_pol * sin_az * b_r + cos_pol * sin_az * b_pol + cos_az * b_az
-    out[2] = cos_pol * b_r - sin_pol * b_pol
-    return out
-
-
 def _get_degrees_orders(order):
     """Get the set of degrees used in our basis functions."""
     degrees = np.zeros(_get_n_moments(order), int)
@@ -4,7 +4,7 @@
 
 import numpy as np
 import pytest
-from numpy.testing import assert_array_equal
+from numpy.testing import assert_allclose, assert_array_equal
 
 from mne.preprocessing.ctps_ import _compute_normalized_phase, _prob_kuiper, ctps
 from mne.time_frequency import morlet
@@ -86,3 +86,18 @@ def test_ctps():
         _prob_kuiper(np.array([1.0, 1.0]), 400), _prob_kuiper(np.array([1.0, 1.0]), 400)
     )
     assert _prob_kuiper(0.1, 400) < 0.1
+
+
+def test_ctps_blocks(monkeypatch):
+    """Test that CTPS of several sources matches CTPS of each source."""
+    data = get_data(50, 150)
+    ks_dyn, pk_dyn, _ = ctps(data)
+    for ii in range(data.shape[1]):
+        ks, pk, _ = ctps(data[:, [ii]])
+        assert_allclose(ks_dyn[[ii]], ks)
+        assert_allclose(pk_dyn[[ii]], pk)
+    # a few sources and time slices at a time
+    monkeypatch.setattr("mne.preprocessing.ctps_._CTPS_BLOCK_BYTES", 8 * 50 * 600)
+    ks_dyn_2, pk_dyn_2, _ = ctps(data)
+    assert_allclose(ks_dyn_2, ks_dyn)
+    assert_allclose(pk_dyn_2, pk_dyn)
@@ -47,6 +47,8 @@ from mne.preprocessing import (
     read_ica,
 )
 from mne.preprocessing.ica import (
+    _find_sources,
+    _ica_channel_unmixing,
     _ica_explained_variance,
     _sort_components,
     corrmap,
@@ -184,6 +186,183 @@ def test_ica_simple(method):
     assert amari_distance < 0.1
 
 
+@pytest.mark.parametrize("method", ["infomax", "fastica", "picard"])
+@pytest.mark.parametrize("noise_cov", [False, True])
+def test_ica_warm_start(method, noise_cov):
+    """Test initializing ICA with the solution from another run."""
+    _skip_check_picard(method)
+    n_components, n_samples = 4, 5000
+    rng = np.random.RandomState(0)
+    A = rng.randn(n_components, n_components)
+    info = create_info(n_components, 1000.0, "eeg")
+    with info._unlock():
+        info["highpass"] = 1.0
+    cov = make_ad_hoc_cov(info) if noise_cov else None
+    raws = [
+        RawArray(1e-5 * A @ rng.laplace(size=(n_components, n_samples)), info)
+        for _ in range(2)
+    ]
+    kwargs = dict(n_components=n_components, method=method, noise_cov=cov)
+    ica = ICA(random_state=0, **kwargs)
+    ctx = pytest.warns(RuntimeWarning, match="No average EEG")
+    with ctx if noise_cov else nullcontext():
+        ica.fit(raws[0])
+        ica_warm = ICA(random_state=1, **kwargs).fit(raws[1], warm_start=ica)
+        ica_cold = ICA(random_state=1, **kwargs).fit(raws[1])
+    assert ica_warm.n_iter_ < ica_cold.n_iter_
+    for this_ica in (ica, ica_warm, ica_cold):
+        transform = _ica_channel_unmixing(this_ica) @ A
+        amari_distance = np.mean(
+            np.sum(np.abs(transform), axis=1) / np.max(np.abs(transform), axis=1) - 1
+        )
+        assert amari_distance < 0.1
+    # a fit of the same data starting from its own solution stops quickly
+    n_iter = ica_cold.n_iter_
+    with ctx if noise_cov else nullcontext():
+        ica_cold.fit(raws[1], warm_start=ica_cold)
+    assert ica_cold.n_iter_ < n_iter
+    with pytest.raises(ValueError, match="must be a fitted"):
+        ICA(**kwargs).fit(raws[1], warm_start=ICA(**kwargs))
+    with pytest.raises(ValueError, match="do not match"):
+        ICA(**kwargs).fit(raws[1], picks=[0, 1, 2], warm_start=ica)
+    with pytest.raises(ValueError, match="warm_start has 4 components"):
+        with ctx if noise_cov else nullcontext():
+            ICA(n_components=3, method=method, noise_cov=cov).fit(
+                raws[1], warm_start=ica
+            )
+
+
+@pytest.mark.parametrize("noise_cov", [False, True])
+def test_ica_apply_blocks(noise_cov, tmp_path, monkeypatch):
+    """Test applying ICA and getting sources block by block."""
+    n_channels, n_samples = 5, 1000
+    rng = np.random.RandomState(0)
+    info = create_info(n_channels, 1000.0, "eeg")
+    with info._unlock():
+        info["highpass"] = 1.0
+    data = (
+        1e-5
+        * rng.randn(n_channels, n_channels)
+        @ rng.laplace(size=(n_channels, n_samples))
+    )
+    data += 1e-6 * rng.randn(n_channels, 1)
+    raw = RawArray(data.copy(), info)
+    cov = make_ad_hoc_cov(info) if noise_cov else None
+    ica = ICA(n_components=n_channels, noise_cov=cov, max_iter=2, random_state=0)
+    with _record_warnings():  # no average reference, did not converge
+        ica.fit(raw)
+    # the reference: subtract the back-projection of the excluded sources
+    pre_whitened = ica._pre_whiten(data.copy()) - ica.pca_mean_[:, np.newaxis]
+    sources = ica.unmixing_matrix_ @ ica.pca_components_ @ pre_whitened
+    back_proj = ica.pca_components_.T @ ica.mixing_matrix_[:, [1]] @ sources[[1]]
+    if noise_cov:
+        back_proj = np.linalg.pinv(ica.pre_whitener_) @ back_proj
+    else:
+        back_proj *= ica.pre_whitener_
+    want = data - back_proj
+    raw.save(tmp_path / "test_raw.fif", fmt="double")
+    # a few samples per block
+    monkeypatch.setattr("mne.preprocessing.ica._ICA_BLOCK_BYTES", 8 * n_channels * 7)
+    for preload in (False, tmp_path / "data.dat"):
+        raw_read = read_raw_fif(tmp_path / "test_raw.fif", preload=preload)
+        assert_allclose(ica.get_sources(raw_read).get_data(), sources, rtol=1e-7)
+        assert_allclose(
+            ica._transform_raw(raw_read, 10, 101, False), sources[:, 10:101], rtol=1e-7
+        )
+    assert isinstance(raw_read._data, np.memmap)
+    ica.apply(raw_read, exclude=[1], start=10, stop=101)
+    assert_allclose(
+        raw_read.get_data(),
+        np.concatenate([data[:, :10], want[:, 10:101], data[:, 101:]], axis=1),
+        atol=1e-12,
+    )
+    ica.apply(raw, exclude=[1])
+    assert_allclose(raw.get_data(), want, atol=1e-12)
+    # epochs and evoked
+    epochs = EpochsArray(data.reshape(n_channels, 10, -1).transpose(1, 0, 2), info)
+    want_epochs = want.reshape(n_channels, 10, -1).transpose(1, 0, 2)
+    assert_allclose(
+        ica.get_sources(epochs).get_data(),
+        sources.reshape(n_channels, 10, -1).transpose(1, 0, 2),
+        rtol=1e-7,
+    )
+    assert_allclose(ica.apply(epochs, exclude=[1]).get_data(), want_epochs, atol=1e-12)
+    evoked = EvokedArray(data[:, :100], info)
+    assert_allclose(ica.apply(evoked, exclude=[1]).data, want[:, :100], atol=1e-12)
+
+
+def test_ica_sources_view(monkeypatch):
+    """Test that the artifact scorers share the sources of a Raw instance."""
+    n_channels, sfreq = 6, 100.0
+    rng = np.random.RandomState(0)
+    ch_names = ["Fz", "Cz", "Pz", "C3", "C4", "Oz", "EOG"]
+    info = create_info(ch_names, sfreq, ["eeg"] * n_channels + ["eog"])
+    with info._unlock():
+        info["highpass"] = 1.0
+    data = 1e-5 * rng.laplace(size=(n_channels + 1, 3000))
+    data[-1] += data[0]
+    raw = RawArray(data, info)
+    raw.set_montage("colin27_1020")
+    ica = ICA(n_components=n_channels, max_iter=2, random_state=0)
+    with _record_warnings():  # did not converge
+        ica.fit(raw)
+    calls = list()
+    transform_raw = _ICA._transform_raw
+
+    def _transform_raw(self, raw, *args, **kwargs):
+        calls.append(args)
+        return transform_raw(self, raw, *args, **kwargs)
+
+    monkeypatch.setattr(_ICA, "_transform_raw", _transform_raw)
+    # without a cache, every scorer computes the sources
+    eog_idx, eog_scores = ica.find_bads_eog(raw)
+    muscle_scores = ica.find_bads_muscle(raw)[1]
+    ecg_scores = ica.find_bads_ecg(raw, "EOG", method="correlation")[1]
+    assert len(calls) == 3
+    assert ica._sources_cache is None
+    with ica.cache_sources():
+        assert ica.copy()._sources_cache is None
+        assert_allclose(ica.find_bads_eog(raw)[1], eog_scores)
+        assert_allclose(ica.score_sources(raw, "EOG", l_freq=1, h_freq=10), eog_scores)
+        assert_allclose(ica.find_bads_muscle(raw)[1], muscle_scores)
+        assert_allclose(
+            ica.find_bads_ecg(raw, "EOG", method="correlation")[1], ecg_scores
+        )
+        assert len(calls) == 4
+        # other data, segments, or ICA solutions
+        raw_copy = raw.copy()
+        ica.find_bads_eog(raw_copy)
+        assert len(calls) == 5
+        ica.find_bads_eog(raw, start=0, stop=2000)
+        assert len(calls) == 6
+        ica.find_bads_eog(raw)
+        assert len(calls) == 6
+        assert len(ica._sources_cache._views) == 3
+        del raw_copy  # releases its sources
+        assert len(ica._sources_cache._views) == 2
+        ica.pca_mean_ = ica.pca_mean_ + 1e-7
+        ica.find_bads_eog(raw)
+        assert len(calls) == 7
+        # bad segments are omitted from the full sources
+        raw.set_annotations(Annotations([5.0, 29.0], [2.0, 0.99], ["BAD_blink", "bad"]))
+        view = ica._get_sources_view(raw, None, None)
+        assert len(calls) == 7
+        assert_allclose(
+            view.get_data(ica, reject_by_annotation=True),
+            ica._transform_raw(raw, 0, None, reject_by_annotation=True),
+        )
+        assert view.get_data(ica, reject_by_annotation=True).shape[1] == 2701
+        assert len(calls) == 9
+        assert ica._get_sources_view(raw, None, None) is view
+    assert ica._sources_cache is None
+    assert ica._get_sources_view(raw, None, None) is not view
+    # the vectorized correlation
+    x, y = rng.randn(4, 100), rng.randn(1, 100)
+    assert_allclose(
+        _find_sources(x, y, "pearsonr"), get_score_funcs()["pearsonr"](x, y)
+    )
+
+
 def test_warnings():
     """Test that ICA warns on certain input data conditions."""
     raw = read_raw_fif(raw_fname).crop(0, 5).load_data()
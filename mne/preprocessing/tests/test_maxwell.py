@@ -43,6 +43,7 @@ from mne.preprocessing.maxwell import (
     _bases_complex_to_real,
     _bases_real_to_complex,
     _compute_sphere_activation_in,
+    _decomp_cache,
     _get_degrees_orders,
     _get_n_moments,
     _mne_ord_to_mf_idx,
@@ -54,6 +55,7 @@ from mne.preprocessing.maxwell import (
     _trans_sss_basis,
 )
 from mne.rank import _compute_rank_int, _get_rank_sss, compute_rank
+from mne.transforms import rot_to_quat
 from mne.utils import (
     _record_warnings,
     assert_meg_snr,
@@ -581,6 +583,25 @@ def test_multipolar_bases():
         assert_allclose(S_tot, S_tot_fast * flips, atol=1e-16)
 
 
+@pytest.mark.parametrize("int_order, ext_order", [(8, 3), (3, 5), (1, 0)])
+def test_sss_basis_orders(int_order, ext_order):
+    """Test the optimized SSS basis against the readable one for many orders."""
+    info = read_info(raw_small_fname)
+    info = pick_info(info, pick_types(info, meg=True))
+    coils = _prep_meg_channels(info, accuracy="accurate")["defs"]
+    exp = dict(int_order=int_order, ext_order=ext_order, origin=(0.0, 0.01, 0.04))
+    S_tot = _sss_basis_basic(exp, coils)
+    S_tot_fast = _trans_sss_basis(
+        exp, all_coils=_prep_mf_coils(info), trans=info["dev_head_t"]
+    )
+    # sign convention for negative orders differs (see test_multipolar_bases)
+    orders = np.concatenate(
+        [_get_degrees_orders(order)[1] for order in (int_order, ext_order)]
+    )
+    flips = np.where(orders < 0, (-1.0) ** orders, 1.0)
+    assert_allclose(S_tot, S_tot_fast * flips, rtol=1e-7, atol=1e-16)
+
+
 # This is also slow, but we probably want it running on all OSes
 @testing.requires_testing_data
 def test_basic():
@@ -2056,6 +2077,93 @@ def test_find_bads_maxwell_flat():
     assert noisy == want_noisy
 
 
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        dict(),
+        dict(st_duration=4.0),
+        dict(st_duration=4.0, st_only=True),
+        dict(st_duration=4.0, head_pos="moving"),
+    ],
+)
+def test_maxwell_filter_stream(kwargs, tmp_path):
+    """Test memory-bounded streaming Maxwell filtering to disk."""
+    raw = read_raw_fif(raw_small_fname, allow_maxshield="yes")
+    raw.del_proj()
+    raw.info["bads"] = ["MEG 2443"]
+    raw.set_annotations(mne.Annotations(raw.first_time + 13.0, 1.0, "bad_skip"))
+    kwargs["skip_by_annotation"] = "bad_skip"
+    if kwargs.get("head_pos") == "moving":
+        trans = raw.info["dev_head_t"]["trans"]
+        quat = rot_to_quat(trans[:3, :3])
+        kwargs["head_pos"] = np.array(
+            [
+                np.concatenate(
+                    [
+                        [raw.first_time + t],
+                        quat,
+                        trans[:3, 3] + [0, 0, 1e-3 * t],
+                        [0] * 3,
+                    ]
+                )
+                for t in (0.0, 5.0, 10.0)
+            ]
+        )
+    want = _maxwell_filter_ola(raw, **kwargs)
+    fname = tmp_path / "test_raw_sss.fif"
+    assert not raw.preload
+    got = _maxwell_filter_ola(raw, fname=fname, **kwargs)
+    assert not got.preload
+    assert got.filenames == (fname,)
+    assert got.ch_names == want.ch_names
+    assert got.info["bads"] == want.info["bads"]
+    assert got.first_samp == want.first_samp
+    got_max_info = got.info["proc_history"][0]["max_info"]
+    want_max_info = want.info["proc_history"][0]["max_info"]
+    assert got_max_info["max_st"].get("job") == want_max_info["max_st"].get("job")
+    for key in ("nfree", "components"):
+        assert_array_equal(
+            got_max_info["sss_info"].get(key), want_max_info["sss_info"].get(key)
+        )
+    assert_allclose(got.get_data(), want.get_data(), rtol=1e-6, atol=1e-15)
+    with pytest.raises(FileExistsError, match="Destination file exists"):
+        _maxwell_filter_ola(raw, fname=fname, **kwargs)
+
+
+def test_maxwell_decomp_cache(tmp_path, monkeypatch):
+    """Test caching of SSS decompositions across runs."""
+    monkeypatch.delenv("MNE_PERSISTENT_CACHE_DIR", raising=False)
+    _decomp_cache.clear()
+    raw = read_raw_fif(raw_small_fname).crop(0, 2).load_data()
+    raw.del_proj()
+    raw.info["bads"] = ["MEG 2443"]
+    want = maxwell_filter(raw).get_data()
+    n_cached = len(_decomp_cache._cache)
+    assert n_cached > 0
+    with catch_logging() as log:
+        got = maxwell_filter(raw.copy(), verbose="debug").get_data()
+    log = log.getvalue()
+    assert "Using cached maxwell_decomp" in log
+    assert "harmonic components" in log  # still logged when cached
+    assert_array_equal(got, want)
+    assert len(_decomp_cache._cache) == n_cached
+    # different bads, different decompositions
+    raw.info["bads"] = ["MEG 2443", "MEG 1032"]
+    maxwell_filter(raw)
+    assert len(_decomp_cache._cache) > n_cached
+    # on-disk persistence
+    monkeypatch.setenv("MNE_PERSISTENT_CACHE_DIR", str(tmp_path))
+    _decomp_cache.clear()
+    raw.info["bads"] = ["MEG 2443"]
+    maxwell_filter(raw)
+    assert len(list((tmp_path / "maxwell_decomp").glob("*.npz"))) == n_cached
+    _decomp_cache.clear()
+    with catch_logging() as log:
+        got = maxwell_filter(raw, verbose="debug").get_data()
+    assert str(tmp_path / "maxwell_decomp") in log.getvalue()
+    assert_allclose(got, want, rtol=1e-12, atol=1e-20)
+
+
 @pytest.mark.parametrize(
     "regularize, n, int_order",
     [
@@ -68,6 +68,10 @@ def estimate_rank(
         data = data.copy()  # operate on a copy
         norms = _compute_row_norms(data)
         data /= norms[:, np.newaxis]
+    if data.shape[1] > 2 * data.shape[0]:
+        # the triangular factor of a QR decomposition has the same singular
+        # values and is much cheaper to obtain for long recordings
+        data = np.linalg.qr(data.T, mode="r")
     s = linalg.svdvals(data)
     rank = _estimate_rank_from_s(s, tol, tol_kind)
     if return_singular is True:
@@ -97,7 +101,7 @@ def _estimate_rank_from_s(s, tol="auto", tol_kind="absolute"):
         The estimated rank.
     """
     s = np.array(s, float)
-    max_s = np.amax(s, axis=-1)
+    max_s = np.amax(s, axis=-1, keepdims=True)
     if isinstance(tol, str):
         if tol not in ("auto", "float32"):
             raise ValueError(f'tol must be "auto" or float, got {repr(tol)}')
@@ -115,10 +119,10 @@ def _estimate_rank_from_s(s, tol="auto", tol_kind="absolute"):
             logger.info(
                 "    Using tolerance %0.2g (%0.2g eps * %d dim * %0.2g"
                 "  max singular value)",
-                tol,
+                tol[0],
                 eps,
                 len(s),
-                max_s,
+                max_s[0],
             )
     elif not (isinstance(tol, np.ndarray) and tol.dtype.kind == "f"):
         tol = float(tol)
@@ -8,7 +8,6 @@ from pathlib import Path
 
 import numpy as np
 
-from .._fiff.constants import FIFF
 from .._fiff.meas_info import Info
 from .._fiff.pick import pick_channels, pick_channels_forward, pick_info, pick_types
 from .._ola import _Interp2
@@ -22,13 +21,12 @@ from ..chpi import (
 from ..cov import Covariance, make_ad_hoc_cov, read_cov
 from ..event import _get_stim_channel
 from ..forward import (
-    _compute_forwards,
     _magnetic_dipole_field_vec,
     _merge_fwds,
+    _MovingForwardModeler,
     _prep_meg_channels,
     _prepare_for_forward,
     _stc_src_sel,
-    _to_forward_dict,
     _transform_orig_meg_coils,
     convert_forward_solution,
     restrict_forward_to_stc,
@@ -40,8 +38,7 @@ from ..source_space._source_space import (
     _set_source_space_vertices,
     setup_volume_source_space,
 )
-from ..surface import _CheckInside
-from ..transforms import Transform, _get_trans, transform_surface_to
+from ..transforms import Transform, _get_trans
 from ..utils import (
     _check_preload,
     _pl,
@@ -794,6 +791,30 @@ def _iter_forward_solutions(
     info = pick_info(info, picks)
     with info._unlock():
         info.update(projs=[], bads=[])  # Ensure no 'projs' or 'bads'
+    if forward is None:
+        # The sensor-independent parts only need to be computed once
+        fm = _MovingForwardModeler(
+            info,
+            trans,
+            src,
+            bem,
+            mindist=mindist,
+            n_jobs=n_jobs,
+            verbose=_verbose_safe_false(),
+        )
+        for ti, dev_head_t in enumerate(dev_head_ts):
+            logger.info(
+                f"Computing gain matrix for transform #{ti + 1}/{len(dev_head_ts)}"
+            )
+            dev_head_t = Transform(
+                dev_head_t["from"], dev_head_t["to"], dev_head_t["trans"]
+            )
+            fwd = fm.compute(dev_head_t)
+            yield fwd
+        # need an extra one to fill last buffer
+        yield fwd
+        return
+
     mri_head_t, trans = _get_trans(trans)
     sensors, rr, info, update_kwargs, bem = _prepare_for_forward(
         src,
@@ -810,16 +831,8 @@ def _iter_forward_solutions(
     eegnames = sensors.get("eeg", dict()).get("ch_names", [])
     if not len(eegnames):
         eegfwd = None
-    elif forward is not None:
-        eegfwd = pick_channels_forward(forward, eegnames, verbose=False)
     else:
-        eegels = sensors.get("eeg", dict()).get("defs", [])
-        this_sensors = dict(eeg=dict(ch_names=eegnames, defs=eegels))
-        eegfwd = _compute_forwards(
-            rr, bem=bem, sensors=this_sensors, n_jobs=n_jobs, verbose=False
-        )["eeg"]
-        eegfwd = _to_forward_dict(eegfwd, eegnames)
-        del eegels
+        eegfwd = pick_channels_forward(forward, eegnames, verbose=False)
     del eegnames
 
     # short circuit here if there are no MEG channels (don't need to iterate)
@@ -830,54 +843,13 @@ def _iter_forward_solutions(
         yield eegfwd
         return
 
-    coord_frame = FIFF.FIFFV_COORD_HEAD
-    if bem is not None and not bem["is_sphere"]:
-        idx = np.where(
-            np.array([s["id"] for s in bem["surfs"]]) == FIFF.FIFFV_BEM_SURF_ID_BRAIN
-        )[0]
-        assert len(idx) == 1
-        # make a copy so it isn't mangled in use
-        bem_surf = transform_surface_to(
-            bem["surfs"][idx[0]], coord_frame, mri_head_t, copy=True
-        )
-    megcoils = sensors["meg"]["defs"]
-    if "eeg" in sensors:
-        del sensors["eeg"]
     megnames = sensors["meg"]["ch_names"]
     fwds = dict()
     if eegfwd is not None:
         fwds["eeg"] = eegfwd
     del eegfwd
-    for ti, dev_head_t in enumerate(dev_head_ts):
-        # Could be *slightly* more efficient not to do this N times,
-        # but the cost here is tiny compared to actual fwd calculation
-        logger.info(f"Computing gain matrix for transform #{ti + 1}/{len(dev_head_ts)}")
-        _transform_orig_meg_coils(megcoils, dev_head_t)
-
-        # Make sure our sensors are all outside our BEM
-        coil_rr = np.array([coil["r0"] for coil in megcoils])
-
-        # Compute forward
-        if forward is None:
-            if not bem["is_sphere"]:
-                outside = ~_CheckInside(bem_surf)(coil_rr, n_jobs=n_jobs, verbose=False)
-            elif bem.radius is not None:
-                d = coil_rr - bem["r0"]
-                outside = np.sqrt(np.sum(d * d, axis=1)) > bem.radius
-            else:  # only r0 provided
-                outside = np.ones(len(coil_rr), bool)
-            if not outside.all():
-                raise RuntimeError(
-                    f"{np.sum(~outside)} MEG sensors collided with inner skull "
-                    f"surface for transform {ti}"
-                )
-            megfwd = _compute_forwards(
-                rr, sensors=sensors, bem=bem, n_jobs=n_jobs, verbose=False
-            )["meg"]
-            megfwd = _to_forward_dict(megfwd, megnames)
-        else:
-            megfwd = pick_channels_forward(forward, megnames, verbose=False)
-        fwds["meg"] = megfwd
+    for _ in dev_head_ts:
+        fwds["meg"] = pick_channels_forward(forward, megnames, verbose=False)
         fwd = _merge_fwds(fwds, verbose=False)
         fwd.update(**update_kwargs)
 
@@ -19,7 +19,7 @@ from .baseline import rescale
 from .cov import Covariance
 from .evoked import _get_peak
 from .filter import FilterMixin, _check_fun, resample
-from .fixes import _reshape_view, _safe_svd
+from .fixes import _reshape_view, _safe_svd, has_numba, jit
 from .parallel import parallel_func
 from .source_space._source_space import (
     SourceSpaces,
@@ -3396,6 +3396,188 @@ _label_funcs = {
 }
 
 
+class _LabelOperator:
+    """Precomputed extraction of label time courses.
+
+    The labels (and, for mixed source spaces, the volume source spaces to
+    average) are stacked into sparse operators once, so that each source
+    estimate only needs a single sparse-dense product and vectorized
+    reductions.
+    """
+
+    def __init__(self, label_vertidx, label_flip, mode, nvert, n_mean):
+        assert mode in ("mean", "mean_flip", "max", "pca_flip")
+        self.mode = mode
+        nvert = np.asarray(nvert)
+        n_sources = nvert.sum()
+        self.n_labels = len(label_vertidx) + n_mean
+        # the means of the volume source spaces of mixed ones
+        nvert_mean = nvert[len(nvert) - n_mean :]
+        mean_op = sparse.csr_array(
+            (
+                np.repeat(1.0 / np.maximum(nvert_mean, 1), nvert_mean),
+                (
+                    np.repeat(np.arange(n_mean), nvert_mean),
+                    np.arange(n_sources - nvert_mean.sum(), n_sources),
+                ),
+            ),
+            shape=(n_mean, n_sources),
+        )
+        # stack the label vertices (or interpolation rows) into one operator
+        blocks, flips = list(), list()
+        for vertidx, flip in zip(label_vertidx, label_flip):
+            if vertidx is None:
+                vertidx = sparse.csr_array((0, n_sources))
+            elif not isinstance(vertidx, sparse.csr_array):
+                vertidx = sparse.csr_array(
+                    (np.ones(len(vertidx)), vertidx, np.arange(len(vertidx) + 1)),
+                    shape=(len(vertidx), n_sources),
+                )
+            assert vertidx.shape[1] == n_sources
+            blocks.append(vertidx)
+            if flip is None:
+                flip = np.ones(vertidx.shape[0])
+            flips.append(np.reshape(flip, -1))
+        sizes = np.array([block.shape[0] for block in blocks], int)
+        self.stops = np.cumsum(sizes)
+        self.starts = self.stops - sizes
+        self.expand = sparse.vstack(blocks + [mean_op[:0]], format="csr")
+        # plain vertex selections are faster to gather than to multiply
+        expand = self.expand
+        self.idx = None
+        if np.array_equal(expand.indptr, np.arange(expand.shape[0] + 1)) and np.all(
+            expand.data == 1
+        ):
+            self.idx = expand.indices
+        self.flip = np.concatenate(flips + [np.zeros(0)])
+        if mode in ("mean", "mean_flip"):
+            # these are linear, so precompose everything into one operator
+            weights = np.repeat(1.0 / np.maximum(sizes, 1), sizes)
+            if mode == "mean_flip":
+                weights = weights * self.flip
+            reduce = sparse.csr_array(
+                (weights, np.arange(len(weights)), np.concatenate([[0], self.stops])),
+                shape=(len(sizes), len(weights)),
+            )
+            self.op = sparse.vstack([reduce @ self.expand, mean_op], format="csr")
+        else:
+            self.mean_op = mean_op
+
+    def __call__(self, data):
+        """Extract the label time courses from source data."""
+        shape = data.shape[1:]
+        data = np.reshape(data, (data.shape[0], -1))
+        if self.mode in ("mean", "mean_flip"):
+            out = self.op @ data
+        else:
+            n_mode = len(self.starts)
+            out = np.zeros((self.n_labels, data.shape[1]), data.dtype)
+            if self.mode == "max" and self.idx is not None:
+                maxes = np.zeros((n_mode, data.shape[1]), np.abs(data[:0]).dtype)
+                _label_max(
+                    np.ascontiguousarray(data), self.idx, self.starts, self.stops, maxes
+                )
+                out[:n_mode] = maxes
+            else:
+                for l0, l1, rows, starts, stops in self._iter_rows(data):
+                    if self.mode == "max":
+                        maxes = np.zeros((l1 - l0, data.shape[1]), rows.real.dtype)
+                        idx = np.arange(len(rows))
+                        _label_max(rows, idx, starts, stops, maxes)
+                        out[l0:l1] = maxes
+                    else:
+                        flip = self.flip[self.starts[l0] : self.stops[l1 - 1]]
+                        out[l0:l1] = _pca_flip_segments(rows, starts, stops, flip)
+            out[n_mode:] = self.mean_op @ data
+        return _reshape_view(
+            out.astype(data.dtype, copy=False), (self.n_labels,) + shape
+        )
+
+    def _iter_rows(self, data):
+        # gather the rows of as many labels at once as memory allows
+        n_rows = max(_LABEL_ROWS_BYTES // (16 * data.shape[1]), 1)
+        l0 = 0
+        while l0 < len(self.starts):
+            r0 = self.starts[l0]
+            l1 = max(np.searchsorted(self.stops, r0 + n_rows, "right"), l0 + 1)
+            r1 = self.stops[l1 - 1]
+            if self.idx is None:
+                rows = self.expand[r0:r1] @ data
+            else:
+                rows = data[self.idx[r0:r1]]
+            yield l0, l1, rows, self.starts[l0:l1] - r0, self.stops[l0:l1] - r0
+            l0 = l1
+
+
+def _label_max_numpy(data, idx, starts, stops, out):
+    for li, (start, stop) in enumerate(zip(starts, stops)):
+        if stop > start:
+            out[li] = np.max(np.abs(data[idx[start:stop]]), axis=0)
+
+
+@jit(fastmath=False)  # we need NaN propagation
+def _label_max_numba(data, idx, starts, stops, out):  # pragma: no cover
+    # a single pass over the data without any temporary copies
+    for li in range(len(starts)):
+        for ri in range(starts[li], stops[li]):
+            row = data[idx[ri]]
+            for ti in range(len(row)):
+                val = abs(row[ti])
+                if ri == starts[li] or val > out[li, ti] or val != val:
+                    out[li, ti] = val
+
+
+if has_numba:
+    _label_max = _label_max_numba
+else:
+    _label_max = _label_max_numpy
+
+
+_LABEL_ROWS_BYTES = 2**25  # size of the label data gathered at once
+_PCA_FLIP_BATCH_BYTES = 2**25  # size of the stacked label data for pca_flip
+
+
+def _pca_flip_segments(rows, starts, stops, flip):
+    """Compute the pca_flip time courses of contiguous groups of rows."""
+    # The first right singular vector (and singular value) of each label's
+    # data is obtained from the largest eigenpair of its (small) Gram matrix.
+    # Labels of similar size are padded with zeros (which does not change the
+    # result) and stacked to solve many eigenproblems in one call.
+    n_labels, n_times = len(starts), rows.shape[1]
+    out = np.zeros((n_labels, n_times), rows.dtype)
+    sizes = stops - starts
+    use_gram = (sizes > 0) & (sizes <= n_times) & (rows.dtype.kind == "f")
+    for li in np.where((sizes > 0) & ~use_gram)[0]:
+        this_flip = flip[starts[li] : stops[li], np.newaxis]
+        out[li] = _pca_flip(this_flip, rows[starts[li] : stops[li]])
+    rows = np.concatenate([rows, np.zeros((1, n_times), rows.dtype)])
+    flip = np.concatenate([flip, [0.0]])
+    # buckets of sizes within a factor of 2 ** 0.25 of one another
+    label_idx = np.where(use_gram)[0]
+    buckets = np.floor(4 * np.log2(np.maximum(sizes[label_idx], 1))).astype(int)
+    for bucket in np.unique(buckets):
+        bucket_idx = label_idx[buckets == bucket]
+        n_pad = sizes[bucket_idx].max()
+        n_batch = _PCA_FLIP_BATCH_BYTES // (rows.itemsize * n_pad * n_times)
+        for batch_start in range(0, len(bucket_idx), max(n_batch, 1)):
+            batch_idx = bucket_idx[batch_start : batch_start + max(n_batch, 1)]
+            pad_idx = starts[batch_idx, np.newaxis] + np.arange(n_pad)
+            pad_idx[pad_idx >= stops[batch_idx, np.newaxis]] = len(rows) - 1
+            data = rows[pad_idx]
+            gram = data @ data.transpose(0, 2, 1)
+            w, v = np.linalg.eigh(gram)
+            u, s = v[..., -1], np.sqrt(np.maximum(w[:, -1], 0))
+            # determine sign-flip
+            sign = np.sign(np.sum(u * flip[pad_idx], axis=1))
+            # use average power in label for scaling
+            scale = np.sqrt(np.trace(gram, axis1=1, axis2=2) / sizes[batch_idx])
+            weight = np.zeros(len(batch_idx))
+            np.divide(sign * scale, s, out=weight, where=s > 0)
+            # V[0] = U[:, 0] @ data / s[0]
+            out[batch_idx] = ((u * weight[:, np.newaxis])[:, np.newaxis] @ data)[:, 0]
+    return out
+
+
 @contextlib.contextmanager
 def _temporary_vertices(src, vertices):
     orig_vertices = [s["vertno"] for s in src]
@@ -3681,7 +3863,7 @@ def _gen_extract_label_time_course(
     n_mode = len(labels)  # how many processed with the given mode
     n_mean = len(src[2:]) if kind == "mixed" else 0
     n_labels = n_mode + n_mean
-    vertno = func = None
+    vertno = func = label_op = None
     for si, stc in enumerate(stcs):
         _validate_type(stc, _BaseSourceEstimate, f"stcs[{si}]", "source estimate")
         _check_option(
@@ -3700,7 +3882,10 @@ def _gen_extract_label_time_course(
             label_vertidx, src_flip = _prepare_label_extraction(
                 stc, labels, src, mode, allow_empty, use_sparse
             )
-            func = _label_funcs[mode]
+            if mode is None:
+                func = _label_funcs[mode]
+            else:
+                label_op = _LabelOperator(label_vertidx, src_flip, mode, nvert, n_mean)
         # make sure the stc is compatible with the source space
         if len(vertno) != len(stc.vertices):
             raise ValueError("stc not compatible with source space")
@@ -3722,30 +3907,21 @@ def _gen_extract_label_time_course(
         if mode is None:
             # prepopulate an empty list for easy array-like index-based assignment
             label_tc = [None] * max(len(label_vertidx), len(src_flip))
+            for i, (vertidx, flip) in enumerate(zip(label_vertidx, src_flip)):
+                if vertidx is not None:
+                    if isinstance(vertidx, sparse.csr_array):
+                        assert mri_resolution
+                        assert vertidx.shape[1] == stc.data.shape[0]
+                        this_data = np.reshape(stc.data, (stc.data.shape[0], -1))
+                        this_data = vertidx @ this_data
+                        this_data = _reshape_view(
+                            this_data, (this_data.shape[0],) + stc.data.shape[1:]
+                        )
+                    else:
+                        this_data = stc.data[vertidx]
+                    label_tc[i] = func(flip, this_data)
         else:
-            # For other modes, initialize the label_tc array
-            label_tc = np.zeros((n_labels,) + stc.data.shape[1:], dtype=stc.data.dtype)
-        for i, (vertidx, flip) in enumerate(zip(label_vertidx, src_flip)):
-            if vertidx is not None:
-                if isinstance(vertidx, sparse.csr_array):
-                    assert mri_resolution
-                    assert vertidx.shape[1] == stc.data.shape[0]
-                    this_data = np.reshape(stc.data, (stc.data.shape[0], -1))
-                    this_data = vertidx @ this_data
-                    this_data = _reshape_view(
-                        this_data, (this_data.shape[0],) + stc.data.shape[1:]
-                    )
-                else:
-                    this_data = stc.data[vertidx]
-                label_tc[i] = func(flip, this_data)
-
-        if mode is not None:
-            offset = nvert[:-n_mean].sum()  # effectively :2 or :0
-            for i, nv in enumerate(nvert[2:]):
-                if nv != 0:
-                    v2 = offset + nv
-                    label_tc[n_mode + i] = np.mean(stc.data[offset:v2], axis=0)
-                    offset = v2
+            label_tc = label_op(stc.data)
         yield label_tc
 
 
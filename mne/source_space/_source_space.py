@@ -8,9 +8,9 @@
 import os
 import os.path as op
 from copy import deepcopy
-from functools import partial
 
 import numpy as np
+from scipy import sparse
 from scipy.sparse import csr_array, triu
 from scipy.sparse.csgraph import dijkstra
 from scipy.spatial.distance import cdist
@@ -41,7 +41,7 @@ from .._freesurfer import (
     read_freesurfer_lut,
 )
 from ..bem import ConductorModel, read_bem_surfaces
-from ..fixes import _get_img_fdata, _reshape_view
+from ..fixes import _get_img_fdata, _reshape_view, has_numba, jit
 from ..parallel import parallel_func
 from ..surface import (
     _CheckInside,
@@ -74,6 +74,7 @@ from ..utils import (
     _check_fname,
     _check_option,
     _check_sphere,
+    _ContentCache,
     _ensure_int,
     _get_call_line,
     _import_nibabel,
@@ -2415,8 +2416,12 @@ def _add_interpolator(sp):
     logger.info("[done]")
 
 
-def _grid_interp(from_shape, to_shape, trans, order=1, inuse=None):
-    """Compute a grid-to-grid linear or nearest interpolation given."""
+def _grid_interp(from_shape, to_shape, trans, order=1, inuse=None, *, disp=None):
+    """Compute a grid-to-grid linear or nearest interpolation given.
+
+    If provided, ``disp(rr)`` gives the (n_points, 3) displacements in "from"
+    voxels to add to the transformed homogeneous "to" voxels ``rr`` (4, n_points).
+    """
     from_shape = np.array(from_shape, int)
     to_shape = np.array(to_shape, int)
     trans = np.array(trans, np.float64)  # to -> from
@@ -2427,7 +2432,9 @@ def _grid_interp(from_shape, to_shape, trans, order=1, inuse=None):
         inuse = np.ones(shape[1], bool)
     assert inuse.dtype == np.dtype(bool)
     assert inuse.shape == (shape[1],)
-    data, indices, indptr = _grid_interp_jit(from_shape, to_shape, trans, order, inuse)
+    data, indices, indptr = _grid_interp_jit(
+        from_shape, to_shape, trans, order, inuse, disp
+    )
     data = np.concatenate(data)
     indices = np.concatenate(indices)
     indptr = np.cumsum(indptr)
@@ -2436,7 +2443,7 @@ def _grid_interp(from_shape, to_shape, trans, order=1, inuse=None):
 
 
 # This is all set up to do jit, but it's actually slower!
-def _grid_interp_jit(from_shape, to_shape, trans, order, inuse):
+def _grid_interp_jit(from_shape, to_shape, trans, order, inuse, disp=None):
     # Loop over slices to save (lots of) memory
     # Note that it is the slowest incrementing index
     # This is equivalent to using mgrid and reshaping, but faster
@@ -2461,6 +2468,8 @@ def _grid_interp_jit(from_shape, to_shape, trans, order, inuse):
         # frame (this is labeled as FIFFV_MNE_COORD_MRI_VOXEL, but it's
         # really a subset of the entire volume!)
         r0 = (trans @ r0_)[:3].T
+        if disp is not None:
+            r0 += disp(r0_)
         if order == 0:
             rx = np.round(r0).astype(np.int32)
             keep = np.where(
@@ -2730,7 +2739,15 @@ def add_source_space_distances(src, dist_limit=np.inf, n_jobs=None, *, verbose=N
 
     We recommend computing distances once per source space and then saving
     the source space to disk, as the computed distances will automatically be
-    stored along with the source space data for future use.
+    stored along with the source space data for future use. When the
+    ``MNE_PERSISTENT_CACHE_DIR`` config value is set, the distances are also
+    cached there per surface, so that other source spaces on the same surface
+    (e.g., a different decimation) only compute the distances that are
+    missing.
+
+    .. versionchanged:: 1.13
+       With Numba installed, the distances are computed in threads, and
+       computation stops at ``dist_limit``.
     """
     src = _ensure_src(src)
     dist_limit = float(dist_limit)
@@ -2740,7 +2757,6 @@ def add_source_space_distances(src, dist_limit=np.inf, n_jobs=None, *, verbose=N
     if src.kind != "surface":
         raise RuntimeError("Currently all source spaces must be of surface type")
 
-    parallel, p_fun, n_jobs = parallel_func(_do_src_distances, n_jobs)
     min_dists = list()
     min_idxs = list()
     msg = "patch information" if patch_only else "source space distances"
@@ -2753,38 +2769,22 @@ def add_source_space_distances(src, dist_limit=np.inf, n_jobs=None, *, verbose=N
         )
     for s in src:
         adjacency = mesh_dist(s["tris"], s["rr"])
+        # the nearest source of each vertex in a single multi-source pass
+        min_dist, _, min_idx = dijkstra(
+            adjacency,
+            indices=s["vertno"],
+            min_only=True,
+            return_predecessors=True,
+            limit=np.inf if patch_only else dist_limit,
+        )
+        min_idxs.append(min_idx)
         if patch_only:
-            min_dist, _, min_idx = dijkstra(
-                adjacency, indices=s["vertno"], min_only=True, return_predecessors=True
-            )
             min_dists.append(min_dist.astype(np.float32))
-            min_idxs.append(min_idx)
             for key in ("dist", "dist_limit"):
                 s[key] = None
         else:
-            d = parallel(
-                p_fun(adjacency, s["vertno"], r, dist_limit)
-                for r in np.array_split(np.arange(len(s["vertno"])), n_jobs)
-            )
-            # deal with indexing so we can add patch info
-            min_idx = np.array([dd[1] for dd in d])
-            min_dist = np.array([dd[2] for dd in d])
-            midx = np.argmin(min_dist, axis=0)
-            range_idx = np.arange(len(s["rr"]))
-            min_dist = min_dist[midx, range_idx]
-            min_idx = min_idx[midx, range_idx]
             min_dists.append(min_dist)
-            min_idxs.append(min_idx)
-            # convert to sparse representation
-            d = np.concatenate([dd[0] for dd in d]).ravel()  # already float32
-            idx = d > 0
-            d = d[idx]
-            i, j = np.meshgrid(s["vertno"], s["vertno"])
-            i = i.ravel()[idx]
-            j = j.ravel()[idx]
-            s["dist"] = csr_array(
-                (d, (i, j)), shape=(s["np"], s["np"]), dtype=np.float32
-            )
+            s["dist"] = _get_src_distances(adjacency, s, dist_limit, n_jobs)
             s["dist_limit"] = np.array([dist_limit], np.float32)
 
     # Let's see if our distance was sufficient to allow for patch info
@@ -2799,29 +2799,187 @@ def add_source_space_distances(src, dist_limit=np.inf, n_jobs=None, *, verbose=N
     return src
 
 
-def _do_src_distances(con, vertno, run_inds, limit):
-    """Compute source space distances in chunks."""
-    func = partial(dijkstra, limit=limit)
+# The distances of the high-resolution surface are reused across source space
+# decimations (and incrementally extended), but as they can take up a lot of
+# memory they are only cached on disk (when MNE_PERSISTENT_CACHE_DIR is set)
+_src_dist_cache = _ContentCache("source_space_distances", maxsize=0)
+
+
+def _get_src_distances(adjacency, s, dist_limit, n_jobs):
+    """Get the sparse distances between the sources of a surface."""
+    n_vertices = s["np"]
+    vertno = s["vertno"]
+    # see which distances were already computed for this surface
+    key = (s["tris"], s["rr"], dist_limit)
+    cached = _src_dist_cache.get(key)
+    done = np.zeros(n_vertices, bool)
+    if cached is None:
+        dist = csr_array((n_vertices, n_vertices), dtype=np.float32)
+    else:
+        done[cached["vertno"]] = True
+        dist = csr_array(
+            (cached["data"], cached["indices"], cached["indptr"]),
+            shape=(n_vertices, n_vertices),
+        )
+    todo = vertno[~done[vertno]]
+    logger.info(
+        f"    Computing distances for {len(todo)}/{len(vertno)} sources "
+        f"({len(vertno) - len(todo)} cached)"
+    )
+    if len(todo):
+        # compute the new rows (for all vertices we keep)
+        targets = np.union1d(vertno, np.where(done)[0])
+        parallel, p_fun, n_jobs = parallel_func(
+            _do_src_distances,
+            n_jobs,
+            max_jobs=len(todo),
+            prefer="threads" if has_numba else None,
+        )
+        out = parallel(
+            p_fun(adjacency, sources, targets, dist_limit)
+            for sources in np.array_split(todo, n_jobs)
+        )
+        # (todo, targets) -> (n_vertices, n_vertices), todo is sorted
+        counts, indices, data = (np.concatenate(oo) for oo in zip(*out))
+        del out
+        indptr = np.zeros(n_vertices + 1, np.int64)
+        indptr[todo + 1] = counts
+        rows = csr_array(
+            (data, indices, np.cumsum(indptr)), shape=(n_vertices, n_vertices)
+        )
+        del counts, indices, data
+        if done.any():  # also fill in the old rows
+            rows = csr_array(dist + rows + (rows * done).T, dtype=np.float32)
+            rows.sort_indices()
+        dist = rows
+        _src_dist_cache.set(
+            key,
+            dict(
+                vertno=targets,
+                data=dist.data,
+                indices=dist.indices,
+                indptr=dist.indptr,
+            ),
+        )
+    if done.any():
+        # subselect our sources (this also copies any cached arrays)
+        use = np.isin(np.arange(n_vertices), vertno).astype(np.float32)
+        use = sparse.diags_array(use)
+        dist = csr_array(use @ dist @ use, dtype=np.float32)
+        dist.eliminate_zeros()
+    return dist
+
+
+def _do_src_distances(con, sources, targets, limit):
+    """Compute the distances from sources to targets in chunks."""
+    target_idx = np.full(con.shape[0], -1, np.int64)
+    target_idx[targets] = np.arange(len(targets))
+    con = (
+        con.indptr.astype(np.int64),
+        con.indices.astype(np.int64),
+        con.data.astype(np.float64),
+    )
     chunk_size = 20  # save memory by chunking (only a little slower)
-    lims = np.r_[np.arange(0, len(run_inds), chunk_size), len(run_inds)]
-    n_chunks = len(lims) - 1
-    # eventually we want this in float32, so save memory by only storing 32-bit
-    d = np.empty((len(run_inds), len(vertno)), np.float32)
-    min_dist = np.empty((n_chunks, con.shape[0]))
-    min_idx = np.empty((n_chunks, con.shape[0]), np.int32)
-    range_idx = np.arange(con.shape[0])
-    for li, (l1, l2) in enumerate(zip(lims[:-1], lims[1:])):
-        idx = vertno[run_inds[l1:l2]]
-        out = func(con, indices=idx)
-        midx = np.argmin(out, axis=0)
-        min_idx[li] = idx[midx]
-        min_dist[li] = out[midx, range_idx]
-        d[l1:l2] = out[:, vertno]
-    midx = np.argmin(min_dist, axis=0)
-    min_dist = min_dist[midx, range_idx]
-    min_idx = min_idx[midx, range_idx]
-    d[d == np.inf] = 0  # scipy will give us np.inf for uncalc. distances
-    return d, min_idx, min_dist
+    counts, indices, dists = list(), list(), list()
+    for start in range(0, len(sources), chunk_size):
+        idx = sources[start : start + chunk_size].astype(np.int64)
+        # eventually we want this in float32, so save memory by only storing
+        # 32-bit, and zeros (self and beyond the limit) are dropped
+        out = np.zeros((len(idx), len(targets)), np.float32)
+        _bounded_dijkstra(*con, idx, target_idx, limit, out)
+        mask = out != 0
+        counts.append(mask.sum(axis=1))
+        indices.append(targets[np.nonzero(mask)[1]])
+        dists.append(out[mask])
+    return np.concatenate(counts), np.concatenate(indices), np.concatenate(dists)
+
+
+def _bounded_dijkstra_scipy(indptr, indices, data, sources, target_idx, limit, out):
+    con = csr_array((data, indices, indptr), shape=(len(target_idx),) * 2)
+    targets = np.where(target_idx >= 0)[0]
+    dist = dijkstra(con, indices=sources, limit=limit)[:, targets]
+    dist[dist == np.inf] = 0  # scipy will give us np.inf for uncalc. distances
+    out[:, target_idx[targets]] = dist
+
+
+@jit(fastmath=False)  # we rely on np.inf
+def _bounded_dijkstra_numba(
+    indptr, indices, data, sources, target_idx, limit, out
+):  # pragma: no cover
+    # Dijkstra's algorithm that stops at the limit, and only touches (and
+    # resets) the vertices within it. This releases the GIL, so it can run in
+    # threads.
+    n_vertices = len(indptr) - 1
+    dist = np.full(n_vertices, np.inf)
+    visited = np.zeros(n_vertices, np.bool_)
+    touched = np.empty(n_vertices, np.int64)
+    # binary min-heap (with lazy deletion, so at most one entry per edge)
+    heap_dist = np.empty(len(indices) + 1)
+    heap_vertex = np.empty(len(indices) + 1, np.int64)
+    for si in range(len(sources)):
+        source = sources[si]
+        dist[source] = 0.0
+        touched[0] = source
+        n_touched = 1
+        heap_dist[0] = 0.0
+        heap_vertex[0] = source
+        n_heap = 1
+        while n_heap:
+            # pop
+            this_dist = heap_dist[0]
+            vertex = heap_vertex[0]
+            n_heap -= 1
+            last_dist = heap_dist[n_heap]
+            last_vertex = heap_vertex[n_heap]
+            pos = 0
+            while True:
+                child = 2 * pos + 1
+                if child >= n_heap:
+                    break
+                if child + 1 < n_heap and heap_dist[child + 1] < heap_dist[child]:
+                    child += 1
+                if heap_dist[child] >= last_dist:
+                    break
+                heap_dist[pos] = heap_dist[child]
+                heap_vertex[pos] = heap_vertex[child]
+                pos = child
+            heap_dist[pos] = last_dist
+            heap_vertex[pos] = last_vertex
+            if visited[vertex]:
+                continue
+            visited[vertex] = True
+            if target_idx[vertex] >= 0:
+                out[si, target_idx[vertex]] = this_dist
+            for ii in range(indptr[vertex], indptr[vertex + 1]):
+                other = indices[ii]
+                other_dist = this_dist + data[ii]
+                if other_dist > limit or other_dist >= dist[other]:
+                    continue
+                if dist[other] == np.inf:
+                    touched[n_touched] = other
+                    n_touched += 1
+                dist[other] = other_dist
+                # push
+                pos = n_heap
+                n_heap += 1
+                while pos > 0:
+                    parent = (pos - 1) // 2
+                    if heap_dist[parent] <= other_dist:
+                        break
+                    heap_dist[pos] = heap_dist[parent]
+                    heap_vertex[pos] = heap_vertex[parent]
+                    pos = parent
+                heap_dist[pos] = other_dist
+                heap_vertex[pos] = other
+        for ii in range(n_touched):
+            dist[touched[ii]] = np.inf
+            visited[touched[ii]] = False
+
+
+if has_numba:
+    _bounded_dijkstra = _bounded_dijkstra_numba
+else:
+    _bounded_dijkstra = _bounded_dijkstra_scipy
 
 
 # XXX this should probably be removed because it returns surface Labels,
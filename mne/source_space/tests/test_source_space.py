@@ -12,6 +12,7 @@ from numpy.testing import (
     assert_array_less,
     assert_equal,
 )
+from scipy.sparse.csgraph import dijkstra
 
 import mne
 from mne import (
@@ -34,15 +35,27 @@ from mne import (
 from mne._fiff.constants import FIFF
 from mne._fiff.pick import _picks_to_idx
 from mne.datasets import testing
-from mne.fixes import _get_img_fdata
+from mne.fixes import _get_img_fdata, has_numba
 from mne.source_estimate import _get_src_type
 from mne.source_space import (
+    _source_space,
     compute_distance_to_sensors,
     get_decimated_surfaces,
 )
-from mne.source_space._source_space import _compare_source_spaces
-from mne.surface import _accumulate_normals, _triangle_neighbors
-from mne.utils import _record_warnings, copytree_rw, requires_mne, run_subprocess
+from mne.source_space._source_space import SourceSpaces, _compare_source_spaces
+from mne.surface import (
+    _accumulate_normals,
+    _get_ico_surface,
+    _triangle_neighbors,
+    mesh_dist,
+)
+from mne.utils import (
+    _ContentCache,
+    _record_warnings,
+    copytree_rw,
+    requires_mne,
+    run_subprocess,
+)
 
 data_path = testing.data_path(download=False)
 subjects_dir = data_path / "subjects"
@@ -271,6 +284,61 @@ def test_add_source_space_distances(tmp_path):
         assert_allclose(np.zeros_like(d.data), d.data, rtol=0, atol=1e-9)
 
 
+def _ico_src(vertno):
+    surf = _get_ico_surface(3)
+    n_vertices = len(surf["rr"])
+    src = list()
+    for id_ in (FIFF.FIFFV_MNE_SURF_LEFT_HEMI, FIFF.FIFFV_MNE_SURF_RIGHT_HEMI):
+        src.append(
+            dict(
+                rr=surf["rr"] * 0.08,
+                nn=surf["rr"],
+                tris=surf["tris"],
+                np=n_vertices,
+                ntri=len(surf["tris"]),
+                vertno=vertno,
+                nuse=len(vertno),
+                inuse=np.isin(np.arange(n_vertices), vertno).astype(int),
+                type="surf",
+                id=id_,
+                coord_frame=FIFF.FIFFV_COORD_MRI,
+            )
+        )
+    return SourceSpaces(src)
+
+
+@pytest.mark.parametrize("kernel", ("numba", "scipy"))
+@pytest.mark.parametrize("dist_limit", (0.01, np.inf))
+def test_add_source_space_distances_cache(kernel, dist_limit, monkeypatch):
+    """Test that source space distances are reused and extended."""
+    if kernel == "numba" and not has_numba:
+        pytest.skip("Numba not installed")
+    monkeypatch.setattr(
+        _source_space,
+        "_bounded_dijkstra",
+        getattr(_source_space, f"_bounded_dijkstra_{kernel}"),
+    )
+    monkeypatch.delenv("MNE_PERSISTENT_CACHE_DIR", raising=False)
+    cache = _ContentCache("source_space_distances", maxsize=1)
+    monkeypatch.setattr(_source_space, "_src_dist_cache", cache)
+    vertno = np.arange(0, 642, 3)
+    src = _ico_src(vertno)
+    want = dijkstra(mesh_dist(src[0]["tris"], src[0]["rr"]), limit=dist_limit)
+    want[np.isinf(want)] = 0
+    # a subset, then extend it to all sources, then a subset of those
+    for use in (vertno[::2], vertno, vertno[1::4]):
+        src = _ico_src(use)
+        add_source_space_distances(src, dist_limit=dist_limit, n_jobs=2)
+        dist = src[0]["dist"]
+        assert dist.dtype == np.float32
+        dist_want = np.zeros_like(want)
+        dist_want[np.ix_(use, use)] = want[np.ix_(use, use)]
+        assert_allclose(dist.toarray(), dist_want, rtol=1e-6)
+    assert_array_equal(
+        cache.get((src[0]["tris"], src[0]["rr"], dist_limit))["vertno"], vertno
+    )
+
+
 @testing.requires_testing_data
 @requires_mne
 def test_discrete_source_space(tmp_path):
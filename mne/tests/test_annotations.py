@@ -635,6 +635,92 @@ def test_annotation_epoching():
     assert_equal([0, 2, 4], epochs.selection)
 
 
+def test_annotation_index():
+    """Test finding the annotations overlapping many segments at once."""
+    rng = np.random.default_rng(0)
+    onset = rng.uniform(0, 100, 500)
+    duration = rng.uniform(0, 2, 500) * rng.integers(0, 2, 500)
+    duration[::50] = np.nan
+    description = rng.choice(["BAD_a", "bad b", "Bad", "edge", "w"], 500)
+    annot = Annotations(onset, duration, description)
+    index = annot._get_index()
+    assert annot._get_index() is index  # cached
+    assert_array_equal(
+        index.kind_mask(("BAD", "Edge")), ~np.isin(annot.description, ["w"])
+    )
+
+    def first_overlap(tmin, tmax):
+        end = annot.onset + annot.duration
+        hits = np.flatnonzero(
+            (annot.onset < tmax) & (end > tmin) & index.kind_mask(("bad",))
+        )
+        return hits[0] if len(hits) else -1
+
+    tmin = rng.uniform(-5, 105, 2000)
+    tmax = tmin + rng.uniform(0, 0.5, 2000)
+    want = [first_overlap(*segment) for segment in zip(tmin, tmax)]
+    assert_array_equal(index.first_overlap(("bad",), tmin, tmax), want)
+    assert (np.array(want) == -1).any() and (np.array(want) >= 0).any()
+    want = [first_overlap(*segment) for segment in zip(tmin + 1, tmax + 1)]
+    assert_array_equal(index.first_overlap(("bad",), tmin, tmax, offset=1.0), want)
+
+    # changes in place are detected
+    annot.onset[0] += 10
+    annot.description[1] = "w"
+    index = annot._get_index()
+    assert not index.kind_mask(("bad",))[1]
+    want = [first_overlap(*segment) for segment in zip(tmin, tmax)]
+    assert_array_equal(index.first_overlap(("bad",), tmin, tmax), want)
+    assert_array_equal(index.first_overlap(("foo",), tmin, tmax), -1)
+    # as well as those of methods
+    for method, args in (
+        ("append", (50, 1, "bad")),
+        ("delete", (0,)),
+        ("crop", (10, 90)),
+        ("rename", ({"w": "bad w"},)),
+    ):
+        index = annot._get_index()
+        getattr(annot, method)(*args)
+        new_index = annot._get_index()
+        assert new_index is not index
+        assert new_index.matches(annot)
+
+
+@first_samps
+@pytest.mark.parametrize("meas_date", (None, 1e9))
+def test_annotation_epoching_many(first_samp, meas_date):
+    """Test rejecting epochs by many annotations."""
+    rng = np.random.default_rng(0)
+    info = create_info(1, 100.0, "eeg")
+    info.set_meas_date(meas_date)
+    raw = RawArray(np.ones((1, 60000)), info, first_samp=first_samp)
+    onset = rng.uniform(0, 600, 3000) + raw.first_time * (meas_date is not None)
+    description = rng.choice(["BAD_a", "bad b", "w"], 3000)
+    raw.set_annotations(Annotations(onset, 0.1, description, meas_date))
+    events = np.sort(rng.choice(np.arange(100, 59900), 1000, replace=False))
+    events = np.c_[events + first_samp, np.zeros((1000, 2), int) + [0, 1]]
+    kwargs = dict(tmin=-0.1, tmax=0.2, baseline=None, reject_tmax=0.1)
+    epochs = Epochs(raw, events, **kwargs).drop_bad()
+    onset = raw.annotations.onset - raw._first_time
+    bad = np.char.startswith(np.char.lower(raw.annotations.description), "bad")
+    want = list()
+    for event in events[:, 0] / raw.info["sfreq"] - raw.first_time:
+        hits = (onset < event + 0.11) & (onset + 0.1 > event - 0.1) & bad
+        want.append((raw.annotations.description[hits][0],) if hits.any() else ())
+    assert 0 < len(epochs) < len(events)
+    assert epochs.drop_log == tuple(want)
+    # the same epoch by epoch
+    data = np.array([epoch for epoch in Epochs(raw, events, **kwargs)])
+    assert_array_equal(data, epochs.get_data())
+    # data to use between the bad annotations
+    data, times = raw.get_data(reject_by_annotation="omit", return_times=True)
+    used = np.ones(len(raw.times), bool)
+    for start in np.round(onset[bad] * raw.info["sfreq"]).astype(int):
+        used[start : start + 10] = False
+    assert_array_equal(times, raw.times[used])
+    assert data.shape == (1, used.sum())
+
+
 @pytest.mark.parametrize("with_extras", [True, False])
 def test_annotation_concat(with_extras):
     """Test if two Annotations objects can be concatenated."""
@@ -33,14 +33,17 @@ from mne.bem import (
     _check_surface_size,
     _get_ico_map,
     _ico_downsample,
+    _lin_pot_coeff_rows,
+    _lin_pot_coeff_submat,
     _order_surfaces,
+    _surfaces_to_bem,
     distance_to_bem,
     fit_sphere_to_headshape,
     make_scalp_surfaces,
 )
 from mne.datasets import testing
 from mne.io import read_info
-from mne.surface import _get_ico_surface, read_surface
+from mne.surface import _get_ico_surface, complete_surface_info, read_surface
 from mne.transforms import translation
 from mne.utils import (
     _chmod_rw_R,
@@ -325,6 +328,53 @@ def test_bem_solution(tmp_path, cond, fname):
     _compare_bem_solutions(solution_read, solution)
 
 
+@pytest.mark.parametrize("same", [True, False])
+def test_lin_pot_coeff(same):
+    """Test the array and the per-point linear collocation coefficients."""
+    fro = complete_surface_info(_get_ico_surface(1))
+    to = fro if same else complete_surface_info(_get_ico_surface(2))
+    if not same:
+        to["rr"] *= 0.8
+    args = (fro["rr"], to["rr"][to["tris"]], to["tri_nn"], to["tri_area"])
+    want = np.zeros((len(fro["rr"]), len(to["rr"])))
+    _lin_pot_coeff_submat(*args, to["tris"], same, want)
+    assert np.abs(want).max() > 0.1
+    got = np.zeros_like(want)
+    _lin_pot_coeff_rows(*args, to["tris"], same, got)
+    assert_allclose(got, want, rtol=1e-10, atol=1e-12)
+    if same:  # no contribution of a vertex's own triangles
+        assert_allclose(np.diag(want), 0.0)
+
+
+def test_bem_solution_float32():
+    """Test making a BEM solution in single precision."""
+    surfs = list()
+    for rad in (90.0, 85.0, 80.0):
+        surf = _get_ico_surface(2)
+        surfs.append(dict(rr=surf["rr"] * rad, tris=surf["tris"]))
+    ids = [
+        FIFF.FIFFV_BEM_SURF_ID_HEAD,
+        FIFF.FIFFV_BEM_SURF_ID_SKULL,
+        FIFF.FIFFV_BEM_SURF_ID_BRAIN,
+    ]
+    surfs = _surfaces_to_bem(surfs, ids, (0.3, 0.006, 0.3))
+    solution = make_bem_solution(surfs)
+    assert solution["solution"].dtype == np.float64
+    with catch_logging() as log:
+        solution_32 = make_bem_solution(surfs, dtype="float32", verbose=True)
+    log = log.getvalue()
+    assert "IP approach required" in log
+    assert solution_32["solution"].dtype == np.float32
+    assert_allclose(
+        solution_32["solution"],
+        solution["solution"],
+        rtol=0,
+        atol=1e-5 * np.abs(solution["solution"]).max(),
+    )
+    with pytest.raises(ValueError, match="Invalid value for the 'dtype'"):
+        make_bem_solution(surfs, dtype="float16")
+
+
 def test_fit_sphere_to_headshape():
     """Test fitting a sphere to digitization points."""
     # Create points of various kinds
@@ -28,6 +28,7 @@ from mne.chpi import (
     get_active_chpi,
     get_chpi_info,
     head_pos_to_trans_rot_t,
+    iter_head_pos,
     read_head_pos,
     refit_hpi,
     write_head_pos,
@@ -333,6 +334,31 @@ def test_calculate_chpi_positions_preload():
     assert object_diff(pos, pos_preload) == ""
 
 
+@pytest.mark.slowtest
+@testing.requires_testing_data
+def test_iter_head_pos():
+    """Test chunked head position estimation and parallel coil fitting."""
+    raw = read_raw_fif(chpi_fif_fname, allow_maxshield="yes").crop(0, 5)
+    chpi_amplitudes = compute_chpi_amplitudes(raw, t_step_min=0.1)
+    chpi_locs = compute_chpi_locs(raw.info, chpi_amplitudes)
+    head_pos = compute_head_pos(raw.info, chpi_locs, weighted=True)
+    head_pos_iter = list(iter_head_pos(raw, 2.0, t_step_min=0.1))
+    assert_array_equal(np.concatenate(head_pos_iter), head_pos)
+    head_pos = compute_head_pos(raw.info, chpi_locs, weighted=False)
+    head_pos_iter = list(iter_head_pos(raw, 2.0, t_step_min=0.1, weighted=False))
+    assert len(head_pos_iter) == 3
+    for pos in head_pos_iter:
+        assert pos.ndim == 2 and pos.shape[1] == 10
+    assert_array_equal(np.concatenate(head_pos_iter), head_pos)
+    # splitting the coil fits into chunks only changes the warm starts
+    chpi_locs_par = compute_chpi_locs(raw.info, chpi_amplitudes, n_jobs=2)
+    assert_array_equal(chpi_locs_par["times"], chpi_locs["times"])
+    assert_allclose(chpi_locs_par["rrs"], chpi_locs["rrs"], atol=1e-4)
+    assert_allclose(chpi_locs_par["gofs"], chpi_locs["gofs"], atol=1e-3)
+    with pytest.raises(ValueError, match="must be positive"):
+        iter_head_pos(raw, 0.0)
+
+
 @pytest.mark.slowtest
 @testing.requires_testing_data
 def test_calculate_chpi_positions_vv():
@@ -38,7 +38,9 @@ from mne._fiff.pick import _DATA_CH_TYPES_SPLIT
 from mne.channels import equalize_channels
 from mne.cov import (
     _auto_low_rank_model,
+    _gram_covariance_ok,
     _regularized_covariance,
+    _regularized_covariance_gram,
     compute_whitener,
     prepare_noise_cov,
     regularize,
@@ -608,6 +610,30 @@ def test_regularized_covariance():
     assert_allclose(data, evoked.data, atol=1e-20)
 
 
+@pytest.mark.parametrize("reg", (None, "shrinkage", 0.3))
+@pytest.mark.parametrize("rank", (dict(seeg=5, mag=3), dict(seeg=3, mag=2)))
+def test_regularized_covariance_gram(reg, rank):
+    """Test regularized covariances from Gram matrices."""
+    pytest.importorskip("sklearn")
+    rng = np.random.default_rng(0)
+    info = create_info(8, 1000.0, ["seeg"] * 5 + ["mag"] * 3)
+    data = np.empty((4, 8, 200))
+    data[:, :5] = (
+        1e-5 * rng.standard_normal((4, 5, 3)) @ rng.standard_normal((4, 3, 200))
+    )
+    data[:, 5:] = 1e-12 * rng.standard_normal((4, 3, 200))
+    assert _gram_covariance_ok(reg, None, info, rank)
+    covs = _regularized_covariance_gram(
+        data @ data.transpose(0, 2, 1), 200, reg, info, rank
+    )
+    for this_data, cov in zip(data, covs):
+        want = _regularized_covariance(this_data, reg, None, info, rank=rank)
+        assert_allclose(cov, want, rtol=1e-7, atol=1e-10 * np.abs(want).max())
+    assert not _gram_covariance_ok("oas", None, info, rank)
+    assert not _gram_covariance_ok(reg, None, info, dict(seeg=5))
+    assert not _gram_covariance_ok(reg, None, info, "full")
+
+
 def test_auto_low_rank():
     """Test probabilistic low rank estimators."""
     pytest.importorskip("sklearn")
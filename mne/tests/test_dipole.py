@@ -35,7 +35,12 @@ from mne import (
 from mne._fiff.constants import FIFF
 from mne.bem import _bem_find_surface, read_bem_solution
 from mne.datasets import testing
-from mne.dipole import _BDIP_ERROR_KEYS, get_phantom_dipoles
+from mne.dipole import (
+    _BDIP_ERROR_KEYS,
+    _dipole_gof,
+    _dipole_gof_multi,
+    get_phantom_dipoles,
+)
 from mne.io import read_raw_ctf, read_raw_fif
 from mne.proj import make_eeg_average_ref_proj
 from mne.simulation import simulate_evoked
@@ -311,6 +316,24 @@ def test_dipole_fitting_fixed(tmp_path):
     assert_allclose(shift_times, orig_times + 1)
 
 
+def test_dipole_gof_multi():
+    """Test batched goodness of fit against the one-candidate version."""
+    rng = np.random.default_rng(0)
+    n_cand, n_chan, n_data = 20, 30, 5
+    fwd = rng.standard_normal((n_cand, 3, n_chan))
+    fwd[::2, 2] *= 1e-3  # some candidates only use two components
+    uu, sing, vv = np.linalg.svd(fwd, full_matrices=False)
+    B = rng.standard_normal((n_chan, n_data))
+    B2 = np.sum(B * B, axis=0)
+    gof = _dipole_gof_multi(sing, vv, B, B2)
+    assert gof.shape == (n_cand, n_data)
+    want = [
+        [_dipole_gof(u, s, v, b, b2)[0] for b, b2 in zip(B.T, B2)]
+        for u, s, v in zip(uu, sing, vv)
+    ]
+    assert_allclose(gof, want, rtol=1e-12)
+
+
 @testing.requires_testing_data
 def test_len_index_dipoles():
     """Test len and indexing of Dipole objects."""
@@ -17,6 +17,7 @@ from numpy.testing import (
 from mne import (
     Annotations,
     Epochs,
+    EventFinder,
     compute_raw_covariance,
     count_events,
     create_info,
@@ -414,6 +415,101 @@ def test_find_events():
         find_events(raw)
 
 
+def _random_stim_raw(rng, n_times=300, pulses=False):
+    """Make a raw instance with runs of random (also negative) stim values."""
+    values = list()
+    while len(values) < n_times:
+        value = rng.choice([0, 0, 1, 2, 3, 5, 6, -2, 70000])
+        values.extend([value] * rng.integers(1, 8))
+        if pulses:  # back to zero after each value
+            values.extend([0] * rng.integers(1, 4))
+    data = np.array(values[:n_times], float)
+    data = np.array([data, np.roll(data, 3)])
+    info = create_info(["STI1", "STI2"], 100.0, "stim")
+    return RawArray(data, info, first_samp=17, verbose=False)
+
+
+@pytest.mark.filterwarnings("ignore:.*negative values.*:RuntimeWarning")
+@pytest.mark.filterwarnings("ignore:.*duplicated.*:RuntimeWarning")
+@pytest.mark.parametrize("output", ("onset", "step", "offset"))
+@pytest.mark.parametrize("consecutive", ("increasing", True, False))
+def test_event_finder(output, consecutive):
+    """Test finding events in chunks of data like find_events."""
+    rng = np.random.default_rng(0)
+    # find_events can only pair up offsets and onsets of separate pulses
+    raw = _random_stim_raw(rng, pulses=output == "offset")
+    merge = 0 if output == "offset" else 1
+    for stim_channel, min_duration, mask, uint_cast, initial_event in (
+        ("STI1", 0, None, False, False),
+        ("STI1", 0.03 * merge, 3, True, True),
+        ("STI1", -0.03 * merge, None, False, True),
+        (["STI1", "STI2"], 0, None, True, False),
+        (["STI1", "STI2"], 0.03 * merge, 6, False, True),
+    ):
+        kwargs = dict(
+            stim_channel=stim_channel,
+            output=output,
+            consecutive=consecutive,
+            min_duration=min_duration,
+            shortest_event=1,
+            mask=mask,
+            uint_cast=uint_cast,
+            initial_event=initial_event,
+        )
+        want = find_events(raw, **kwargs)
+        assert len(want)
+        data = raw.get_data(stim_channel)
+        for _ in range(3):
+            finder = EventFinder(raw.info, first_samp=raw.first_samp, **kwargs)
+            cuts = np.sort(rng.choice(np.arange(1, len(raw.times)), 10, False))
+            online = [finder.process(chunk) for chunk in np.split(data, cuts, 1)]
+            events = finder.finish()
+            assert_array_equal(events, want)
+            # events are found while the data arrive, except at the end
+            online = np.concatenate(online)
+            n_online = len(online)
+            if isinstance(stim_channel, str):
+                if output != "offset" and len(online) > len(events):
+                    n_online -= 1  # onset without an offset
+                assert_array_equal(online[:n_online], events[:n_online])
+                assert len(events) - n_online <= 2
+    assert "STI1, STI2, 300 samples processed" in repr(finder)
+    assert finder.ch_names == ["STI1", "STI2"]
+    with pytest.raises(AttributeError):
+        finder.ch_names = ["STI1"]
+
+    with pytest.raises(RuntimeError, match="finish"):
+        finder.process(data)
+    with pytest.raises(RuntimeError, match="already"):
+        finder.finish()
+    finder = EventFinder(raw.info, "STI1", output="step")
+    with pytest.raises(ValueError, match="must have shape"):
+        finder.process(data)
+    finder.process([0, 1, 0, 2, 0])
+    with pytest.raises(ValueError, match="shorter than the shortest_event"):
+        finder.finish()
+
+
+@pytest.mark.filterwarnings("ignore:.*negative values.*:RuntimeWarning")
+@pytest.mark.filterwarnings("ignore:.*duplicated.*:RuntimeWarning")
+def test_find_events_not_preloaded(tmp_path, monkeypatch):
+    """Test find_events on data that are read in chunks."""
+    rng = np.random.default_rng(0)
+    raw = _random_stim_raw(rng, 3000)
+    raw.save(tmp_path / "test_raw.fif")
+    raw_read = read_raw_fif(tmp_path / "test_raw.fif")
+    monkeypatch.setattr("mne.event._FIND_EVENTS_CHUNK_BYTES", 8 * 2 * 123)
+    for kwargs in (
+        dict(),
+        dict(output="step", consecutive=True, min_duration=-0.03),
+        dict(output="step", consecutive=False, min_duration=0.03),
+        dict(output="offset", mask=3, mask_type="not_and", initial_event=True),
+    ):
+        kwargs.update(stim_channel=["STI1", "STI2"], shortest_event=1)
+        assert_array_equal(find_events(raw_read, **kwargs), find_events(raw, **kwargs))
+    assert not raw_read.preload
+
+
 def test_pick_events():
     """Test pick events in a events ndarray."""
     events = np.array([[1, 0, 1], [2, 1, 0], [3, 0, 4], [4, 4, 2], [5, 2, 0]])
@@ -35,9 +35,11 @@ from mne._freesurfer import _get_atlas_values, _get_mri_info_data
 from mne.datasets import testing
 from mne.fixes import _get_img_fdata
 from mne.minimum_norm import apply_inverse, make_inverse_operator, read_inverse_operator
+from mne.morph import _hemi_morph_mat, _reslice_interp, _sdr_interp
 from mne.source_space._source_space import _add_interpolator, _grid_interp
+from mne.surface import _get_ico_surface, write_surface
 from mne.transforms import quat_to_rot
-from mne.utils import _record_warnings, catch_logging
+from mne.utils import _ContentCache, _record_warnings, catch_logging
 
 # Setup paths
 
@@ -262,6 +264,56 @@ def test_surface_source_morph_round_trip(smooth, lower, upper, n_warn, dtype):
     assert_power_preserved(stc, stc_back)
 
 
+def test_surface_source_morph_apply_array(tmp_path, monkeypatch):
+    """Test morphing many surface source estimates at once."""
+    surf = _get_ico_surface(3)
+    (tmp_path / "sub" / "surf").mkdir(parents=True)
+    for hemi in ("lh", "rh"):
+        fname = tmp_path / "sub" / "surf" / f"{hemi}.sphere.reg"
+        write_surface(fname, surf["rr"] * 100, surf["tris"])
+    # the morph maps read from disk are what later morphs use (and hash)
+    mne.read_morph_map("sub", "sub", subjects_dir=tmp_path)
+    monkeypatch.setattr(
+        mne.morph, "_hemi_morph_cache", _ContentCache("surface_morph", 8)
+    )
+    n_computed = list()
+
+    def _count_hemi_morph_mat(*args):
+        n_computed.append(None)
+        return _hemi_morph_mat(*args)
+
+    monkeypatch.setattr(mne.morph, "_hemi_morph_mat", _count_hemi_morph_mat)
+    vertices = [np.arange(0, len(surf["rr"]), 3), np.arange(1, len(surf["rr"]), 4)]
+    n_from = sum(len(v) for v in vertices)
+    rng = np.random.RandomState(0)
+    data = rng.randn(4, n_from, 5)
+    stcs = [SourceEstimate(d, vertices, 0, 1, "sub") for d in data]
+    kwargs = dict(spacing=[np.arange(len(surf["rr"]))] * 2, subjects_dir=tmp_path)
+    with pytest.warns(RuntimeWarning, match="vertices not included"):
+        morph = compute_source_morph(stcs[0], "sub", "sub", smooth=1, **kwargs)
+    assert len(n_computed) == 2
+    # the morph matrices of the hemispheres are reused (with their warnings)
+    with pytest.warns(RuntimeWarning, match="vertices not included"):
+        morph_2 = compute_source_morph(stcs[0], "sub", "sub", smooth=1, **kwargs)
+    assert len(n_computed) == 2
+    assert_array_equal(morph.morph_mat.toarray(), morph_2.morph_mat.toarray())
+    compute_source_morph(stcs[0], "sub", "sub", smooth=None, **kwargs)
+    assert len(n_computed) == 4
+    want = np.array([morph.apply(stc).data for stc in stcs])
+    assert want.shape == (4, 2 * len(surf["rr"]), 5)
+    for n_jobs in (None, 2):
+        assert_allclose(morph.apply_array(data, n_jobs=n_jobs), want)
+    # vector source estimates
+    data_vec = rng.randn(2, n_from, 3, 5)
+    want = [
+        morph.apply(VectorSourceEstimate(d, vertices, 0, 1, "sub")).data
+        for d in data_vec
+    ]
+    assert_allclose(morph.apply_array(data_vec), want)
+    with pytest.raises(ValueError, match="must have shape"):
+        morph.apply_array(data[:, 1:])
+
+
 @testing.requires_testing_data
 def test_surface_source_morph_shortcut(subjects_dir_tmp):
     """Test that our shortcut for smooth=0 works."""
@@ -1181,3 +1233,46 @@ def test_resample_equiv(from_shape, from_affine, to_shape, to_affine, order, see
     else:
         perc = 100 * np.isclose(got_mne, got_dipy).mean()
         assert 83 < perc <= 100
+
+
+@pytest.mark.parametrize("is_inverse", (False, True))
+def test_sdr_reslice_equiv(is_inverse):
+    """Test that our sparse SDR and reslice operators match dipy."""
+    pytest.importorskip("dipy")
+    from dipy.align.imwarp import DiffeomorphicMap
+    from dipy.align.reslice import reslice
+
+    rng = np.random.RandomState(0)
+    from_shape, to_shape = (12, 10, 8), (9, 11, 10)
+    from_affine = _rand_affine(rng)
+    from_affine[:3, :3] *= 2
+    prealign = _rand_affine(rng)
+    if is_inverse:
+        from_shape, to_shape = to_shape, from_shape
+    sdr_morph = DiffeomorphicMap(
+        3,
+        to_shape,
+        disp_grid2world=from_affine,
+        domain_shape=to_shape,
+        domain_grid2world=from_affine,
+        codomain_shape=from_shape,
+        codomain_grid2world=_rand_affine(rng),
+        prealign=prealign,
+    )
+    field = rng.randn(*to_shape, 3).astype(np.float32)
+    sdr_morph.forward = sdr_morph.backward = field
+    sdr_morph.is_inverse = is_inverse
+    data = rng.randn(*from_shape)
+    want = sdr_morph.transform(data)
+    interp = _sdr_interp(sdr_morph, from_shape)
+    got = (interp @ data.ravel(order="F")).reshape(want.shape, order="F")
+    assert_allclose(got, want, rtol=1e-5, atol=1e-5)
+    # reslicing
+    want, want_affine = reslice(data, from_affine, (2, 2, 2), (3, 1.5, 4))
+    interp, shape, affine = _reslice_interp(
+        from_shape, from_affine, (2, 2, 2), (3, 1.5, 4)
+    )
+    assert shape == want.shape
+    assert_allclose(affine, want_affine)
+    got = (interp @ data.ravel(order="F")).reshape(shape, order="F")
+    assert_allclose(got, want, atol=1e-12)
@@ -6,7 +6,7 @@ import numpy as np
 import pytest
 from numpy.testing import assert_allclose
 
-from mne._ola import _COLA, _Interp2, _Storer
+from mne._ola import _COLA, _Interp2, _QueueStorer, _Storer
 
 
 def test_interp_2pt():
@@ -126,3 +126,33 @@ def test_cola(ndim):
                             cola.feed(signal[..., n_input : n_input + next_len])
                             n_input += next_len
                         assert_allclose(out, signal / 2.0, atol=1e-7)
+
+
+def test_cola_queue():
+    """Test COLA processing with queued (streaming) storage."""
+    rng = np.random.RandomState(0)
+    n_total, n_samples = 1000, 100
+    signal = rng.randn(3, n_total)
+
+    def processor(x, *, start, stop):
+        return (x / 2.0,)
+
+    queue = _QueueStorer(picks=[0, 2])
+    cola = _COLA(processor, queue, n_total, n_samples, n_samples // 2, 1000.0)
+    outs = list()
+    n_input = 0
+    while n_input < n_total:
+        next_len = min(rng.randint(1, 120), n_total - n_input)
+        chunk = signal[:, n_input : n_input + next_len].copy()
+        queue.push(chunk)
+        cola.feed(chunk[[0, 2]])
+        out = queue.pop()
+        if out is not None:
+            outs.append(out)
+        n_input += next_len
+    assert queue.n_pending == 0
+    out = np.concatenate(outs, axis=-1)
+    assert_allclose(out[[0, 2]], signal[[0, 2]] / 2.0, atol=1e-7)
+    assert_allclose(out[1], signal[1])
+    with pytest.raises(RuntimeError, match="only 0 samples have been pushed"):
+        _QueueStorer()(np.zeros((1, 1)))
@@ -63,7 +63,7 @@ from mne import (
 )
 from mne._fiff.constants import FIFF
 from mne.datasets import testing
-from mne.fixes import _get_img_fdata
+from mne.fixes import _get_img_fdata, has_numba
 from mne.io import read_info, read_raw_fif
 from mne.label import label_sign_flip, read_labels_from_annot
 from mne.minimum_norm import (
@@ -73,7 +73,15 @@ from mne.minimum_norm import (
     read_inverse_operator,
 )
 from mne.morph_map import _make_morph_map_hemi
-from mne.source_estimate import _get_vol_mask, _make_stc, grade_to_tris
+from mne.source_estimate import (
+    _get_vol_mask,
+    _label_funcs,
+    _label_max_numba,
+    _label_max_numpy,
+    _LabelOperator,
+    _make_stc,
+    grade_to_tris,
+)
 from mne.source_space._source_space import _get_src_nn
 from mne.transforms import apply_trans, invert_transform
 from mne.utils import (
@@ -842,6 +850,53 @@ def test_extract_label_time_course(kind, vector):
     assert x.size == 0
 
 
+@pytest.mark.parametrize("mode", ("mean", "mean_flip", "max", "pca_flip"))
+@pytest.mark.parametrize("kernel", ("numba", "numpy"))
+def test_label_operator(mode, kernel, monkeypatch):
+    """Test the stacked label extraction against the per-label functions."""
+    if kernel == "numba" and not has_numba:
+        pytest.skip("Numba not installed")
+    label_max = dict(numba=_label_max_numba, numpy=_label_max_numpy)[kernel]
+    monkeypatch.setattr("mne.source_estimate._label_max", label_max)
+    # exercise the chunking and batching
+    monkeypatch.setattr("mne.source_estimate._LABEL_ROWS_BYTES", 16 * 20 * 30)
+    monkeypatch.setattr("mne.source_estimate._PCA_FLIP_BATCH_BYTES", 8 * 10 * 20)
+    rng = np.random.default_rng(0)
+    nvert = np.array([50, 60, 10, 20])  # a mixed source space
+    n_mean, n_times = 2, 20
+    label_vertidx = [rng.choice(110, size, replace=False) for size in (1, 5, 9, 30)]
+    label_vertidx.insert(2, None)  # empty label
+    label_vertidx.append(label_vertidx[-1][:7])  # overlapping
+    for v in label_vertidx:
+        if v is not None:
+            v.sort()
+    label_flip = [
+        None if v is None else rng.choice([-1.0, 1.0], (len(v), 1))
+        for v in label_vertidx
+    ]
+    data = rng.standard_normal((nvert.sum(), n_times))
+    data[label_vertidx[1]] *= 10  # a dominant component
+    label_op = _LabelOperator(label_vertidx, label_flip, mode, nvert, n_mean)
+    want = np.zeros((len(label_vertidx) + n_mean, n_times))
+    for li, (v, flip) in enumerate(zip(label_vertidx, label_flip)):
+        if v is not None:
+            want[li] = _label_funcs[mode](flip, data[v])
+    want[-2] = data[110:120].mean(axis=0)
+    want[-1] = data[120:].mean(axis=0)
+    assert_allclose(label_op(data), want, rtol=1e-7, atol=1e-12)
+    # interpolated (sparse) rows as for volume labels
+    label_vertidx = [
+        sparse.csr_array(rng.random((n_rows, 110)) * (rng.random((n_rows, 110)) < 0.1))
+        for n_rows in (4, 25)
+    ]
+    data = data[:110]
+    label_op = _LabelOperator(label_vertidx, [None] * 2, mode, [110], 0)
+    want = [
+        _label_funcs[mode](np.ones((v.shape[0], 1)), v @ data) for v in label_vertidx
+    ]
+    assert_allclose(label_op(data), want, rtol=1e-7, atol=1e-12)
+
+
 @testing.requires_testing_data
 @pytest.mark.parametrize(
     "label_type, mri_res, vector, test_label, cf, call",
@@ -26,6 +26,7 @@ from mne.transforms import (
     _average_quats,
     _cart_to_sph,
     _compute_r2,
+    _compute_volume_registration_step,
     _euler_to_quat,
     _find_trans,
     _find_vector_rotation,
@@ -57,6 +58,7 @@ from mne.transforms import (
 from mne.transforms import (
     _SphericalSurfaceWarp as SphericalSurfaceWarp,
 )
+from mne.utils import _ContentCache
 
 data_path = testing.data_path(download=False)
 fname = data_path / "MEG" / "sample" / "sample_audvis_trunc-trans.fif"
@@ -648,6 +650,66 @@ def test_volume_registration():
     )
 
 
+def test_volume_registration_cache(monkeypatch):
+    """Test that the volume registration steps are reused."""
+    nib = pytest.importorskip("nibabel")
+    pytest.importorskip("dipy")
+    from scipy.ndimage import gaussian_filter
+
+    rng = np.random.RandomState(0)
+    data = gaussian_filter(rng.rand(20, 22, 18), 2).astype(np.float32)
+    affine = np.diag([2.0, 2.0, 2.0, 1.0])
+    static = nib.Nifti1Image(data, affine)
+    moving = nib.Nifti1Image(np.roll(data, 1, axis=0), affine)
+    monkeypatch.setattr(
+        mne.transforms,
+        "_volume_registration_cache",
+        _ContentCache("volume_registration", 8),
+    )
+    steps = list()
+
+    def _count_step(step, *args):
+        steps.append(step)
+        return _compute_volume_registration_step(step, *args)
+
+    monkeypatch.setattr(
+        mne.transforms, "_compute_volume_registration_step", _count_step
+    )
+    kwargs = dict(niter=dict(translation=[2], rigid=[2], affine=[2], sdr=[2]))
+    reg_affine, sdr_morph = mne.transforms.compute_volume_registration(
+        moving, static, pipeline="all", **kwargs
+    )
+    assert steps == ["translation", "rigid", "affine", "sdr"]
+    reg_affine_2, sdr_morph_2 = mne.transforms.compute_volume_registration(
+        moving, static, pipeline="all", **kwargs
+    )
+    assert len(steps) == 4
+    assert_array_equal(reg_affine, reg_affine_2)
+    assert_array_equal(sdr_morph.forward, sdr_morph_2.forward)
+    assert sdr_morph.is_inverse == sdr_morph_2.is_inverse
+    img = mne.transforms.apply_volume_registration(
+        moving, static, reg_affine, sdr_morph
+    )
+    img_2 = mne.transforms.apply_volume_registration(
+        moving, static, reg_affine_2, sdr_morph_2
+    )
+    assert_array_equal(img.get_fdata(), img_2.get_fdata())
+    # the affine steps are shared with other pipelines
+    mne.transforms.compute_volume_registration(
+        moving, static, pipeline="rigids", **kwargs
+    )
+    assert len(steps) == 4
+    kwargs["niter"]["sdr"] = [1]
+    mne.transforms.compute_volume_registration(moving, static, pipeline="all", **kwargs)
+    assert steps[4:] == ["sdr"]
+    # but not with other images
+    moving = nib.Nifti1Image(np.roll(data, 2, axis=0), affine)
+    mne.transforms.compute_volume_registration(
+        moving, static, pipeline=("translation",), **kwargs
+    )
+    assert steps[5:] == ["translation"]
+
+
 def test_displacement_field():
     """Test that our matched point deformation works."""
     to = np.array([[5, 4, 1], [6, 1, 0], [4, -1, 1], [3, 3, 0]], float)
@@ -7,6 +7,7 @@
 import glob
 import os
 from copy import deepcopy
+from functools import partial
 from pathlib import Path
 
 import numpy as np
@@ -22,6 +23,7 @@ from .fixes import _get_img_fdata, jit, sph_harm_y
 from .utils import (
     _check_fname,
     _check_option,
+    _ContentCache,
     _ensure_int,
     _import_nibabel,
     _path_like,
@@ -32,6 +34,7 @@ from .utils import (
     fill_doc,
     get_subjects_dir,
     logger,
+    object_hash,
     verbose,
     wrapped_stdout,
 )
@@ -1819,17 +1822,6 @@ def _compute_volume_registration(
 ):
     nib = _import_nibabel("SDR morph")
     _require_version("dipy", "SDR morph", "0.10.1")
-    with _record_warnings():
-        from dipy.align import (
-            affine,
-            affine_registration,
-            center_of_mass,
-            imwarp,
-            metrics,
-            rigid,
-            translation,
-        )
-        from dipy.align.imaffine import AffineMap
 
     # input validation
     _validate_type(moving, nib.spatialimages.SpatialImage, "moving")
@@ -1841,72 +1833,46 @@ def _compute_volume_registration(
 
     logger.info("Computing registration...")
 
-    # affine optimizations
-    reg_affine = starting_affine
-    sdr_morph = None
-    pipeline_options = dict(
-        translation=[center_of_mass, translation], rigid=[rigid], affine=[affine]
-    )
-    sigmas_mm = np.array([3.0, 1.0, 0.0])  # default for affine_registration
-    sigma_diff_mm = 2.0
-    factors = [4, 2, 1]
-    current_zoom = None
-    for i, step in enumerate(pipeline):
-        # reslice image with zooms
-        if i == 0 or zooms[step] != zooms[pipeline[i - 1]]:
+    # Each step is cached (at its resolution) based on the image contents, the
+    # step parameters, and the affine it starts from, so re-running the same
+    # (or a partially overlapping) registration pipeline reuses the results
+    img_hashes = [
+        object_hash(
+            [np.asanyarray(img.dataobj), img.affine, img.header.get_zooms()[:3]]
+        )
+        for img in (moving, static)
+    ]
+    zoomed = dict()
+
+    def _get_zoomed(step):
+        # reslice images with zooms
+        if zooms[step] not in zoomed:
             if zooms[step] is not None:
                 logger.info(f"Reslicing to zooms={zooms[step]} for {step} ...")
-                current_zoom = np.mean(zooms[step])
             else:
                 logger.info(f"Using original zooms for {step} ...")
-                current_zoom = original_zoom
-            static_zoomed, static_affine = _reslice_normalize(static, zooms[step])
-            moving_zoomed, moving_affine = _reslice_normalize(moving, zooms[step])
-        logger.info(f"Optimizing {step}:")
-        if step == "sdr":  # happens last
-            sigma_diff_vox = sigma_diff_mm / current_zoom
-            affine_map = AffineMap(
-                reg_affine,  # apply registration here
-                domain_grid_shape=static_zoomed.shape,
-                domain_grid2world=static_affine,
-                codomain_grid_shape=moving_zoomed.shape,
-                codomain_grid2world=moving_affine,
-            )
-            moving_zoomed = affine_map.transform(moving_zoomed)
-            metric = metrics.CCMetric(
-                dim=3,
-                sigma_diff=sigma_diff_vox,
-                radius=max(int(np.ceil(2 * sigma_diff_vox)), 1),
+            zoomed[zooms[step]] = (
+                _reslice_normalize(static, zooms[step])
+                + _reslice_normalize(moving, zooms[step])
+                + (np.mean(zooms[step] or original_zoom),)
             )
-            sdr = imwarp.SymmetricDiffeomorphicRegistration(
-                metric,
-                level_iters=niter[step],
-            )
-            with wrapped_stdout(indent="    ", cull_newlines=True):
-                sdr_morph = sdr.optimize(
-                    static_zoomed,
-                    moving_zoomed,
-                    static_grid2world=static_affine,
-                    moving_grid2world=static_affine,
-                )
-            moved_zoomed = sdr_morph.transform(moving_zoomed)
-        else:
-            sigmas_vox = list(sigmas_mm / current_zoom)
-            with wrapped_stdout(indent="    ", cull_newlines=True):
-                moved_zoomed, reg_affine = affine_registration(
-                    moving_zoomed,
-                    static_zoomed,
-                    moving_affine=moving_affine,
-                    static_affine=static_affine,
-                    nbins=32,
-                    metric="MI",
-                    pipeline=pipeline_options[step],
-                    level_iters=niter[step],
-                    sigmas=sigmas_vox,
-                    factors=factors,
-                    starting_affine=reg_affine,
-                )
+        return zoomed[zooms[step]]
 
+    # affine optimizations
+    reg_affine = starting_affine
+    sdr_morph = None
+    for step in pipeline:
+        key = (step, img_hashes, zooms[step], niter[step], reg_affine)
+        value = _volume_registration_cache(
+            key,
+            partial(
+                _compute_volume_registration_step, step, reg_affine, niter, _get_zoomed
+            ),
+        )
+        if step == "sdr":  # happens last
+            sdr_morph = _sdr_from_dict(value)
+        else:
+            reg_affine = np.array(value["reg_affine"])
             # report some useful information
             if step in ("translation", "rigid"):
                 angle, dist = angle_distance_between_rigid(
@@ -1915,19 +1881,120 @@ def _compute_volume_registration(
                 logger.info(f"    Translation: {dist:6.1f} mm")
                 if step == "rigid":
                     logger.info(f"    Rotation:    {angle:6.1f}°")
-        assert moved_zoomed.shape == static_zoomed.shape, step
-        r2 = _compute_r2(static_zoomed, moved_zoomed)
-        logger.info(f"    R²:          {r2:6.1f}%")
+        logger.info(f"    R²:          {float(value['r2']):6.1f}%")
     return (
         reg_affine,
         sdr_morph,
-        static_zoomed.shape,
-        static_affine,
-        moving_zoomed.shape,
-        moving_affine,
+        tuple(int(n) for n in value["static_shape"]),
+        np.array(value["static_affine"]),
+        tuple(int(n) for n in value["moving_shape"]),
+        np.array(value["moving_affine"]),
     )
 
 
+_volume_registration_cache = _ContentCache("volume_registration", maxsize=8)
+
+
+def _compute_volume_registration_step(step, reg_affine, niter, get_zoomed):
+    with _record_warnings():
+        from dipy.align import (
+            affine,
+            affine_registration,
+            center_of_mass,
+            imwarp,
+            metrics,
+            rigid,
+            translation,
+        )
+        from dipy.align.imaffine import AffineMap
+
+    pipeline_options = dict(
+        translation=[center_of_mass, translation], rigid=[rigid], affine=[affine]
+    )
+    sigmas_mm = np.array([3.0, 1.0, 0.0])  # default for affine_registration
+    sigma_diff_mm = 2.0
+    factors = [4, 2, 1]
+    static_zoomed, static_affine, moving_zoomed, moving_affine, current_zoom = (
+        get_zoomed(step)
+    )
+    logger.info(f"Optimizing {step}:")
+    value = dict()
+    if step == "sdr":  # happens last
+        sigma_diff_vox = sigma_diff_mm / current_zoom
+        affine_map = AffineMap(
+            reg_affine,  # apply registration here
+            domain_grid_shape=static_zoomed.shape,
+            domain_grid2world=static_affine,
+            codomain_grid_shape=moving_zoomed.shape,
+            codomain_grid2world=moving_affine,
+        )
+        moving_zoomed = affine_map.transform(moving_zoomed)
+        metric = metrics.CCMetric(
+            dim=3,
+            sigma_diff=sigma_diff_vox,
+            radius=max(int(np.ceil(2 * sigma_diff_vox)), 1),
+        )
+        sdr = imwarp.SymmetricDiffeomorphicRegistration(
+            metric,
+            level_iters=niter[step],
+        )
+        with wrapped_stdout(indent="    ", cull_newlines=True):
+            sdr_morph = sdr.optimize(
+                static_zoomed,
+                moving_zoomed,
+                static_grid2world=static_affine,
+                moving_grid2world=static_affine,
+            )
+        moved_zoomed = sdr_morph.transform(moving_zoomed)
+        value.update(_sdr_to_dict(sdr_morph))
+    else:
+        sigmas_vox = list(sigmas_mm / current_zoom)
+        with wrapped_stdout(indent="    ", cull_newlines=True):
+            moved_zoomed, reg_affine = affine_registration(
+                moving_zoomed,
+                static_zoomed,
+                moving_affine=moving_affine,
+                static_affine=static_affine,
+                nbins=32,
+                metric="MI",
+                pipeline=pipeline_options[step],
+                level_iters=niter[step],
+                sigmas=sigmas_vox,
+                factors=factors,
+                starting_affine=reg_affine,
+            )
+        value["reg_affine"] = reg_affine
+    assert moved_zoomed.shape == static_zoomed.shape, step
+    value.update(
+        r2=_compute_r2(static_zoomed, moved_zoomed),
+        static_shape=static_zoomed.shape,
+        static_affine=static_affine,
+        moving_shape=moving_zoomed.shape,
+        moving_affine=moving_affine,
+    )
+    return value
+
+
+def _sdr_to_dict(sdr_morph):
+    """Convert a DiffeomorphicMap to a dict of arrays (for caching)."""
+    return {
+        f"sdr_{key}": val for key, val in sdr_morph.__dict__.items() if val is not None
+    }
+
+
+def _sdr_from_dict(value):
+    """Reconstruct a DiffeomorphicMap from a dict of arrays."""
+    from dipy.align.imwarp import DiffeomorphicMap
+
+    sdr_morph = DiffeomorphicMap(None, [])
+    for key, val in value.items():
+        if key.startswith("sdr_"):
+            # dipy needs writeable arrays (and scalars)
+            val = np.array(val)
+            setattr(sdr_morph, key[4:], val.item() if val.ndim == 0 else val)
+    return sdr_morph
+
+
 @verbose
 def apply_volume_registration(
     moving,
@@ -10,6 +10,7 @@ __all__ = [
     "ProgressBar",
     "SizeMixin",
     "TimeMixin",
+    "_ContentCache",
     "_DefaultEventParser",
     "_PCA",
     "_ReuseCycle",
@@ -360,6 +361,7 @@ from .numerics import (
     _array_repr,
     _check_dt,
     _compute_row_norms,
+    _ContentCache,
     _custom_lru_cache,
     _date_to_julian,
     _dt_to_stamp,
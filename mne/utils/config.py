@@ -187,6 +187,10 @@ _known_config_types = {
         "str, threshold on the minimum size of arrays passed to the workers that "
         "triggers automated memory mapping, e.g., 1M or 0.5G"
     ),
+    "MNE_PERSISTENT_CACHE_DIR": (
+        "str, path to a directory in which to persistently cache expensive "
+        "intermediate results (e.g., Maxwell filtering decompositions)"
+    ),
     "MNE_REPR_HTML": (
         "bool, represent some objects with rich HTML in a notebook environment"
     ),
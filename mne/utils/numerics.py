@@ -1122,6 +1122,150 @@ def _custom_lru_cache(maxsize):
     return dec
 
 
+class _ContentCache:
+    """Content-addressed LRU cache of dicts of arrays.
+
+    Keys are hashed with :func:`object_hash`. If the ``MNE_PERSISTENT_CACHE_DIR``
+    config value is set, values are also stored in (and read from) ``.npz`` files
+    in the ``name`` subdirectory of that directory, so they can be reused across
+    sessions.
+
+    Parameters
+    ----------
+    name : str
+        The name of the cache (also used as the on-disk subdirectory).
+    maxsize : int
+        The maximum number of entries to keep in memory. Zero disables
+        in-memory caching.
+    """
+
+    def __init__(self, name, maxsize):
+        self.name = name
+        self.maxsize = maxsize
+        self._cache = dict()
+
+    def __call__(self, key, compute):
+        """Get the value for a key, computing it if necessary.
+
+        Parameters
+        ----------
+        key : object
+            The object to hash (see :func:`object_hash`).
+        compute : callable
+            Function that takes no arguments and returns a dict of ndarray
+            (or scalars).
+
+        Returns
+        -------
+        value : dict
+            The (read-only) arrays.
+        """
+        value = self.get(key)
+        if value is None:
+            value = self.set(key, compute())
+        return value
+
+    def get(self, key):
+        """Get the value for a key if it is cached.
+
+        Parameters
+        ----------
+        key : object
+            The object to hash (see :func:`object_hash`).
+
+        Returns
+        -------
+        value : dict | None
+            The (read-only) arrays, or None if the key is not in the cache.
+        """
+        hash_ = self._hash(key)
+        if hash_ in self._cache:
+            logger.debug(f"    Using cached {self.name} {hash_}")
+            value = self._cache.pop(hash_)
+        else:
+            value = self._read(hash_)
+        if value is not None:
+            self._insert(hash_, value)
+        return value
+
+    def set(self, key, value):
+        """Set (or replace) the value for a key.
+
+        Parameters
+        ----------
+        key : object
+            The object to hash (see :func:`object_hash`).
+        value : dict
+            The ndarray (or scalar) values to store.
+
+        Returns
+        -------
+        value : dict
+            The (read-only) arrays.
+        """
+        hash_ = self._hash(key)
+        # read-only copies, so later changes of the arrays passed do not leak in
+        value = {k: np.array(v) for k, v in value.items()}
+        for v in value.values():
+            v.setflags(write=False)
+        self._write(hash_, value)
+        self._cache.pop(hash_, None)
+        self._insert(hash_, value)
+        return value
+
+    def clear(self):
+        """Clear the in-memory cache."""
+        self._cache.clear()
+
+    @staticmethod
+    def _hash(key):
+        return f"{object_hash(key):032x}"
+
+    def _insert(self, hash_, value):
+        if self.maxsize > 0:
+            self._cache[hash_] = value  # (re)insert in last pos
+        while len(self._cache) > max(self.maxsize, 0):
+            self._cache.pop(next(iter(self._cache)))  # first in, first out
+
+    def _get_dir(self):
+        from .config import get_config
+
+        cache_dir = get_config("MNE_PERSISTENT_CACHE_DIR", None)
+        if cache_dir is None:
+            return None
+        return Path(cache_dir).expanduser() / self.name
+
+    def _read(self, hash_):
+        cache_dir = self._get_dir()
+        if cache_dir is None:
+            return None
+        fname = cache_dir / f"{hash_}.npz"
+        if not fname.is_file():
+            return None
+        try:
+            with np.load(fname) as npz:
+                value = {key: npz[key] for key in npz.files}
+        except Exception as exp:
+            logger.info(f"    Could not read cached {self.name} {fname}: {exp}")
+            return None
+        logger.debug(f"    Using cached {self.name} {fname}")
+        for v in value.values():
+            v.setflags(write=False)
+        return value
+
+    def _write(self, hash_, value):
+        cache_dir = self._get_dir()
+        if cache_dir is None:
+            return
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        fname = cache_dir / f"{hash_}.npz"
+        # write to a temporary file first so that parallel jobs never see a
+        # partially written file
+        tmp_fname = cache_dir / f"{hash_}-{os.getpid()}.tmp.npz"
+        np.savez(tmp_fname, **value)
+        os.replace(tmp_fname, fname)
+
+
 def _array_repr(x):
     """Produce compact info about float ndarray x."""
     assert isinstance(x, np.ndarray), type(x)
@@ -4,6 +4,7 @@
 
 from copy import deepcopy
 from datetime import date
+from functools import partial
 from io import StringIO
 from pathlib import Path
 
@@ -22,6 +23,7 @@ from mne.utils import (
     _apply_scaling_array,
     _apply_scaling_cov,
     _array_equal_nan,
+    _ContentCache,
     _custom_lru_cache,
     _date_to_julian,
     _freq_mask,
@@ -607,6 +609,63 @@ def test_custom_lru_cache():
     assert n_calls == [2, 2]  # never did any computation
 
 
+def test_content_cache(tmp_path, monkeypatch):
+    """Test our _ContentCache implementation."""
+    monkeypatch.delenv("MNE_PERSISTENT_CACHE_DIR", raising=False)
+    n_calls = [0]
+
+    def compute(x):
+        n_calls[0] += 1
+        return dict(x=x * 2, n=len(x))
+
+    cache = _ContentCache("test", maxsize=1)
+    x = np.arange(3.0)
+    out = cache(x, partial(compute, x))
+    assert n_calls == [1]
+    assert_array_equal(out["x"], x * 2)
+    assert out["n"] == 3
+    with pytest.raises(ValueError, match="read-only"):
+        out["x"][0] = 1
+    assert cache(x.copy(), partial(compute, x)) is out
+    assert n_calls == [1]
+    cache(x + 1, partial(compute, x + 1))
+    assert n_calls == [2]
+    cache(x, partial(compute, x))  # got popped
+    assert n_calls == [3]
+    cache.maxsize = 0
+    cache(x, partial(compute, x))
+    assert n_calls == [3]  # still in memory when we changed the size
+    cache(x, partial(compute, x))
+    assert n_calls == [4]
+    # on-disk persistence
+    monkeypatch.setenv("MNE_PERSISTENT_CACHE_DIR", str(tmp_path))
+    cache = _ContentCache("test", maxsize=0)
+    out = cache(x, partial(compute, x))
+    assert n_calls == [5]
+    fnames = list((tmp_path / "test").glob("*.npz"))
+    assert len(fnames) == 1
+    out_2 = _ContentCache("test", maxsize=0)(x, partial(compute, x))
+    assert n_calls == [5]
+    assert_array_equal(out_2["x"], out["x"])
+    assert out_2["n"] == 3
+    assert not out_2["x"].flags.writeable
+    # corrupt files are recomputed
+    fnames[0].write_bytes(b"")
+    cache(x, partial(compute, x))
+    assert n_calls == [6]
+    # explicit get/set (for incremental computations)
+    cache = _ContentCache("test", maxsize=1)
+    assert cache.get(x + 2) is None
+    y = x * 3
+    out = cache.set(x + 2, dict(y=y))
+    assert y.flags.writeable  # the passed arrays are not modified
+    assert not out["y"].flags.writeable
+    assert cache.get(x + 2) is out
+    assert_array_equal(_ContentCache("test", maxsize=0).get(x + 2)["y"], y)
+    y[:] = 0  # nor do later changes of them modify the cache
+    assert_array_equal(cache.get(x + 2)["y"], x * 3)
+
+
 def test_replace_md5(tmp_path):
     """Test _replace_md5."""
     old = tmp_path / "test"